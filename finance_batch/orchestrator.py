@@ -42,18 +42,25 @@ from finance_batch.tasks.payroll_tasks import LaborCostAllocationTask
 
 if TYPE_CHECKING:
     from finance_config.schema import AccountingConfigurationSet
+    from finance_modules.assets.service import FixedAssetService
 
 logger = get_logger("batch.orchestrator")
 
 
-def _default_task_registry() -> TaskRegistry:
-    """Create a TaskRegistry pre-loaded with all module task implementations."""
+def _default_task_registry(
+    asset_service_factory: Callable[[Session], FixedAssetService] | None = None,
+) -> TaskRegistry:
+    """Create a TaskRegistry pre-loaded with all module task implementations.
+
+    ``asset_service_factory`` is handed to the mass depreciation task,
+    which posts through FixedAssetService.
+    """
     registry = TaskRegistry()
     registry.register(PaymentRunTask())
     registry.register(InvoiceMatchTask())
     registry.register(DunningLetterTask())
     registry.register(SmallBalanceWriteOffTask())
-    registry.register(MassDepreciationTask())
+    registry.register(MassDepreciationTask(asset_service_factory))
     registry.register(BankReconcileTask())
     registry.register(ECLCalculationTask())
     registry.register(RecurringEntryTask())
@@ -105,6 +112,7 @@ class BatchOrchestrator:
         clock: Clock | None = None,
         actor_id: UUID | None = None,
         task_registry: TaskRegistry | None = None,
+        asset_service_factory: Callable[[Session], FixedAssetService] | None = None,
     ) -> BatchOrchestrator:
         """Create a fully wired BatchOrchestrator from a session.
 
@@ -114,9 +122,15 @@ class BatchOrchestrator:
             actor_id: Optional actor UUID for audit attribution.
             task_registry: Optional pre-configured registry. If None,
                 uses the default registry with all module tasks.
+            asset_service_factory: Builds a FixedAssetService on the
+                executor's session for the mass depreciation task; used
+                only with the default registry.
         """
         effective_clock = clock or SystemClock()
-        registry = task_registry if task_registry is not None else _default_task_registry()
+        registry = (
+            task_registry if task_registry is not None
+            else _default_task_registry(asset_service_factory)
+        )
 
         return cls(
             session=session,
@@ -27,6 +27,7 @@ from uuid import UUID, uuid4
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from finance_kernel.db.pool_telemetry import pool_caller
 from finance_kernel.domain.clock import Clock, SystemClock
 from finance_kernel.exceptions import (
     BatchAlreadyRunningError,
@@ -175,6 +176,10 @@ class BatchExecutor:
             BatchAlreadyRunningError: If job is already RUNNING.
             TaskNotRegisteredError: If task_type is not registered.
         """
+        with pool_caller("batch"):
+            return self._execute_job(job_id, actor_id)
+
+    def _execute_job(self, job_id: UUID, actor_id: UUID) -> BatchRunResult:
         start_time = time.monotonic()
 
         # BT-8: Lock job row
@@ -1,20 +1,38 @@
 """
-Batch task: Mass depreciation (wraps FixedAssetService.run_mass_depreciation).
+Batch task: Mass depreciation (posts one consolidated entry per asset through
+FixedAssetService, with asset_id and cost_center line dimensions).
 """
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable
+from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from finance_batch.domain.types import BatchItemStatus
 from finance_batch.tasks.base import BatchItemInput, BatchTaskResult
 
+if TYPE_CHECKING:
+    from finance_modules.assets.service import FixedAssetService
+
 
 class MassDepreciationTask:
-    """Batch task for running mass depreciation across eligible assets."""
+    """Batch task for running mass depreciation across eligible assets.
+
+    ``service_factory`` builds a ``FixedAssetService`` on the executor's
+    session, so postings pass the service's mass depreciation workflow
+    guard; without one, items fail with SERVICE_NOT_CONFIGURED rather than
+    succeeding without a journal entry.
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[Session], FixedAssetService] | None = None,
+    ) -> None:
+        self._service_factory = service_factory
 
     @property
     def task_type(self) -> str:
@@ -30,24 +48,43 @@ class MassDepreciationTask:
         session: Session,
         as_of: datetime,
     ) -> tuple[BatchItemInput, ...]:
-        from finance_modules.assets.orm import AssetModel
-
-        query = session.query(AssetModel).filter(
-            AssetModel.status == "active",
-        )
-        assets = query.all()
-
-        return tuple(
-            BatchItemInput(
-                item_index=i,
-                item_key=str(asset.id),
-                payload={
-                    "asset_id": str(asset.id),
-                    "asset_code": getattr(asset, "asset_code", ""),
-                },
-            )
-            for i, asset in enumerate(assets)
-        )
+        """One item per in-service asset with an unposted charge for the period.
+
+        Parameters: ``period_date`` (ISO date, default ``as_of``),
+        ``convention`` (default "mid_month"), ``chunk_size`` (default 1000).
+        Amounts are computed here, chunk by chunk, by the portfolio
+        depreciation engine; items carry the schedule values.  Assets with
+        only an unposted (draft) row for the period are included.
+        """
+        from finance_modules.assets.helpers import depreciate_portfolio
+        from finance_modules.assets.register import iter_register_chunks
+
+        period = parameters.get("period_date")
+        period_date = date.fromisoformat(period) if period else as_of.date()
+
+        items: list[BatchItemInput] = []
+        for chunk in iter_register_chunks(
+            session,
+            period_date,
+            chunk_size=int(parameters.get("chunk_size", 1000)),
+            convention=parameters.get("convention", "mid_month"),
+            unposted_only=True,
+        ):
+            lines, _skipped = depreciate_portfolio(chunk, period_date)
+            for line in lines:
+                items.append(BatchItemInput(
+                    item_index=len(items),
+                    item_key=str(line.asset_id),
+                    payload={
+                        "asset_id": str(line.asset_id),
+                        "period_date": period_date.isoformat(),
+                        "depreciation_amount": str(line.depreciation_amount),
+                        "accumulated_depreciation": str(line.accumulated_depreciation),
+                        "net_book_value": str(line.net_book_value),
+                        "cost_center": line.cost_center,
+                    },
+                ))
+        return tuple(items)
 
     def execute_item(
         self,
@@ -56,14 +93,57 @@ class MassDepreciationTask:
         session: Session,
         as_of: datetime,
     ) -> BatchTaskResult:
+        """Post the item's depreciation, then write its schedule row and balances.
+
+        Parameters: ``actor_id`` (required), ``currency`` (default "USD").
+        Posting goes through ``FixedAssetService.post_depreciation_lines``,
+        which never commits; the executor's savepoint covers the posting
+        and the register writes together.
+        """
+        from finance_modules.assets.models import PortfolioDepreciationLine
+
+        if self._service_factory is None:
+            return BatchTaskResult(
+                status=BatchItemStatus.FAILED,
+                error_code="SERVICE_NOT_CONFIGURED",
+                error_message="MassDepreciationTask needs a service_factory to post",
+            )
+        actor = parameters.get("actor_id")
+        if not actor:
+            return BatchTaskResult(
+                status=BatchItemStatus.FAILED,
+                error_code="MISSING_ACTOR",
+                error_message="parameters.actor_id is required",
+            )
         try:
-            # The actual depreciation calculation would be delegated to
-            # FixedAssetService.run_mass_depreciation for a single asset.
-            # This is a thin wrapper that the orchestrator wires with the
-            # actual service instance.
+            payload = item.payload
+            line = PortfolioDepreciationLine(
+                asset_id=UUID(payload["asset_id"]),
+                period_date=date.fromisoformat(payload["period_date"]),
+                depreciation_amount=Decimal(payload["depreciation_amount"]),
+                accumulated_depreciation=Decimal(payload["accumulated_depreciation"]),
+                net_book_value=Decimal(payload["net_book_value"]),
+                cost_center=payload.get("cost_center"),
+            )
+            result = self._service_factory(session).post_depreciation_lines(
+                [line],
+                actor_id=UUID(str(actor)),
+                currency=parameters.get("currency", "USD"),
+            )
+            if not result.is_success:
+                return BatchTaskResult(
+                    status=BatchItemStatus.FAILED,
+                    error_code="DEPRECIATION_NOT_POSTED",
+                    error_message=result.message or result.status.value,
+                )
             return BatchTaskResult(
                 status=BatchItemStatus.SUCCEEDED,
-                result_data={"asset_id": item.payload.get("asset_id")},
+                result_data={
+                    "asset_id": payload["asset_id"],
+                    "depreciation_amount": payload["depreciation_amount"],
+                    "cost_center": line.cost_center,
+                    "journal_entry_ids": [str(i) for i in result.journal_entry_ids],
+                },
             )
         except Exception as exc:
             return BatchTaskResult(
@@ -4,7 +4,8 @@ Batch task: Credit Loss module (ECL calculation).
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -30,6 +31,15 @@ class ECLCalculationTask:
         session: Session,
         as_of: datetime,
     ) -> tuple[BatchItemInput, ...]:
+        """One item per portfolio segment.
+
+        With a ``rates`` parameter the segments come from a portfolio ECL
+        run over the open AR subledger (``_prepare_portfolio_items``);
+        otherwise they are taken as given from ``segments``.
+        """
+        if parameters.get("rates"):
+            return self._prepare_portfolio_items(parameters, session, as_of)
+
         # ECL segments passed via parameters
         segments = parameters.get("segments", [])
         return tuple(
@@ -41,6 +51,93 @@ class ECLCalculationTask:
             for i, seg in enumerate(segments)
         )
 
+    def _prepare_portfolio_items(
+        self,
+        parameters: dict[str, Any],
+        session: Session,
+        as_of: datetime,
+    ) -> tuple[BatchItemInput, ...]:
+        """Run ``portfolio_ecl``; items carry the per-segment roll-forward.
+
+        Parameters: ``method`` (default "loss_rate"), ``rates`` as a list of
+        ``{"segment", "bucket" | "vintage", "rate"}``, ``lgd`` as
+        ``{segment: rate}``, ``as_of_date`` (ISO date, default ``as_of``),
+        ``currency``, ``buckets`` as a list of ``{"name", "min_days",
+        "max_days"}``, ``terms_days``, ``vintage_grain``, ``segment_key``,
+        ``segment_map`` as ``{entity_id: segment}``, ``chunk_size`` and
+        ``opening_allowance`` / ``write_offs`` / ``recoveries`` as
+        ``{segment: amount}``.
+        """
+        from finance_engines.aging import STANDARD_BUCKETS, AgeBucket
+        from finance_modules.credit_loss.models import ECLRateMatrix
+        from finance_modules.credit_loss.service import portfolio_ecl
+
+        def amounts(name: str) -> dict[str, Decimal]:
+            return {k: Decimal(str(v)) for k, v in (parameters.get(name) or {}).items()}
+
+        method = parameters.get("method", "loss_rate")
+        rate_key = "vintage" if method == "vintage" else "bucket"
+        matrix = ECLRateMatrix(
+            method=method,
+            rates={
+                (r.get("segment", "*"), r[rate_key]): Decimal(str(r["rate"]))
+                for r in parameters["rates"]
+            },
+            lgd=amounts("lgd"),
+        )
+        as_of_param = parameters.get("as_of_date")
+        as_of_date = date.fromisoformat(as_of_param) if as_of_param else as_of.date()
+        bucket_params = parameters.get("buckets")
+        buckets = (
+            tuple(
+                AgeBucket(
+                    b["name"],
+                    int(b["min_days"]),
+                    None if b.get("max_days") is None else int(b["max_days"]),
+                )
+                for b in bucket_params
+            )
+            if bucket_params
+            else STANDARD_BUCKETS
+        )
+
+        result = portfolio_ecl(
+            session,
+            as_of_date,
+            matrix,
+            currency=parameters.get("currency", "USD"),
+            opening_allowance=amounts("opening_allowance"),
+            write_offs=amounts("write_offs"),
+            recoveries=amounts("recoveries"),
+            buckets=buckets,
+            terms_days=int(parameters.get("terms_days", 0)),
+            vintage_grain=parameters.get("vintage_grain", "month"),
+            segment_key=parameters.get("segment_key", "segment"),
+            segment_map=parameters.get("segment_map"),
+            chunk_size=int(parameters.get("chunk_size", 5000)),
+        )
+        by_segment = result.by_segment()
+        return tuple(
+            BatchItemInput(
+                item_index=i,
+                item_key=row.segment,
+                payload={
+                    "segment_name": row.segment,
+                    "as_of_date": as_of_date.isoformat(),
+                    "method": method,
+                    "gross_receivable": str(
+                        by_segment.get(row.segment, (Decimal("0"),))[0]
+                    ),
+                    "opening_allowance": str(row.opening_allowance),
+                    "provision": str(row.provision),
+                    "write_offs": str(row.write_offs),
+                    "recoveries": str(row.recoveries),
+                    "closing_allowance": str(row.closing_allowance),
+                },
+            )
+            for i, row in enumerate(result.rollforward)
+        )
+
     def execute_item(
         self,
         item: BatchItemInput,
@@ -51,7 +148,10 @@ class ECLCalculationTask:
         try:
             return BatchTaskResult(
                 status=BatchItemStatus.SUCCEEDED,
-                result_data={"segment": item.item_key},
+                result_data={
+                    "segment": item.item_key,
+                    "provision": item.payload.get("provision"),
+                },
             )
         except Exception as exc:
             return BatchTaskResult(
@@ -186,6 +186,7 @@ def parse_policy(data: dict[str, Any]) -> PolicyDefinition:
             ledger=m.get("ledger", "GL"),
             from_context=m.get("from_context"),
             foreach=m.get("foreach"),
+            skip_empty=bool(m.get("skip_empty", False)),
         )
         for m in data.get("line_mappings", [])
     )
@@ -97,6 +97,7 @@ class LineMappingDef:
     ledger: str = "GL"
     from_context: str | None = None
     foreach: str | None = None
+    skip_empty: bool = False  # explicitly empty foreach collection posts no line
 
 
 @dataclass(frozen=True)
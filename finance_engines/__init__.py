@@ -49,15 +49,20 @@ logger = get_logger("engines")
 from finance_engines.aging import (
     AgeBucket,
     AgedItem,
+    AgingBucketTotal,
     AgingCalculator,
     AgingReport,
 )
 from finance_engines.allocation import (
     AllocationEngine,
     AllocationLine,
+    AllocationMatrix,
     AllocationMethod,
     AllocationResult,
     AllocationTarget,
+    RoundingPolicy,
+    allocate_matrix,
+    largest_remainder_split,
 )
 from finance_engines.allocation_cascade import (
     AllocationBase,
@@ -66,6 +71,7 @@ from finance_engines.allocation_cascade import (
     build_dcaa_cascade,
     calculate_contract_total,
     execute_cascade,
+    spread_cascade_results,
 )
 from finance_engines.billing import (
     BillingContractType,
@@ -95,12 +101,21 @@ from finance_engines.correction import (
     UnwindPlan,
     UnwindStrategy,
 )
+from finance_engines.fx import (
+    FxRatePoint,
+    FxRateStore,
+    TranslatedBalance,
+    TranslationInput,
+    TrialBalanceTranslation,
+    translate_trial_balance,
+)
 from finance_engines.ice import (
     AllowabilityStatus,
     ContractCeilingInput,
     ContractCostInput,
     CostElement,
     ICEInput,
+    ICELineCache,
     ICEScheduleType,
     ICESubmission,
     ICEValidationFinding,
@@ -187,6 +202,10 @@ __all__ = [
     "AllocationLine",
     "AllocationResult",
     "AllocationMethod",
+    "RoundingPolicy",
+    "AllocationMatrix",
+    "allocate_matrix",
+    "largest_remainder_split",
     # Matching
     "MatchingEngine",
     "MatchCandidate",
@@ -200,6 +219,14 @@ __all__ = [
     "AgeBucket",
     "AgedItem",
     "AgingReport",
+    "AgingBucketTotal",
+    # FX rate store and trial-balance translation
+    "FxRatePoint",
+    "FxRateStore",
+    "TranslationInput",
+    "TranslatedBalance",
+    "TrialBalanceTranslation",
+    "translate_trial_balance",
     # Subledger (pure domain types only)
     "SubledgerEntry",
     # Tax
@@ -238,6 +265,7 @@ __all__ = [
     "execute_cascade",
     "build_dcaa_cascade",
     "calculate_contract_total",
+    "spread_cascade_results",
     # Billing Engine (pure)
     "BillingContractType",
     "BillingLineType",
@@ -282,6 +310,7 @@ __all__ = [
     "ScheduleJLine",
     "ICEValidationFinding",
     "ICESubmission",
+    "ICELineCache",
     "compile_ice_submission",
     "compile_schedule_a",
     "compile_schedule_b",
@@ -3,7 +3,9 @@ Module: finance_engines.aging
 Responsibility:
     Calculate document aging and classify documents into configurable
     aging buckets.  Used for AP aging, AR aging, and inventory
-    slow-moving analysis.
+    slow-moving analysis.  Reports can also be assembled from bucket
+    totals pre-aggregated by the database (``generate_report_from_totals``)
+    so large open-item populations never materialize per-item objects.
 
 Architecture position:
     Engines -- pure calculation layer, zero I/O.
@@ -13,9 +15,12 @@ Invariants enforced:
     - Purity: no clock access, no I/O (R6).
     - Decimal-only arithmetic for all monetary amounts (R16, R17).
     - Deterministic bucket classification for identical inputs.
+    - Report totals are aggregated once per report and cached; repeated
+      ``total_by_bucket`` / ``total_by_counterparty`` calls are O(buckets).
 
 Failure modes:
-    - ValueError when an age does not fall into any configured bucket.
+    - ValueError when an age does not fall into any configured bucket, or
+      a pre-aggregated total names a bucket the report does not define.
     - KeyError from document dicts missing required keys in
       ``generate_report_from_documents``.
 
@@ -43,6 +48,7 @@ from __future__ import annotations
 import time
 from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
@@ -155,16 +161,51 @@ class AgedItem:
         return max(0, self.age_days)
 
 
+@dataclass(frozen=True)
+class AgingBucketTotal:
+    """
+    Pre-aggregated open amount for one counterparty and bucket.
+
+    Contract:
+        Frozen dataclass produced by the caller from a grouped query.
+        ``overdue_amount`` is the portion of ``amount`` past due.
+    Non-goals:
+        - Does not carry the underlying documents; detail is optional on
+          the report.
+    """
+
+    counterparty_id: str | UUID | None
+    bucket_name: str
+    amount: Money
+    overdue_amount: Money
+    item_count: int
+
+
+@dataclass(frozen=True)
+class _AgingSummary:
+    """Aggregates computed once per report (see ``AgingReport._summary``)."""
+
+    item_count: int
+    total: Money | None
+    overdue: Money | None
+    by_bucket: dict[str, Money]
+    by_counterparty: dict[str | UUID, dict[str, Money]]
+
+
 @dataclass(frozen=True)
 class AgingReport:
     """
     Complete aging report.
 
     Contract:
-        Frozen dataclass containing a snapshot aging report.
+        Frozen dataclass containing a snapshot aging report.  Totals come
+        from ``bucket_totals`` when supplied (database-aggregated report,
+        ``items`` optional detail) and otherwise from ``items``.
     Guarantees:
         - ``total_amount()`` equals the sum of all item amounts.
         - ``total_by_bucket()`` covers every bucket in ``self.buckets``.
+        - Totals are computed on first access and cached; the returned
+          dicts are copies.
     Non-goals:
         - Does not enforce single-currency across items; mixed currencies
           will cause ``Money`` addition to raise.
@@ -175,22 +216,56 @@ class AgingReport:
     items: tuple[AgedItem, ...]
     report_type: str = "standard"  # "AP", "AR", "inventory"
     currency: str | None = None
+    bucket_totals: tuple[AgingBucketTotal, ...] = ()
+
+    @cached_property
+    def _summary(self) -> _AgingSummary:
+        if self.bucket_totals:
+            rows = [
+                (t.counterparty_id, t.bucket_name, t.amount, t.overdue_amount, t.item_count)
+                for t in self.bucket_totals
+            ]
+        else:
+            rows = [
+                (i.counterparty_id, i.bucket.name, i.amount,
+                 i.amount if i.is_overdue else None, 1)
+                for i in self.items
+            ]
+        if not rows:
+            return _AgingSummary(0, None, None, {}, {})
+
+        zero = Money.zero(rows[0][2].currency)
+        by_bucket = {b.name: zero for b in self.buckets}
+        by_counterparty: dict[str | UUID, dict[str, Money]] = {}
+        total = overdue = zero
+        count = 0
+
+        for counterparty_id, bucket_name, amount, overdue_amount, n in rows:
+            total = total + amount
+            count += n
+            if overdue_amount is not None:
+                overdue = overdue + overdue_amount
+            if bucket_name in by_bucket:
+                by_bucket[bucket_name] = by_bucket[bucket_name] + amount
+            if counterparty_id is not None:
+                if counterparty_id not in by_counterparty:
+                    by_counterparty[counterparty_id] = {b.name: zero for b in self.buckets}
+                current = by_counterparty[counterparty_id][bucket_name]
+                by_counterparty[counterparty_id][bucket_name] = current + amount
+
+        return _AgingSummary(count, total, overdue, by_bucket, by_counterparty)
+
+    def _zero(self) -> Money:
+        return Money.zero(self.currency or "USD")
 
     @property
     def item_count(self) -> int:
         """Total number of items in report."""
-        return len(self.items)
+        return self._summary.item_count
 
     def total_amount(self) -> Money:
         """Sum of all item amounts."""
-        if not self.items:
-            currency = self.currency or "USD"
-            return Money.zero(currency)
-
-        total = self.items[0].amount
-        for item in self.items[1:]:
-            total = total + item.amount
-        return total
+        return self._summary.total or self._zero()
 
     def total_by_bucket(self) -> dict[str, Money]:
         """
@@ -199,23 +274,7 @@ class AgingReport:
         Returns:
             Dict mapping bucket name to total amount
         """
-        if not self.items:
-            return {}
-
-        result: dict[str, Money] = {}
-        currency = self.items[0].amount.currency
-
-        for bucket in self.buckets:
-            bucket_items = [i for i in self.items if i.bucket.name == bucket.name]
-            if bucket_items:
-                total = bucket_items[0].amount
-                for item in bucket_items[1:]:
-                    total = total + item.amount
-                result[bucket.name] = total
-            else:
-                result[bucket.name] = Money.zero(currency)
-
-        return result
+        return dict(self._summary.by_bucket)
 
     def total_by_counterparty(self) -> dict[str | UUID, dict[str, Money]]:
         """
@@ -224,25 +283,10 @@ class AgingReport:
         Returns:
             Dict mapping counterparty_id to dict of bucket name to amount
         """
-        if not self.items:
-            return {}
-
-        result: dict[str | UUID, dict[str, Money]] = {}
-        currency = self.items[0].amount.currency
-
-        for item in self.items:
-            if item.counterparty_id is None:
-                continue
-
-            if item.counterparty_id not in result:
-                result[item.counterparty_id] = {
-                    b.name: Money.zero(currency) for b in self.buckets
-                }
-
-            current = result[item.counterparty_id][item.bucket.name]
-            result[item.counterparty_id][item.bucket.name] = current + item.amount
-
-        return result
+        return {
+            counterparty_id: dict(by_bucket)
+            for counterparty_id, by_bucket in self._summary.by_counterparty.items()
+        }
 
     def items_in_bucket(self, bucket_name: str) -> tuple[AgedItem, ...]:
         """Get all items in a specific bucket."""
@@ -261,15 +305,7 @@ class AgingReport:
 
     def overdue_amount(self) -> Money:
         """Total amount of overdue items."""
-        overdue = self.overdue_items()
-        if not overdue:
-            currency = self.currency or (self.items[0].amount.currency if self.items else "USD")
-            return Money.zero(currency)
-
-        total = overdue[0].amount
-        for item in overdue[1:]:
-            total = total + item.amount
-        return total
+        return self._summary.overdue or self._zero()
 
 
 class AgingCalculator:
@@ -549,3 +585,53 @@ class AgingCalculator:
             buckets=buckets,
             report_type=report_type,
         )
+
+    @traced_engine("aging", "1.0", fingerprint_fields=("totals", "as_of_date", "report_type"))
+    def generate_report_from_totals(
+        self,
+        totals: Sequence[AgingBucketTotal],
+        as_of_date: date,
+        buckets: Sequence[AgeBucket] | None = None,
+        report_type: str = "standard",
+        items: Sequence[AgedItem] = (),
+        currency: str | None = None,
+    ) -> AgingReport:
+        """
+        Generate an aging report from pre-aggregated bucket totals.
+
+        Used when bucket classification has already been done by the
+        database; ``items`` is optional detail for drill-down and does not
+        contribute to totals.  ``currency`` labels the report when
+        ``totals`` is empty.
+
+        Raises:
+            ValueError: If a total names a bucket not in ``buckets``.
+        """
+        if buckets is None:
+            buckets = self.DEFAULT_BUCKETS
+
+        names = {b.name for b in buckets}
+        for total in totals:
+            if total.bucket_name not in names:
+                raise ValueError(f"Unknown aging bucket: {total.bucket_name}")
+
+        if totals:
+            currency = totals[0].amount.currency.code
+
+        logger.info("aging_report_from_totals_generated", extra={
+            "as_of_date": as_of_date.isoformat(),
+            "report_type": report_type,
+            "group_count": len(totals),
+            "item_count": sum(t.item_count for t in totals),
+            "detail_count": len(items),
+            "currency": currency,
+        })
+
+        return AgingReport(
+            as_of_date=as_of_date,
+            buckets=tuple(buckets),
+            items=tuple(items),
+            report_type=report_type,
+            currency=currency,
+            bucket_totals=tuple(totals),
+        )
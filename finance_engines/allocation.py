@@ -12,7 +12,10 @@ Architecture position:
 Invariants enforced:
     - R4 (balance per currency): total_allocated + unallocated == source_amount.
     - R5 / R17 (rounding): rounding difference is deterministically assigned
-      to a single designated target so penny totals are preserved.
+      to a single designated target so penny totals are preserved.  The
+      optional largest-remainder policy instead hands residual minor units
+      out one each by descending remainder (ties: lowest index), which is
+      equally deterministic and equally exact.
     - R16 (ISO 4217): currency consistency enforced across targets and source.
     - Purity: no clock access, no I/O (R6).
 
@@ -21,6 +24,8 @@ Failure modes:
     - ValueError on zero total weight (weighted method).
     - ValueError on missing eligible_amount for pro-rata method.
     - ValueError on unknown allocation method.
+    - ValueError (matrix mode) on amounts finer than the currency's minor
+      unit, mixed currencies, or a weight vector summing to zero.
 
 Audit relevance:
     Allocation results feed journal line generation. The deterministic
@@ -29,7 +34,7 @@ Audit relevance:
 
 Usage:
     from finance_engines.allocation import AllocationEngine, AllocationTarget, AllocationMethod
-    from finance_kernel.domain.values import Money
+    from finance_kernel.domain.values import Currency, Money
 
     engine = AllocationEngine()
     result = engine.allocate(
@@ -40,11 +45,23 @@ Usage:
         ],
         method=AllocationMethod.PRORATA,
     )
+
+    # Matrix mode: spread M sources over N targets in one call, in integer
+    # minor units with largest-remainder rounding.
+    matrix = allocate_matrix(
+        sources=[("FRINGE", Money.of("35000.00", "USD")),
+                 ("OVERHEAD", Money.of("45000.00", "USD"))],
+        target_ids=["C-1", "C-2", "C-3"],
+        weights=[Decimal("120"), Decimal("80"), Decimal("40")],
+    )
+    matrix.amount(0, 2)   # FRINGE share of C-3
 """
 
 from __future__ import annotations
 
+import heapq
 import time
+from array import array
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import date
@@ -70,6 +87,13 @@ class AllocationMethod(str, Enum):
     EQUAL = "equal"  # Split evenly
 
 
+class RoundingPolicy(str, Enum):
+    """How ratio allocations distribute the rounding residual."""
+
+    DESIGNATED_TARGET = "designated_target"  # One target absorbs the residual
+    LARGEST_REMAINDER = "largest_remainder"  # One minor unit each by remainder
+
+
 @dataclass(frozen=True)
 class AllocationTarget:
     """
@@ -182,6 +206,7 @@ class AllocationEngine:
         targets: Sequence[AllocationTarget],
         method: AllocationMethod,
         rounding_target_index: int | None = None,
+        rounding_policy: RoundingPolicy = RoundingPolicy.DESIGNATED_TARGET,
     ) -> AllocationResult:
         """
         Allocate amount to targets using specified method.
@@ -191,6 +216,8 @@ class AllocationEngine:
             targets: Sequence of allocation targets
             method: Allocation method to use
             rounding_target_index: Which target gets rounding adjustment (default: last)
+            rounding_policy: Residual policy for PRORATA, WEIGHTED and EQUAL;
+                ``rounding_target_index`` only applies to DESIGNATED_TARGET
 
         Returns:
             AllocationResult with all allocation details
@@ -219,7 +246,9 @@ class AllocationEngine:
 
         match method:
             case AllocationMethod.PRORATA:
-                return self._allocate_prorata(amount, targets, rounding_target_index)
+                return self._allocate_prorata(
+                    amount, targets, rounding_target_index, rounding_policy,
+                )
             case AllocationMethod.FIFO:
                 return self._allocate_fifo(amount, targets)
             case AllocationMethod.LIFO:
@@ -227,9 +256,13 @@ class AllocationEngine:
             case AllocationMethod.SPECIFIC:
                 return self._allocate_specific(amount, targets)
             case AllocationMethod.WEIGHTED:
-                return self._allocate_weighted(amount, targets, rounding_target_index)
+                return self._allocate_weighted(
+                    amount, targets, rounding_target_index, rounding_policy,
+                )
             case AllocationMethod.EQUAL:
-                return self._allocate_equal(amount, targets, rounding_target_index)
+                return self._allocate_equal(
+                    amount, targets, rounding_target_index, rounding_policy,
+                )
             case _:
                 logger.error("allocation_unknown_method", extra={
                     "method": str(method),
@@ -241,9 +274,12 @@ class AllocationEngine:
         amount: Money,
         targets: Sequence[AllocationTarget],
         rounding_target_index: int | None = None,
+        rounding_policy: RoundingPolicy = RoundingPolicy.DESIGNATED_TARGET,
     ) -> AllocationResult:
         """Convenience method for pro-rata allocation."""
-        return self._allocate_prorata(amount, targets, rounding_target_index)
+        return self._allocate_prorata(
+            amount, targets, rounding_target_index, rounding_policy,
+        )
 
     def allocate_fifo(
         self,
@@ -258,15 +294,19 @@ class AllocationEngine:
         amount: Money,
         targets: Sequence[AllocationTarget],
         rounding_target_index: int | None = None,
+        rounding_policy: RoundingPolicy = RoundingPolicy.DESIGNATED_TARGET,
     ) -> AllocationResult:
         """Convenience method for equal allocation."""
-        return self._allocate_equal(amount, targets, rounding_target_index)
+        return self._allocate_equal(
+            amount, targets, rounding_target_index, rounding_policy,
+        )
 
     def _allocate_prorata(
         self,
         amount: Money,
         targets: Sequence[AllocationTarget],
         rounding_target_index: int | None,
+        rounding_policy: RoundingPolicy = RoundingPolicy.DESIGNATED_TARGET,
     ) -> AllocationResult:
         """Allocate proportionally by eligible amount."""
         # Calculate total eligible
@@ -306,8 +346,10 @@ class AllocationEngine:
             amount=amount,
             targets=targets,
             method=AllocationMethod.PRORATA,
-            get_ratio=lambda t: t.eligible_amount.amount / total_eligible,
+            weights=[t.eligible_amount.amount for t in targets],
+            total_weight=total_eligible,
             rounding_target_index=rounding_target_index,
+            rounding_policy=rounding_policy,
         )
 
     def _allocate_weighted(
@@ -315,6 +357,7 @@ class AllocationEngine:
         amount: Money,
         targets: Sequence[AllocationTarget],
         rounding_target_index: int | None,
+        rounding_policy: RoundingPolicy = RoundingPolicy.DESIGNATED_TARGET,
     ) -> AllocationResult:
         """Allocate by explicit weight factors."""
         total_weight = sum(t.weight for t in targets)
@@ -326,8 +369,10 @@ class AllocationEngine:
             amount=amount,
             targets=targets,
             method=AllocationMethod.WEIGHTED,
-            get_ratio=lambda t: t.weight / total_weight,
+            weights=[t.weight for t in targets],
+            total_weight=total_weight,
             rounding_target_index=rounding_target_index,
+            rounding_policy=rounding_policy,
         )
 
     def _allocate_equal(
@@ -335,6 +380,7 @@ class AllocationEngine:
         amount: Money,
         targets: Sequence[AllocationTarget],
         rounding_target_index: int | None,
+        rounding_policy: RoundingPolicy = RoundingPolicy.DESIGNATED_TARGET,
     ) -> AllocationResult:
         """Allocate equally to all targets."""
         count = len(targets)
@@ -342,8 +388,10 @@ class AllocationEngine:
             amount=amount,
             targets=targets,
             method=AllocationMethod.EQUAL,
-            get_ratio=lambda t: Decimal("1") / Decimal(str(count)),
+            weights=[Decimal("1")] * count,
+            total_weight=Decimal(str(count)),
             rounding_target_index=rounding_target_index,
+            rounding_policy=rounding_policy,
         )
 
     def _allocate_by_ratio(
@@ -351,45 +399,61 @@ class AllocationEngine:
         amount: Money,
         targets: Sequence[AllocationTarget],
         method: AllocationMethod,
-        get_ratio: callable,
+        weights: Sequence[Decimal],
+        total_weight: Decimal,
         rounding_target_index: int | None,
+        rounding_policy: RoundingPolicy = RoundingPolicy.DESIGNATED_TARGET,
     ) -> AllocationResult:
         """Common logic for ratio-based allocations.
 
         Preconditions:
-            - ``targets`` is non-empty.
-            - ``get_ratio`` returns a Decimal in [0, 1] for each target
-              and the ratios sum to 1.
+            - ``targets`` is non-empty and ``weights`` is parallel to it.
+            - ``total_weight`` is ``sum(weights)`` and is non-zero.
         Postconditions:
-            - Sum of all ``allocated`` amounts == ``amount`` (the rounding
-              target absorbs the penny residual).
+            - Sum of all ``allocated`` amounts == ``amount`` before any
+              eligible-amount cap (the rounding residual is assigned per
+              ``rounding_policy``).
         Raises:
-            - No direct raises; delegates to ``Money`` arithmetic.
+            - ValueError (largest remainder) if ``amount`` is finer than the
+              currency's minor unit.
         """
-        if rounding_target_index is None:
-            rounding_target_index = len(targets) - 1
-
         # INVARIANT: R17 — rounding precision derived from currency decimal places
         currency = amount.currency
         decimal_places = Decimal(10) ** -currency.decimal_places
-        lines: list[AllocationLine] = []
-        allocated_so_far = Decimal("0")
 
-        for i, target in enumerate(targets):
-            is_rounding_target = i == rounding_target_index
+        # Each ratio is computed once; the naive (independently rounded)
+        # split is both the DESIGNATED_TARGET basis and the reference for
+        # rounding_adjustment.
+        naive = [
+            (amount.amount * (w / total_weight)).quantize(
+                decimal_places, rounding=ROUND_HALF_UP
+            )
+            for w in weights
+        ]
+        naive_total = sum(naive, Decimal("0"))
+
+        if rounding_policy == RoundingPolicy.LARGEST_REMAINDER:
+            places = currency.decimal_places
+            units = largest_remainder_split(
+                _to_minor_units(amount.amount, places), _integer_weights(weights),
+            )
+            allocations = [Decimal(u).scaleb(-places) for u in units]
+        else:
+            if rounding_target_index is None:
+                rounding_target_index = len(targets) - 1
+            # INVARIANT: R5 — rounding difference assigned to exactly one target
+            # Rounding target gets remainder
+            allocations = list(naive)
+            allocations[rounding_target_index] = amount.amount - (
+                naive_total - naive[rounding_target_index]
+            )
 
-            if is_rounding_target:
-                # INVARIANT: R5 — rounding difference assigned to exactly one target
-                # Rounding target gets remainder
-                allocated_amount = amount.amount - allocated_so_far
-            else:
-                ratio = get_ratio(target)
-                allocated_amount = (amount.amount * ratio).quantize(
-                    decimal_places, rounding=ROUND_HALF_UP
-                )
-                allocated_so_far += allocated_amount
+        zero = Money.zero(currency)
+        lines: list[AllocationLine] = []
+        total_allocated = Decimal("0")
 
-            allocated_money = Money.of(allocated_amount, currency)
+        for target, allocated_amount in zip(targets, allocations):
+            allocated_money = Money(allocated_amount, currency)
 
             # Calculate remaining on target
             if target.eligible_amount is not None:
@@ -397,12 +461,13 @@ class AllocationEngine:
                 if remaining.amount < Decimal("0"):
                     # Over-allocated: cap at eligible, track excess
                     allocated_money = target.eligible_amount
-                    remaining = Money.zero(currency)
+                    remaining = zero
                 is_fully = remaining.is_zero
             else:
-                remaining = Money.zero(currency)
+                remaining = zero
                 is_fully = True
 
+            total_allocated += allocated_money.amount
             lines.append(
                 AllocationLine(
                     target_id=target.target_id,
@@ -413,11 +478,7 @@ class AllocationEngine:
                 )
             )
 
-        total_allocated = sum(
-            (line.allocated.amount for line in lines),
-            Decimal("0"),
-        )
-        total_allocated_money = Money.of(total_allocated, currency)
+        total_allocated_money = Money(total_allocated, currency)
         unallocated = amount - total_allocated_money
 
         # INVARIANT: R4 — total_allocated + unallocated == source_amount
@@ -427,14 +488,11 @@ class AllocationEngine:
         )
 
         # Calculate rounding adjustment (difference from naive allocation)
-        naive_total = sum(
-            (amount.amount * get_ratio(t)).quantize(decimal_places, rounding=ROUND_HALF_UP)
-            for t in targets
-        )
         rounding_adjustment = Money.of(amount.amount - naive_total, currency)
 
         logger.info("allocation_by_ratio_completed", extra={
             "method": method.value,
+            "rounding_policy": rounding_policy.value,
             "source_amount": str(amount.amount),
             "total_allocated": str(total_allocated),
             "unallocated": str(unallocated.amount),
@@ -561,3 +619,189 @@ class AllocationEngine:
             unallocated=unallocated,
             rounding_adjustment=Money.zero(currency),  # No rounding in sequential
         )
+
+
+# =============================================================================
+# Integer minor-unit core and matrix mode
+# =============================================================================
+
+
+def _to_minor_units(amount: Decimal, decimal_places: int) -> int:
+    """Exact integer minor units for ``amount`` (e.g. cents for USD)."""
+    scaled = amount.scaleb(decimal_places)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(
+            f"Amount {amount} has more precision than {decimal_places} "
+            f"decimal places"
+        )
+    return int(scaled)
+
+
+def _integer_weights(weights: Sequence[Decimal | int]) -> list[int]:
+    """Scale non-negative Decimal weights to integers with the same ratios."""
+    places = 0
+    for w in weights:
+        if isinstance(w, Decimal):
+            exponent = w.as_tuple().exponent
+            if isinstance(exponent, int) and -exponent > places:
+                places = -exponent
+    result = [int(Decimal(w).scaleb(places)) for w in weights]
+    if any(w < 0 for w in result):
+        raise ValueError("Weight cannot be negative")
+    return result
+
+
+def largest_remainder_split(total_units: int, weights: Sequence[int]) -> list[int]:
+    """
+    Split ``total_units`` integer minor units in proportion to ``weights``.
+
+    Each target first receives ``floor(total * w / W)``; the residual units
+    (always fewer than the number of targets) go one each to the targets
+    with the largest remainders, ties broken by lowest index.  Targets with
+    zero weight never receive a unit.
+
+    Pure function, exact integer arithmetic.
+
+    Guarantees:
+        - ``sum(result) == total_units`` (R4), for negative totals too.
+        - Identical inputs give identical splits (R5 / R6).
+
+    Raises:
+        ValueError: If the weights sum to zero.
+    """
+    weight_total = sum(weights)
+    if weight_total == 0:
+        raise ValueError("Total weight cannot be zero")
+
+    shares: list[int] = []
+    remainders: list[int] = []
+    for w in weights:
+        q, r = divmod(total_units * w, weight_total)
+        shares.append(q)
+        remainders.append(r)
+
+    residual = total_units - sum(shares)
+    if residual:
+        # nlargest matches a stable sorted(..., reverse=True): equal
+        # remainders keep index order.
+        for i in heapq.nlargest(residual, range(len(shares)), key=remainders.__getitem__):
+            shares[i] += 1
+    return shares
+
+
+@dataclass(frozen=True, eq=False)
+class AllocationMatrix:
+    """
+    Result of a matrix allocation: M sources spread over N targets.
+
+    Contract:
+        ``rows[s][t]`` is the allocation of source ``s`` to target ``t`` in
+        integer minor units of ``currency``, held as compact ``array('q')``
+        rows rather than one ``Money`` per cell.
+    Guarantees:
+        - ``sum(rows[s]) == minor units of source s`` for every row (R4).
+    Non-goals:
+        - Does not build journal lines; callers read cells as ``Money`` on
+          demand.
+    """
+
+    currency: Currency
+    source_ids: tuple[str | UUID, ...]
+    target_ids: tuple[str | UUID, ...]
+    rows: tuple[array, ...]
+
+    def _money(self, units: int) -> Money:
+        return Money(Decimal(units).scaleb(-self.currency.decimal_places), self.currency)
+
+    def amount(self, source_index: int, target_index: int) -> Money:
+        """Allocation of one source to one target."""
+        return self._money(self.rows[source_index][target_index])
+
+    def row(self, source_index: int) -> tuple[Money, ...]:
+        """All target allocations for one source."""
+        return tuple(self._money(u) for u in self.rows[source_index])
+
+    def source_totals(self) -> tuple[Money, ...]:
+        """Allocated total per source (equals each source amount)."""
+        return tuple(self._money(sum(r)) for r in self.rows)
+
+    def target_totals(self) -> tuple[Money, ...]:
+        """Total received per target across all sources."""
+        if not self.rows:
+            return tuple(self._money(0) for _ in self.target_ids)
+        return tuple(self._money(sum(col)) for col in zip(*self.rows))
+
+
+@traced_engine("allocation_matrix", "1.0", fingerprint_fields=("sources",))
+def allocate_matrix(
+    sources: Sequence[tuple[str | UUID, Money]],
+    target_ids: Sequence[str | UUID],
+    weights: Sequence[Decimal] | Sequence[Sequence[Decimal]],
+) -> AllocationMatrix:
+    """
+    Allocate M source amounts across N targets in one pass.
+
+    Pure function.  Works in integer minor units with largest-remainder
+    rounding (see ``largest_remainder_split``), so a full indirect-cost
+    spread to tens of thousands of cost objects allocates every penny
+    exactly without a ``Money`` or ``AllocationLine`` per cell.
+
+    Args:
+        sources: ``(source_id, amount)`` pairs, all in one currency.
+        target_ids: The N targets, in output column order.
+        weights: Either one length-N weight vector shared by every source,
+            or M length-N vectors (one per source, in source order).
+
+    Returns:
+        AllocationMatrix with one row per source.
+
+    Raises:
+        ValueError: On mixed currencies, sub-minor-unit amounts, shape
+            mismatch, negative weights, or a weight vector summing to zero.
+    """
+    if not sources:
+        raise ValueError("At least one source is required")
+    currency = sources[0][1].currency
+    places = currency.decimal_places
+    n = len(target_ids)
+
+    shared = not weights or not isinstance(weights[0], Sequence)
+    if shared:
+        shared_weights = _integer_weights(weights)
+        row_weights = None
+    else:
+        if len(weights) != len(sources):
+            raise ValueError(
+                f"Expected {len(sources)} weight vectors, got {len(weights)}"
+            )
+        shared_weights = None
+        row_weights = [_integer_weights(w) for w in weights]
+
+    rows: list[array] = []
+    for s, (source_id, amount) in enumerate(sources):
+        if amount.currency != currency:
+            raise ValueError(
+                f"Currency mismatch: {amount.currency} vs {currency}"
+            )
+        w = shared_weights if shared else row_weights[s]
+        if len(w) != n:
+            raise ValueError(
+                f"Source {source_id}: expected {n} weights, got {len(w)}"
+            )
+        rows.append(array("q", largest_remainder_split(
+            _to_minor_units(amount.amount, places), w,
+        )))
+
+    logger.info("allocation_matrix_completed", extra={
+        "source_count": len(sources),
+        "target_count": n,
+        "shared_weights": shared,
+        "currency": currency.code,
+    })
+
+    return AllocationMatrix(
+        currency=currency,
+        source_ids=tuple(sid for sid, _ in sources),
+        target_ids=tuple(target_ids),
+        rows=tuple(rows),
+    )
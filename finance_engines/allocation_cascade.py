@@ -55,6 +55,14 @@ Usage:
     }
 
     results, final_balances = execute_cascade(steps, balances, rates, "USD")
+
+    # Spread every pool the cascade filled over the cost objects in one
+    # matrix allocation (one weight vector per pool).
+    matrix = spread_cascade_results(
+        results,
+        target_ids=contract_ids,
+        target_bases={"FRINGE": labor_by_contract, "OVERHEAD": ..., "G&A": ...},
+    )
 """
 
 from __future__ import annotations
@@ -64,6 +72,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 
+from finance_engines.allocation import AllocationMatrix, allocate_matrix
 from finance_engines.tracer import traced_engine
 from finance_kernel.domain.values import Money
 from finance_kernel.logging_config import get_logger
@@ -288,6 +297,46 @@ def execute_cascade(
     return results, balances
 
 
+def spread_cascade_results(
+    results: Sequence[AllocationStepResult],
+    target_ids: Sequence[str],
+    target_bases: dict[str, Sequence[Decimal]],
+) -> AllocationMatrix:
+    """
+    Spread each cascade step's allocated amount over cost objects.
+
+    Pure function.  One matrix row per step result (source id is the
+    step's ``pool_to``), weighted by that pool's per-target base, so the
+    whole indirect-cost spread runs as a single ``allocate_matrix`` call
+    in integer minor units with largest-remainder rounding.
+
+    Args:
+        results: Step results from ``execute_cascade``
+        target_ids: Cost objects (e.g. contracts), in output column order
+        target_bases: Per-target allocation base by ``pool_to``
+            (e.g. direct labor by contract for FRINGE)
+
+    Returns:
+        AllocationMatrix whose rows sum exactly to each step's
+        ``amount_allocated``.
+
+    Raises:
+        ValueError: If a step's ``pool_to`` has no base in ``target_bases``,
+            or any ``allocate_matrix`` precondition fails.
+    """
+    missing = sorted({
+        r.step.pool_to for r in results if r.step.pool_to not in target_bases
+    })
+    if missing:
+        raise ValueError(f"No allocation base for pools: {missing}")
+
+    return allocate_matrix(
+        sources=[(r.step.pool_to, r.amount_allocated) for r in results],
+        target_ids=target_ids,
+        weights=[target_bases[r.step.pool_to] for r in results],
+    )
+
+
 def build_dcaa_cascade() -> tuple[AllocationStep, ...]:
     """
     Build standard DCAA indirect cost allocation cascade.
@@ -0,0 +1,331 @@
+"""
+finance_engines.fx -- Indexed FX rate store and trial-balance translation.
+
+Responsibility:
+    Hold exchange rates in memory indexed by (from, to) currency pair with
+    effective dates kept sorted for ``bisect`` lookup; resolve any pair
+    directly, by inverse, or by triangulation through a base currency; and
+    compute time-weighted average rates.  On top of the store, translate a
+    complete multi-currency trial balance into a presentation currency in
+    one pass (ASC 830 current-rate method), producing per-account
+    translated balances and the cumulative translation adjustment (CTA)
+    per source currency.
+
+Architecture position:
+    Engines -- pure calculation layer, zero I/O.
+    May only import finance_kernel/domain/values and finance_kernel.exceptions.
+    Rates are loaded by the caller (``ExchangeRateSelector`` in the kernel)
+    and handed in as ``FxRatePoint`` values; ``GLService`` owns caching the
+    store and posting the CTA.
+
+Invariants enforced:
+    - R6 (replay safety): identical rates and balances produce identical
+      output; no clock access.
+    - Lookup returns the latest rate effective on or before the as-of date;
+      later rates on the same date replace earlier ones.
+    - Each source currency's balances sum to zero before translation (R4),
+      so the translated sum per currency is exactly that currency's CTA;
+      after the CTA is booked the translated trial balance balances.
+    - Decimal-only arithmetic; translated amounts are quantized to
+      ``places`` with ROUND_HALF_UP.
+
+Failure modes:
+    - ExchangeRateNotFoundError when no direct, inverse, or triangulated
+      rate exists on or before the requested date.
+    - ValueError for an unknown account type, non-positive rate, or an
+      average-rate window whose end precedes its start.
+
+Audit relevance:
+    Every translated line records the rate type (closing, average,
+    historical) and the rate applied, so the CTA can be re-derived line by
+    line from the trial balance and the rate table.
+
+Usage:
+    store = FxRateStore(points, base_currency="USD")
+    store.rate("EUR", "GBP", date(2025, 6, 30))
+    translation = translate_trial_balance(
+        balances, store, "USD", as_of=date(2025, 6, 30),
+        period_start=date(2025, 1, 1),
+    )
+    translation.cta_amount
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+from finance_kernel.exceptions import ExchangeRateNotFoundError
+from finance_kernel.logging_config import get_logger
+
+logger = get_logger("engines.fx")
+
+RATE_CLOSING = "closing"
+RATE_AVERAGE = "average"
+RATE_HISTORICAL = "historical"
+
+# ASC 830 current-rate method: balance sheet at closing, income statement at
+# average, equity at historical rates.
+_RATE_TYPE_BY_ACCOUNT_TYPE = {
+    "asset": RATE_CLOSING,
+    "liability": RATE_CLOSING,
+    "equity": RATE_HISTORICAL,
+    "revenue": RATE_AVERAGE,
+    "expense": RATE_AVERAGE,
+}
+
+_ONE = Decimal("1")
+
+
+@dataclass(frozen=True)
+class FxRatePoint:
+    """One directional rate: 1 ``from_currency`` = ``rate`` ``to_currency``."""
+
+    from_currency: str
+    to_currency: str
+    effective_date: date
+    rate: Decimal
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(
+                f"Exchange rate must be positive: {self.from_currency}/"
+                f"{self.to_currency} {self.rate}"
+            )
+
+
+class FxRateStore:
+    """
+    In-memory rate table indexed by currency pair with bisectable dates.
+
+    Contract:
+        ``rate(from, to, as_of)`` resolves, in order: identity, a direct
+        quote, the inverse of the opposite quote, then triangulation
+        ``from -> base -> to`` using the same rules for each leg.
+        Construction is O(n log n); each lookup is O(log n).
+    """
+
+    def __init__(self, points: Iterable[FxRatePoint], base_currency: str = "USD") -> None:
+        self.base_currency = base_currency
+        series: dict[tuple[str, str], dict[date, Decimal]] = {}
+        for point in points:
+            series.setdefault(
+                (point.from_currency, point.to_currency), {},
+            )[point.effective_date] = point.rate
+        self._dates: dict[tuple[str, str], list[date]] = {}
+        self._rates: dict[tuple[str, str], list[Decimal]] = {}
+        for pair, by_date in series.items():
+            ordered = sorted(by_date)
+            self._dates[pair] = ordered
+            self._rates[pair] = [by_date[d] for d in ordered]
+
+    @property
+    def pairs(self) -> tuple[tuple[str, str], ...]:
+        return tuple(sorted(self._dates))
+
+    def __len__(self) -> int:
+        return sum(len(d) for d in self._dates.values())
+
+    def _quote(self, pair: tuple[str, str], as_of: date) -> Decimal | None:
+        dates = self._dates.get(pair)
+        if not dates:
+            return None
+        i = bisect_right(dates, as_of)
+        return self._rates[pair][i - 1] if i else None
+
+    def _leg(self, from_currency: str, to_currency: str, as_of: date) -> Decimal | None:
+        if from_currency == to_currency:
+            return _ONE
+        direct = self._quote((from_currency, to_currency), as_of)
+        if direct is not None:
+            return direct
+        inverse = self._quote((to_currency, from_currency), as_of)
+        if inverse is not None:
+            return _ONE / inverse
+        return None
+
+    def find_rate(self, from_currency: str, to_currency: str, as_of: date) -> Decimal | None:
+        """Rate effective on ``as_of``, or None when it cannot be resolved."""
+        rate = self._leg(from_currency, to_currency, as_of)
+        if rate is not None:
+            return rate
+        base = self.base_currency
+        if base in (from_currency, to_currency):
+            return None
+        to_base = self._leg(from_currency, base, as_of)
+        from_base = self._leg(base, to_currency, as_of)
+        if to_base is None or from_base is None:
+            return None
+        return to_base * from_base
+
+    def rate(self, from_currency: str, to_currency: str, as_of: date) -> Decimal:
+        """Rate effective on ``as_of``; raises ExchangeRateNotFoundError."""
+        rate = self.find_rate(from_currency, to_currency, as_of)
+        if rate is None:
+            raise ExchangeRateNotFoundError(from_currency, to_currency, as_of.isoformat())
+        return rate
+
+    def average_rate(
+        self, from_currency: str, to_currency: str, start: date, end: date,
+    ) -> Decimal:
+        """
+        Time-weighted (per calendar day) average rate over ``[start, end]``.
+
+        The window is split at every date on which a quote used by the pair
+        (direct, inverse, or either triangulation leg) changes, so the cost
+        is O(k log n) in the number of rate changes, not in days.
+        """
+        if end < start:
+            raise ValueError(f"Average-rate window ends before it starts: {start}..{end}")
+        if from_currency == to_currency:
+            return _ONE
+        involved = {from_currency, to_currency, self.base_currency}
+        breaks = {start}
+        for (a, b), dates in self._dates.items():
+            if a in involved and b in involved:
+                lo = bisect_right(dates, start)
+                hi = bisect_right(dates, end)
+                breaks.update(dates[lo:hi])
+        edges = sorted(breaks) + [end + timedelta(days=1)]
+
+        weighted = Decimal("0")
+        for seg_start, seg_end in zip(edges, edges[1:]):
+            days = (seg_end - seg_start).days
+            weighted += self.rate(from_currency, to_currency, seg_start) * days
+        return weighted / ((end - start).days + 1)
+
+
+# ---------------------------------------------------------------------------
+# Trial-balance translation
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class TranslationInput:
+    """One trial-balance line in its transaction currency (debit-positive)."""
+
+    account_code: str
+    account_type: str
+    currency: str
+    balance: Decimal
+
+
+@dataclass(frozen=True)
+class TranslatedBalance:
+    """A trial-balance line translated into the presentation currency."""
+
+    account_code: str
+    account_type: str
+    currency: str
+    balance: Decimal
+    rate_type: str
+    rate: Decimal
+    translated: Decimal
+
+
+@dataclass(frozen=True)
+class TrialBalanceTranslation:
+    """Whole-trial-balance translation result with CTA per source currency."""
+
+    target_currency: str
+    as_of: date
+    period_start: date
+    lines: tuple[TranslatedBalance, ...]
+    cta_by_currency: tuple[tuple[str, Decimal], ...]
+
+    @property
+    def cta_amount(self) -> Decimal:
+        """Net CTA; positive is a credit to CTA equity (translation gain)."""
+        return sum((amount for _, amount in self.cta_by_currency), Decimal("0"))
+
+    @property
+    def translated_total(self) -> Decimal:
+        """Debit-positive sum of translated lines (equals ``cta_amount``)."""
+        return sum((line.translated for line in self.lines), Decimal("0"))
+
+    def by_account(self) -> dict[str, Decimal]:
+        totals: dict[str, Decimal] = {}
+        for line in self.lines:
+            totals[line.account_code] = (
+                totals.get(line.account_code, Decimal("0")) + line.translated
+            )
+        return totals
+
+
+def translate_trial_balance(
+    balances: Iterable[TranslationInput],
+    store: FxRateStore,
+    target_currency: str,
+    as_of: date,
+    period_start: date,
+    historical_rates: Mapping[tuple[str, str], Decimal] | None = None,
+    places: int = 2,
+) -> TrialBalanceTranslation:
+    """
+    Translate every trial-balance line into ``target_currency`` in one pass.
+
+    Closing and average rates are resolved once per source currency.
+    ``historical_rates`` maps (account_code, currency) to the rate at which
+    an equity balance was originally translated; equity lines without one
+    fall back to the closing rate (and so contribute no CTA).
+    """
+    historical_rates = historical_rates or {}
+    quantum = Decimal(1).scaleb(-places)
+    closing: dict[str, Decimal] = {}
+    average: dict[str, Decimal] = {}
+    cta: dict[str, Decimal] = {}
+    lines: list[TranslatedBalance] = []
+
+    for item in balances:
+        rate_type = _RATE_TYPE_BY_ACCOUNT_TYPE.get(item.account_type)
+        if rate_type is None:
+            raise ValueError(
+                f"Unknown account type {item.account_type!r} for {item.account_code}"
+            )
+        ccy = item.currency
+        if ccy not in closing:
+            closing[ccy] = store.rate(ccy, target_currency, as_of)
+        if rate_type == RATE_AVERAGE:
+            if ccy not in average:
+                average[ccy] = store.average_rate(ccy, target_currency, period_start, as_of)
+            rate = average[ccy]
+        elif rate_type == RATE_HISTORICAL:
+            rate = historical_rates.get((item.account_code, ccy))
+            if rate is None:
+                rate_type, rate = RATE_CLOSING, closing[ccy]
+        else:
+            rate = closing[ccy]
+
+        translated = (item.balance * rate).quantize(quantum, rounding=ROUND_HALF_UP)
+        lines.append(TranslatedBalance(
+            account_code=item.account_code,
+            account_type=item.account_type,
+            currency=ccy,
+            balance=item.balance,
+            rate_type=rate_type,
+            rate=rate,
+            translated=translated,
+        ))
+        cta[ccy] = cta.get(ccy, Decimal("0")) + translated
+
+    result = TrialBalanceTranslation(
+        target_currency=target_currency,
+        as_of=as_of,
+        period_start=period_start,
+        lines=tuple(lines),
+        cta_by_currency=tuple(sorted(
+            (ccy, amount) for ccy, amount in cta.items()
+            if ccy != target_currency
+        )),
+    )
+    logger.info("fx_trial_balance_translated", extra={
+        "target_currency": target_currency,
+        "as_of": as_of.isoformat(),
+        "line_count": len(lines),
+        "currency_count": len(closing),
+        "cta_amount": str(result.cta_amount),
+    })
+    return result
@@ -47,6 +47,15 @@ DCAA ICE Schedules produced:
     - Schedule I: Cumulative Allowable Cost Summary by Contract
     - Schedule J: Contract Ceiling/Funding Comparison
 
+Incremental compilation:
+    Schedules H and I share one set of per-contract lines, computed once
+    per compilation with each pool's base rule resolved once.  A caller
+    that recompiles after edits can pass an ``ICELineCache``; lines are
+    memoised by their full (frozen) inputs, so only contracts whose costs
+    changed are recomputed and results are identical to a cold compile.
+    An optional ``concurrent.futures.Executor`` compiles the independent
+    schedules and contract-line chunks concurrently.
+
 Usage:
     from finance_engines.ice import (
         compile_ice_submission,
@@ -76,10 +85,12 @@ from __future__ import annotations
 
 import time
 from collections.abc import Sequence
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
+from itertools import repeat
 
 from finance_engines.tracer import traced_engine
 from finance_kernel.domain.values import Money
@@ -95,6 +106,9 @@ logger = get_logger("engines.ice")
 _TWO_PLACES = Decimal("0.01")
 _SIX_PLACES = Decimal("0.000001")
 
+# Contracts per executor task when compiling Schedule H/I lines.
+_CONTRACT_CHUNK = 256
+
 
 class ICEScheduleType(str, Enum):
     """ICE schedule identifiers."""
@@ -597,11 +611,18 @@ class ICESubmission:
 
 
 @traced_engine("ice", "1.0", fingerprint_fields=("ice_input",))
-def compile_ice_submission(ice_input: ICEInput) -> ICESubmission:
+def compile_ice_submission(
+    ice_input: ICEInput,
+    *,
+    line_cache: ICELineCache | None = None,
+    executor: Executor | None = None,
+) -> ICESubmission:
     """
     Compile a complete ICE submission from input data.
 
     Pure function -- no side effects, no I/O, deterministic output.
+    ``line_cache`` and ``executor`` only change how the result is
+    computed, never the result.
 
     Preconditions:
         ice_input is a valid ICEInput with non-empty contract_costs and
@@ -617,6 +638,10 @@ def compile_ice_submission(ice_input: ICEInput) -> ICESubmission:
 
     Args:
         ice_input: Complete ICE input data
+        line_cache: Optional per-contract Schedule H/I line memo, reused
+            across compilations so unchanged contracts are not recomputed
+        executor: Optional executor; Schedules A, B, C, G, J and chunks
+            of contract lines are submitted to it concurrently
 
     Returns:
         ICESubmission with all schedules and validation findings
@@ -635,18 +660,33 @@ def compile_ice_submission(ice_input: ICEInput) -> ICESubmission:
         "currency": currency,
     })
 
-    # Compile individual schedules
-    schedule_a = compile_schedule_a(ice_input.contract_costs, currency)
-    schedule_b = compile_schedule_b(ice_input.labor_details, currency)
-    schedule_c = compile_schedule_c(ice_input.other_direct_costs, currency)
-    schedule_g = compile_schedule_g(ice_input.indirect_pools, currency)
-    schedule_h = compile_schedule_h(
-        ice_input.contract_costs, ice_input.indirect_pools, currency
+    # Compile individual schedules.  A, B, C, G and J are independent of
+    # each other and of the contract lines shared by H and I.
+    independent = (
+        (compile_schedule_a, ice_input.contract_costs),
+        (compile_schedule_b, ice_input.labor_details),
+        (compile_schedule_c, ice_input.other_direct_costs),
+        (compile_schedule_g, ice_input.indirect_pools),
+        (compile_schedule_j, ice_input.contract_ceilings),
     )
-    schedule_i = compile_schedule_i(
-        ice_input.contract_costs, ice_input.indirect_pools, currency
+    if executor is None:
+        schedule_a, schedule_b, schedule_c, schedule_g, schedule_j = (
+            fn(data, currency) for fn, data in independent
+        )
+    else:
+        futures = [executor.submit(fn, data, currency) for fn, data in independent]
+
+    contract_lines = _compile_contract_lines(
+        ice_input.contract_costs, ice_input.indirect_pools, currency,
+        line_cache=line_cache, executor=executor,
     )
-    schedule_j = compile_schedule_j(ice_input.contract_ceilings, currency)
+    schedule_h = _assemble_schedule_h(contract_lines, currency)
+    schedule_i = _assemble_schedule_i(contract_lines, currency)
+
+    if executor is not None:
+        schedule_a, schedule_b, schedule_c, schedule_g, schedule_j = (
+            f.result() for f in futures
+        )
 
     # Calculate totals
     total_unallowable_direct = ice_input.total_unallowable_direct or zero
@@ -983,35 +1023,9 @@ def compile_schedule_h(
     Returns:
         ScheduleH with indirect costs allocated to each contract
     """
-    lines: list[ScheduleHLine] = []
-    total_indirect = Decimal("0")
-
-    for cc in contract_costs:
-        for pool in indirect_pools:
-            # Determine allocation base for this pool
-            base = _get_pool_allocation_base(cc, pool.pool_name, currency)
-            applied = (base.amount * pool.claimed_rate).quantize(
-                _TWO_PLACES, rounding=ROUND_HALF_UP
-            )
-
-            lines.append(ScheduleHLine(
-                contract_number=cc.contract_number,
-                pool_name=pool.pool_name,
-                allocation_base=base,
-                claimed_rate=pool.claimed_rate,
-                applied_amount=Money.of(applied, currency),
-            ))
-
-            total_indirect += applied
-
-    logger.info("schedule_h_compiled", extra={
-        "line_count": len(lines),
-        "total_indirect_applied": str(total_indirect),
-    })
-
-    return ScheduleH(
-        lines=tuple(lines),
-        total_indirect_applied=Money.of(total_indirect, currency),
+    return _assemble_schedule_h(
+        _compile_contract_lines(contract_costs, indirect_pools, currency),
+        currency,
     )
 
 
@@ -1034,7 +1048,40 @@ def compile_schedule_i(
     Returns:
         ScheduleI with total claimed costs per contract
     """
-    zero = Money.zero(currency)
+    return _assemble_schedule_i(
+        _compile_contract_lines(contract_costs, indirect_pools, currency),
+        currency,
+    )
+
+
+def _assemble_schedule_h(
+    contract_lines: Sequence[_ContractIndirectLines],
+    currency: str,
+) -> ScheduleH:
+    """Build Schedule H from precompiled per-contract lines."""
+    lines: list[ScheduleHLine] = []
+    total_indirect = Decimal("0")
+
+    for cl in contract_lines:
+        lines.extend(cl.h_lines)
+        total_indirect += cl.i_line.total_indirect.amount
+
+    logger.info("schedule_h_compiled", extra={
+        "line_count": len(lines),
+        "total_indirect_applied": str(total_indirect),
+    })
+
+    return ScheduleH(
+        lines=tuple(lines),
+        total_indirect_applied=Money.of(total_indirect, currency),
+    )
+
+
+def _assemble_schedule_i(
+    contract_lines: Sequence[_ContractIndirectLines],
+    currency: str,
+) -> ScheduleI:
+    """Build Schedule I from precompiled per-contract lines."""
     lines: list[ScheduleILine] = []
 
     gt_direct = Decimal("0")
@@ -1043,40 +1090,15 @@ def compile_schedule_i(
     gt_fee = Decimal("0")
     gt_claimed = Decimal("0")
 
-    for cc in contract_costs:
-        total_direct = cc.total_direct
-
-        # Calculate total indirect for this contract
-        contract_indirect = Decimal("0")
-        for pool in indirect_pools:
-            base = _get_pool_allocation_base(cc, pool.pool_name, currency)
-            applied = (base.amount * pool.claimed_rate).quantize(
-                _TWO_PLACES, rounding=ROUND_HALF_UP
-            )
-            contract_indirect += applied
-
-        total_indirect = Money.of(contract_indirect, currency)
-        total_cost = Money.of(total_direct.amount + contract_indirect, currency)
-
-        # Fee is zero in ICE (claimed separately)
-        fee = zero
-        total_claimed = total_cost
-
-        lines.append(ScheduleILine(
-            contract_number=cc.contract_number,
-            contract_type=cc.contract_type,
-            total_direct=total_direct,
-            total_indirect=total_indirect,
-            total_cost=total_cost,
-            fee=fee,
-            total_claimed=total_claimed,
-        ))
+    for cl in contract_lines:
+        line = cl.i_line
+        lines.append(line)
 
-        gt_direct += total_direct.amount
-        gt_indirect += contract_indirect
-        gt_cost += total_cost.amount
-        gt_fee += fee.amount
-        gt_claimed += total_claimed.amount
+        gt_direct += line.total_direct.amount
+        gt_indirect += line.total_indirect.amount
+        gt_cost += line.total_cost.amount
+        gt_fee += line.fee.amount
+        gt_claimed += line.total_claimed.amount
 
     logger.info("schedule_i_compiled", extra={
         "contract_count": len(lines),
@@ -1165,13 +1187,14 @@ def compile_schedule_j(
 # ============================================================================
 
 
-def _get_pool_allocation_base(
-    contract_cost: ContractCostInput,
-    pool_name: str,
-    currency: str,
-) -> Money:
+_BASE_DIRECT_LABOR = "direct_labor"
+_BASE_TOTAL_DIRECT = "total_direct"
+_BASE_DIRECT_MATERIAL = "direct_material"
+
+
+def _pool_base_kind(pool_name: str) -> str:
     """
-    Determine the allocation base for a contract and indirect pool.
+    Resolve which contract cost an indirect pool is allocated over.
 
     Standard DCAA pool base rules:
     - FRINGE: Applied to direct labor
@@ -1180,30 +1203,187 @@ def _get_pool_allocation_base(
     - MATERIAL_HANDLING: Applied to direct material
 
     Pure function.
-
-    Args:
-        contract_cost: Contract's direct costs
-        pool_name: Name of the indirect pool
-        currency: Currency code
-
-    Returns:
-        Money representing the allocation base
     """
-    zero = Money.zero(currency)
     pool_upper = pool_name.upper()
 
     if pool_upper == "FRINGE":
-        return contract_cost.direct_labor
+        return _BASE_DIRECT_LABOR
     elif pool_upper == "OVERHEAD":
         # Labor + fringe (but we don't cascade here - that's Schedule I's job)
-        return contract_cost.direct_labor
+        return _BASE_DIRECT_LABOR
     elif pool_upper in ("G&A", "GA", "G_AND_A"):
-        return contract_cost.total_direct
+        return _BASE_TOTAL_DIRECT
     elif pool_upper in ("MATERIAL_HANDLING", "MAT_HANDLING"):
-        return contract_cost.direct_material or zero
+        return _BASE_DIRECT_MATERIAL
     else:
         # Default: apply to total direct costs
-        return contract_cost.total_direct
+        return _BASE_TOTAL_DIRECT
+
+
+# ============================================================================
+# Per-Contract Indirect Lines (Schedules H and I)
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class _ContractIndirectLines:
+    """
+    One contract's Schedule H lines and its Schedule I line.
+
+    The unit of memoisation in ``ICELineCache``: it depends only on the
+    contract's ``ContractCostInput``, the indirect pools, and currency.
+    """
+
+    h_lines: tuple[ScheduleHLine, ...]
+    i_line: ScheduleILine
+
+
+class ICELineCache:
+    """
+    Memo of per-contract Schedule H/I lines across ICE compilations.
+
+    Contract:
+        Lines are keyed by the contract's frozen ``ContractCostInput`` under
+        the compilation's (indirect pools, currency) fingerprint.  A hit
+        returns exactly what recomputation would, so passing a cache never
+        changes an ICE result.
+
+    Guarantees:
+        - Editing one contract's costs recomputes only that contract's
+          lines on the next compilation.
+        - Changing any indirect pool (rate, name, order) or the currency
+          invalidates every line.
+        - After each compilation only lines for that compilation's
+          contracts are retained, so the cache does not grow across edits.
+
+    Non-goals:
+        - Not thread-safe: use one cache per compilation at a time.
+    """
+
+    __slots__ = ("_fingerprint", "_lines", "hits", "misses")
+
+    def __init__(self) -> None:
+        self._fingerprint: tuple | None = None
+        self._lines: dict[ContractCostInput, _ContractIndirectLines] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+
+def _compile_contract_lines(
+    contract_costs: Sequence[ContractCostInput],
+    indirect_pools: Sequence[IndirectPoolInput],
+    currency: str,
+    *,
+    line_cache: ICELineCache | None = None,
+    executor: Executor | None = None,
+) -> list[_ContractIndirectLines]:
+    """
+    Compile Schedule H/I lines for every contract, in contract order.
+
+    Each pool's base rule is resolved once, not once per contract.  Cache
+    misses are computed inline, or in chunks of ``_CONTRACT_CHUNK``
+    contracts on ``executor`` when one is given.
+    """
+    pools = tuple(indirect_pools)
+    base_kinds = tuple(_pool_base_kind(pool.pool_name) for pool in pools)
+
+    cached: dict[ContractCostInput, _ContractIndirectLines] = {}
+    if line_cache is not None:
+        fingerprint = (pools, currency)
+        if line_cache._fingerprint == fingerprint:
+            cached = line_cache._lines
+        line_cache._fingerprint = fingerprint
+
+    missing = list(dict.fromkeys(cc for cc in contract_costs if cc not in cached))
+    if executor is not None and len(missing) > _CONTRACT_CHUNK:
+        chunks = [
+            missing[i:i + _CONTRACT_CHUNK]
+            for i in range(0, len(missing), _CONTRACT_CHUNK)
+        ]
+        computed = [
+            lines
+            for chunk_lines in executor.map(
+                _compile_contract_chunk,
+                chunks,
+                repeat(pools),
+                repeat(base_kinds),
+                repeat(currency),
+            )
+            for lines in chunk_lines
+        ]
+    else:
+        computed = _compile_contract_chunk(missing, pools, base_kinds, currency)
+
+    retained = {cc: cached[cc] for cc in contract_costs if cc in cached}
+    retained.update(zip(missing, computed))
+
+    if line_cache is not None:
+        line_cache._lines = retained
+        line_cache.hits = len(contract_costs) - len(missing)
+        line_cache.misses = len(missing)
+        logger.debug("ice_contract_lines_compiled", extra={
+            "contract_count": len(contract_costs),
+            "cache_hits": line_cache.hits,
+            "cache_misses": line_cache.misses,
+        })
+
+    return [retained[cc] for cc in contract_costs]
+
+
+def _compile_contract_chunk(
+    contract_costs: Sequence[ContractCostInput],
+    pools: tuple[IndirectPoolInput, ...],
+    base_kinds: tuple[str, ...],
+    currency: str,
+) -> list[_ContractIndirectLines]:
+    """Compile Schedule H/I lines for a chunk of contracts. Pure function."""
+    zero = Money.zero(currency)
+    result: list[_ContractIndirectLines] = []
+
+    for cc in contract_costs:
+        total_direct = cc.total_direct
+        bases = {
+            _BASE_DIRECT_LABOR: cc.direct_labor,
+            _BASE_TOTAL_DIRECT: total_direct,
+            _BASE_DIRECT_MATERIAL: cc.direct_material or zero,
+        }
+
+        h_lines: list[ScheduleHLine] = []
+        contract_indirect = Decimal("0")
+        for pool, kind in zip(pools, base_kinds):
+            base = bases[kind]
+            applied = (base.amount * pool.claimed_rate).quantize(
+                _TWO_PLACES, rounding=ROUND_HALF_UP
+            )
+            h_lines.append(ScheduleHLine(
+                contract_number=cc.contract_number,
+                pool_name=pool.pool_name,
+                allocation_base=base,
+                claimed_rate=pool.claimed_rate,
+                applied_amount=Money.of(applied, currency),
+            ))
+            contract_indirect += applied
+
+        total_cost = Money.of(total_direct.amount + contract_indirect, currency)
+
+        # Fee is zero in ICE (claimed separately)
+        result.append(_ContractIndirectLines(
+            h_lines=tuple(h_lines),
+            i_line=ScheduleILine(
+                contract_number=cc.contract_number,
+                contract_type=cc.contract_type,
+                total_direct=total_direct,
+                total_indirect=Money.of(contract_indirect, currency),
+                total_cost=total_cost,
+                fee=zero,
+                total_claimed=total_cost,
+            ),
+        ))
+
+    return result
 
 
 # ============================================================================
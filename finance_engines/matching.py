@@ -48,6 +48,7 @@ Usage:
 
 from __future__ import annotations
 
+import logging
 import time
 from collections.abc import Sequence
 from dataclasses import dataclass, field
@@ -241,9 +242,12 @@ class MatchingEngine:
         })
 
         suggestions: list[MatchSuggestion] = []
+        log_candidates = logger.isEnabledFor(logging.DEBUG)
 
         for candidate in candidates:
-            suggestion = self._evaluate_match(target, candidate, tolerance)
+            suggestion = self._evaluate_match(
+                target, candidate, tolerance, log_candidates
+            )
             if suggestion.score > Decimal("0"):
                 suggestions.append(suggestion)
 
@@ -255,7 +259,7 @@ class MatchingEngine:
             "target_document_id": str(target.document_id),
             "candidates_evaluated": len(candidates),
             "suggestions_found": len(sorted_suggestions),
-            "top_score": str(sorted_suggestions[0].score) if sorted_suggestions else "0",
+            "top_score": sorted_suggestions[0].score if sorted_suggestions else "0",
             "duration_ms": duration_ms,
         })
 
@@ -340,7 +344,7 @@ class MatchingEngine:
         logger.info("match_creation_completed", extra={
             "match_type": match_type.value,
             "status": status.value,
-            "matched_amount": str(matched_amount.amount),
+            "matched_amount": matched_amount.amount,
             "document_count": len(documents),
             "has_price_variance": price_variance is not None,
             "has_quantity_variance": quantity_variance is not None,
@@ -387,14 +391,21 @@ class MatchingEngine:
         target: MatchCandidate,
         candidate: MatchCandidate,
         tolerance: MatchTolerance,
+        log_evaluation: bool = True,
     ) -> MatchSuggestion:
-        """Evaluate how well two documents match."""
-        logger.debug("match_evaluation_started", extra={
-            "target_id": str(target.document_id),
-            "candidate_id": str(candidate.document_id),
-            "target_type": target.document_type,
-            "candidate_type": candidate.document_type,
-        })
+        """Evaluate how well two documents match.
+
+        log_evaluation: callers scoring many candidates pass the result of one
+        ``isEnabledFor`` check so the per-candidate extra is never built when
+        DEBUG is off.
+        """
+        if log_evaluation and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("match_evaluation_started", extra={
+                "target_id": target.document_id,
+                "candidate_id": candidate.document_id,
+                "target_type": target.document_type,
+                "candidate_type": candidate.document_type,
+            })
 
         score = Decimal("100")
         notes: list[str] = []
@@ -7,6 +7,8 @@ Pure validation functions for DCAA-compliant rate management:
 
 * D8 -- labor rate verification against approved schedules and contract
   ceilings (FAR 31.201-3)
+* ``RateScheduleIndex`` -- interval index over schedules and ceilings for
+  batch verification of a whole pay period (``verify_labor_rates``)
 * Provisional-to-final indirect rate reconciliation
 
 Architecture position
@@ -29,14 +31,18 @@ Failure modes
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
+from typing import Generic, TypeVar
 from uuid import UUID
 
 from finance_modules.contracts.rate_types import (
     ContractRateCeiling,
     IndirectRateRecord,
     IndirectRateType,
+    LaborChargeLine,
     LaborRateSchedule,
     RateReconciliationRecord,
     RateSource,
@@ -108,6 +114,114 @@ def find_contract_ceiling(
     return None
 
 
+# ---------------------------------------------------------------------------
+# Interval index
+# ---------------------------------------------------------------------------
+
+_T = TypeVar("_T", LaborRateSchedule, ContractRateCeiling)
+
+
+class _EffectiveIntervals(Generic[_T]):
+    """Effective-date intervals for one key, bisectable by ``effective_from``.
+
+    Lookup returns exactly what a linear scan of the original tuple would:
+    the earliest-positioned item effective on the date.  When the key's
+    intervals do not overlap (the normal case) that is the single item
+    whose ``effective_from`` is the last one <= the date; overlapping
+    intervals fall back to checking every item that has already started.
+    """
+
+    __slots__ = ("_starts", "_items", "_positions", "_disjoint")
+
+    def __init__(self, positioned: list[tuple[int, _T]]):
+        ordered = sorted(positioned, key=lambda p: (p[1].effective_from, p[0]))
+        self._starts = [item.effective_from for _, item in ordered]
+        self._items = [item for _, item in ordered]
+        self._positions = [pos for pos, _ in ordered]
+        self._disjoint = all(
+            prev.effective_to is not None and prev.effective_to < nxt.effective_from
+            for prev, nxt in zip(self._items, self._items[1:])
+        )
+
+    def find(self, as_of: date) -> _T | None:
+        hi = bisect_right(self._starts, as_of)
+        if hi == 0:
+            return None
+        if self._disjoint:
+            item = self._items[hi - 1]
+            return item if item.is_effective(as_of) else None
+        best: _T | None = None
+        best_pos = -1
+        for i in range(hi):
+            item = self._items[i]
+            if item.is_effective(as_of) and (best is None or self._positions[i] < best_pos):
+                best, best_pos = item, self._positions[i]
+        return best
+
+
+def _group_intervals(
+    items: Iterable[_T], key_of,
+) -> dict[tuple, _EffectiveIntervals[_T]]:
+    grouped: dict[tuple, list[tuple[int, _T]]] = {}
+    for pos, item in enumerate(items):
+        grouped.setdefault(key_of(item), []).append((pos, item))
+    return {key: _EffectiveIntervals(group) for key, group in grouped.items()}
+
+
+class RateScheduleIndex:
+    """Prebuilt lookup over rate schedules and contract ceilings (D8).
+
+    Built once per verification run.  Schedules are keyed by
+    (employee_classification, labor_category) and ceilings by
+    (contract_id, labor_category); each key holds effective-date intervals
+    that are bisected per lookup, so verifying N charge lines against S
+    schedule rows costs O(S log S + N log S) instead of O(N * S).
+
+    Results are identical to ``find_applicable_rate`` /
+    ``find_contract_ceiling`` over the same tuples.
+    """
+
+    __slots__ = ("_rates", "_ceilings")
+
+    def __init__(
+        self,
+        rate_schedule: Iterable[LaborRateSchedule],
+        contract_ceilings: Iterable[ContractRateCeiling] = (),
+    ):
+        self._rates = _group_intervals(
+            rate_schedule,
+            lambda s: (s.employee_classification, s.labor_category),
+        )
+        self._ceilings = _group_intervals(
+            contract_ceilings,
+            lambda c: (c.contract_id, c.labor_category),
+        )
+
+    @property
+    def has_ceilings(self) -> bool:
+        return bool(self._ceilings)
+
+    def find_rate(
+        self,
+        employee_classification: str,
+        labor_category: str,
+        as_of_date: date,
+    ) -> LaborRateSchedule | None:
+        """Indexed equivalent of ``find_applicable_rate``."""
+        intervals = self._rates.get((employee_classification, labor_category))
+        return intervals.find(as_of_date) if intervals is not None else None
+
+    def find_ceiling(
+        self,
+        contract_id: UUID,
+        labor_category: str,
+        as_of_date: date,
+    ) -> ContractRateCeiling | None:
+        """Indexed equivalent of ``find_contract_ceiling``."""
+        intervals = self._ceilings.get((contract_id, labor_category))
+        return intervals.find(as_of_date) if intervals is not None else None
+
+
 # ---------------------------------------------------------------------------
 # D8: Labor rate verification (FAR 31.201-3)
 # ---------------------------------------------------------------------------
@@ -148,7 +262,66 @@ def verify_labor_rate(
     approved = find_applicable_rate(
         employee_classification, labor_category, rate_schedule, charge_date,
     )
+    ceiling: ContractRateCeiling | None = None
+    if approved is not None and contract_id is not None and contract_ceilings:
+        ceiling = find_contract_ceiling(
+            contract_id, labor_category, contract_ceilings, charge_date,
+        )
+    return _verify_against(
+        employee_id, employee_classification, labor_category, charged_rate,
+        approved, ceiling, contract_id, charge_date,
+    )
 
+
+def verify_labor_rates(
+    lines: Iterable[LaborChargeLine],
+    index: RateScheduleIndex,
+) -> tuple[RateVerificationResult, ...]:
+    """Verify a batch of labor charges (e.g. a whole pay period) (D8).
+
+    Same checks and results as calling ``verify_labor_rate`` per line with
+    the schedules and ceilings the index was built from, but each lookup
+    is a dict hit plus a bisect.
+
+    Args:
+        lines: Labor charge lines to verify.
+        index: Prebuilt index over the applicable schedules and ceilings.
+
+    Returns:
+        One RateVerificationResult per line, in input order.
+    """
+    check_ceilings = index.has_ceilings
+    results: list[RateVerificationResult] = []
+    for line in lines:
+        approved = index.find_rate(
+            line.employee_classification, line.labor_category, line.charge_date,
+        )
+        ceiling: ContractRateCeiling | None = None
+        if approved is not None and check_ceilings and line.contract_id is not None:
+            ceiling = index.find_ceiling(
+                line.contract_id, line.labor_category, line.charge_date,
+            )
+        results.append(
+            _verify_against(
+                line.employee_id, line.employee_classification,
+                line.labor_category, line.charged_rate, approved, ceiling,
+                line.contract_id, line.charge_date,
+            )
+        )
+    return tuple(results)
+
+
+def _verify_against(
+    employee_id: UUID,
+    employee_classification: str,
+    labor_category: str,
+    charged_rate: Decimal,
+    approved: LaborRateSchedule | None,
+    ceiling: ContractRateCeiling | None,
+    contract_id: UUID | None,
+    charge_date: date,
+) -> RateVerificationResult:
+    """Apply the D8 checks once the approved rate and ceiling are resolved."""
     if approved is None:
         return RateVerificationResult(
             is_valid=False,
@@ -187,28 +360,24 @@ def verify_labor_rate(
 
     # Step 4: Check contract ceiling
     ceiling_rate: Decimal | None = None
-    if contract_id is not None and contract_ceilings:
-        ceiling = find_contract_ceiling(
-            contract_id, labor_category, contract_ceilings, charge_date,
-        )
-        if ceiling is not None:
-            ceiling_rate = ceiling.max_loaded_rate or ceiling.max_hourly_rate
-            if charged_rate > ceiling_rate:
-                excess = charged_rate - ceiling_rate
-                return RateVerificationResult(
-                    is_valid=False,
-                    employee_id=employee_id,
-                    charged_rate=charged_rate,
-                    approved_rate=approved.loaded_rate,
-                    ceiling_rate=ceiling_rate,
-                    excess_amount=excess,
-                    violation_type=RateViolationType.EXCEEDS_CONTRACT_CEILING,
-                    message=(
-                        f"Charged rate ({charged_rate}) exceeds contract "
-                        f"ceiling ({ceiling_rate}) for labor category "
-                        f"'{labor_category}' on contract {contract_id}."
-                    ),
-                )
+    if ceiling is not None:
+        ceiling_rate = ceiling.max_loaded_rate or ceiling.max_hourly_rate
+        if charged_rate > ceiling_rate:
+            excess = charged_rate - ceiling_rate
+            return RateVerificationResult(
+                is_valid=False,
+                employee_id=employee_id,
+                charged_rate=charged_rate,
+                approved_rate=approved.loaded_rate,
+                ceiling_rate=ceiling_rate,
+                excess_amount=excess,
+                violation_type=RateViolationType.EXCEEDS_CONTRACT_CEILING,
+                message=(
+                    f"Charged rate ({charged_rate}) exceeds contract "
+                    f"ceiling ({ceiling_rate}) for labor category "
+                    f"'{labor_category}' on contract {contract_id}."
+                ),
+            )
 
     # All checks passed
     return RateVerificationResult(
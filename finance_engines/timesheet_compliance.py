@@ -7,7 +7,8 @@ Pure validation functions for DCAA-compliant timekeeping:
 
 * D1 -- daily recording enforcement (FAR 31.201-2(d))
 * D3 -- total time accounting (CAS 418)
-* D4 -- concurrent work overlap detection (CAS 418)
+* D4 -- concurrent work overlap detection (CAS 418), per employee or
+  for a whole pay period in one pass
 * D5 -- correction by reversal validation (R10)
 
 Architecture position
@@ -30,7 +31,9 @@ Failure modes
 
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import date, time, timedelta
 from decimal import Decimal
 from uuid import UUID
@@ -39,6 +42,7 @@ from finance_modules.payroll.dcaa_types import (
     ChargeType,
     ConcurrentWorkCheck,
     TimesheetEntry,
+    TimesheetSubmission,
     TotalTimeRecord,
 )
 
@@ -184,6 +188,7 @@ def validate_total_time_accounting(
 
 def detect_concurrent_overlaps(
     entries: tuple[TimesheetEntry, ...],
+    employee_id: UUID | None = None,
 ) -> ConcurrentWorkCheck:
     """Detect overlapping time entries on different charge codes.
 
@@ -191,67 +196,112 @@ def detect_concurrent_overlaps(
     at the same time.  This checks for time range overlaps when
     start_time and end_time are provided.
 
+    Each work date is swept in start-time order, keeping only the entries
+    still open at the current start time, so a day costs O(n log n) plus
+    the number of overlapping pairs rather than O(n^2) comparisons.
+
     Args:
-        entries: All time entries to check (should be for one employee,
-            one work_date).
+        entries: All time entries to check for one employee (any number
+            of work dates).
+        employee_id: Employee the entries belong to.  ``TimesheetEntry``
+            carries no employee, so when omitted the first entry's id is
+            reported in its place.
 
     Returns:
-        ConcurrentWorkCheck with overlap details.
+        ConcurrentWorkCheck with overlap details.  Pairs are ordered as the
+        entries appear in ``entries``.
     """
     if not entries:
         return ConcurrentWorkCheck(
-            employee_id=entries[0].entry_id if entries else UUID(int=0),
+            employee_id=employee_id or UUID(int=0),
             work_date=date(1970, 1, 1),
             is_valid=True,
         )
 
-    # Group entries by work_date
-    by_date: dict[date, list[TimesheetEntry]] = defaultdict(list)
-    for entry in entries:
-        by_date[entry.work_date].append(entry)
-
-    employee_id = entries[0].entry_id  # placeholder if no entries
-    overlaps: list[tuple[UUID, UUID]] = []
-
-    for work_date_key, day_entries in by_date.items():
-        employee_id = day_entries[0].entry_id
-
-        # Check for time range overlaps between different charge codes
-        timed_entries = [
-            e for e in day_entries
-            if e.start_time is not None and e.end_time is not None
-        ]
+    # Group entry positions by work_date
+    by_date: dict[date, list[int]] = defaultdict(list)
+    for position, entry in enumerate(entries):
+        by_date[entry.work_date].append(position)
 
-        for i in range(len(timed_entries)):
-            for j in range(i + 1, len(timed_entries)):
-                a = timed_entries[i]
-                b = timed_entries[j]
-
-                # Skip if same charge code (working on same project is OK)
-                if a.charge_code == b.charge_code:
-                    continue
-
-                # Check time overlap
-                if _times_overlap(a.start_time, a.end_time, b.start_time, b.end_time):
-                    overlaps.append((a.entry_id, b.entry_id))
+    overlaps: list[tuple[int, int]] = []
+    for positions in by_date.values():
+        overlaps.extend(_sweep_day_overlaps(entries, positions))
+    overlaps.sort()
 
     total_hours = sum((e.hours for e in entries), Decimal("0"))
 
     return ConcurrentWorkCheck(
-        employee_id=entries[0].entry_id,
+        employee_id=employee_id or entries[0].entry_id,
         work_date=entries[0].work_date,
         is_valid=len(overlaps) == 0,
-        overlapping_entries=tuple(overlaps),
+        overlapping_entries=tuple(
+            (entries[i].entry_id, entries[j].entry_id) for i, j in overlaps
+        ),
         total_hours=total_hours,
     )
 
 
-def _times_overlap(
-    start_a: time, end_a: time,
-    start_b: time, end_b: time,
-) -> bool:
-    """Check if two time ranges overlap (assumes same day, no midnight crossing)."""
-    return start_a < end_b and start_b < end_a
+def detect_pay_period_overlaps(
+    submissions: Iterable[TimesheetSubmission],
+) -> dict[UUID, ConcurrentWorkCheck]:
+    """Run D4 for every employee in a pay period in one pass.
+
+    Entries from all of an employee's submissions (e.g. one per work week)
+    are checked together, so overlaps are found regardless of how the
+    period was split into submissions.
+
+    Args:
+        submissions: Timesheet submissions for the period, any employees,
+            any order.
+
+    Returns:
+        ``{employee_id: ConcurrentWorkCheck}`` in first-seen employee order.
+    """
+    by_employee: dict[UUID, list[TimesheetEntry]] = {}
+    for submission in submissions:
+        by_employee.setdefault(submission.employee_id, []).extend(
+            submission.entries
+        )
+    return {
+        employee_id: detect_concurrent_overlaps(tuple(entries), employee_id)
+        for employee_id, entries in by_employee.items()
+    }
+
+
+def _sweep_day_overlaps(
+    entries: tuple[TimesheetEntry, ...],
+    positions: list[int],
+) -> list[tuple[int, int]]:
+    """Overlapping (i, j) position pairs, i < j, among one day's entries.
+
+    Entries are half-open ``[start, end)`` intervals, so back-to-back
+    entries do not overlap and a zero-length entry (end == start) covers no
+    time and is skipped.  Timed entries are visited by start time.  A
+    min-heap keyed on end time holds the entries still open; anything
+    ending at or before the current start cannot overlap it or any later
+    entry and is dropped.
+    """
+    timed = sorted(
+        (
+            (entries[p].start_time, p)
+            for p in positions
+            if entries[p].start_time is not None
+            and entries[p].end_time is not None
+            and entries[p].end_time > entries[p].start_time
+        ),
+    )
+    pairs: list[tuple[int, int]] = []
+    active: list[tuple[time, int]] = []  # (end_time, position)
+    for start, p in timed:
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        code = entries[p].charge_code
+        for _, q in active:
+            # Same charge code is OK (working on same project)
+            if entries[q].charge_code != code:
+                pairs.append((q, p) if q < p else (p, q))
+        heapq.heappush(active, (entries[p].end_time, p))
+    return pairs
 
 
 # ---------------------------------------------------------------------------
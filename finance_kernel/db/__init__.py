@@ -1,12 +1,18 @@
 """Database layer - engine, base classes, types, and audit."""
 
 from finance_kernel.db.base import UUID, Base, TrackedBase, UUIDString
-from finance_kernel.db.engine import create_tables, get_engine, get_session
+from finance_kernel.db.engine import (
+    create_tables,
+    get_engine,
+    get_read_session,
+    get_session,
+)
 from finance_kernel.db.types import Currency, Money, PayloadHash, Sequence
 
 __all__ = [
     "get_engine",
     "get_session",
+    "get_read_session",
     "create_tables",
     "Base",
     "TrackedBase",
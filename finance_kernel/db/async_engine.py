@@ -0,0 +1,109 @@
+"""Async SQLAlchemy engine and session factory for read-only query workloads.
+
+Built on ``sqlalchemy.ext.asyncio`` with the asyncpg driver (optional
+dependency: ``pip install .[async]``).  Posting stays on the synchronous
+engine in ``engine.py``; the async engine serves concurrent reads such as
+report sections and traces, each on its own pooled connection.
+"""
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from finance_kernel.logging_config import get_logger
+
+logger = get_logger("db.async_engine")
+
+ASYNC_DRIVER = "postgresql+asyncpg"
+
+# Module-level async engine and session factory
+_async_engine: AsyncEngine | None = None
+_AsyncSessionFactory: async_sessionmaker[AsyncSession] | None = None
+
+
+def to_async_url(database_url: str) -> str:
+    """Rewrite a PostgreSQL URL (any sync driver) to use asyncpg."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        raise ValueError(f"Async engine requires PostgreSQL, got {url.drivername!r}")
+    return url.set(drivername=ASYNC_DRIVER).render_as_string(hide_password=False)
+
+
+def init_async_engine_from_url(
+    database_url: str,
+    echo: bool = False,
+    pool_size: int = 10,
+    max_overflow: int = 5,
+    pool_pre_ping: bool = True,
+    pool_timeout: int = 30,
+    pool_recycle: int = 1800,
+) -> AsyncEngine:
+    """Initialize the async engine from a PostgreSQL database URL.
+
+    Raises ImportError when asyncpg is not installed.
+    """
+    global _async_engine, _AsyncSessionFactory
+
+    try:
+        import asyncpg  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "The async read API requires asyncpg: pip install asyncpg"
+        ) from exc
+
+    _async_engine = create_async_engine(
+        to_async_url(database_url),
+        echo=echo,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=pool_pre_ping,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        isolation_level="READ COMMITTED",
+    )
+    _AsyncSessionFactory = async_sessionmaker(bind=_async_engine, expire_on_commit=False)
+
+    logger.info(
+        "async_engine_initialized",
+        extra={
+            "dialect": "postgresql",
+            "driver": "asyncpg",
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+        },
+    )
+
+    return _async_engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the current async engine instance."""
+    if _async_engine is None:
+        raise RuntimeError(
+            "Async engine not initialized. Call init_async_engine_from_url() first."
+        )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the async session factory for creating sessions."""
+    if _AsyncSessionFactory is None:
+        raise RuntimeError(
+            "Async engine not initialized. Call init_async_engine_from_url() first."
+        )
+    return _AsyncSessionFactory
+
+
+async def reset_async_engine() -> None:
+    """Dispose the async engine and drop the session factory."""
+    global _async_engine, _AsyncSessionFactory
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+    _AsyncSessionFactory = None
@@ -1,14 +1,34 @@
-"""SQLAlchemy engine initialization, session factory, and transactional scope."""
+"""SQLAlchemy engine initialization, session factory, and transactional scope.
+
+An optional second engine points at a read replica.  ``get_read_session``
+routes read-only selector and reporting workloads to it when the replica has
+applied the primary's journal up to the allowed lag, measured on
+``journal_entries.seq`` (R9), and falls back to the primary otherwise.  The
+primary's watermark is cached for a short TTL so replica reads do not each
+cost a primary round trip.
+
+The primary engine's pool is an ``InstrumentedQueuePool`` with
+``PoolTelemetry`` attached (checkout wait, hold time per caller, overflow and
+timeouts; see pool_telemetry.py), optionally resized by an
+``AdaptivePoolPolicy``.
+"""
 
 import atexit
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
+from finance_kernel.db.pool_telemetry import (
+    AdaptivePoolPolicy,
+    InstrumentedQueuePool,
+    PoolTelemetry,
+)
 from finance_kernel.logging_config import configure_logging, get_logger
 
 logger = get_logger("db.engine")
@@ -16,6 +36,23 @@ logger = get_logger("db.engine")
 # Module-level engine and session factory
 _engine: Engine | None = None
 _SessionFactory: sessionmaker[Session] | None = None
+_pool_telemetry: PoolTelemetry | None = None
+
+# Optional read replica engine and session factory
+_replica_engine: Engine | None = None
+_ReplicaSessionFactory: sessionmaker[Session] | None = None
+_replica_max_lag: int = 0
+
+# Primary journal watermark as (seq, monotonic read time); reused for
+# _watermark_ttl seconds by get_read_session.
+_primary_watermark: tuple[int, float] | None = None
+_watermark_ttl: float = 1.0
+
+# Highest posted journal sequence; served backwards from idx_journal_seq.
+_JOURNAL_WATERMARK_SQL = text(
+    "SELECT seq FROM journal_entries WHERE seq IS NOT NULL "
+    "ORDER BY seq DESC LIMIT 1"
+)
 
 
 def init_engine_from_url(
@@ -26,14 +63,23 @@ def init_engine_from_url(
     pool_pre_ping: bool = True,
     pool_timeout: int = 30,
     pool_recycle: int = 1800,
+    adaptive_pool: AdaptivePoolPolicy | None = None,
 ) -> Engine:
-    """Initialize the SQLAlchemy engine from a PostgreSQL database URL."""
-    global _engine, _SessionFactory
+    """Initialize the SQLAlchemy engine from a PostgreSQL database URL.
+
+    Pool telemetry is always collected (``get_pool_telemetry()``).  With
+    ``adaptive_pool`` the pool starts at ``pool_size`` clamped to the
+    policy's bounds and is resized from measured checkout waits.
+    """
+    global _engine, _SessionFactory, _pool_telemetry
+
+    if adaptive_pool is not None:
+        pool_size = min(max(pool_size, adaptive_pool.min_size), adaptive_pool.max_size)
 
     _engine = create_engine(
         database_url,
         echo=echo,
-        poolclass=QueuePool,
+        poolclass=InstrumentedQueuePool,
         pool_size=pool_size,
         max_overflow=max_overflow,
         pool_pre_ping=pool_pre_ping,
@@ -43,6 +89,7 @@ def init_engine_from_url(
     )
 
     _SessionFactory = sessionmaker(bind=_engine, expire_on_commit=False)
+    _pool_telemetry = PoolTelemetry(_engine, adaptive=adaptive_pool)
 
     configure_logging()
     logger.info(
@@ -51,6 +98,7 @@ def init_engine_from_url(
             "dialect": "postgresql",
             "pool_size": pool_size,
             "max_overflow": max_overflow,
+            "adaptive_pool": adaptive_pool is not None,
             "echo": echo,
         },
     )
@@ -65,6 +113,11 @@ def get_engine() -> Engine:
     return _engine
 
 
+def get_pool_telemetry() -> PoolTelemetry | None:
+    """Pool telemetry of the primary engine, or None before initialization."""
+    return _pool_telemetry
+
+
 def get_session() -> Session:
     """Get a new session instance."""
     if _SessionFactory is None:
@@ -83,6 +136,197 @@ def get_session_factory() -> sessionmaker[Session]:
     return _SessionFactory
 
 
+def init_replica_engine_from_url(
+    database_url: str,
+    echo: bool = False,
+    pool_size: int = 10,
+    max_overflow: int = 5,
+    pool_pre_ping: bool = True,
+    pool_timeout: int = 30,
+    pool_recycle: int = 1800,
+    max_lag: int = 0,
+    watermark_ttl: float = 1.0,
+) -> Engine:
+    """Initialize the read replica engine used by ``get_read_session``.
+
+    Replica transactions are READ ONLY at REPEATABLE READ, so every query in
+    a read session sees the snapshot the lag check was made against.
+    ``max_lag`` is the default number of journal entries the replica may
+    trail the primary by before reads fall back to the primary.
+    ``watermark_ttl`` is how many seconds a primary watermark read is reused
+    for lag checks (0 reads it for every read session).
+    """
+    global _replica_engine, _ReplicaSessionFactory, _replica_max_lag
+    global _primary_watermark, _watermark_ttl
+
+    if max_lag < 0:
+        raise ValueError(f"max_lag must be non-negative, got {max_lag}")
+    if watermark_ttl < 0:
+        raise ValueError(f"watermark_ttl must be non-negative, got {watermark_ttl}")
+
+    _replica_engine = create_engine(
+        database_url,
+        echo=echo,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=pool_pre_ping,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        isolation_level="REPEATABLE READ",
+        execution_options={"postgresql_readonly": True},
+    )
+    _ReplicaSessionFactory = sessionmaker(bind=_replica_engine, expire_on_commit=False)
+    _replica_max_lag = max_lag
+    _primary_watermark = None
+    _watermark_ttl = watermark_ttl
+
+    logger.info(
+        "replica_engine_initialized",
+        extra={
+            "dialect": "postgresql",
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "max_lag": max_lag,
+            "watermark_ttl": watermark_ttl,
+        },
+    )
+
+    return _replica_engine
+
+
+def get_replica_engine() -> Engine | None:
+    """Get the read replica engine, or None when no replica is configured."""
+    return _replica_engine
+
+
+@dataclass(frozen=True)
+class ReplicaLag:
+    """Journal watermarks of the primary and the replica at one check."""
+
+    primary_seq: int
+    replica_seq: int
+
+    @property
+    def entries_behind(self) -> int:
+        return max(self.primary_seq - self.replica_seq, 0)
+
+
+def _journal_watermark(connection) -> int:
+    return connection.execute(_JOURNAL_WATERMARK_SQL).scalar() or 0
+
+
+def _read_primary_watermark(connection) -> int:
+    """Read the primary's watermark and refresh the cached value."""
+    global _primary_watermark
+
+    seq = _journal_watermark(connection)
+    _primary_watermark = (seq, time.monotonic())
+    return seq
+
+
+def _cached_primary_watermark() -> int | None:
+    """The cached primary watermark, or None once older than the TTL."""
+    cached = _primary_watermark
+    if cached is None or time.monotonic() - cached[1] > _watermark_ttl:
+        return None
+    return cached[0]
+
+
+def get_replica_lag() -> ReplicaLag:
+    """Compare the primary's and the replica's journal watermarks (live reads)."""
+    if _replica_engine is None:
+        raise RuntimeError(
+            "Replica not initialized. Call init_replica_engine_from_url() first."
+        )
+    with get_engine().connect() as primary, _replica_engine.connect() as replica:
+        return ReplicaLag(
+            primary_seq=_read_primary_watermark(primary),
+            replica_seq=_journal_watermark(replica),
+        )
+
+
+def get_read_session(
+    min_seq: int | None = None,
+    max_lag: int | None = None,
+) -> Session:
+    """Get a session for read-only selector and reporting workloads.
+
+    Routed to the replica when one is configured and its journal watermark
+    is within ``max_lag`` entries of the primary's (default: the value given
+    to ``init_replica_engine_from_url``) and at least ``min_seq`` -- pass the
+    seq of an entry just posted to read your own write.  Otherwise a primary
+    session is returned, so callers never see an older ledger than allowed.
+
+    The replica watermark is read inside the returned session's transaction;
+    its REPEATABLE READ snapshot keeps every later query at or after it.
+    The primary watermark comes from the cache while it is younger than
+    ``watermark_ttl``; failing that, from ``min_seq`` when given (the
+    caller's own write is the freshest primary position it needs); only
+    otherwise is it read live from the primary.  ``max_lag`` is therefore
+    measured against a primary position at most ``watermark_ttl`` old.
+    Callers must not write through the session; close it with ``close()``.
+    """
+    if _ReplicaSessionFactory is None:
+        return get_session()
+
+    allowed = _replica_max_lag if max_lag is None else max_lag
+    session = _ReplicaSessionFactory()
+    try:
+        replica_seq = _journal_watermark(session)
+        primary_seq = _cached_primary_watermark()
+        if primary_seq is None and min_seq is None:
+            with get_engine().connect() as primary:
+                primary_seq = _read_primary_watermark(primary)
+        primary_seq = primary_seq or 0
+        if min_seq is not None and min_seq > primary_seq:
+            primary_seq = min_seq
+    except Exception:
+        session.close()
+        logger.warning("replica_read_fallback", extra={"reason": "error"}, exc_info=True)
+        return get_session()
+
+    lag = ReplicaLag(primary_seq=primary_seq, replica_seq=replica_seq)
+    if lag.entries_behind > allowed or (min_seq is not None and replica_seq < min_seq):
+        session.close()
+        logger.warning(
+            "replica_read_fallback",
+            extra={
+                "reason": "lag",
+                "primary_seq": primary_seq,
+                "replica_seq": replica_seq,
+                "max_lag": allowed,
+                "min_seq": min_seq,
+            },
+        )
+        return get_session()
+
+    logger.info(
+        "session_created",
+        extra={
+            "trace_type": "FINANCE_DB_SESSION",
+            "route": "replica",
+            "replica_seq": replica_seq,
+            "entries_behind": lag.entries_behind,
+        },
+    )
+    return session
+
+
+@contextmanager
+def read_session_scope(
+    min_seq: int | None = None,
+    max_lag: int | None = None,
+) -> Generator[Session, None, None]:
+    """Provide a read-only scope routed by ``get_read_session``; never commits."""
+    session = get_read_session(min_seq=min_seq, max_lag=max_lag)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """Provide a transactional scope: commits on success, rolls back on exception."""
@@ -108,8 +352,6 @@ def create_tables(install_triggers: bool = True, *, kernel_only: bool = False) -
     ``finance_modules._orm_registry``.  Pass ``kernel_only=True`` to bypass
     the guard for kernel-only unit tests.
     """
-    import time
-
     from finance_kernel.db.base import Base
 
     engine = get_engine()
@@ -132,6 +374,16 @@ def create_tables(install_triggers: bool = True, *, kernel_only: bool = False) -
 
     Base.metadata.create_all(engine)
 
+    # SL-P1: entries written before the projection table existed are not
+    # in it; the flush listener only applies deltas from here on.
+    if "subledger_entity_balances" in Base.metadata.tables:
+        from finance_kernel.db.subledger_projection import (
+            backfill_subledger_entity_balances,
+        )
+
+        with engine.begin() as connection:
+            backfill_subledger_entity_balances(connection)
+
     # Install triggers for defense-in-depth (retry on deadlock).
     if install_triggers:
         from sqlalchemy.exc import OperationalError
@@ -167,23 +419,40 @@ def drop_tables() -> None:
 
 def reset_engine() -> None:
     """Reset the engine and session factory. Useful for test cleanup."""
-    global _engine, _SessionFactory
+    global _engine, _SessionFactory, _pool_telemetry
+
+    reset_replica_engine()
 
     if _engine is not None:
         _engine.dispose()
         _engine = None
 
     _SessionFactory = None
+    _pool_telemetry = None
+
+
+def reset_replica_engine() -> None:
+    """Reset the read replica engine; reads route to the primary again."""
+    global _replica_engine, _ReplicaSessionFactory, _replica_max_lag
+    global _primary_watermark
+
+    if _replica_engine is not None:
+        _replica_engine.dispose()
+        _replica_engine = None
+
+    _ReplicaSessionFactory = None
+    _replica_max_lag = 0
+    _primary_watermark = None
 
 
 def _atexit_dispose():
     """Dispose the engine on process exit to release all pooled connections."""
-    global _engine
-    if _engine is not None:
-        try:
-            _engine.dispose()
-        except Exception:
-            pass
+    for engine in (_replica_engine, _engine):
+        if engine is not None:
+            try:
+                engine.dispose()
+            except Exception:
+                pass
 
 
 atexit.register(_atexit_dispose)
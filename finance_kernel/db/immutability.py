@@ -1,5 +1,7 @@
 """ORM-level immutability enforcement (R10 compliance -- layer 1 of 2)."""
 
+from uuid import uuid4
+
 from sqlalchemy import event
 from sqlalchemy.orm import Session, UOWTransaction
 
@@ -56,6 +58,55 @@ def _check_account_deletion_before_flush(session, flush_context, instances):
             raise AccountReferencedError(account_id=str(obj.id))
 
 
+def _bump_reference_stamps_before_flush(session, flush_context, instances):
+    """Bump reference component stamps for flushed COA/dimension/FX writes (R21).
+
+    The stamps back the O(1) snapshot freshness check in
+    ReferenceSnapshotService.validate_freshness; they are bumped in the same
+    transaction as the write, so a rollback discards both.
+    """
+    from sqlalchemy import text
+
+    from finance_kernel.models.account import Account
+    from finance_kernel.models.dimensions import Dimension, DimensionValue
+    from finance_kernel.models.exchange_rate import ExchangeRate
+
+    stamped = (
+        (Account, "coa"),
+        ((Dimension, DimensionValue), "dimension_schema"),
+        (ExchangeRate, "fx_rates"),
+    )
+    stamped_types = (Account, Dimension, DimensionValue, ExchangeRate)
+    changed = [
+        *session.new,
+        *session.deleted,
+        *(
+            obj for obj in session.dirty
+            if isinstance(obj, stamped_types) and session.is_modified(obj)
+        ),
+    ]
+    components = {
+        component
+        for obj in changed
+        for model, component in stamped
+        if isinstance(obj, model)
+    }
+    if not components:
+        return
+
+    with session.no_autoflush:
+        for component in sorted(components):
+            session.execute(
+                text("""
+                    INSERT INTO reference_component_stamps (id, component, stamp)
+                    VALUES (:id, :component, 1)
+                    ON CONFLICT (component)
+                    DO UPDATE SET stamp = reference_component_stamps.stamp + 1
+                """),
+                {"id": str(uuid4()), "component": component},
+            )
+
+
 def _check_journal_entry_immutability(mapper, connection, target):
     """Prevent updates to posted JournalEntry records (R10)."""
     from finance_kernel.models.journal import JournalEntry, JournalEntryStatus
@@ -832,6 +883,46 @@ def _check_reconciliation_failure_report_delete(mapper, connection, target):
     )
 
 
+def _reject_period_close_snapshot_change(target, operation: str) -> None:
+    """Raise for any change to a sealed period-close snapshot row (R10, R24)."""
+    from finance_kernel.models.period_close_balance import (
+        PeriodCloseBalanceModel,
+        PeriodCloseSnapshotModel,
+    )
+
+    if isinstance(target, PeriodCloseSnapshotModel):
+        entity_type = "PeriodCloseSnapshot"
+    elif isinstance(target, PeriodCloseBalanceModel):
+        entity_type = "PeriodCloseBalance"
+    else:
+        return
+
+    logger.error(
+        "immutability_violation_blocked",
+        extra={
+            "invariant": "R10",
+            "entity_type": entity_type,
+            "entity_id": str(target.id),
+            "operation": operation,
+        },
+    )
+    raise ImmutabilityViolationError(
+        entity_type=entity_type,
+        entity_id=str(target.id),
+        reason="Sealed period-close balances are immutable",
+    )
+
+
+def _check_period_close_snapshot_immutability(mapper, connection, target):
+    """Prevent updates to period-close snapshots and their balance rows."""
+    _reject_period_close_snapshot_change(target, "UPDATE")
+
+
+def _check_period_close_snapshot_delete(mapper, connection, target):
+    """Prevent deletion of period-close snapshots and their balance rows."""
+    _reject_period_close_snapshot_change(target, "DELETE")
+
+
 def register_immutability_listeners():
     """Register all immutability enforcement event listeners (R10)."""
     from finance_kernel.models.account import Account
@@ -840,6 +931,10 @@ def register_immutability_listeners():
     from finance_kernel.models.exchange_rate import ExchangeRate
     from finance_kernel.models.fiscal_period import FiscalPeriod
     from finance_kernel.models.journal import JournalEntry, JournalLine
+    from finance_kernel.models.period_close_balance import (
+        PeriodCloseBalanceModel,
+        PeriodCloseSnapshotModel,
+    )
     from finance_kernel.models.subledger import (
         ReconciliationFailureReportModel,
         SubledgerEntryModel,
@@ -848,6 +943,9 @@ def register_immutability_listeners():
     # Session-level before_flush for account deletion checks
     event.listen(Session, "before_flush", _check_account_deletion_before_flush)
 
+    # Session-level before_flush for reference snapshot change stamps (R21)
+    event.listen(Session, "before_flush", _bump_reference_stamps_before_flush)
+
     # JournalEntry listeners
     event.listen(JournalEntry, "before_update", _check_journal_entry_immutability)
     event.listen(JournalEntry, "before_delete", _check_journal_entry_delete)
@@ -894,6 +992,11 @@ def register_immutability_listeners():
         _check_reconciliation_failure_report_delete,
     )
 
+    # Period-close balance snapshot listeners (always immutable)
+    for model in (PeriodCloseSnapshotModel, PeriodCloseBalanceModel):
+        event.listen(model, "before_update", _check_period_close_snapshot_immutability)
+        event.listen(model, "before_delete", _check_period_close_snapshot_delete)
+
 
 def _safe_remove_listener(target, event_name, listener_fn):
     """Safely remove an event listener, ignoring if not registered."""
@@ -909,12 +1012,17 @@ def unregister_immutability_listeners():
     from finance_kernel.models.exchange_rate import ExchangeRate
     from finance_kernel.models.fiscal_period import FiscalPeriod
     from finance_kernel.models.journal import JournalEntry, JournalLine
+    from finance_kernel.models.period_close_balance import (
+        PeriodCloseBalanceModel,
+        PeriodCloseSnapshotModel,
+    )
     from finance_kernel.models.subledger import (
         ReconciliationFailureReportModel,
         SubledgerEntryModel,
     )
 
     _safe_remove_listener(Session, "before_flush", _check_account_deletion_before_flush)
+    _safe_remove_listener(Session, "before_flush", _bump_reference_stamps_before_flush)
 
     _safe_remove_listener(JournalEntry, "before_update", _check_journal_entry_immutability)
     _safe_remove_listener(JournalEntry, "before_delete", _check_journal_entry_delete)
@@ -951,3 +1059,11 @@ def unregister_immutability_listeners():
         "before_delete",
         _check_reconciliation_failure_report_delete,
     )
+
+    for model in (PeriodCloseSnapshotModel, PeriodCloseBalanceModel):
+        _safe_remove_listener(
+            model, "before_update", _check_period_close_snapshot_immutability,
+        )
+        _safe_remove_listener(
+            model, "before_delete", _check_period_close_snapshot_delete,
+        )
@@ -0,0 +1,106 @@
+"""Optional fiscal-period partitioning of the journal and subledger tables.
+
+Installs ``sql/20_period_partitioning.sql``: journal_entries, journal_lines
+and subledger_entries become RANGE partitions on ``effective_date``, one per
+fiscal period (plus a DEFAULT partition), so as-of and period queries scan
+only the periods they cover.  Global keys (R3 idempotency, R9 seq, reversal
+and subledger idempotency) move to unpartitioned key registries kept in step
+by triggers, and the existing immutability/balance triggers are re-created
+on the partitioned parents.  See the SQL file header for details.
+
+PostgreSQL only.  Run after ``install_immutability_triggers``; re-installing
+triggers afterwards is safe (they attach to the partitioned parents).
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from finance_kernel.db.triggers import install_trigger_file
+from finance_kernel.logging_config import get_logger
+
+logger = get_logger("db.partitioning")
+
+PARTITIONING_FILE = "20_period_partitioning.sql"
+
+PARTITIONED_TABLES = ("journal_entries", "journal_lines", "subledger_entries")
+
+
+def install_period_partitioning(engine: Engine) -> int:
+    """Convert the journal tables to the partitioned layout (idempotent).
+
+    Returns the number of period partitions created (0 when already
+    partitioned).  Existing rows are copied; the conversion runs in one
+    transaction and takes ACCESS EXCLUSIVE locks on the tables it rebuilds.
+    """
+    install_trigger_file(engine, PARTITIONING_FILE)
+    with engine.begin() as conn:
+        created = conn.execute(text("SELECT finance_partition_by_period()")).scalar()
+
+    logger.info("period_partitioning_installed", extra={"partitions_created": created})
+    return created
+
+
+def period_partitioning_installed(engine: Engine) -> bool:
+    """True when journal_entries is a partitioned table."""
+    with engine.connect() as conn:
+        return bool(conn.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM pg_class"
+            " WHERE oid = to_regclass('journal_entries') AND relkind = 'p')"
+        )).scalar())
+
+
+def ensure_period_partitions(engine: Engine) -> int:
+    """Create partitions for fiscal periods that have none yet.
+
+    New periods are partitioned automatically on insert; this covers periods
+    created while the layout was being installed.
+    """
+    with engine.begin() as conn:
+        return conn.execute(text("SELECT finance_ensure_period_partitions()")).scalar()
+
+
+def list_period_partitions(engine: Engine, table: str) -> list[str]:
+    """Names of the partitions currently attached to ``table``."""
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"{table!r} is not a partitioned table: {PARTITIONED_TABLES}")
+    with engine.connect() as conn:
+        return list(conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i"
+            " JOIN pg_class c ON c.oid = i.inhrelid"
+            " WHERE i.inhparent = to_regclass(:table)"
+            " ORDER BY c.relname"
+        ), {"table": table}).scalars())
+
+
+def archive_period_partition(
+    engine: Engine,
+    period_code: str,
+    tablespace: str | None = None,
+    detach: bool = False,
+) -> int:
+    """Move a locked period's partitions to ``tablespace`` and/or detach them.
+
+    Detached partitions remain as read-only tables named
+    ``<table>_<period_code>``; their keys stay reserved in the registries.
+    Raises DBAPIError (restrict_violation) unless the period is LOCKED.
+    Returns the number of partitions processed.
+    """
+    if tablespace is None and not detach:
+        raise ValueError("Nothing to do: pass a tablespace and/or detach=True")
+
+    with engine.begin() as conn:
+        processed = conn.execute(
+            text("SELECT finance_archive_period_partition(:code, :tablespace, :detach)"),
+            {"code": period_code, "tablespace": tablespace, "detach": detach},
+        ).scalar()
+
+    logger.info(
+        "period_partition_archived",
+        extra={
+            "period_code": period_code,
+            "tablespace": tablespace,
+            "detached": detach,
+            "partitions": processed,
+        },
+    )
+    return processed
@@ -0,0 +1,478 @@
+"""Connection pool telemetry and adaptive pool sizing for the primary engine.
+
+Separates "waiting for a pooled connection" from "waiting for the database"
+in posting and batch latency.  Recorded per engine:
+
+* checkout wait -- time for ``pool.connect()`` to hand out a usable
+  connection (queue wait, plus connect/pre-ping when one is opened or
+  tested).  SQLAlchemy fires no event when a checkout *starts*, so
+  ``InstrumentedQueuePool`` times ``connect()``; everything else comes from
+  pool events.
+* hold time per caller tag -- checkout -> checkin, keyed by the tag active
+  at checkout (``pool_caller("posting")``; untagged checkouts use
+  ``DEFAULT_CALLER``).
+* overflow checkouts, checkout timeouts, invalidations, resizes.
+
+``AdaptivePoolPolicy`` optionally lets the pool grow while recent checkout
+waits exceed a target and shrink back when it is idle.  Growing raises
+the size of the live pool in place, so its open connections are kept;
+shrinking swaps in a recreated pool of the new size (as
+``engine.dispose()`` does).  The snapshot and
+Prometheus export sit next to the posting profiler's
+(``PostingProfiler.write_prometheus_textfile`` appends them).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from finance_kernel.logging_config import get_logger
+from finance_kernel.utils.histogram import LatencyHistogram
+
+logger = get_logger("db.pool_telemetry")
+
+DEFAULT_CALLER = "default"
+
+_caller_tag: ContextVar[str] = ContextVar("pool_caller_tag", default=DEFAULT_CALLER)
+
+
+@contextmanager
+def pool_caller(tag: str) -> Iterator[None]:
+    """Attribute connections checked out inside the block to ``tag``."""
+    token = _caller_tag.set(tag)
+    try:
+        yield
+    finally:
+        _caller_tag.reset(token)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports checkout waits and can be resized.
+
+    Logs under SQLAlchemy's own ``sqlalchemy.pool.impl.QueuePool`` logger.
+    SQLAlchemy would otherwise name the pool logger after this class, which
+    puts it inside the ``finance_kernel`` tree: that tree is kept at DEBUG
+    for the decision journal, so every checkout/reset record (including the
+    DSN) would be journaled into ``InterpretationOutcome.decision_log``.
+    """
+
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.QueuePool"
+
+    telemetry: PoolTelemetry | None = None
+
+    def __init__(self, creator, **kw):
+        super().__init__(creator, **kw)
+        self._init_args = (creator, kw)
+
+    @property
+    def max_overflow(self) -> int:
+        """``max_overflow`` this pool was created with."""
+        return self._init_args[1].get("max_overflow", 10)
+
+    def connect(self):
+        started = time.perf_counter_ns()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.telemetry is not None:
+                self.telemetry._record_timeout(time.perf_counter_ns() - started)
+            raise
+        if self.telemetry is not None:
+            self.telemetry._record_wait(time.perf_counter_ns() - started)
+        return connection
+
+    def grow(self, pool_size: int) -> bool:
+        """Raise the pool size in place; False when this pool cannot.
+
+        QueuePool keeps its size in the queue's ``maxsize`` and counts open
+        connections as ``_overflow + maxsize``, so growing by ``n`` raises
+        ``maxsize`` by ``n`` and lowers ``_overflow`` by ``n`` under both
+        locks: open and checked-out connections stay as they are and the
+        new slots are filled as checkouts need them.  These are private
+        SQLAlchemy 2.0 attributes; if they are missing the caller falls
+        back to ``recreate``.
+        """
+        queue = getattr(self, "_pool", None)
+        overflow_lock = getattr(self, "_overflow_lock", None)
+        if (
+            overflow_lock is None
+            or not hasattr(self, "_overflow")
+            or not hasattr(queue, "maxsize")
+            or not hasattr(queue, "mutex")
+        ):
+            return False
+        with overflow_lock, queue.mutex:
+            extra = pool_size - queue.maxsize
+            if extra < 0:
+                raise ValueError(
+                    f"grow() cannot shrink the pool ({queue.maxsize} -> {pool_size})"
+                )
+            queue.maxsize = pool_size
+            self._overflow -= extra
+        self.logger.info("Pool grown to %d", pool_size)
+        return True
+
+    def recreate(self, pool_size: int | None = None) -> InstrumentedQueuePool:
+        """New pool with the same arguments and listeners, optionally resized.
+
+        Built from the arguments this pool was constructed with rather than
+        QueuePool internals; ``engine.dispose()`` calls it without a size.
+        """
+        if pool_size is not None and pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+        self.logger.info("Pool recreating")
+        creator, kw = self._init_args
+        pool = self.__class__(
+            creator,
+            **{
+                **kw,
+                "pool_size": pool_size if pool_size is not None else self.size(),
+                "_dispatch": self.dispatch,
+            },
+        )
+        pool.telemetry = self.telemetry
+        return pool
+
+
+@dataclass(frozen=True)
+class AdaptivePoolPolicy:
+    """
+    When and how far the adaptive mode resizes the pool.
+
+    Every ``interval_s`` (checked on checkout) the p95 of the last
+    ``window`` checkout waits is compared with ``target_wait_ms``: above it
+    the pool grows by ``step`` (up to ``max_size``); below a quarter of it,
+    with peak concurrent checkouts at least ``step`` under the size, the
+    pool shrinks by ``step`` (down to ``min_size``).
+    """
+
+    min_size: int
+    max_size: int
+    target_wait_ms: float = 5.0
+    window: int = 200
+    interval_s: float = 5.0
+    step: int = 2
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_size <= self.max_size:
+            raise ValueError(
+                f"Require 1 <= min_size <= max_size, got {self.min_size}..{self.max_size}"
+            )
+        if self.target_wait_ms <= 0 or self.window < 1 or self.step < 1:
+            raise ValueError("target_wait_ms, window and step must be positive")
+        if self.interval_s < 0:
+            raise ValueError(f"interval_s must be non-negative, got {self.interval_s}")
+
+
+@dataclass(frozen=True)
+class HoldStats:
+    """Connection hold time for one caller tag."""
+
+    caller: str
+    count: int
+    total_us: int
+    max_us: int
+    p50_us: int
+    p99_us: int
+
+
+@dataclass(frozen=True)
+class PoolSnapshot:
+    """Point-in-time pool gauges and counters."""
+
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    overflow_checkouts: int
+    timeouts: int
+    invalidations: int
+    resizes: int
+    wait_count: int
+    wait_total_us: int
+    wait_max_us: int
+    wait_p50_us: int
+    wait_p99_us: int
+    holds: tuple[HoldStats, ...]
+
+    def hold(self, caller: str) -> HoldStats | None:
+        for h in self.holds:
+            if h.caller == caller:
+                return h
+        return None
+
+
+class PoolTelemetry:
+    """
+    Pool metrics for one engine created with ``InstrumentedQueuePool``.
+
+    Contract:
+        Construction registers the pool event listeners on ``engine``; they
+        survive ``engine.dispose()``.  All counters are guarded by one lock;
+        listeners never touch the connection itself.
+    """
+
+    _CHECKOUT_KEY = "pool_telemetry_checkout"
+
+    def __init__(self, engine: Engine, adaptive: AdaptivePoolPolicy | None = None):
+        if not isinstance(engine.pool, InstrumentedQueuePool):
+            raise ValueError(
+                "PoolTelemetry requires an engine created with "
+                "poolclass=InstrumentedQueuePool"
+            )
+        self._engine = engine
+        self.adaptive = adaptive
+        self._lock = threading.Lock()
+        self._resize_lock = threading.Lock()
+        self._retired: list[tuple[InstrumentedQueuePool, int]] = []
+        self._reset_counters()
+        engine.pool.telemetry = self
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _reset_counters(self) -> None:
+        self._wait = LatencyHistogram()
+        self._holds: dict[str, LatencyHistogram] = {}
+        self._checkouts = 0
+        self._overflow_checkouts = 0
+        self._timeouts = 0
+        self._invalidations = 0
+        self._resizes = 0
+        self._recent_waits: deque[int] = deque(
+            maxlen=self.adaptive.window if self.adaptive else 1,
+        )
+        self._peak_checked_out = 0
+        self._last_evaluated = time.monotonic()
+
+    @property
+    def pool(self) -> InstrumentedQueuePool:
+        return self._engine.pool
+
+    # -- event handlers -------------------------------------------------------
+
+    def _record_wait(self, wait_ns: int) -> None:
+        with self._lock:
+            self._wait.record(wait_ns // 1000)
+            self._recent_waits.append(wait_ns // 1000)
+        if self.adaptive is not None:
+            self._maybe_resize()
+
+    def _record_timeout(self, wait_ns: int) -> None:
+        with self._lock:
+            self._timeouts += 1
+            self._wait.record(wait_ns // 1000)
+            self._recent_waits.append(wait_ns // 1000)
+        logger.warning(
+            "pool_checkout_timeout",
+            extra={"caller": _caller_tag.get(), "wait_ms": round(wait_ns / 1e6, 2)},
+        )
+        if self.adaptive is not None:
+            self._maybe_resize()
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info[self._CHECKOUT_KEY] = (
+            _caller_tag.get(), time.perf_counter_ns(),
+        )
+        pool = self.pool
+        checked_out = pool.checkedout()
+        with self._lock:
+            self._checkouts += 1
+            if pool.overflow() > 0:
+                self._overflow_checkouts += 1
+            if checked_out > self._peak_checked_out:
+                self._peak_checked_out = checked_out
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop(self._CHECKOUT_KEY, None)
+        if started is None:
+            return
+        caller, started_ns = started
+        held_us = (time.perf_counter_ns() - started_ns) // 1000
+        with self._lock:
+            histogram = self._holds.get(caller)
+            if histogram is None:
+                histogram = self._holds[caller] = LatencyHistogram()
+            histogram.record(held_us)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self._invalidations += 1
+
+    # -- adaptive sizing ------------------------------------------------------
+
+    def _maybe_resize(self) -> None:
+        policy = self.adaptive
+        if not self._resize_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.monotonic()
+            with self._lock:
+                if now - self._last_evaluated < policy.interval_s or not self._recent_waits:
+                    return
+                waits = sorted(self._recent_waits)
+                p95_us = waits[min(len(waits) - 1, (len(waits) * 95) // 100)]
+                peak = self._peak_checked_out
+                self._last_evaluated = now
+                self._peak_checked_out = self.pool.checkedout()
+
+            size = self.pool.size()
+            target_us = policy.target_wait_ms * 1000
+            if p95_us > target_us and size < policy.max_size:
+                new_size = min(policy.max_size, size + policy.step)
+            elif (
+                p95_us < target_us / 4
+                and size > policy.min_size
+                and peak <= size - policy.step
+            ):
+                new_size = max(policy.min_size, size - policy.step)
+            else:
+                return
+
+            self.resize(new_size)
+            with self._lock:
+                self._resizes += 1
+                self._recent_waits.clear()
+            logger.info(
+                "pool_resized",
+                extra={
+                    "old_size": size,
+                    "new_size": new_size,
+                    "p95_wait_ms": round(p95_us / 1000, 2),
+                    "peak_checked_out": peak,
+                },
+            )
+        finally:
+            self._resize_lock.release()
+
+    def resize(self, pool_size: int) -> None:
+        """Resize the engine's pool to ``pool_size`` connections.
+
+        Growing raises the size of the live pool (``grow``), keeping its
+        open connections.  Shrinking swaps in a recreated pool and disposes
+        the old one: idle connections close now, checked-out ones are
+        returned to it and closed when the retired pool is next swept (on
+        resize and snapshot) -- the same path ``engine.dispose()`` takes.
+        Listeners and telemetry carry over to the new pool.
+        """
+        old = self.pool
+        if pool_size >= old.size() and old.grow(pool_size):
+            return
+        self._engine.pool = old.recreate(pool_size=pool_size)
+        outstanding = old.checkedout()
+        old.dispose()
+        if outstanding:
+            with self._lock:
+                self._retired.append((old, outstanding))
+
+    def _sweep_retired(self) -> None:
+        """Close connections returned to retired pools; forget drained ones.
+
+        A disposed pool's ``checkedout()`` no longer counts what is still
+        out, so the count at retirement is carried and decremented by the
+        connections found returned on each sweep.
+        """
+        with self._lock:
+            retired, self._retired = self._retired, []
+        still_in_use = []
+        for pool, outstanding in retired:
+            returned = pool.checkedin()
+            pool.dispose()
+            if outstanding > returned:
+                still_in_use.append((pool, outstanding - returned))
+        with self._lock:
+            self._retired.extend(still_in_use)
+
+    # -- read side ------------------------------------------------------------
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset_counters()
+
+    def snapshot(self) -> PoolSnapshot:
+        self._sweep_retired()
+        pool = self.pool
+        with self._lock:
+            holds = tuple(
+                HoldStats(
+                    caller=caller,
+                    count=h.count,
+                    total_us=h.total_us,
+                    max_us=h.max_us,
+                    p50_us=h.percentile(50),
+                    p99_us=h.percentile(99),
+                )
+                for caller, h in sorted(self._holds.items())
+            )
+            return PoolSnapshot(
+                pool_size=pool.size(),
+                max_overflow=pool.max_overflow,
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(0, pool.overflow()),
+                checkouts=self._checkouts,
+                overflow_checkouts=self._overflow_checkouts,
+                timeouts=self._timeouts,
+                invalidations=self._invalidations,
+                resizes=self._resizes,
+                wait_count=self._wait.count,
+                wait_total_us=self._wait.total_us,
+                wait_max_us=self._wait.max_us,
+                wait_p50_us=self._wait.percentile(50),
+                wait_p99_us=self._wait.percentile(99),
+                holds=holds,
+            )
+
+    def to_prometheus_text(self, prefix: str = "finance_db_pool") -> str:
+        """Render the snapshot in Prometheus text format 0.0.4."""
+        s = self.snapshot()
+        lines = []
+        for name, kind, value, help_text in (
+            ("size", "gauge", s.pool_size, "Configured pool size."),
+            ("checked_out", "gauge", s.checked_out, "Connections currently checked out."),
+            ("overflow", "gauge", s.overflow, "Connections open beyond pool size."),
+            ("checkouts_total", "counter", s.checkouts, "Connection checkouts."),
+            ("overflow_checkouts_total", "counter", s.overflow_checkouts,
+             "Checkouts served while the pool was in overflow."),
+            ("timeouts_total", "counter", s.timeouts, "Checkouts that timed out."),
+            ("invalidations_total", "counter", s.invalidations,
+             "Connections invalidated."),
+            ("resizes_total", "counter", s.resizes, "Adaptive pool resizes."),
+        ):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.append(f"{prefix}_{name} {value}")
+        lines.append(f"# HELP {prefix}_checkout_wait_seconds Time to obtain a connection.")
+        lines.append(f"# TYPE {prefix}_checkout_wait_seconds summary")
+        for q, value in (("0.5", s.wait_p50_us), ("0.99", s.wait_p99_us)):
+            lines.append(
+                f'{prefix}_checkout_wait_seconds{{quantile="{q}"}} {value / 1_000_000:.6f}'
+            )
+        lines.append(f"{prefix}_checkout_wait_seconds_sum {s.wait_total_us / 1_000_000:.6f}")
+        lines.append(f"{prefix}_checkout_wait_seconds_count {s.wait_count}")
+        lines.append(f"# HELP {prefix}_hold_seconds Connection hold time per caller.")
+        lines.append(f"# TYPE {prefix}_hold_seconds summary")
+        for h in s.holds:
+            caller = h.caller.replace("\\", "\\\\").replace('"', '\\"')
+            for q, value in (("0.5", h.p50_us), ("0.99", h.p99_us)):
+                lines.append(
+                    f'{prefix}_hold_seconds{{caller="{caller}",quantile="{q}"}} '
+                    f"{value / 1_000_000:.6f}"
+                )
+            lines.append(
+                f'{prefix}_hold_seconds_sum{{caller="{caller}"}} {h.total_us / 1_000_000:.6f}'
+            )
+            lines.append(f'{prefix}_hold_seconds_count{{caller="{caller}"}} {h.count}')
+        return "\n".join(lines) + "\n"
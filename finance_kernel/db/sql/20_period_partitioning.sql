@@ -0,0 +1,411 @@
+-- =============================================================================
+-- Fiscal-Period Partitioning (optional layout)
+-- =============================================================================
+-- Converts journal_entries, journal_lines and subledger_entries into
+-- PostgreSQL declarative partitions (RANGE on effective_date), one partition
+-- per fiscal period plus a DEFAULT partition.  Queries that filter on
+-- effective_date then scan only the partitions of the periods they cover,
+-- and locked periods can be moved to another tablespace or detached.
+--
+-- NOT part of TRIGGER_FILES: loading this file only defines functions.
+-- Install explicitly with finance_kernel.db.partitioning
+-- (install_period_partitioning), AFTER the immutability triggers.
+--
+-- Invariants preserved:
+--   R3/R9 -- PostgreSQL requires unique keys on a partitioned table to
+--            contain the partition key, so the global keys move to two
+--            unpartitioned key registries kept in step by triggers:
+--              journal_entry_keys   (id, idempotency_key, seq, reversal_of_id)
+--              subledger_entry_keys (id, journal_entry_id, subledger_type,
+--                                    source_line_id)
+--            Foreign keys that referenced the partitioned tables now
+--            reference the registries.  Registry rows survive archival, so
+--            an idempotency key or seq is never reusable.
+--   R10/R12 -- Row triggers on the original tables are re-created on the
+--            partitioned parents; PostgreSQL clones them onto every
+--            partition, including partitions created later.
+--   Partition key is immutable -- effective_date cannot change, so rows
+--            never move between partitions.
+--   Detached partitions keep immutability via
+--            trg_archived_partition_immutability.
+--
+-- Functions:
+--   finance_partition_by_period()       -- one-shot conversion (idempotent)
+--   finance_ensure_period_partitions()  -- partitions for new fiscal periods
+--                                          (also fired by a fiscal_periods
+--                                          AFTER INSERT trigger)
+--   finance_archive_period_partition(period_code, tablespace, detach)
+-- =============================================================================
+
+
+-- -----------------------------------------------------------------------------
+-- Naming and partition creation
+-- -----------------------------------------------------------------------------
+
+-- Function: Partition name for a parent table and fiscal period code
+-- e.g. ('journal_entries', '2025-06') -> 'journal_entries_2025_06'
+CREATE OR REPLACE FUNCTION finance_period_partition_name(
+    p_table TEXT,
+    p_period_code TEXT
+)
+RETURNS TEXT AS $$
+    SELECT p_table || '_' || lower(regexp_replace(p_period_code, '[^A-Za-z0-9]+', '_', 'g'));
+$$ LANGUAGE sql IMMUTABLE;
+
+
+-- Function: Create the DEFAULT partition and one partition per fiscal period
+-- under p_parent, named after p_table.  Periods whose date range overlaps an
+-- existing partition (e.g. adjustment periods) are skipped.
+CREATE OR REPLACE FUNCTION _finance_create_period_partitions(
+    p_parent TEXT,
+    p_table TEXT
+)
+RETURNS INTEGER AS $$
+DECLARE
+    period RECORD;
+    part TEXT;
+    created INTEGER := 0;
+BEGIN
+    IF to_regclass(p_table || '_default') IS NULL THEN
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', p_table || '_default', p_parent);
+    END IF;
+
+    FOR period IN
+        SELECT period_code, start_date, end_date
+        FROM fiscal_periods
+        ORDER BY start_date, period_code
+    LOOP
+        part := finance_period_partition_name(p_table, period.period_code);
+        CONTINUE WHEN to_regclass(part) IS NOT NULL;
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                part, p_parent, period.start_date, period.end_date + 1
+            );
+            created := created + 1;
+        EXCEPTION WHEN invalid_object_definition THEN
+            RAISE NOTICE 'Period % overlaps an existing % partition; rows stay there',
+                period.period_code, p_table;
+        END;
+    END LOOP;
+
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Function: Create partitions for fiscal periods that have none yet
+CREATE OR REPLACE FUNCTION finance_ensure_period_partitions()
+RETURNS INTEGER AS $$
+DECLARE
+    parent TEXT;
+    created INTEGER := 0;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['journal_entries', 'journal_lines', 'subledger_entries'] LOOP
+        IF EXISTS (
+            SELECT 1 FROM pg_class
+            WHERE oid = to_regclass(parent) AND relkind = 'p'
+        ) THEN
+            created := created + _finance_create_period_partitions(parent, parent);
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Function: Trigger wrapper so new fiscal periods get partitions on creation
+CREATE OR REPLACE FUNCTION create_fiscal_period_partitions()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM finance_ensure_period_partitions();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- -----------------------------------------------------------------------------
+-- Key registries (global uniqueness + foreign key targets)
+-- -----------------------------------------------------------------------------
+
+-- Function: Keep journal_entry_keys in step with journal_entries
+CREATE OR REPLACE FUNCTION sync_journal_entry_keys()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO journal_entry_keys (id, effective_date, idempotency_key, seq, reversal_of_id)
+        VALUES (NEW.id, NEW.effective_date, NEW.idempotency_key, NEW.seq, NEW.reversal_of_id);
+        RETURN NEW;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE journal_entry_keys
+        SET idempotency_key = NEW.idempotency_key,
+            seq = NEW.seq,
+            reversal_of_id = NEW.reversal_of_id
+        WHERE id = OLD.id;
+        RETURN NEW;
+    END IF;
+
+    DELETE FROM journal_entry_keys WHERE id = OLD.id;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Function: Keep subledger_entry_keys in step with subledger_entries
+CREATE OR REPLACE FUNCTION sync_subledger_entry_keys()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO subledger_entry_keys (id, effective_date, journal_entry_id, subledger_type, source_line_id)
+        VALUES (NEW.id, NEW.effective_date, NEW.journal_entry_id, NEW.subledger_type, NEW.source_line_id);
+        RETURN NEW;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE subledger_entry_keys
+        SET journal_entry_id = NEW.journal_entry_id,
+            subledger_type = NEW.subledger_type,
+            source_line_id = NEW.source_line_id
+        WHERE id = OLD.id;
+        RETURN NEW;
+    END IF;
+
+    DELETE FROM subledger_entry_keys WHERE id = OLD.id;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Function: Reject changes to the partition key
+CREATE OR REPLACE FUNCTION prevent_partition_key_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.effective_date IS DISTINCT FROM OLD.effective_date THEN
+        RAISE EXCEPTION 'Cannot change effective_date of % row % (fiscal-period partition key)',
+            TG_TABLE_NAME, OLD.id
+            USING ERRCODE = 'restrict_violation';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Function: Detached (archived) partitions are read-only
+CREATE OR REPLACE FUNCTION prevent_archived_partition_modification()
+RETURNS TRIGGER AS $$
+BEGIN
+    RAISE EXCEPTION 'R10 Violation: Cannot modify archived partition % row %',
+        TG_TABLE_NAME, OLD.id
+        USING ERRCODE = 'restrict_violation';
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- -----------------------------------------------------------------------------
+-- Conversion
+-- -----------------------------------------------------------------------------
+
+-- Function: Rebuild one table as a partitioned table, carrying over rows,
+-- indexes (unique ones demoted; uniqueness lives in p_registry), foreign
+-- keys (incoming ones re-pointed at p_registry) and row triggers.
+CREATE OR REPLACE FUNCTION _finance_partition_table(
+    p_table TEXT,
+    p_registry TEXT
+)
+RETURNS void AS $$
+DECLARE
+    old_oid OID := p_table::regclass;
+    staging TEXT := p_table || '_partitioned';
+    ddl TEXT[];
+    stmt TEXT;
+BEGIN
+    -- Everything that DROP TABLE ... CASCADE removes, captured as DDL first
+    SELECT coalesce(array_agg(replace(pg_get_indexdef(indexrelid), 'CREATE UNIQUE INDEX', 'CREATE INDEX')), '{}')
+    INTO ddl
+    FROM pg_index
+    WHERE indrelid = old_oid AND NOT indisprimary;
+
+    SELECT ddl || coalesce(array_agg(format(
+        'ALTER TABLE %s ADD CONSTRAINT %I %s',
+        conrelid::regclass, conname,
+        CASE WHEN confrelid = old_oid
+            THEN regexp_replace(pg_get_constraintdef(oid),
+                                'REFERENCES (public\.)?' || p_table || '\(',
+                                'REFERENCES ' || p_registry || '(')
+            ELSE pg_get_constraintdef(oid)
+        END
+    ) ORDER BY conname), '{}')
+    INTO ddl
+    FROM pg_constraint
+    WHERE contype = 'f' AND (conrelid = old_oid OR confrelid = old_oid);
+
+    SELECT ddl || coalesce(array_agg(pg_get_triggerdef(oid) ORDER BY tgname), '{}')
+    INTO ddl
+    FROM pg_trigger
+    WHERE tgrelid = old_oid AND NOT tgisinternal;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE)'
+        ' PARTITION BY RANGE (effective_date)',
+        staging, p_table
+    );
+    PERFORM _finance_create_period_partitions(staging, p_table);
+    EXECUTE format('INSERT INTO %I SELECT * FROM %I', staging, p_table);
+
+    -- Lines written before effective_date was denormalized take the entry's
+    IF p_table = 'journal_lines' THEN
+        EXECUTE format(
+            'UPDATE %I jl SET effective_date = je.effective_date'
+            ' FROM journal_entries je'
+            ' WHERE je.id = jl.journal_entry_id AND jl.effective_date IS NULL',
+            staging
+        );
+    END IF;
+
+    EXECUTE format('DROP TABLE %I CASCADE', p_table);
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', staging, p_table);
+    EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id, effective_date)', p_table);
+
+    FOREACH stmt IN ARRAY ddl LOOP
+        EXECUTE stmt;
+    END LOOP;
+
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_partition_key ON %I', p_table, p_table);
+    EXECUTE format(
+        'CREATE TRIGGER trg_%s_partition_key BEFORE UPDATE ON %I'
+        ' FOR EACH ROW EXECUTE FUNCTION prevent_partition_key_change()',
+        p_table, p_table
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Function: Convert the journal and subledger tables to the partitioned
+-- layout.  No-op when already converted.  Returns the number of period
+-- partitions created.
+CREATE OR REPLACE FUNCTION finance_partition_by_period()
+RETURNS INTEGER AS $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE oid = to_regclass('journal_entries') AND relkind = 'p'
+    ) THEN
+        RETURN 0;
+    END IF;
+
+    CREATE TABLE journal_entry_keys (
+        id              VARCHAR(36) PRIMARY KEY,
+        effective_date  DATE NOT NULL,
+        idempotency_key VARCHAR(300) NOT NULL CONSTRAINT uq_journal_entry_keys_idempotency UNIQUE,
+        seq             BIGINT CONSTRAINT uq_journal_entry_keys_seq UNIQUE,
+        reversal_of_id  VARCHAR(36)
+    );
+    CREATE UNIQUE INDEX uq_journal_entry_keys_reversal_of
+        ON journal_entry_keys (reversal_of_id) WHERE reversal_of_id IS NOT NULL;
+    INSERT INTO journal_entry_keys (id, effective_date, idempotency_key, seq, reversal_of_id)
+    SELECT id, effective_date, idempotency_key, seq, reversal_of_id FROM journal_entries;
+
+    CREATE TABLE subledger_entry_keys (
+        id               VARCHAR(36) PRIMARY KEY,
+        effective_date   DATE NOT NULL,
+        journal_entry_id VARCHAR(36) NOT NULL,
+        subledger_type   VARCHAR(30) NOT NULL,
+        source_line_id   VARCHAR(100),
+        CONSTRAINT uq_subledger_entry_keys_idempotency
+            UNIQUE (journal_entry_id, subledger_type, source_line_id)
+    );
+    INSERT INTO subledger_entry_keys (id, effective_date, journal_entry_id, subledger_type, source_line_id)
+    SELECT id, effective_date, journal_entry_id, subledger_type, source_line_id FROM subledger_entries;
+
+    -- Lines carry their entry's effective_date as the partition key
+    ALTER TABLE journal_lines ADD COLUMN IF NOT EXISTS effective_date DATE;
+
+    PERFORM _finance_partition_table('journal_entries', 'journal_entry_keys');
+    PERFORM _finance_partition_table('journal_lines', 'journal_entry_keys');
+    PERFORM _finance_partition_table('subledger_entries', 'subledger_entry_keys');
+
+    CREATE TRIGGER trg_journal_entry_keys_sync
+        AFTER INSERT OR UPDATE OR DELETE ON journal_entries
+        FOR EACH ROW
+        EXECUTE FUNCTION sync_journal_entry_keys();
+
+    CREATE TRIGGER trg_subledger_entry_keys_sync
+        AFTER INSERT OR UPDATE OR DELETE ON subledger_entries
+        FOR EACH ROW
+        EXECUTE FUNCTION sync_subledger_entry_keys();
+
+    DROP TRIGGER IF EXISTS trg_fiscal_period_create_partitions ON fiscal_periods;
+    CREATE TRIGGER trg_fiscal_period_create_partitions
+        AFTER INSERT ON fiscal_periods
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION create_fiscal_period_partitions();
+
+    RETURN (
+        SELECT count(*)::INTEGER FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent IN ('journal_entries'::regclass, 'journal_lines'::regclass,
+                              'subledger_entries'::regclass)
+          AND c.relname NOT LIKE '%\_default'
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- -----------------------------------------------------------------------------
+-- Archival
+-- -----------------------------------------------------------------------------
+
+-- Function: Move a locked period's partitions (and their indexes) to
+-- p_tablespace and/or detach them from the partitioned parents.  Detached
+-- partitions stay as read-only standalone tables; their registry rows stay,
+-- so archived idempotency keys and seq values remain reserved.
+-- Returns the number of partitions processed.
+CREATE OR REPLACE FUNCTION finance_archive_period_partition(
+    p_period_code TEXT,
+    p_tablespace TEXT DEFAULT NULL,
+    p_detach BOOLEAN DEFAULT FALSE
+)
+RETURNS INTEGER AS $$
+DECLARE
+    period_status TEXT;
+    parent TEXT;
+    part TEXT;
+    idx TEXT;
+    processed INTEGER := 0;
+BEGIN
+    SELECT status INTO period_status FROM fiscal_periods WHERE period_code = p_period_code;
+    IF period_status IS NULL THEN
+        RAISE EXCEPTION 'Fiscal period % does not exist', p_period_code
+            USING ERRCODE = 'no_data_found';
+    END IF;
+    IF period_status != 'locked' THEN
+        RAISE EXCEPTION 'Cannot archive fiscal period % with status % (must be locked)',
+            p_period_code, period_status
+            USING ERRCODE = 'restrict_violation';
+    END IF;
+
+    FOREACH parent IN ARRAY ARRAY['journal_entries', 'journal_lines', 'subledger_entries'] LOOP
+        part := finance_period_partition_name(parent, p_period_code);
+        CONTINUE WHEN to_regclass(part) IS NULL;
+
+        IF p_tablespace IS NOT NULL THEN
+            EXECUTE format('ALTER TABLE %I SET TABLESPACE %I', part, p_tablespace);
+            FOR idx IN SELECT indexrelid::regclass::TEXT FROM pg_index WHERE indrelid = part::regclass LOOP
+                EXECUTE format('ALTER INDEX %s SET TABLESPACE %I', idx, p_tablespace);
+            END LOOP;
+        END IF;
+
+        IF p_detach AND EXISTS (SELECT 1 FROM pg_inherits WHERE inhrelid = part::regclass) THEN
+            EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, part);
+            EXECUTE format(
+                'CREATE TRIGGER trg_archived_partition_immutability'
+                ' BEFORE UPDATE OR DELETE ON %I'
+                ' FOR EACH ROW EXECUTE FUNCTION prevent_archived_partition_modification()',
+                part
+            );
+        END IF;
+
+        processed := processed + 1;
+    END LOOP;
+
+    RETURN processed;
+END;
+$$ LANGUAGE plpgsql;
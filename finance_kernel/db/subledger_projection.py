@@ -0,0 +1,216 @@
+"""ORM-level maintenance of the subledger balance projection (SL-P1).
+
+``subledger_entity_balances`` holds per-(subledger_type, entity_id, currency)
+totals, entry counts and open-item counts so balance and aging reads do not
+scan ``subledger_entries``.  A Session ``before_flush`` listener applies each
+flush's entry inserts, deletes and updates as deltas in the same transaction;
+``backfill_subledger_entity_balances`` rebuilds the table from the entries
+at schema setup.
+"""
+
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from finance_kernel.logging_config import get_logger
+
+logger = get_logger("db.subledger_projection")
+
+
+_SUBLEDGER_PROJECTION_FIELDS = (
+    "subledger_type",
+    "entity_id",
+    "currency",
+    "debit_amount",
+    "credit_amount",
+    "effective_date",
+    "reconciliation_status",
+)
+
+
+def _subledger_projection_values(target, committed: bool) -> tuple:
+    """Projection-relevant field values of a subledger entry.
+
+    ``committed`` selects the values as loaded from the database (the row the
+    projection currently includes) instead of the pending ones.
+    """
+    from sqlalchemy.orm.attributes import get_history
+
+    values = []
+    for field in _SUBLEDGER_PROJECTION_FIELDS:
+        value = getattr(target, field)
+        if committed:
+            history = get_history(target, field)
+            if history.deleted:
+                value = history.deleted[0]
+        values.append(value)
+    return tuple(values)
+
+
+def _maintain_subledger_balances_before_flush(session, flush_context, instances):
+    """Apply flushed subledger entry writes to subledger_entity_balances (SL-P1).
+
+    Inserts add the entry, deletes subtract it, and updates subtract the
+    committed values and add the pending ones, so a reconciliation status
+    change moves the open-item count and a pre-posting amount correction
+    moves the totals.  Deltas are summed per (subledger_type, entity_id,
+    currency) and applied with one upsert per key in the flush's transaction.
+    """
+    from decimal import Decimal
+
+    from sqlalchemy import text
+
+    from finance_kernel.models.subledger import (
+        ReconciliationStatus,
+        SubledgerEntryModel,
+    )
+
+    open_statuses = (
+        None,  # column default, applied at INSERT
+        ReconciliationStatus.OPEN.value,
+        ReconciliationStatus.PARTIAL.value,
+    )
+    deltas: dict[tuple[str, str, str], list] = {}
+
+    def apply(values: tuple, sign: int) -> None:
+        sl_type, entity_id, currency, debit, credit, effective, status = values
+        if isinstance(status, ReconciliationStatus):
+            status = status.value
+        delta = deltas.setdefault(
+            (str(sl_type), str(entity_id), str(currency).upper()),
+            [Decimal("0"), Decimal("0"), 0, 0, None],
+        )
+        delta[0] += sign * Decimal(str(debit or 0))
+        delta[1] += sign * Decimal(str(credit or 0))
+        delta[2] += sign
+        delta[3] += sign if status in open_statuses else 0
+        if sign > 0 and effective is not None:
+            delta[4] = effective if delta[4] is None else max(delta[4], effective)
+
+    for obj in session.new:
+        if isinstance(obj, SubledgerEntryModel):
+            apply(_subledger_projection_values(obj, committed=False), 1)
+    for obj in session.deleted:
+        if isinstance(obj, SubledgerEntryModel):
+            apply(_subledger_projection_values(obj, committed=True), -1)
+    for obj in session.dirty:
+        if not isinstance(obj, SubledgerEntryModel) or not session.is_modified(obj):
+            continue
+        before = _subledger_projection_values(obj, committed=True)
+        after = _subledger_projection_values(obj, committed=False)
+        if before != after:
+            apply(before, -1)
+            apply(after, 1)
+
+    pending = {
+        key: delta for key, delta in deltas.items()
+        if delta[0] or delta[1] or delta[2] or delta[3] or delta[4] is not None
+    }
+    if not pending:
+        return
+
+    with session.no_autoflush:
+        for (sl_type, entity_id, currency), delta in sorted(pending.items()):
+            session.execute(
+                text("""
+                    INSERT INTO subledger_entity_balances (
+                        id, subledger_type, entity_id, currency,
+                        debit_total, credit_total, entry_count,
+                        open_item_count, last_effective_date
+                    )
+                    VALUES (
+                        :id, :subledger_type, :entity_id, :currency,
+                        :debit, :credit, :entries, :open_items, :effective
+                    )
+                    ON CONFLICT (subledger_type, entity_id, currency)
+                    DO UPDATE SET
+                        debit_total = subledger_entity_balances.debit_total + :debit,
+                        credit_total = subledger_entity_balances.credit_total + :credit,
+                        entry_count = subledger_entity_balances.entry_count + :entries,
+                        open_item_count =
+                            subledger_entity_balances.open_item_count + :open_items,
+                        last_effective_date = GREATEST(
+                            subledger_entity_balances.last_effective_date,
+                            :effective
+                        )
+                """),
+                {
+                    "id": str(uuid4()),
+                    "subledger_type": sl_type,
+                    "entity_id": entity_id,
+                    "currency": currency,
+                    "debit": delta[0],
+                    "credit": delta[1],
+                    "entries": delta[2],
+                    "open_items": delta[3],
+                    "effective": delta[4],
+                },
+            )
+
+
+def backfill_subledger_entity_balances(connection) -> int:
+    """Rebuild subledger_entity_balances from subledger_entries (SL-P1).
+
+    The before_flush listener only applies deltas, so a key whose entries
+    predate the projection table would get a row holding just the first
+    new entry.  Run at schema setup, before writes are served: every key
+    is recomputed with one GROUP BY and upserted over any existing row.
+    Returns the number of keys written.
+    """
+    from sqlalchemy import text
+
+    from finance_kernel.models.subledger import ReconciliationStatus
+
+    result = connection.execute(
+        text("""
+            INSERT INTO subledger_entity_balances (
+                id, subledger_type, entity_id, currency,
+                debit_total, credit_total, entry_count,
+                open_item_count, last_effective_date
+            )
+            SELECT
+                gen_random_uuid()::text, subledger_type, entity_id,
+                UPPER(currency),
+                COALESCE(SUM(debit_amount), 0),
+                COALESCE(SUM(credit_amount), 0),
+                COUNT(*),
+                COUNT(*) FILTER (
+                    WHERE reconciliation_status IN (:open, :partial)
+                ),
+                MAX(effective_date)
+            FROM subledger_entries
+            GROUP BY subledger_type, entity_id, UPPER(currency)
+            ON CONFLICT (subledger_type, entity_id, currency)
+            DO UPDATE SET
+                debit_total = EXCLUDED.debit_total,
+                credit_total = EXCLUDED.credit_total,
+                entry_count = EXCLUDED.entry_count,
+                open_item_count = EXCLUDED.open_item_count,
+                last_effective_date = EXCLUDED.last_effective_date
+        """),
+        {
+            "open": ReconciliationStatus.OPEN.value,
+            "partial": ReconciliationStatus.PARTIAL.value,
+        },
+    )
+    if result.rowcount:
+        logger.info(
+            "subledger_balance_projection_backfilled",
+            extra={"keys": result.rowcount},
+        )
+    return result.rowcount
+
+
+def register_subledger_projection_listeners():
+    """Register the subledger balance projection listener (SL-P1)."""
+    listener = _maintain_subledger_balances_before_flush
+    if not event.contains(Session, "before_flush", listener):
+        event.listen(Session, "before_flush", listener)
+
+
+def unregister_subledger_projection_listeners():
+    """Remove the subledger balance projection listener. WARNING: tests only."""
+    listener = _maintain_subledger_balances_before_flush
+    if event.contains(Session, "before_flush", listener):
+        event.remove(Session, "before_flush", listener)
@@ -113,7 +113,7 @@ def triggers_installed(engine: Engine) -> bool:
     """Check if all immutability triggers are installed."""
     trigger_list = ", ".join(f"'{name}'" for name in ALL_TRIGGER_NAMES)
     check_sql = f"""
-    SELECT COUNT(*) FROM pg_trigger
+    SELECT COUNT(DISTINCT tgname) FROM pg_trigger
     WHERE tgname IN ({trigger_list});
     """
 
@@ -126,7 +126,7 @@ def get_installed_triggers(engine: Engine) -> list[str]:
     """Get list of installed immutability trigger names."""
     trigger_list = ", ".join(f"'{name}'" for name in ALL_TRIGGER_NAMES)
     check_sql = f"""
-    SELECT tgname FROM pg_trigger
+    SELECT DISTINCT tgname FROM pg_trigger
     WHERE tgname IN ({trigger_list})
     ORDER BY tgname;
     """
@@ -1,5 +1,6 @@
 """MeaningBuilder -- Extracts economic meaning from business events."""
 
+import logging
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
@@ -196,16 +197,17 @@ class MeaningBuilder:
         target_ledgers: frozenset[str] | None = None,
     ) -> MeaningBuilderResult:
         """Build economic meaning from an event using a profile."""
-        logger.debug(
-            "meaning_build_started",
-            extra={
-                "event_id": str(event_id),
-                "event_type": event_type,
-                "profile": profile.name,
-                "profile_version": profile.version,
-                "effective_date": str(effective_date),
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "meaning_build_started",
+                extra={
+                    "event_id": event_id,
+                    "event_type": event_type,
+                    "profile": profile.name,
+                    "profile_version": profile.version,
+                    "effective_date": str(effective_date),
+                },
+            )
 
         # Policy validation (if registry provided and module specified)
         if self._policy_registry and module_type and target_ledgers:
@@ -294,17 +296,18 @@ class MeaningBuilder:
             created_at=created_at,
         )
 
-        logger.info(
-            "meaning_derived",
-            extra={
-                "event_id": str(event_id),
-                "event_type": event_type,
-                "profile": profile.name,
-                "economic_type": profile.meaning.economic_type,
-                "quantity": str(quantity) if quantity is not None else None,
-                "has_dimensions": dimensions is not None,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "meaning_derived",
+                extra={
+                    "event_id": event_id,
+                    "event_type": event_type,
+                    "profile": profile.name,
+                    "economic_type": profile.meaning.economic_type,
+                    "quantity": quantity,
+                    "has_dimensions": dimensions is not None,
+                },
+            )
 
         return MeaningBuilderResult.ok(economic_event, guard_result)
 
@@ -314,18 +317,20 @@ class MeaningBuilder:
         guards: tuple[GuardCondition, ...],
     ) -> GuardEvaluationResult:
         """Evaluate guard conditions against payload (P12)."""
+        log_guards = logger.isEnabledFor(logging.INFO)
         for guard in guards:
             triggered = self._evaluate_expression(payload, guard.expression)
-            logger.info(
-                "guard_evaluated",
-                extra={
-                    "guard_type": guard.guard_type.value,
-                    "expression": guard.expression,
-                    "reason_code": guard.reason_code,
-                    "triggered": triggered,
-                    "passed": not triggered,
-                },
-            )
+            if log_guards:
+                logger.info(
+                    "guard_evaluated",
+                    extra={
+                        "guard_type": guard.guard_type.value,
+                        "expression": guard.expression,
+                        "reason_code": guard.reason_code,
+                        "triggered": triggered,
+                        "passed": not triggered,
+                    },
+                )
             if triggered:
                 if guard.guard_type == GuardType.REJECT:
                     return GuardEvaluationResult.reject(
@@ -30,13 +30,20 @@ logger = get_logger("domain.policy_bridge")
 
 @dataclass(frozen=True)
 class ModuleLineMapping:
-    """Canonical line mapping for AccountingIntent construction."""
+    """Canonical line mapping for AccountingIntent construction.
+
+    A ``foreach`` mapping posts one line per item of the payload collection,
+    or one line for the event amount when the collection is empty or absent.
+    With ``skip_empty`` an explicitly empty collection posts no line
+    (consolidated events that split their lines across several collections).
+    """
 
     role: str
     side: str
     ledger: str = "GL"
     from_context: str | None = None
     foreach: str | None = None
+    skip_empty: bool = False
 
 
 @dataclass(frozen=True)
@@ -171,6 +178,7 @@ def convert_line_mapping(local_mapping: Any, role_value: str) -> ModuleLineMappi
         side=local_mapping.side,
         from_context=getattr(local_mapping, "from_context", None),
         foreach=getattr(local_mapping, "foreach", None),
+        skip_empty=getattr(local_mapping, "skip_empty", False),
     )
 
 
@@ -321,12 +329,16 @@ def _build_intent_lines(
             )
             for item in collection:
                 item_amount = _extract_amount(item, amount)
+                dimensions, memo = _extract_line_detail(item)
                 lines.append(
                     _create_intent_line(
-                        mapping.role, mapping.side, item_amount, currency
+                        mapping.role, mapping.side, item_amount, currency,
+                        dimensions=dimensions, memo=memo,
                     )
                 )
-            if not collection:
+            if not collection and not (
+                mapping.skip_empty and mapping.foreach in payload
+            ):
                 lines.append(
                     _create_intent_line(
                         mapping.role, mapping.side, amount, currency
@@ -388,14 +400,38 @@ def _extract_amount(item: Any, default: Decimal) -> Decimal:
     return default
 
 
+def _extract_line_detail(item: Any) -> tuple[dict[str, str] | None, str | None]:
+    """Extract optional per-line ``dimensions`` and ``memo`` from a collection item."""
+    if not isinstance(item, dict):
+        return None, None
+    dims = item.get("dimensions")
+    dimensions = (
+        {str(k): str(v) for k, v in dims.items() if v is not None}
+        if isinstance(dims, dict) and dims else None
+    )
+    memo = item.get("memo")
+    return dimensions, str(memo) if memo is not None else None
+
+
 def _create_intent_line(
-    role: str, side: str, amount: Decimal, currency: str
+    role: str,
+    side: str,
+    amount: Decimal,
+    currency: str,
+    dimensions: dict[str, str] | None = None,
+    memo: str | None = None,
 ) -> IntentLine:
     """Create an IntentLine for the given role and side."""
     if side == "debit":
-        return IntentLine.debit(role=role, amount=amount, currency=currency)
+        return IntentLine.debit(
+            role=role, amount=amount, currency=currency,
+            dimensions=dimensions, memo=memo,
+        )
     else:
-        return IntentLine.credit(role=role, amount=amount, currency=currency)
+        return IntentLine.credit(
+            role=role, amount=amount, currency=currency,
+            dimensions=dimensions, memo=memo,
+        )
 
 
 # ---------------------------------------------------------------------------
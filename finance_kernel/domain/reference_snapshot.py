@@ -32,6 +32,7 @@ class ComponentVersion:
     content_hash: str  # SHA-256 of component state
     effective_from: datetime
     effective_to: datetime | None = None  # None = current
+    change_stamp: int | None = None  # Component change stamp at capture; None = unstamped
 
     def __post_init__(self) -> None:
         if self.version < 1:
@@ -3,13 +3,18 @@
 __all__ = [
     "StructuredFormatter",
     "LogContext",
+    "QueueingHandler",
+    "BatchingLogWriter",
     "get_logger",
     "configure_logging",
+    "flush_logging",
     "reset_logging",
 ]
 
+import atexit
 import json
 import logging
+import queue
 import threading
 import time
 from contextvars import ContextVar
@@ -150,9 +155,13 @@ class _LogContextManager:
 # JSON Formatter
 # ---------------------------------------------------------------------------
 
+# Attribute set by QueueingHandler: LogContext captured on the emitting thread
+# (ContextVars are not visible from the writer thread).
+_RECORD_CONTEXT_ATTR = "_log_context"
+
 _STDLIB_KEYS: frozenset[str] = frozenset(
     vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
-) | {"message", "taskName"}
+) | {"message", "taskName", _RECORD_CONTEXT_ATTR}
 
 
 class _JSONEncoder(json.JSONEncoder):
@@ -186,8 +195,11 @@ class StructuredFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
+        # Context captured at enqueue time (queued mode), else the live context.
         # Use snapshot when set (one get_all() per request instead of per record)
-        ctx = LogContext.get_snapshot() or LogContext.get_all()
+        ctx = getattr(record, _RECORD_CONTEXT_ATTR, None)
+        if ctx is None:
+            ctx = LogContext.get_snapshot() or LogContext.get_all()
         payload.update(ctx)
         for key, val in vars(record).items():
             if key not in _STDLIB_KEYS and key not in payload:
@@ -249,12 +261,169 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(f"{_LOGGER_PREFIX}.{name}")
 
 
+# ---------------------------------------------------------------------------
+# Queued (asynchronous) pipeline
+# ---------------------------------------------------------------------------
+
+
+class QueueingHandler(logging.Handler):
+    """Emitting-thread side of the queued pipeline: capture context, enqueue.
+
+    The posting thread pays for one ContextVar read and one queue put per
+    record.  Message interpolation, extra-field serialisation, ``json.dumps``
+    and I/O all happen on the ``BatchingLogWriter`` thread.
+
+    Unlike ``logging.handlers.QueueHandler`` the record is not pre-formatted
+    on the emitting thread; extras must therefore not be mutated after the
+    log call (log values, not live objects).  ``handle`` skips the handler
+    lock -- the queue is already thread-safe.
+    """
+
+    def __init__(self, record_queue: "queue.SimpleQueue[Any]", level: int = logging.NOTSET):
+        super().__init__(level)
+        self._queue = record_queue
+
+    def handle(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        if self.filters and not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if getattr(record, _RECORD_CONTEXT_ATTR, None) is None:
+            setattr(
+                record,
+                _RECORD_CONTEXT_ATTR,
+                LogContext.get_snapshot() or LogContext.get_all(),
+            )
+        self._queue.put(record)
+
+
+class _FlushMarker:
+    """Queue sentinel: set once every record enqueued before it is written."""
+
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class BatchingLogWriter:
+    """Background thread that formats and writes queued records in batches.
+
+    Drains up to ``batch_size`` records per wake-up.  For a ``StreamHandler``
+    the batch is formatted, joined, and written with a single ``write`` and
+    ``flush`` under the handler lock; any other handler receives the records
+    one by one through ``handle`` (still off the emitting thread).
+    """
+
+    def __init__(self, handler: logging.Handler, *, batch_size: int = 256):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._handler = handler
+        self._batch_size = batch_size
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def queue(self) -> "queue.SimpleQueue[Any]":
+        return self._queue
+
+    @property
+    def handler(self) -> logging.Handler:
+        return self._handler
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="finance-kernel-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until every record enqueued so far is written."""
+        if self._thread is None:
+            return True
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Write everything already queued, then stop the thread."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        q = self._queue
+        while True:
+            batch: list[logging.LogRecord] = []
+            markers: list[_FlushMarker] = []
+            stop = False
+            item = q.get()
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, _FlushMarker):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+            for marker in markers:
+                marker.done.set()
+            if stop:
+                return
+
+    def _write(self, batch: list[logging.LogRecord]) -> None:
+        h = self._handler
+        if not isinstance(h, logging.StreamHandler):
+            for record in batch:
+                if record.levelno >= h.level:
+                    h.handle(record)
+            return
+        lines: list[str] = []
+        for record in batch:
+            if record.levelno < h.level or not h.filter(record):
+                continue
+            try:
+                lines.append(h.format(record))
+            except Exception:
+                h.handleError(record)
+        if not lines:
+            return
+        lines.append("")
+        h.acquire()
+        try:
+            h.stream.write(h.terminator.join(lines))
+            h.flush()
+        except Exception:
+            h.handleError(batch[-1])
+        finally:
+            h.release()
+
+
 # ---------------------------------------------------------------------------
 # Initialization
 # ---------------------------------------------------------------------------
 
 _configured = False
 _lock = threading.Lock()
+_writer: BatchingLogWriter | None = None
 
 
 def configure_logging(
@@ -262,9 +431,15 @@ def configure_logging(
     level: int = logging.INFO,
     stream: Any = None,
     handler: logging.Handler | None = None,
+    queued: bool = False,
+    batch_size: int = 256,
 ) -> None:
-    """Configure the finance_kernel logger hierarchy (idempotent)."""
-    global _configured
+    """Configure the finance_kernel logger hierarchy (idempotent).
+
+    queued: When True the emitting thread only enqueues records; a
+    ``BatchingLogWriter`` thread formats and writes them in batches.
+    """
+    global _configured, _writer
     with _lock:
         if _configured:
             return
@@ -282,14 +457,34 @@ def configure_logging(
         h = logging.StreamHandler(stream or sys.stderr)
 
     h.setFormatter(StructuredFormatter())
-    root_logger.addHandler(h)
+    if not queued:
+        root_logger.addHandler(h)
+        return
+
+    writer = BatchingLogWriter(h, batch_size=batch_size)
+    writer.start()
+    _writer = writer
+    atexit.register(writer.stop)
+    root_logger.addHandler(QueueingHandler(writer.queue))
+
+
+def flush_logging(timeout: float | None = 5.0) -> bool:
+    """Block until queued records are written (no-op in synchronous mode)."""
+    writer = _writer
+    if writer is None:
+        return True
+    return writer.flush(timeout)
 
 
 def reset_logging() -> None:
     """Reset logging configuration. FOR TESTING ONLY."""
-    global _configured
+    global _configured, _writer
     with _lock:
         _configured = False
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
+        atexit.unregister(writer.stop)
     logger = logging.getLogger(_LOGGER_PREFIX)
     logger.handlers.clear()
     logger.setLevel(logging.WARNING)
@@ -28,8 +28,14 @@ from finance_kernel.models.journal import (
     LineSide,
 )
 from finance_kernel.models.party import Party, PartyStatus, PartyType
+from finance_kernel.models.period_close_balance import (
+    PeriodCloseBalanceModel,
+    PeriodCloseSnapshotModel,
+)
+from finance_kernel.models.reference_stamp import ReferenceComponentStamp
 from finance_kernel.models.subledger import (
     ReconciliationFailureReportModel,
+    SubledgerEntityBalanceModel,
     SubledgerEntryModel,
     SubledgerPeriodStatus,
     SubledgerPeriodStatusModel,
@@ -45,6 +51,8 @@ __all__ = [
     "NormalBalance",
     "FiscalPeriod",
     "PeriodStatus",
+    "PeriodCloseSnapshotModel",
+    "PeriodCloseBalanceModel",
     "Event",
     "JournalEntry",
     "JournalLine",
@@ -58,6 +66,7 @@ __all__ = [
     "Party",
     "PartyType",
     "PartyStatus",
+    "ReferenceComponentStamp",
     "Contract",
     "ContractLineItem",
     "ContractStatus",
@@ -70,6 +79,7 @@ __all__ = [
     "VALID_TRANSITIONS",
     "SubledgerReconciliationStatus",
     "SubledgerEntryModel",
+    "SubledgerEntityBalanceModel",
     "SubledgerReconciliationModel",
     "ReconciliationFailureReportModel",
     "SubledgerPeriodStatus",
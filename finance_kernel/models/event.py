@@ -69,6 +69,7 @@ class Event(Base):
         Index("idx_event_type_effective", "event_type", "effective_date"),
         Index("idx_event_effective_occurred", "effective_date", "occurred_at"),
         Index("idx_event_producer", "producer"),
+        Index("idx_event_ingested", "ingested_at", "id"),
     )
 
     # Globally unique event identifier (not the same as the row id)
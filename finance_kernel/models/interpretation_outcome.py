@@ -188,7 +188,7 @@ class InterpretationOutcome(Base):
 
     # Decision journal — structured log records captured during interpretation.
     # Stored as a JSON array of dicts, each with ts, message, and structured fields.
-    # Populated automatically by InterpretationCoordinator via LogCapture.
+    # Populated automatically by InterpretationCoordinator via DecisionJournal.
     decision_log: Mapped[list | None] = mapped_column(
         JSON,
         nullable=True,
@@ -439,6 +439,13 @@ class JournalLine(TrackedBase):
         default=0,
     )
 
+    # Copy of the parent entry's effective_date (partition key when the
+    # period-partitioned layout in db/partitioning.py is installed)
+    effective_date: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+    )
+
     # Relationships
     entry: Mapped["JournalEntry"] = relationship(
         back_populates="lines",
@@ -0,0 +1,170 @@
+"""
+Module: finance_kernel.models.period_close_balance
+Responsibility: ORM persistence for the sealed closing-balance snapshot
+    written when a fiscal period is locked -- one header per period and one
+    row per (account, currency, dimension set) with the cumulative posted
+    totals as of the period's end date.
+Architecture position: Kernel > Models.  May import from db/base.py only.
+
+Invariants enforced:
+    R10 -- Snapshot headers and balance rows are append-only; ORM listeners
+           in db/immutability.py reject every update and delete.
+    R24 -- ``ledger_hash`` is the canonical ledger hash over the lines the
+           snapshot summarizes; ``seal_hash`` binds it to the balance rows.
+
+Failure modes:
+    - IntegrityError on a second snapshot for the same period
+      (uq_period_close_snapshot_period).
+    - ImmutabilityViolationError on update or delete (R10).
+
+Audit relevance:
+    A locked period's lines never change (R12), so its closing balances are
+    a stable starting point for every later as-of query.  The snapshot is a
+    derived artifact, never a source of truth: LedgerSelector.
+    verify_close_snapshot recomputes it from the journal and checks the seal.
+"""
+
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from finance_kernel.db.base import Base, TrackedBase, UUIDString
+
+
+class PeriodCloseSnapshotModel(TrackedBase):
+    """
+    Sealed closing-balance snapshot of one locked fiscal period.
+
+    Contract:
+        Covers every posted line with effective_date <= ``end_date`` and
+        entry seq <= ``seq_watermark`` (the last posted seq when the period
+        was locked).  Lines posted later -- in later periods, or backdated
+        into a still-open earlier period -- have a higher seq and are read
+        as the tail on top of the snapshot.
+
+    Guarantees:
+        - One snapshot per period (uq_period_close_snapshot_period).
+        - ``balances_hash`` is the SHA-256 over the canonical balance rows;
+          ``seal_hash`` is the SHA-256 over (period_code, end_date,
+          seq_watermark, ledger_hash, balances_hash).
+        - Immutable after creation (ORM listener, R10).
+    """
+
+    __tablename__ = "period_close_snapshots"
+
+    __table_args__ = (
+        UniqueConstraint("period_code", name="uq_period_close_snapshot_period"),
+        Index("idx_period_close_snapshot_end", "end_date"),
+    )
+
+    period_code: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    end_date: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+    # Last posted JournalEntry.seq covered by the snapshot (0 when none)
+    seq_watermark: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    # R24 canonical ledger hash over the covered lines
+    ledger_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    balances_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    seal_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    cell_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<PeriodCloseSnapshot {self.period_code}: {self.seal_hash[:12]}>"
+
+
+class PeriodCloseBalanceModel(Base):
+    """
+    Cumulative posted totals of one (account, currency, dimension set) cell.
+
+    Contract:
+        ``dimensions_key`` is the canonical dimensions JSON used by the R24
+        hash (sorted keys, compact separators; empty string when the lines
+        carry no dimensions), so cells are unique regardless of the key
+        order the lines were written with.
+
+    Guarantees:
+        - One row per cell within a snapshot (uq_period_close_balance_cell).
+        - Immutable after creation (ORM listener, R10).
+    """
+
+    __tablename__ = "period_close_balances"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "snapshot_id",
+            "account_id",
+            "currency",
+            "dimensions_key",
+            name="uq_period_close_balance_cell",
+        ),
+        Index("idx_period_close_balance_account", "snapshot_id", "account_id"),
+    )
+
+    snapshot_id: Mapped[UUID] = mapped_column(
+        UUIDString(),
+        ForeignKey("period_close_snapshots.id"),
+        nullable=False,
+    )
+    account_id: Mapped[UUID] = mapped_column(
+        UUIDString(),
+        ForeignKey("accounts.id"),
+        nullable=False,
+    )
+    currency: Mapped[str] = mapped_column(
+        String(3),
+        nullable=False,
+    )
+    dimensions_key: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+    dimensions: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+    debit_total: Mapped[Decimal] = mapped_column(
+        Numeric(38, 9),
+        nullable=False,
+    )
+    credit_total: Mapped[Decimal] = mapped_column(
+        Numeric(38, 9),
+        nullable=False,
+    )
+    line_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
@@ -0,0 +1,58 @@
+"""
+Module: finance_kernel.models.reference_stamp
+Responsibility: ORM persistence for per-component reference data change
+    stamps.  One row per stamped snapshot component (coa, dimension_schema,
+    fx_rates) holding a monotonically increasing counter that is bumped in
+    the same transaction as any ORM write to that component's tables.
+Architecture position: Kernel > Models.  May import from db/base.py only.
+    MUST NOT import from services/, selectors/, domain/, or outer layers.
+
+Invariants enforced:
+    R21 -- Reference snapshot determinism.  A snapshot records the stamp of
+           each stamped component at capture time; an unchanged stamp proves
+           the component's rows have not been written since, so the freshness
+           check can skip re-hashing the component.
+    Stamps only ever increase (bumped by ``stamp = stamp + 1`` upsert in the
+    before_flush listener in db/immutability.py).
+
+Failure modes:
+    - A missing row reads as stamp 0 (component never written through the ORM).
+    - Core-level bulk writes that bypass the ORM flush do not bump the stamp;
+      ``ReferenceSnapshotService.validate_integrity`` remains the full check.
+
+Audit relevance:
+    Stamps are operational metadata, not ledger data.  They let every
+    posting prove its reference snapshot is current without reloading the
+    whole chart of accounts, dimension schema, and rate table.
+"""
+
+from sqlalchemy import BigInteger, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from finance_kernel.db.base import Base
+
+
+class ReferenceComponentStamp(Base):
+    """
+    Change counter for one reference data component.
+
+    Contract:
+        ``component`` is a ``SnapshotComponentType`` value; ``stamp`` is the
+        number of flushes that have written the component's tables.
+
+    Non-goals:
+        - Does NOT record what changed; content hashes on the snapshot do.
+    """
+
+    __tablename__ = "reference_component_stamps"
+
+    __table_args__ = (
+        UniqueConstraint("component", name="uq_reference_component_stamp"),
+    )
+
+    component: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    stamp: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ReferenceComponentStamp {self.component}={self.stamp}>"
@@ -20,6 +20,9 @@ Invariants enforced:
     F13    -- subledger_type is persisted as SubledgerType.value (canonical string).
     F16    -- GL linkage uses journal_entry_id / journal_line_id (canonical names).
     F17    -- period_code references FiscalPeriod.period_code (FK integrity).
+    SL-P1  -- SubledgerEntityBalanceModel holds the running totals of every
+              (subledger_type, entity_id, currency) and is maintained in the
+              same flush as the entry writes it summarizes.
 
 Failure modes:
     - IntegrityError on duplicate (journal_entry_id, subledger_type, source_line_id)
@@ -35,6 +38,8 @@ Audit relevance:
     that subledger aggregate balances match GL control account balances.
     ReconciliationFailureReportModel is a sacred audit artifact that records
     any GL/SL divergence detected during period close.
+    SubledgerEntityBalanceModel is a derived projection, never a source of
+    truth; it can always be rebuilt from subledger_entries.
 """
 
 from datetime import date, datetime
@@ -56,7 +61,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from finance_kernel.db.base import TrackedBase, UUIDString
+from finance_kernel.db.base import Base, TrackedBase, UUIDString
 
 
 class ReconciliationStatus(str, Enum):
@@ -208,6 +213,88 @@ class SubledgerEntryModel(TrackedBase):
     )
 
 
+class SubledgerEntityBalanceModel(Base):
+    """
+    Running balance projection for one entity in one subledger and currency.
+
+    Contract:
+        One row per (subledger_type, entity_id, currency).  Totals cover every
+        entry of the key regardless of effective date; as-of balances are the
+        projection minus the entries dated after the as-of date.
+        ``last_effective_date`` is the latest effective date ever added, so a
+        query dated on or after it needs no correction at all.
+
+    Guarantees:
+        - Updated by the before_flush listener in db/subledger_projection.py
+          with an ``INSERT ... ON CONFLICT DO UPDATE`` delta upsert in the
+          same transaction as the entry insert, reconciliation update, or
+          delete.
+        - open_item_count counts entries in OPEN or PARTIAL status.
+
+    Non-goals:
+        - Core-level bulk writes to subledger_entries bypass the ORM flush
+          and therefore the projection; SubledgerPeriodService.
+          verify_balance_projection recomputes and optionally repairs it.
+          Entries that predate the table are folded in by
+          backfill_subledger_entity_balances, which create_tables runs.
+    """
+
+    __tablename__ = "subledger_entity_balances"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "subledger_type",
+            "entity_id",
+            "currency",
+            name="uq_sl_entity_balance",
+        ),
+        Index("idx_sl_entity_balance_type_ccy", "subledger_type", "currency"),
+    )
+
+    subledger_type: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+    )
+    entity_id: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+    currency: Mapped[str] = mapped_column(
+        String(3),
+        nullable=False,
+    )
+    debit_total: Mapped[Decimal] = mapped_column(
+        Numeric(38, 9),
+        nullable=False,
+        default=Decimal("0"),
+    )
+    credit_total: Mapped[Decimal] = mapped_column(
+        Numeric(38, 9),
+        nullable=False,
+        default=Decimal("0"),
+    )
+    entry_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    open_item_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    last_effective_date: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SubledgerEntityBalance {self.subledger_type}/{self.entity_id}"
+            f"/{self.currency}>"
+        )
+
+
 class SubledgerReconciliationModel(TrackedBase):
     """
     Match-level reconciliation history -- debit-to-credit entry pairing.
@@ -1,5 +1,9 @@
 """Selectors for the finance kernel (read side)."""
 
+from finance_kernel.selectors.exchange_rate_selector import (
+    ExchangeRateRow,
+    ExchangeRateSelector,
+)
 from finance_kernel.selectors.journal_selector import JournalSelector
 from finance_kernel.selectors.ledger_selector import LedgerSelector, TrialBalanceRow
 from finance_kernel.selectors.subledger_selector import (
@@ -19,4 +23,6 @@ __all__ = [
     "SubledgerEntryDTO",
     "SubledgerBalanceDTO",
     "ReconciliationDTO",
+    "ExchangeRateSelector",
+    "ExchangeRateRow",
 ]
@@ -0,0 +1,176 @@
+"""
+Module: finance_kernel.selectors.async_selectors
+Responsibility: Awaitable facade over the synchronous selectors (ledger,
+    journal, subledger, trace) for asyncio callers.  Each call opens its own
+    AsyncSession, so independent calls awaited together (``asyncio.gather``)
+    run concurrently on separate pooled connections.
+Architecture position: Kernel > Selectors.  May import from models/, db/,
+    and sibling selectors.  MUST NOT import from services/ or outer layers.
+
+Invariants enforced:
+    - Read-only: every call runs the existing selector method unchanged via
+      ``AsyncSession.run_sync`` and closes the session without committing,
+      so async and sync callers get byte-identical DTOs (and trace hashes).
+    - One session (one connection, one snapshot) per call; results are
+      frozen DTOs that stay valid after the session closes.
+
+Failure modes:
+    - RuntimeError from ``get_async_session_factory`` when no async engine
+      has been initialized and no factory is passed.
+    - Selector exceptions propagate unchanged to the awaiting caller.
+
+Audit relevance:
+    No query logic is duplicated: the async path executes the same selector
+    code as the CLI and services, so a report or trace produced concurrently
+    matches one produced serially.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date
+from typing import TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from finance_kernel.db.async_engine import get_async_session_factory
+from finance_kernel.domain.clock import Clock
+from finance_kernel.domain.subledger_control import SubledgerType
+from finance_kernel.domain.values import Money
+from finance_kernel.selectors.journal_selector import JournalEntryDTO, JournalSelector
+from finance_kernel.selectors.ledger_selector import (
+    AccountBalance,
+    LedgerSelector,
+    TrialBalanceRow,
+)
+from finance_kernel.selectors.subledger_selector import (
+    AgingBucketTotalDTO,
+    SubledgerBalanceDTO,
+    SubledgerSelector,
+)
+from finance_kernel.selectors.trace_selector import TraceBundle, TraceSelector
+
+T = TypeVar("T")
+
+
+class AsyncSelectors:
+    """
+    Async versions of the main selector queries.
+
+    Contract:
+        Every method is a coroutine returning the same DTOs as the
+        synchronous selector method of the same name.
+
+    Non-goals:
+        - Does not stream: ``trace_events`` materializes the bundles.
+          Use the sync ``TraceSelector.trace_events`` for bulk exports.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        clock: Clock | None = None,
+    ):
+        self._session_factory = session_factory or get_async_session_factory()
+        self._clock = clock
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        """Run ``fn(session)`` against a synchronous view of a fresh session."""
+        async with self._session_factory() as session:
+            return await session.run_sync(fn)
+
+    # Ledger
+
+    async def trial_balance(
+        self, as_of_date: date | None = None, currency: str | None = None,
+    ) -> list[TrialBalanceRow]:
+        return await self.run(
+            lambda s: LedgerSelector(s).trial_balance(as_of_date, currency)
+        )
+
+    async def account_balance(
+        self,
+        account_id: UUID,
+        as_of_date: date | None = None,
+        currency: str | None = None,
+    ) -> list[AccountBalance]:
+        return await self.run(
+            lambda s: LedgerSelector(s).account_balance(account_id, as_of_date, currency)
+        )
+
+    # Journal
+
+    async def journal_entry(self, journal_entry_id: UUID) -> JournalEntryDTO | None:
+        return await self.run(lambda s: JournalSelector(s).get_entry(journal_entry_id))
+
+    async def entries_by_period(
+        self, start_date: date, end_date: date,
+    ) -> list[JournalEntryDTO]:
+        return await self.run(
+            lambda s: JournalSelector(s).get_entries_by_period(start_date, end_date)
+        )
+
+    # Subledger
+
+    async def subledger_balance(
+        self,
+        entity_id: str,
+        subledger_type: SubledgerType,
+        as_of_date: date,
+        currency: str,
+    ) -> SubledgerBalanceDTO:
+        return await self.run(
+            lambda s: SubledgerSelector(s).get_balance(
+                entity_id, subledger_type, as_of_date, currency,
+            )
+        )
+
+    async def subledger_aggregate_balance(
+        self, subledger_type: SubledgerType, as_of_date: date, currency: str,
+    ) -> Money:
+        return await self.run(
+            lambda s: SubledgerSelector(s).get_aggregate_balance(
+                subledger_type, as_of_date, currency,
+            )
+        )
+
+    async def aging_totals(
+        self,
+        subledger_type: SubledgerType,
+        as_of_date: date,
+        buckets: Sequence[tuple[str, int, int | None]],
+        currency: str | None = None,
+        payment_terms_days: int = 0,
+    ) -> list[AgingBucketTotalDTO]:
+        return await self.run(
+            lambda s: SubledgerSelector(s).aging_totals(
+                subledger_type, as_of_date, buckets,
+                currency=currency, payment_terms_days=payment_terms_days,
+            )
+        )
+
+    # Trace
+
+    async def trace_by_event_id(self, event_id: UUID) -> TraceBundle:
+        return await self.run(
+            lambda s: TraceSelector(s, clock=self._clock).trace_by_event_id(event_id)
+        )
+
+    async def trace_by_journal_entry_id(self, entry_id: UUID) -> TraceBundle:
+        return await self.run(
+            lambda s: TraceSelector(s, clock=self._clock).trace_by_journal_entry_id(
+                entry_id,
+            )
+        )
+
+    async def trace_events(
+        self, event_ids: Iterable[UUID], chunk_size: int = 200,
+    ) -> list[TraceBundle]:
+        ids = list(event_ids)
+        return await self.run(
+            lambda s: list(
+                TraceSelector(s, clock=self._clock).trace_events(ids, chunk_size)
+            )
+        )
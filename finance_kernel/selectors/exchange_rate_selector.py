@@ -0,0 +1,97 @@
+"""
+Module: finance_kernel.selectors.exchange_rate_selector
+Responsibility: Read-only access to the exchange rate table for loading
+    in-process rate stores.  Returns lightweight frozen DTOs (column select,
+    no ORM instances) plus the fx_rates change stamp callers use to decide
+    whether a cached store is still current.
+Architecture position: Kernel > Selectors.  May import from models/ and
+    db/.  MUST NOT import from services/, domain/, or outer layers.
+
+Invariants enforced:
+    - Read-only: never adds, flushes, or commits.
+    - Rows are ordered by (from_currency, to_currency, effective_at) so a
+      consumer can build sorted per-pair series in one pass.
+
+Failure modes:
+    - Database errors propagate to the caller.
+
+Audit relevance:
+    The rates loaded here drive currency translation and CTA; rows are
+    immutable once referenced by a journal line (R10), so a store keyed on
+    the fx_rates stamp reproduces the rates a posting would have used.
+"""
+
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import or_, select
+
+from finance_kernel.models.exchange_rate import ExchangeRate
+from finance_kernel.models.reference_stamp import ReferenceComponentStamp
+from finance_kernel.selectors.base import BaseSelector
+
+FX_RATES_COMPONENT = "fx_rates"
+
+
+@dataclass(frozen=True)
+class ExchangeRateRow:
+    """One exchange rate row: 1 from_currency = rate to_currency."""
+
+    from_currency: str
+    to_currency: str
+    rate: Decimal
+    effective_at: datetime
+
+
+class ExchangeRateSelector(BaseSelector[ExchangeRate]):
+    """Selector for exchange rate rows and their change stamp."""
+
+    def rates(
+        self,
+        as_of: datetime | None = None,
+        currencies: Collection[str] | None = None,
+    ) -> list[ExchangeRateRow]:
+        """
+        All rates effective at or before ``as_of`` (all rates if None).
+
+        ``currencies`` keeps rows with either side in the set, which is
+        what triangulation through a base currency needs.
+        """
+        query = select(
+            ExchangeRate.from_currency,
+            ExchangeRate.to_currency,
+            ExchangeRate.rate,
+            ExchangeRate.effective_at,
+        ).order_by(
+            ExchangeRate.from_currency,
+            ExchangeRate.to_currency,
+            ExchangeRate.effective_at,
+        )
+        if as_of is not None:
+            query = query.where(ExchangeRate.effective_at <= as_of)
+        if currencies is not None:
+            codes = list(currencies)
+            query = query.where(or_(
+                ExchangeRate.from_currency.in_(codes),
+                ExchangeRate.to_currency.in_(codes),
+            ))
+        return [
+            ExchangeRateRow(
+                from_currency=row.from_currency,
+                to_currency=row.to_currency,
+                rate=row.rate,
+                effective_at=row.effective_at,
+            )
+            for row in self.session.execute(query)
+        ]
+
+    def change_stamp(self) -> int:
+        """Current fx_rates change stamp (0 if rates were never written)."""
+        stamp = self.session.execute(
+            select(ReferenceComponentStamp.stamp).where(
+                ReferenceComponentStamp.component == FX_RATES_COMPONENT,
+            )
+        ).scalar_one_or_none()
+        return stamp or 0
@@ -22,14 +22,18 @@ Audit relevance:
     tables -- the single source of financial truth.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session, selectinload
 
+from finance_kernel.models.event import Event
+from finance_kernel.models.interpretation_outcome import InterpretationOutcome
 from finance_kernel.models.journal import (
     JournalEntry,
     JournalEntryStatus,
@@ -97,6 +101,26 @@ class JournalEntryDTO:
         return self.total_debits == self.total_credits
 
 
+@dataclass
+class SourceEventDTO:
+    """A source event with the decision log of its interpretation outcome."""
+
+    event_id: UUID
+    event_type: str
+    occurred_at: datetime
+    effective_date: date
+    actor_id: UUID
+    producer: str
+    payload: dict[str, Any]
+    schema_version: int
+    ingested_at: datetime
+    decision_log: list | None
+
+
+# Sort key for events that produced no journal entry (after all that did).
+_NO_ENTRY_SEQ = 2**62
+
+
 class JournalSelector(BaseSelector[JournalEntry]):
     """
     Selector for journal entry queries.
@@ -384,3 +408,76 @@ class JournalSelector(BaseSelector[JournalEntry]):
         entries = self.session.execute(query).scalars().all()
 
         return [self._to_dto(entry) for entry in entries]
+
+    def iter_source_events(
+        self,
+        effective_from: date | None = None,
+        effective_to: date | None = None,
+        chunk_size: int = 500,
+    ) -> Iterator[SourceEventDTO]:
+        """
+        Stream events in the order their journal entries were posted.
+
+        Events are ordered by (ingested_at, seq of the event's first journal
+        entry, id) -- events ingested in the same clock tick keep their
+        posting order -- and keyset-paged on that key, so no server-side
+        cursor is held open between chunks.  Each page also carries a plain
+        ``ingested_at >=`` bound, which idx_event_ingested can seek on, so
+        the correlated first-seq subquery is only evaluated for events from
+        the last page's timestamp onward.  Used by event replay.
+
+        Args:
+            effective_from: Optional start date (inclusive).
+            effective_to: Optional end date (inclusive).
+            chunk_size: Rows per page.
+
+        Returns:
+            Iterator of SourceEventDTOs.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        first_seq = func.coalesce(
+            select(func.min(JournalEntry.seq))
+            .where(JournalEntry.source_event_id == Event.event_id)
+            .scalar_subquery(),
+            _NO_ENTRY_SEQ,
+        )
+        query = (
+            select(Event, InterpretationOutcome.decision_log, first_seq)
+            .outerjoin(
+                InterpretationOutcome,
+                InterpretationOutcome.source_event_id == Event.event_id,
+            )
+            .order_by(Event.ingested_at, first_seq, Event.id)
+            .limit(chunk_size)
+        )
+        if effective_from is not None:
+            query = query.where(Event.effective_date >= effective_from)
+        if effective_to is not None:
+            query = query.where(Event.effective_date <= effective_to)
+
+        last_key: tuple[datetime, int, UUID] | None = None
+        while True:
+            page = query if last_key is None else query.where(
+                Event.ingested_at >= last_key[0],
+                tuple_(Event.ingested_at, first_seq, Event.id) > last_key,
+            )
+            rows = self.session.execute(page).all()
+            for event, decision_log, _ in rows:
+                yield SourceEventDTO(
+                    event_id=event.event_id,
+                    event_type=event.event_type,
+                    occurred_at=event.occurred_at,
+                    effective_date=event.effective_date,
+                    actor_id=event.actor_id,
+                    producer=event.producer,
+                    payload=event.payload,
+                    schema_version=event.schema_version,
+                    ingested_at=event.ingested_at,
+                    decision_log=decision_log,
+                )
+            if len(rows) < chunk_size:
+                return
+            last_event, _, last_seq = rows[-1]
+            last_key = (last_event.ingested_at, last_seq, last_event.id)
@@ -10,11 +10,19 @@ Architecture position: Kernel > Selectors.  May import from models/ and
 Invariants enforced:
     R4  -- Double-entry balance verification via total_debits_credits().
     R6  -- No stored balances.  All balance computations derive from posted
-           JournalLine rows at query time.
+           JournalLine rows at query time; the only exception is the sealed
+           closing-balance snapshot of a LOCKED period, which is itself a
+           verifiable aggregate of those rows (see below).
     R24 -- Canonical ledger hash.  canonical_hash() computes a deterministic
            SHA-256 hash over sorted posted lines, enabling post-replay
            verification, tamper detection, and distributed consistency checks.
 
+    PC1 -- Period-close snapshots.  trial_balance(), account_balance() and
+           total_debits_credits() start from the latest snapshot dated on or
+           before the as-of date and aggregate only the lines after it
+           (later effective date, or posted after the lock).  The snapshot's
+           seal links its balance rows to the R24 canonical hash.
+
 Failure modes:
     - Returns empty results or zero balances when no posted entries exist.
     - canonical_hash() is deterministic: same ledger state always produces
@@ -30,23 +38,59 @@ Audit relevance:
 
 import hashlib
 import json
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import Text, and_, case, cast, func, or_, select, union_all
 from sqlalchemy.orm import Session
 
-from finance_kernel.models.account import Account
+from finance_kernel.models.account import Account, AccountType, NormalBalance
+from finance_kernel.models.fiscal_period import FiscalPeriod
 from finance_kernel.models.journal import (
     JournalEntry,
     JournalEntryStatus,
     JournalLine,
     LineSide,
 )
+from finance_kernel.models.period_close_balance import (
+    PeriodCloseBalanceModel,
+    PeriodCloseSnapshotModel,
+)
 from finance_kernel.selectors.base import BaseSelector
 
+# Rows fetched per round trip when streaming lines for per-account hashes.
+_HASH_STREAM_CHUNK = 1000
+
+
+def _effective_on_or_before(as_of_date: date) -> tuple:
+    """Entry cutoff, repeated on the line's denormalized effective_date.
+
+    The line predicate lets PostgreSQL prune later periods when
+    journal_lines is period-partitioned (db/partitioning.py).  Lines written
+    before the column existed carry NULL and are kept.
+    """
+    return (
+        JournalEntry.effective_date <= as_of_date,
+        or_(
+            JournalLine.effective_date <= as_of_date,
+            JournalLine.effective_date.is_(None),
+        ),
+    )
+
+
+def _effective_on_or_after(effective_from: date) -> tuple:
+    """Lower bound counterpart of _effective_on_or_before."""
+    return (
+        JournalEntry.effective_date >= effective_from,
+        or_(
+            JournalLine.effective_date >= effective_from,
+            JournalLine.effective_date.is_(None),
+        ),
+    )
+
 
 @dataclass
 class TrialBalanceRow:
@@ -58,6 +102,7 @@ class TrialBalanceRow:
     currency: str
     debit_total: Decimal
     credit_total: Decimal
+    account_type: str | None = None
 
     @property
     def balance(self) -> Decimal:
@@ -81,6 +126,53 @@ class AccountBalance:
         return self.debit_total - self.credit_total
 
 
+@dataclass
+class PeriodBalanceRow:
+    """Posted totals for one (account, fiscal period, currency, dimensions) cell."""
+
+    account_code: str
+    account_type: str
+    normal_balance: str
+    period_code: str
+    currency: str
+    dimensions: tuple[tuple[str, str | None], ...]
+    debit_total: Decimal
+    credit_total: Decimal
+
+    @property
+    def natural_balance(self) -> Decimal:
+        """Balance on the account's normal side (positive when normal)."""
+        if self.normal_balance == NormalBalance.CREDIT.value:
+            return self.credit_total - self.debit_total
+        return self.debit_total - self.credit_total
+
+
+@dataclass
+class ClosingBalanceCell:
+    """Cumulative posted totals of one (account, currency, dimension set)."""
+
+    account_id: UUID
+    currency: str
+    dimensions_key: str
+    debit_total: Decimal
+    credit_total: Decimal
+    line_count: int
+
+
+@dataclass
+class PeriodCloseSnapshot:
+    """Header of the sealed closing-balance snapshot of a locked period."""
+
+    snapshot_id: UUID
+    period_code: str
+    end_date: date
+    seq_watermark: int
+    ledger_hash: str
+    balances_hash: str
+    seal_hash: str
+    cell_count: int
+
+
 @dataclass
 class LedgerLine:
     """A single line from the ledger view."""
@@ -108,7 +200,8 @@ class LedgerSelector(BaseSelector[JournalLine]):
 
     Guarantees:
         - INVARIANT R6: No stored balances.  Every balance is computed at
-          query time from JournalLine rows.
+          query time from JournalLine rows, or from a sealed period-close
+          snapshot of them plus the lines after it (PC1).
         - INVARIANT R24: canonical_hash() produces a deterministic SHA-256
           hash over sorted posted lines for integrity verification.
         - All balance methods return Decimal (never float).
@@ -116,8 +209,8 @@ class LedgerSelector(BaseSelector[JournalLine]):
     Non-goals:
         - This selector does NOT perform currency conversion; it returns
           balances in their original transaction currency.
-        - Dimension filtering is performed in Python (not SQL JSONB) for
-          portability.
+        - query() filters dimensions in Python; period_balances() groups
+          by dimension values in SQL (``dimensions->>key``).
     """
 
     def __init__(self, session: Session):
@@ -140,10 +233,94 @@ class LedgerSelector(BaseSelector[JournalLine]):
         )
 
         if as_of_date is not None:
-            query = query.where(JournalEntry.effective_date <= as_of_date)
+            query = query.where(*_effective_on_or_before(as_of_date))
 
         return query.order_by(JournalEntry.seq)
 
+    def _close_snapshot_for(
+        self, as_of_date: date | None,
+    ) -> PeriodCloseSnapshotModel | None:
+        """Latest period-close snapshot ending on or before ``as_of_date``."""
+        query = (
+            select(PeriodCloseSnapshotModel)
+            .order_by(PeriodCloseSnapshotModel.end_date.desc())
+            .limit(1)
+        )
+        if as_of_date is not None:
+            query = query.where(PeriodCloseSnapshotModel.end_date <= as_of_date)
+        return self.session.execute(query).scalar_one_or_none()
+
+    def _posted_totals(
+        self,
+        as_of_date: date | None = None,
+        currency: str | None = None,
+        account_id: UUID | None = None,
+    ):
+        """
+        Posted (account_id, currency) totals as a subquery (PC1).
+
+        Without a usable period-close snapshot this is the plain GROUP BY
+        over posted lines.  With one, the snapshot's balance rows are
+        UNION ALL-ed with the lines it does not cover -- effective after its
+        end date, or posted after the lock (seq above its watermark) -- so
+        the caller's outer GROUP BY sums both.
+        """
+        line_query = (
+            select(
+                JournalLine.account_id.label("account_id"),
+                JournalLine.currency.label("currency"),
+                func.sum(
+                    case(
+                        (JournalLine.side == LineSide.DEBIT, JournalLine.amount),
+                        else_=Decimal("0"),
+                    )
+                ).label("debit_total"),
+                func.sum(
+                    case(
+                        (JournalLine.side == LineSide.CREDIT, JournalLine.amount),
+                        else_=Decimal("0"),
+                    )
+                ).label("credit_total"),
+                func.count(JournalLine.id).label("line_count"),
+            )
+            .join(JournalEntry)
+            .where(JournalEntry.status == JournalEntryStatus.POSTED)
+            .group_by(JournalLine.account_id, JournalLine.currency)
+        )
+        if as_of_date is not None:
+            line_query = line_query.where(*_effective_on_or_before(as_of_date))
+        if currency is not None:
+            line_query = line_query.where(JournalLine.currency == currency)
+        if account_id is not None:
+            line_query = line_query.where(JournalLine.account_id == account_id)
+
+        snapshot = self._close_snapshot_for(as_of_date)
+        if snapshot is None:
+            return line_query.subquery()
+
+        line_query = line_query.where(
+            or_(
+                JournalEntry.effective_date > snapshot.end_date,
+                JournalEntry.seq > snapshot.seq_watermark,
+            )
+        )
+        snapshot_query = select(
+            PeriodCloseBalanceModel.account_id,
+            PeriodCloseBalanceModel.currency,
+            PeriodCloseBalanceModel.debit_total,
+            PeriodCloseBalanceModel.credit_total,
+            PeriodCloseBalanceModel.line_count,
+        ).where(PeriodCloseBalanceModel.snapshot_id == snapshot.id)
+        if currency is not None:
+            snapshot_query = snapshot_query.where(
+                PeriodCloseBalanceModel.currency == currency,
+            )
+        if account_id is not None:
+            snapshot_query = snapshot_query.where(
+                PeriodCloseBalanceModel.account_id == account_id,
+            )
+        return union_all(line_query, snapshot_query).subquery()
+
     def query(
         self,
         as_of_date: date | None = None,
@@ -226,8 +403,9 @@ class LedgerSelector(BaseSelector[JournalLine]):
         Compute trial balance as of a specific date.
 
         INVARIANT R6: The trial balance is computed from JournalLines at query
-        time -- never stored.  Sum of all debit_totals MUST equal sum of all
-        credit_totals per currency (R4).
+        time -- never stored.  Lines covered by a sealed period-close snapshot
+        are read as the snapshot's balance rows (PC1).  Sum of all
+        debit_totals MUST equal sum of all credit_totals per currency (R4).
 
         Preconditions: None (returns empty list if no posted entries exist).
         Postconditions: Returns one TrialBalanceRow per (account, currency) pair,
@@ -240,48 +418,28 @@ class LedgerSelector(BaseSelector[JournalLine]):
         Returns:
             List of TrialBalanceRow DTOs.
         """
-        # Build aggregation query
-        debit_sum = func.sum(
-            case(
-                (JournalLine.side == LineSide.DEBIT, JournalLine.amount),
-                else_=Decimal("0"),
-            )
-        ).label("debit_total")
-
-        credit_sum = func.sum(
-            case(
-                (JournalLine.side == LineSide.CREDIT, JournalLine.amount),
-                else_=Decimal("0"),
-            )
-        ).label("credit_total")
-
+        totals = self._posted_totals(as_of_date, currency)
         query = (
             select(
-                JournalLine.account_id,
+                totals.c.account_id,
                 Account.code.label("account_code"),
                 Account.name.label("account_name"),
-                JournalLine.currency,
-                debit_sum,
-                credit_sum,
+                Account.account_type,
+                totals.c.currency,
+                func.sum(totals.c.debit_total).label("debit_total"),
+                func.sum(totals.c.credit_total).label("credit_total"),
             )
-            .join(JournalEntry)
-            .join(Account, JournalLine.account_id == Account.id)
-            .where(JournalEntry.status == JournalEntryStatus.POSTED)
+            .join(Account, totals.c.account_id == Account.id)
             .group_by(
-                JournalLine.account_id,
+                totals.c.account_id,
                 Account.code,
                 Account.name,
-                JournalLine.currency,
+                Account.account_type,
+                totals.c.currency,
             )
-            .order_by(Account.code, JournalLine.currency)
+            .order_by(Account.code, totals.c.currency)
         )
 
-        if as_of_date is not None:
-            query = query.where(JournalEntry.effective_date <= as_of_date)
-
-        if currency is not None:
-            query = query.where(JournalLine.currency == currency)
-
         results = self.session.execute(query).all()
 
         return [
@@ -292,6 +450,7 @@ class LedgerSelector(BaseSelector[JournalLine]):
                 currency=row.currency,
                 debit_total=row.debit_total or Decimal("0"),
                 credit_total=row.credit_total or Decimal("0"),
+                account_type=getattr(row.account_type, "value", row.account_type),
             )
             for row in results
         ]
@@ -317,45 +476,14 @@ class LedgerSelector(BaseSelector[JournalLine]):
         Returns:
             List of AccountBalance DTOs (one per currency).
         """
-        debit_sum = func.sum(
-            case(
-                (JournalLine.side == LineSide.DEBIT, JournalLine.amount),
-                else_=Decimal("0"),
-            )
-        ).label("debit_total")
-
-        credit_sum = func.sum(
-            case(
-                (JournalLine.side == LineSide.CREDIT, JournalLine.amount),
-                else_=Decimal("0"),
-            )
-        ).label("credit_total")
-
-        line_count = func.count(JournalLine.id).label("line_count")
-
-        query = (
-            select(
-                JournalLine.account_id,
-                JournalLine.currency,
-                debit_sum,
-                credit_sum,
-                line_count,
-            )
-            .join(JournalEntry)
-            .where(
-                and_(
-                    JournalEntry.status == JournalEntryStatus.POSTED,
-                    JournalLine.account_id == account_id,
-                )
-            )
-            .group_by(JournalLine.account_id, JournalLine.currency)
-        )
-
-        if as_of_date is not None:
-            query = query.where(JournalEntry.effective_date <= as_of_date)
-
-        if currency is not None:
-            query = query.where(JournalLine.currency == currency)
+        totals = self._posted_totals(as_of_date, currency, account_id)
+        query = select(
+            totals.c.account_id,
+            totals.c.currency,
+            func.sum(totals.c.debit_total).label("debit_total"),
+            func.sum(totals.c.credit_total).label("credit_total"),
+            func.sum(totals.c.line_count).label("line_count"),
+        ).group_by(totals.c.account_id, totals.c.currency)
 
         results = self.session.execute(query).all()
 
@@ -365,7 +493,7 @@ class LedgerSelector(BaseSelector[JournalLine]):
                 currency=row.currency,
                 debit_total=row.debit_total or Decimal("0"),
                 credit_total=row.credit_total or Decimal("0"),
-                line_count=row.line_count,
+                line_count=int(row.line_count),
             )
             for row in results
         ]
@@ -393,13 +521,56 @@ class LedgerSelector(BaseSelector[JournalLine]):
         Returns:
             Tuple of (total_debits, total_credits).
         """
+        totals = self._posted_totals(as_of_date, currency)
+        query = select(
+            func.sum(totals.c.debit_total).label("debit_total"),
+            func.sum(totals.c.credit_total).label("credit_total"),
+        )
+
+        result = self.session.execute(query).one()
+
+        return (
+            result.debit_total or Decimal("0"),
+            result.credit_total or Decimal("0"),
+        )
+
+    def period_balances(
+        self,
+        period_codes: Sequence[str],
+        dimension_keys: Sequence[str] = (),
+        currency: str | None = None,
+        account_types: Sequence[str] | None = None,
+    ) -> list[PeriodBalanceRow]:
+        """
+        Posted totals per (account, fiscal period, currency, dimension values).
+
+        One grouped aggregation for all requested periods: lines are
+        assigned to the fiscal period whose [start_date, end_date] contains
+        the entry's effective_date and grouped by the value of each
+        dimension in ``dimension_keys`` (None when a line lacks the key).
+
+        Args:
+            period_codes: Fiscal period codes to aggregate.
+            dimension_keys: Dimension keys to group by, in cell-key order.
+            currency: Optional currency filter.
+            account_types: Optional AccountType values to include.
+
+        Returns:
+            List of PeriodBalanceRow DTOs (only cells with posted lines).
+        """
+        if not period_codes:
+            return []
+
+        dimension_columns = [
+            JournalLine.dimensions[key].as_string().label(f"dim_{i}")
+            for i, key in enumerate(dimension_keys)
+        ]
         debit_sum = func.sum(
             case(
                 (JournalLine.side == LineSide.DEBIT, JournalLine.amount),
                 else_=Decimal("0"),
             )
         ).label("debit_total")
-
         credit_sum = func.sum(
             case(
                 (JournalLine.side == LineSide.CREDIT, JournalLine.amount),
@@ -407,25 +578,85 @@ class LedgerSelector(BaseSelector[JournalLine]):
             )
         ).label("credit_total")
 
+        group_columns = [
+            Account.code,
+            Account.account_type,
+            Account.normal_balance,
+            FiscalPeriod.period_code,
+            JournalLine.currency,
+            *dimension_columns,
+        ]
         query = (
-            select(debit_sum, credit_sum)
+            select(*group_columns, debit_sum, credit_sum)
             .select_from(JournalLine)
-            .join(JournalEntry)
-            .where(JournalEntry.status == JournalEntryStatus.POSTED)
+            .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
+            .join(Account, JournalLine.account_id == Account.id)
+            .join(
+                FiscalPeriod,
+                and_(
+                    JournalEntry.effective_date >= FiscalPeriod.start_date,
+                    JournalEntry.effective_date <= FiscalPeriod.end_date,
+                ),
+            )
+            .where(
+                JournalEntry.status == JournalEntryStatus.POSTED,
+                FiscalPeriod.period_code.in_(list(period_codes)),
+            )
+            .group_by(*group_columns)
         )
-
-        if as_of_date is not None:
-            query = query.where(JournalEntry.effective_date <= as_of_date)
-
         if currency is not None:
             query = query.where(JournalLine.currency == currency)
+        if account_types is not None:
+            query = query.where(
+                Account.account_type.in_([AccountType(t) for t in account_types])
+            )
 
-        result = self.session.execute(query).one()
+        rows = []
+        for row in self.session.execute(query):
+            rows.append(PeriodBalanceRow(
+                account_code=row.code,
+                account_type=getattr(row.account_type, "value", row.account_type),
+                normal_balance=getattr(row.normal_balance, "value", row.normal_balance),
+                period_code=row.period_code,
+                currency=row.currency,
+                dimensions=tuple(
+                    (key, row[5 + i]) for i, key in enumerate(dimension_keys)
+                ),
+                debit_total=row.debit_total or Decimal("0"),
+                credit_total=row.credit_total or Decimal("0"),
+            ))
+        return rows
 
-        return (
-            result.debit_total or Decimal("0"),
-            result.credit_total or Decimal("0"),
+    def period_watermarks(self, period_codes: Sequence[str]) -> dict[str, int]:
+        """
+        Seq of the most recently posted journal entry in each fiscal period.
+
+        Posted entries are never updated or deleted (R10) and seq is
+        monotonic (R9), so a period's watermark changes exactly when a new
+        entry lands in it -- a cheap staleness check for caches of period
+        aggregates.  Periods without entries are absent.
+        """
+        if not period_codes:
+            return {}
+        latest = (
+            select(JournalEntry.seq)
+            .where(
+                JournalEntry.status == JournalEntryStatus.POSTED,
+                JournalEntry.seq.is_not(None),
+                JournalEntry.effective_date >= FiscalPeriod.start_date,
+                JournalEntry.effective_date <= FiscalPeriod.end_date,
+            )
+            .order_by(JournalEntry.seq.desc())
+            .limit(1)
+            .correlate(FiscalPeriod)
+            .scalar_subquery()
+        )
+        query = select(FiscalPeriod.period_code, latest).where(
+            FiscalPeriod.period_code.in_(list(period_codes)),
         )
+        return {
+            code: seq for code, seq in self.session.execute(query) if seq is not None
+        }
 
     # =========================================================================
     # R24: Canonical Ledger Hash
@@ -435,6 +666,7 @@ class LedgerSelector(BaseSelector[JournalLine]):
         self,
         as_of_date: date | None = None,
         currency: str | None = None,
+        max_seq: int | None = None,
     ) -> str:
         """
         Compute a deterministic, canonical hash of the ledger (R24).
@@ -455,17 +687,20 @@ class LedgerSelector(BaseSelector[JournalLine]):
         Args:
             as_of_date: Optional cutoff date for the hash.
             currency: Optional currency filter.
+            max_seq: Optional last entry seq to include (the ledger as it
+                stood when that entry was posted).
 
         Returns:
             SHA-256 hash of the canonical ledger representation.
         """
-        canonical_lines = self._get_canonical_lines(as_of_date, currency)
+        canonical_lines = self._get_canonical_lines(as_of_date, currency, max_seq)
         return self._compute_hash(canonical_lines)
 
     def _get_canonical_lines(
         self,
         as_of_date: date | None = None,
         currency: str | None = None,
+        max_seq: int | None = None,
     ) -> list[dict]:
         """
         Get lines in canonical order for hashing (R24).
@@ -476,6 +711,7 @@ class LedgerSelector(BaseSelector[JournalLine]):
         Args:
             as_of_date: Optional cutoff date.
             currency: Optional currency filter.
+            max_seq: Optional last entry seq to include.
 
         Returns:
             List of line dictionaries in canonical order.
@@ -499,11 +735,14 @@ class LedgerSelector(BaseSelector[JournalLine]):
         )
 
         if as_of_date is not None:
-            query = query.where(JournalEntry.effective_date <= as_of_date)
+            query = query.where(*_effective_on_or_before(as_of_date))
 
         if currency is not None:
             query = query.where(JournalLine.currency == currency)
 
+        if max_seq is not None:
+            query = query.where(JournalEntry.seq <= max_seq)
+
         # Order by entry seq first (global ordering), then line seq within entry
         query = query.order_by(JournalEntry.seq, JournalLine.line_seq)
 
@@ -521,7 +760,7 @@ class LedgerSelector(BaseSelector[JournalLine]):
                 "dimensions": dims_canonical,
                 "entry_seq": row.entry_seq,
                 "line_seq": row.line_seq,
-                "side": row.side.value,
+                "side": LineSide(row.side).value,
                 "amount": str(row.amount),
                 "is_rounding": row.is_rounding,
             })
@@ -566,14 +805,115 @@ class LedgerSelector(BaseSelector[JournalLine]):
             Hex-encoded SHA-256 hash.
         """
         hasher = hashlib.sha256()
+        self._update_hash(hasher, canonical_lines)
+        return hasher.hexdigest()
 
+    @staticmethod
+    def _update_hash(hasher, canonical_lines: Iterable[dict]) -> None:
+        """Feed canonical lines into a running SHA-256 (R24)."""
         for line in canonical_lines:
             # Create deterministic string representation
             line_str = json.dumps(line, sort_keys=True, separators=(",", ":"))
             hasher.update(line_str.encode("utf-8"))
             hasher.update(b"\n")  # Line separator
 
-        return hasher.hexdigest()
+    def account_canonical_hashes(
+        self,
+        as_of_date: date | None = None,
+        currency: str | None = None,
+        effective_from: date | None = None,
+    ) -> dict[str, str]:
+        """
+        Compute one canonical hash per account, keyed by account code (R24).
+
+        Lines of each account are taken in the R24 canonical order
+        (currency, dimensions, entry_seq, line_seq) but the absolute
+        entry_seq is left out of the hashed representation, so two ledgers
+        that posted the same lines in the same relative order hash equal
+        even when their journal sequence numbers differ (e.g. a replay
+        into an isolated schema).  Keying by code rather than account_id
+        lets the ledgers use different account rows.
+
+        Used by the event replayer to report which accounts diverge.
+        Lines are streamed ordered by (code, currency, entry_seq, line_seq)
+        and hashed one (account, currency) group at a time, so only the
+        group being hashed is held in memory.
+
+        Args:
+            as_of_date: Optional cutoff date (inclusive).
+            currency: Optional currency filter.
+            effective_from: Optional start date (inclusive).
+
+        Returns:
+            Mapping of account code to 64-character SHA-256 hex digest.
+            Accounts without posted lines are absent.
+        """
+        query = (
+            select(
+                Account.code,
+                JournalLine.side,
+                JournalLine.amount,
+                JournalLine.currency,
+                JournalLine.dimensions,
+                JournalLine.is_rounding,
+                JournalLine.line_seq,
+                JournalEntry.effective_date,
+                JournalEntry.seq.label("entry_seq"),
+            )
+            .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
+            .join(Account, JournalLine.account_id == Account.id)
+            .where(JournalEntry.status == JournalEntryStatus.POSTED)
+        )
+        if as_of_date is not None:
+            query = query.where(*_effective_on_or_before(as_of_date))
+        if effective_from is not None:
+            query = query.where(*_effective_on_or_after(effective_from))
+        if currency is not None:
+            query = query.where(JournalLine.currency == currency)
+        # Byte-order collation so currency groups arrive in Python sort order.
+        query = query.order_by(
+            Account.code,
+            JournalLine.currency.collate("C"),
+            JournalEntry.seq,
+            JournalLine.line_seq,
+        ).execution_options(yield_per=_HASH_STREAM_CHUNK)
+
+        hashes: dict[str, str] = {}
+        hasher = None
+        group_key: tuple[str, str] | None = None
+        group: list[tuple[str, dict]] = []
+
+        def flush_group() -> None:
+            # Stable sort: (entry_seq, line_seq) order from SQL is kept
+            # within each dimension set.
+            group.sort(key=lambda x: x[0])
+            self._update_hash(hasher, (line for _, line in group))
+            group.clear()
+
+        for row in self.session.execute(query):
+            if group_key is None or (row.code, row.currency) != group_key:
+                if group:
+                    flush_group()
+                if group_key is None or row.code != group_key[0]:
+                    if hasher is not None:
+                        hashes[group_key[0]] = hasher.hexdigest()
+                    hasher = hashlib.sha256()
+                group_key = (row.code, row.currency)
+            dims = self._canonicalize_dimensions(row.dimensions)
+            group.append((dims, {
+                "currency": row.currency,
+                "dimensions": dims,
+                "effective_date": row.effective_date.isoformat(),
+                "line_seq": row.line_seq,
+                "side": LineSide(row.side).value,
+                "amount": str(row.amount),
+                "is_rounding": row.is_rounding,
+            }))
+        if group:
+            flush_group()
+        if hasher is not None:
+            hashes[group_key[0]] = hasher.hexdigest()
+        return hashes
 
     def verify_canonical_hash(
         self,
@@ -621,3 +961,205 @@ class LedgerSelector(BaseSelector[JournalLine]):
         canonical_lines = self._get_canonical_lines(as_of_date, currency)
         hash_value = self._compute_hash(canonical_lines)
         return hash_value, canonical_lines
+
+    # =========================================================================
+    # PC1: Period-close balance snapshots
+    # =========================================================================
+
+    def posted_seq_watermark(self) -> int:
+        """Seq of the most recently posted journal entry (0 when none)."""
+        seq = self.session.execute(
+            select(JournalEntry.seq)
+            .where(
+                JournalEntry.status == JournalEntryStatus.POSTED,
+                JournalEntry.seq.is_not(None),
+            )
+            .order_by(JournalEntry.seq.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        return seq or 0
+
+    def closing_balance_cells(
+        self, as_of_date: date, max_seq: int,
+    ) -> list[ClosingBalanceCell]:
+        """
+        Cumulative posted totals per (account, currency, dimension set).
+
+        Covers posted lines effective on or before ``as_of_date`` whose entry
+        seq is at most ``max_seq``.  Lines are grouped by their stored
+        dimensions JSON in SQL and merged on the canonical R24 dimensions
+        string here, so key order in the stored JSON does not split a cell.
+
+        Returns:
+            Cells sorted by (account_id, currency, dimensions_key).
+        """
+        dimensions_json = cast(JournalLine.dimensions, Text)
+        query = (
+            select(
+                JournalLine.account_id,
+                JournalLine.currency,
+                dimensions_json.label("dimensions"),
+                func.sum(
+                    case(
+                        (JournalLine.side == LineSide.DEBIT, JournalLine.amount),
+                        else_=Decimal("0"),
+                    )
+                ).label("debit_total"),
+                func.sum(
+                    case(
+                        (JournalLine.side == LineSide.CREDIT, JournalLine.amount),
+                        else_=Decimal("0"),
+                    )
+                ).label("credit_total"),
+                func.count(JournalLine.id).label("line_count"),
+            )
+            .join(JournalEntry)
+            .where(
+                JournalEntry.status == JournalEntryStatus.POSTED,
+                JournalEntry.seq <= max_seq,
+                *_effective_on_or_before(as_of_date),
+            )
+            .group_by(JournalLine.account_id, JournalLine.currency, dimensions_json)
+        )
+
+        cells: dict[tuple[str, str, str], ClosingBalanceCell] = {}
+        for row in self.session.execute(query):
+            dims_key = self._canonicalize_dimensions(
+                json.loads(row.dimensions) if row.dimensions else None,
+            )
+            key = (str(row.account_id), row.currency, dims_key)
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = ClosingBalanceCell(
+                    account_id=row.account_id,
+                    currency=row.currency,
+                    dimensions_key=dims_key,
+                    debit_total=row.debit_total or Decimal("0"),
+                    credit_total=row.credit_total or Decimal("0"),
+                    line_count=row.line_count,
+                )
+            else:
+                cell.debit_total += row.debit_total or Decimal("0")
+                cell.credit_total += row.credit_total or Decimal("0")
+                cell.line_count += row.line_count
+        return [cells[key] for key in sorted(cells)]
+
+    def closing_balances_hash(self, cells: Sequence[ClosingBalanceCell]) -> str:
+        """SHA-256 over closing-balance cells in canonical order (PC1)."""
+        ordered = sorted(
+            cells, key=lambda c: (str(c.account_id), c.currency, c.dimensions_key),
+        )
+        return self._compute_hash([
+            {
+                "account_id": str(cell.account_id),
+                "currency": cell.currency,
+                "dimensions": cell.dimensions_key,
+                "debit_total": format(cell.debit_total, ".9f"),
+                "credit_total": format(cell.credit_total, ".9f"),
+                "line_count": cell.line_count,
+            }
+            for cell in ordered
+        ])
+
+    @staticmethod
+    def close_seal_hash(
+        period_code: str,
+        end_date: date,
+        seq_watermark: int,
+        ledger_hash: str,
+        balances_hash: str,
+    ) -> str:
+        """
+        Seal of a period-close snapshot (PC1).
+
+        Binds the balance rows (``balances_hash``) to the R24 canonical hash
+        of the lines they summarize (``ledger_hash``) and to the coverage
+        bounds, so neither can be swapped without breaking the seal.
+        """
+        payload = json.dumps(
+            {
+                "period_code": period_code,
+                "end_date": end_date.isoformat(),
+                "seq_watermark": seq_watermark,
+                "ledger_hash": ledger_hash,
+                "balances_hash": balances_hash,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def close_snapshot(self, period_code: str) -> PeriodCloseSnapshot | None:
+        """Header of the period's sealed closing-balance snapshot, if any."""
+        snapshot = self.session.execute(
+            select(PeriodCloseSnapshotModel).where(
+                PeriodCloseSnapshotModel.period_code == period_code,
+            )
+        ).scalar_one_or_none()
+        if snapshot is None:
+            return None
+        return PeriodCloseSnapshot(
+            snapshot_id=snapshot.id,
+            period_code=snapshot.period_code,
+            end_date=snapshot.end_date,
+            seq_watermark=snapshot.seq_watermark,
+            ledger_hash=snapshot.ledger_hash,
+            balances_hash=snapshot.balances_hash,
+            seal_hash=snapshot.seal_hash,
+            cell_count=snapshot.cell_count,
+        )
+
+    def verify_close_snapshot(self, period_code: str) -> bool:
+        """
+        Verify a period-close snapshot against the journal (PC1, R24).
+
+        Recomputes the closing balances and the canonical ledger hash over
+        the lines the snapshot covers, and checks them, the stored balance
+        rows, and the seal against the recorded hashes.
+
+        Raises:
+            ValueError: If the period has no snapshot.
+        """
+        snapshot = self.close_snapshot(period_code)
+        if snapshot is None:
+            raise ValueError(f"Period {period_code} has no close snapshot")
+
+        stored = [
+            ClosingBalanceCell(
+                account_id=row.account_id,
+                currency=row.currency,
+                dimensions_key=row.dimensions_key,
+                debit_total=row.debit_total,
+                credit_total=row.credit_total,
+                line_count=row.line_count,
+            )
+            for row in self.session.execute(
+                select(
+                    PeriodCloseBalanceModel.account_id,
+                    PeriodCloseBalanceModel.currency,
+                    PeriodCloseBalanceModel.dimensions_key,
+                    PeriodCloseBalanceModel.debit_total,
+                    PeriodCloseBalanceModel.credit_total,
+                    PeriodCloseBalanceModel.line_count,
+                ).where(PeriodCloseBalanceModel.snapshot_id == snapshot.snapshot_id)
+            )
+        ]
+        recomputed = self.closing_balance_cells(
+            snapshot.end_date, snapshot.seq_watermark,
+        )
+        ledger_hash = self.canonical_hash(
+            snapshot.end_date, max_seq=snapshot.seq_watermark,
+        )
+        seal_hash = self.close_seal_hash(
+            snapshot.period_code,
+            snapshot.end_date,
+            snapshot.seq_watermark,
+            ledger_hash,
+            snapshot.balances_hash,
+        )
+        return (
+            self.closing_balances_hash(stored) == snapshot.balances_hash
+            and self.closing_balances_hash(recomputed) == snapshot.balances_hash
+            and ledger_hash == snapshot.ledger_hash
+            and seal_hash == snapshot.seal_hash
+        )
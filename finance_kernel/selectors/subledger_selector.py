@@ -14,6 +14,10 @@ Invariants enforced:
              the same transaction see a consistent snapshot.
     SL-G10 - Currency codes are uppercase ISO 4217 (assumed normalized at
              ingestion boundary).
+    SL-P1 -- Balances read the subledger_entity_balances projection and
+             subtract only the entries dated after as_of_date, so the cost
+             is independent of the entity's history.  Keys with no
+             projection row are summed from subledger_entries directly.
 
 Failure modes:
     - Returns empty lists or zero-valued BalanceDTOs when no matching entries
@@ -28,12 +32,13 @@ Audit relevance:
     Period-close orchestrators use this selector to detect GL/SL divergence.
 """
 
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import Date, and_, case, func, literal, select
 from sqlalchemy.orm import Session
 
 from finance_kernel.domain.subledger_control import SubledgerType
@@ -41,6 +46,7 @@ from finance_kernel.domain.values import Money
 from finance_kernel.models.subledger import (
     ReconciliationFailureReportModel,
     ReconciliationStatus,
+    SubledgerEntityBalanceModel,
     SubledgerEntryModel,
     SubledgerReconciliationModel,
 )
@@ -91,6 +97,55 @@ class SubledgerEntryDTO:
         )
 
 
+@dataclass(frozen=True)
+class OpenItemDTO:
+    """Column projection of an open subledger item for portfolio streaming.
+
+    ``open_amount`` is the unreconciled remainder, signed debit-positive
+    (an open debit item is positive, an unapplied credit is negative).
+    """
+
+    id: UUID
+    entity_id: str
+    effective_date: date
+    open_amount: Decimal
+    currency: str
+    dimensions: dict | None
+
+
+@dataclass(frozen=True)
+class AgingBucketTotalDTO:
+    """Open-item total for one (entity, currency, aging bucket) group.
+
+    Amounts are signed by the subledger's normal balance side, so open
+    invoices are positive for both AR and AP.  ``overdue_amount`` is the
+    part of ``amount`` more than zero days past due.
+    """
+
+    entity_id: str
+    currency: str
+    bucket: str
+    amount: Decimal
+    overdue_amount: Decimal
+    item_count: int
+
+
+@dataclass(frozen=True)
+class AgingDetailDTO:
+    """Column projection of one open item with its age and bucket."""
+
+    id: UUID
+    entity_id: str
+    source_document_type: str
+    source_document_id: str
+    reference: str | None
+    effective_date: date
+    open_amount: Decimal
+    currency: str
+    age_days: int
+    bucket: str
+
+
 @dataclass(frozen=True)
 class SubledgerBalanceDTO:
     """Balance for a single entity in a subledger."""
@@ -110,6 +165,24 @@ class SubledgerBalanceDTO:
         return self.balance == Decimal("0")
 
 
+@dataclass(frozen=True)
+class EntityBalanceTotalsDTO:
+    """All-dates totals for one (subledger_type, entity_id, currency) key."""
+
+    subledger_type: str
+    entity_id: str
+    currency: str
+    debit_total: Decimal
+    credit_total: Decimal
+    entry_count: int
+    open_item_count: int
+    last_effective_date: date | None
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return (self.subledger_type, self.entity_id, self.currency)
+
+
 @dataclass(frozen=True)
 class ReconciliationDTO:
     """Data transfer object for a reconciliation record."""
@@ -124,14 +197,50 @@ class ReconciliationDTO:
     notes: str | None
 
 
+_OPEN_STATUSES = (
+    ReconciliationStatus.OPEN.value,
+    ReconciliationStatus.PARTIAL.value,
+)
+
+_CREDIT_NORMAL = (SubledgerType.AP.value, SubledgerType.PAYROLL.value)
+
+
+def _open_amount_expression():
+    """Unreconciled remainder, debit-positive (see OpenItemDTO)."""
+    reconciled = func.coalesce(SubledgerEntryModel.reconciled_amount, Decimal("0"))
+    return case(
+        (
+            SubledgerEntryModel.debit_amount.is_not(None),
+            SubledgerEntryModel.debit_amount - reconciled,
+        ),
+        else_=reconciled - func.coalesce(SubledgerEntryModel.credit_amount, Decimal("0")),
+    )
+
+
+def _bucket_case(age_days, buckets: Sequence[tuple[str, int, int | None]]):
+    """
+    SQL CASE mirroring ``AgingCalculator.classify``.
+
+    Negative ages (not yet due) land in the first bucket starting at day 0;
+    an age outside every bucket yields NULL.
+    """
+    if not buckets:
+        raise ValueError("At least one aging bucket is required")
+    current = next((name for name, lo, _ in buckets if lo == 0), buckets[0][0])
+    whens = [(age_days < 0, current)]
+    for name, lo, hi in buckets:
+        whens.append((age_days >= lo if hi is None else age_days.between(lo, hi), name))
+    return case(*whens, else_=None)
+
+
 class SubledgerSelector(BaseSelector[SubledgerEntryModel]):
     """
     Selector for subledger queries.
 
     Contract:
         All public methods return frozen DTOs (SubledgerEntryDTO,
-        SubledgerBalanceDTO, ReconciliationDTO, or Money).  Uses the
-        caller's Session for snapshot isolation (SL-G4).
+        SubledgerBalanceDTO, AgingBucketTotalDTO, ReconciliationDTO, or
+        Money).  Uses the caller's Session for snapshot isolation (SL-G4).
 
     Guarantees:
         - Read-only: No mutations are performed.
@@ -311,10 +420,247 @@ class SubledgerSelector(BaseSelector[SubledgerEntryModel]):
         entries = self.session.execute(query).scalars().all()
         return [self._to_entry_dto(e) for e in entries]
 
+    def iter_open_item_chunks(
+        self,
+        subledger_type: SubledgerType,
+        currency: str | None = None,
+        as_of_date: date | None = None,
+        chunk_size: int = 5000,
+    ) -> Iterator[tuple[OpenItemDTO, ...]]:
+        """
+        Stream open (OPEN / PARTIAL) items across all entities in chunks.
+
+        Selects columns only (no ORM instances are loaded or kept in the
+        identity map) and keyset-pages on ``id``, so memory is bounded by
+        ``chunk_size`` regardless of portfolio size and the caller may
+        process each chunk before the next is fetched.
+
+        Reconciliation state is current; ``as_of_date`` only excludes items
+        with a later effective date.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        query = (
+            select(
+                SubledgerEntryModel.id,
+                SubledgerEntryModel.entity_id,
+                SubledgerEntryModel.effective_date,
+                _open_amount_expression(),
+                SubledgerEntryModel.currency,
+                SubledgerEntryModel.dimensions,
+            )
+            .where(
+                SubledgerEntryModel.subledger_type == subledger_type.value,
+                SubledgerEntryModel.reconciliation_status.in_([
+                    ReconciliationStatus.OPEN.value,
+                    ReconciliationStatus.PARTIAL.value,
+                ]),
+            )
+            .order_by(SubledgerEntryModel.id)
+            .limit(chunk_size)
+        )
+        if currency is not None:
+            query = query.where(SubledgerEntryModel.currency == currency)
+        if as_of_date is not None:
+            query = query.where(SubledgerEntryModel.effective_date <= as_of_date)
+
+        last_id: UUID | None = None
+        while True:
+            page = query if last_id is None else query.where(SubledgerEntryModel.id > last_id)
+            rows = self.session.execute(page).all()
+            if not rows:
+                return
+            yield tuple(OpenItemDTO(*row) for row in rows)
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1][0]
+
+    # =========================================================================
+    # Aging Queries
+    # =========================================================================
+
+    def _aging_subquery(
+        self,
+        subledger_type: SubledgerType,
+        as_of_date: date,
+        buckets: Sequence[tuple[str, int, int | None]],
+        currency: str | None,
+        payment_terms_days: int,
+    ):
+        age_days = (
+            literal(as_of_date, Date)
+            - SubledgerEntryModel.effective_date
+            - payment_terms_days
+        )
+        query = select(
+            SubledgerEntryModel.id,
+            SubledgerEntryModel.entity_id,
+            SubledgerEntryModel.source_document_type,
+            SubledgerEntryModel.source_document_id,
+            SubledgerEntryModel.reference,
+            SubledgerEntryModel.effective_date,
+            _open_amount_expression().label("open_amount"),
+            SubledgerEntryModel.currency,
+            age_days.label("age_days"),
+            _bucket_case(age_days, buckets).label("bucket"),
+        ).where(
+            SubledgerEntryModel.subledger_type == subledger_type.value,
+            SubledgerEntryModel.reconciliation_status.in_(_OPEN_STATUSES),
+            SubledgerEntryModel.effective_date <= as_of_date,
+        )
+        if currency is not None:
+            query = query.where(SubledgerEntryModel.currency == currency)
+        return query.subquery("aged")
+
+    def aging_totals(
+        self,
+        subledger_type: SubledgerType,
+        as_of_date: date,
+        buckets: Sequence[tuple[str, int, int | None]],
+        currency: str | None = None,
+        payment_terms_days: int = 0,
+    ) -> list[AgingBucketTotalDTO]:
+        """
+        Open-item aging totals grouped by entity, currency, and bucket.
+
+        Age and bucket are computed in SQL: days past due is
+        ``as_of_date - effective_date - payment_terms_days`` and each item is
+        classified by a CASE over ``buckets`` ((name, min_days, max_days)
+        tuples, max None = unbounded).  One row is returned per non-empty
+        group, so the result size is entities x buckets, not open items.
+
+        Preconditions: as_of_date is required (no clock access in selectors).
+        Postconditions: Rows ordered by (entity_id, currency, bucket);
+            amounts signed by normal balance side (credit-normal for
+            AP/PAYROLL).
+
+        Raises:
+            ValueError: If buckets is empty or an open item's age falls
+                outside every bucket.
+        """
+        aged = self._aging_subquery(
+            subledger_type, as_of_date, buckets, currency, payment_terms_days,
+        )
+        query = (
+            select(
+                aged.c.entity_id,
+                aged.c.currency,
+                aged.c.bucket,
+                func.sum(aged.c.open_amount).label("amount"),
+                func.sum(
+                    case((aged.c.age_days > 0, aged.c.open_amount), else_=Decimal("0"))
+                ).label("overdue_amount"),
+                func.count().label("item_count"),
+            )
+            .group_by(aged.c.entity_id, aged.c.currency, aged.c.bucket)
+            .order_by(aged.c.entity_id, aged.c.currency, aged.c.bucket)
+        )
+
+        sign = -1 if subledger_type.value in _CREDIT_NORMAL else 1
+        totals: list[AgingBucketTotalDTO] = []
+        for row in self.session.execute(query):
+            if row.bucket is None:
+                raise ValueError(
+                    f"{row.item_count} open {subledger_type.value} item(s) for "
+                    f"{row.entity_id} do not fit any aging bucket"
+                )
+            totals.append(AgingBucketTotalDTO(
+                entity_id=row.entity_id,
+                currency=row.currency,
+                bucket=row.bucket,
+                amount=row.amount * sign,
+                overdue_amount=row.overdue_amount * sign,
+                item_count=row.item_count,
+            ))
+        return totals
+
+    def iter_aging_detail_chunks(
+        self,
+        subledger_type: SubledgerType,
+        as_of_date: date,
+        buckets: Sequence[tuple[str, int, int | None]],
+        currency: str | None = None,
+        payment_terms_days: int = 0,
+        chunk_size: int = 5000,
+    ) -> Iterator[tuple[AgingDetailDTO, ...]]:
+        """
+        Stream aged open items in chunks, keyset-paged on ``id``.
+
+        Same age and bucket rules (and sign convention) as
+        ``aging_totals``; memory is bounded by ``chunk_size``.
+
+        Raises:
+            ValueError: If chunk_size is not positive or buckets is empty.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        aged = self._aging_subquery(
+            subledger_type, as_of_date, buckets, currency, payment_terms_days,
+        )
+        query = select(aged).order_by(aged.c.id).limit(chunk_size)
+        sign = -1 if subledger_type.value in _CREDIT_NORMAL else 1
+
+        last_id: UUID | None = None
+        while True:
+            page = query if last_id is None else query.where(aged.c.id > last_id)
+            rows = self.session.execute(page).all()
+            if not rows:
+                return
+            yield tuple(
+                AgingDetailDTO(
+                    id=row.id,
+                    entity_id=row.entity_id,
+                    source_document_type=row.source_document_type,
+                    source_document_id=row.source_document_id,
+                    reference=row.reference,
+                    effective_date=row.effective_date,
+                    open_amount=row.open_amount * sign,
+                    currency=row.currency,
+                    age_days=row.age_days,
+                    bucket=row.bucket,
+                )
+                for row in rows
+            )
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1].id
+
     # =========================================================================
     # Balance Queries
     # =========================================================================
 
+    def _entry_totals(self, *conditions):
+        """SUM debit/credit, COUNT entries and open items over subledger_entries."""
+        query = select(
+            func.coalesce(
+                func.sum(SubledgerEntryModel.debit_amount), Decimal("0")
+            ).label("debit_total"),
+            func.coalesce(
+                func.sum(SubledgerEntryModel.credit_amount), Decimal("0")
+            ).label("credit_total"),
+            func.count(SubledgerEntryModel.id).label("entry_count"),
+            func.coalesce(func.sum(case(
+                (SubledgerEntryModel.reconciliation_status.in_(_OPEN_STATUSES), 1),
+                else_=0,
+            )), 0).label("open_count"),
+        ).where(*conditions)
+        return self.session.execute(query).one()
+
+    @staticmethod
+    def _signed_balance(
+        subledger_type: SubledgerType, debit_total: Decimal, credit_total: Decimal,
+    ) -> Decimal:
+        # Credit-normal (liabilities): balance = credit - debit
+        # Debit-normal (assets): balance = debit - credit
+        if subledger_type.value in _CREDIT_NORMAL:
+            return credit_total - debit_total
+        return debit_total - credit_total
+
     def get_balance(
         self,
         entity_id: str,
@@ -331,6 +677,10 @@ class SubledgerSelector(BaseSelector[SubledgerEntryModel]):
             and balance computed from entries where effective_date <= as_of_date.
             Balance sign: credit-normal for AP/PAYROLL, debit-normal otherwise.
 
+        Reads the entity's projection row (SL-P1) and subtracts the entries
+        dated after as_of_date; when as_of_date is on or after the latest
+        projected effective date no entry rows are read at all.
+
         Args:
             entity_id: Entity (vendor, customer, etc.).
             subledger_type: Subledger type.
@@ -340,52 +690,47 @@ class SubledgerSelector(BaseSelector[SubledgerEntryModel]):
         Returns:
             SubledgerBalanceDTO with computed totals.
         """
-        debit_sum = func.coalesce(
-            func.sum(SubledgerEntryModel.debit_amount), Decimal("0")
-        ).label("debit_total")
-
-        credit_sum = func.coalesce(
-            func.sum(SubledgerEntryModel.credit_amount), Decimal("0")
-        ).label("credit_total")
-
-        open_count = func.sum(
-            case(
-                (
-                    SubledgerEntryModel.reconciliation_status.in_([
-                        ReconciliationStatus.OPEN.value,
-                        ReconciliationStatus.PARTIAL.value,
-                    ]),
-                    1,
-                ),
-                else_=0,
+        key = (
+            SubledgerEntryModel.entity_id == entity_id,
+            SubledgerEntryModel.subledger_type == subledger_type.value,
+            SubledgerEntryModel.currency == currency,
+        )
+        projection = self.session.execute(
+            select(
+                SubledgerEntityBalanceModel.debit_total,
+                SubledgerEntityBalanceModel.credit_total,
+                SubledgerEntityBalanceModel.entry_count,
+                SubledgerEntityBalanceModel.open_item_count,
+                SubledgerEntityBalanceModel.last_effective_date,
+            ).where(
+                SubledgerEntityBalanceModel.entity_id == entity_id,
+                SubledgerEntityBalanceModel.subledger_type == subledger_type.value,
+                SubledgerEntityBalanceModel.currency == currency,
             )
-        ).label("open_count")
-
-        entry_count = func.count(SubledgerEntryModel.id).label("entry_count")
+        ).one_or_none()
 
-        query = (
-            select(debit_sum, credit_sum, open_count, entry_count)
-            .where(
-                SubledgerEntryModel.entity_id == entity_id,
-                SubledgerEntryModel.subledger_type == subledger_type.value,
-                SubledgerEntryModel.currency == currency,
-                SubledgerEntryModel.effective_date <= as_of_date,
+        if projection is None:
+            totals = self._entry_totals(
+                *key, SubledgerEntryModel.effective_date <= as_of_date,
             )
-        )
-
-        result = self.session.execute(query).one()
-
-        debit_total = result.debit_total or Decimal("0")
-        credit_total = result.credit_total or Decimal("0")
-
-        # Balance sign depends on subledger type normal balance side
-        # Credit-normal (liabilities): balance = credit - debit
-        # Debit-normal (assets): balance = debit - credit
-        _credit_normal = (SubledgerType.AP.value, SubledgerType.PAYROLL.value)
-        if subledger_type.value in _credit_normal:
-            balance = credit_total - debit_total
+            debit_total = totals.debit_total
+            credit_total = totals.credit_total
+            entry_count = totals.entry_count
+            open_count = totals.open_count
         else:
-            balance = debit_total - credit_total
+            debit_total = projection.debit_total
+            credit_total = projection.credit_total
+            entry_count = projection.entry_count
+            open_count = projection.open_item_count
+            last = projection.last_effective_date
+            if last is not None and last > as_of_date:
+                tail = self._entry_totals(
+                    *key, SubledgerEntryModel.effective_date > as_of_date,
+                )
+                debit_total -= tail.debit_total
+                credit_total -= tail.credit_total
+                entry_count -= tail.entry_count
+                open_count -= tail.open_count
 
         return SubledgerBalanceDTO(
             entity_id=entity_id,
@@ -394,9 +739,9 @@ class SubledgerSelector(BaseSelector[SubledgerEntryModel]):
             as_of_date=as_of_date,
             debit_total=debit_total,
             credit_total=credit_total,
-            balance=balance,
-            open_item_count=result.open_count or 0,
-            entry_count=result.entry_count or 0,
+            balance=self._signed_balance(subledger_type, debit_total, credit_total),
+            open_item_count=open_count,
+            entry_count=entry_count,
         )
 
     def get_aggregate_balance(
@@ -417,6 +762,9 @@ class SubledgerSelector(BaseSelector[SubledgerEntryModel]):
         Postconditions: Returns Money with the net aggregate balance.
             Balance sign: credit-normal for AP/PAYROLL, debit-normal otherwise.
 
+        Sums the projection rows of the subledger type and currency (SL-P1)
+        and subtracts the entries dated after as_of_date.
+
         Args:
             subledger_type: Subledger type.
             as_of_date: Cutoff date (required).
@@ -425,36 +773,140 @@ class SubledgerSelector(BaseSelector[SubledgerEntryModel]):
         Returns:
             Money representing the aggregate balance.
         """
-        debit_sum = func.coalesce(
-            func.sum(SubledgerEntryModel.debit_amount), Decimal("0")
-        ).label("debit_total")
-
-        credit_sum = func.coalesce(
-            func.sum(SubledgerEntryModel.credit_amount), Decimal("0")
-        ).label("credit_total")
+        key = (
+            SubledgerEntryModel.subledger_type == subledger_type.value,
+            SubledgerEntryModel.currency == currency,
+        )
+        projection = self.session.execute(
+            select(
+                func.coalesce(
+                    func.sum(SubledgerEntityBalanceModel.debit_total), Decimal("0")
+                ).label("debit_total"),
+                func.coalesce(
+                    func.sum(SubledgerEntityBalanceModel.credit_total), Decimal("0")
+                ).label("credit_total"),
+                func.count(SubledgerEntityBalanceModel.id).label("row_count"),
+                func.max(SubledgerEntityBalanceModel.last_effective_date).label("last"),
+            ).where(
+                SubledgerEntityBalanceModel.subledger_type == subledger_type.value,
+                SubledgerEntityBalanceModel.currency == currency,
+            )
+        ).one()
 
-        query = (
-            select(debit_sum, credit_sum)
-            .where(
-                SubledgerEntryModel.subledger_type == subledger_type.value,
-                SubledgerEntryModel.currency == currency,
-                SubledgerEntryModel.effective_date <= as_of_date,
+        if not projection.row_count:
+            totals = self._entry_totals(
+                *key, SubledgerEntryModel.effective_date <= as_of_date,
             )
+            debit_total = totals.debit_total
+            credit_total = totals.credit_total
+        else:
+            debit_total = projection.debit_total
+            credit_total = projection.credit_total
+            if projection.last is not None and projection.last > as_of_date:
+                tail = self._entry_totals(
+                    *key, SubledgerEntryModel.effective_date > as_of_date,
+                )
+                debit_total -= tail.debit_total
+                credit_total -= tail.credit_total
+
+        return Money.of(
+            self._signed_balance(subledger_type, debit_total, credit_total),
+            currency,
         )
 
-        result = self.session.execute(query).one()
+    # =========================================================================
+    # Balance Projection Verification
+    # =========================================================================
 
-        debit_total = result.debit_total or Decimal("0")
-        credit_total = result.credit_total or Decimal("0")
+    def recompute_entity_balances(
+        self,
+        subledger_type: SubledgerType | None = None,
+    ) -> list[EntityBalanceTotalsDTO]:
+        """
+        Full GROUP BY recompute of every key's totals from subledger_entries.
 
-        # Balance sign depends on subledger type
-        _credit_normal = (SubledgerType.AP.value, SubledgerType.PAYROLL.value)
-        if subledger_type.value in _credit_normal:
-            balance = credit_total - debit_total
-        else:
-            balance = debit_total - credit_total
+        This is the reference the SL-P1 projection is verified against; it
+        reads the entire subledger and is meant for batch verification only.
+        """
+        query = select(
+            SubledgerEntryModel.subledger_type,
+            SubledgerEntryModel.entity_id,
+            SubledgerEntryModel.currency,
+            func.coalesce(
+                func.sum(SubledgerEntryModel.debit_amount), Decimal("0")
+            ).label("debit_total"),
+            func.coalesce(
+                func.sum(SubledgerEntryModel.credit_amount), Decimal("0")
+            ).label("credit_total"),
+            func.count(SubledgerEntryModel.id).label("entry_count"),
+            func.sum(case(
+                (SubledgerEntryModel.reconciliation_status.in_(_OPEN_STATUSES), 1),
+                else_=0,
+            )).label("open_item_count"),
+            func.max(SubledgerEntryModel.effective_date).label("last_effective_date"),
+        ).group_by(
+            SubledgerEntryModel.subledger_type,
+            SubledgerEntryModel.entity_id,
+            SubledgerEntryModel.currency,
+        ).order_by(
+            SubledgerEntryModel.subledger_type,
+            SubledgerEntryModel.entity_id,
+            SubledgerEntryModel.currency,
+        )
+        if subledger_type is not None:
+            query = query.where(
+                SubledgerEntryModel.subledger_type == subledger_type.value,
+            )
+        return [
+            EntityBalanceTotalsDTO(
+                subledger_type=row.subledger_type,
+                entity_id=row.entity_id,
+                currency=row.currency,
+                debit_total=row.debit_total,
+                credit_total=row.credit_total,
+                entry_count=row.entry_count,
+                open_item_count=row.open_item_count,
+                last_effective_date=row.last_effective_date,
+            )
+            for row in self.session.execute(query)
+        ]
 
-        return Money.of(balance, currency)
+    def projected_entity_balances(
+        self,
+        subledger_type: SubledgerType | None = None,
+    ) -> list[EntityBalanceTotalsDTO]:
+        """Current projection rows, in the same order as the recompute."""
+        query = select(
+            SubledgerEntityBalanceModel.subledger_type,
+            SubledgerEntityBalanceModel.entity_id,
+            SubledgerEntityBalanceModel.currency,
+            SubledgerEntityBalanceModel.debit_total,
+            SubledgerEntityBalanceModel.credit_total,
+            SubledgerEntityBalanceModel.entry_count,
+            SubledgerEntityBalanceModel.open_item_count,
+            SubledgerEntityBalanceModel.last_effective_date,
+        ).order_by(
+            SubledgerEntityBalanceModel.subledger_type,
+            SubledgerEntityBalanceModel.entity_id,
+            SubledgerEntityBalanceModel.currency,
+        )
+        if subledger_type is not None:
+            query = query.where(
+                SubledgerEntityBalanceModel.subledger_type == subledger_type.value,
+            )
+        return [
+            EntityBalanceTotalsDTO(
+                subledger_type=row.subledger_type,
+                entity_id=row.entity_id,
+                currency=row.currency,
+                debit_total=row.debit_total,
+                credit_total=row.credit_total,
+                entry_count=row.entry_count,
+                open_item_count=row.open_item_count,
+                last_effective_date=row.last_effective_date,
+            )
+            for row in self.session.execute(query)
+        ]
 
     # =========================================================================
     # Reconciliation Queries
@@ -1,5 +1,14 @@
-"""Read-only trace bundle assembly for audit investigation."""
+"""Read-only trace bundle assembly for audit investigation.
 
+Single-artifact traces (``trace_by_*``) and batch traces (``trace_events``)
+share the same row-to-DTO conversion and bundle finalization, so a bundle
+built in a batch hashes identically to the one built on its own.  The batch
+path resolves every component for a chunk of events with one keyed
+(``IN``-list) query per component type and yields bundles one at a time, so
+memory is bounded by the chunk size.
+"""
+
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict, dataclass, replace
 from datetime import date, datetime
 from decimal import Decimal
@@ -221,6 +230,12 @@ class LogQueryPort(Protocol):
 # ============================================================================
 
 
+_CONFLICT_ACTIONS = frozenset({
+    AuditAction.PROTOCOL_VIOLATION.value,
+    AuditAction.PAYLOAD_MISMATCH.value,
+})
+
+
 class TraceSelector(BaseSelector[JournalEntry]):
     """Read-only trace bundle assembler for audit investigation."""
 
@@ -267,6 +282,43 @@ class TraceSelector(BaseSelector[JournalEntry]):
         event_id, entry_ids = self._resolve_via_links(artifact_type, artifact_id)
         return self._assemble_bundle(artifact, event_id, entry_ids)
 
+    def trace_events(
+        self, event_ids: Iterable[UUID], chunk_size: int = 200,
+    ) -> Iterator[TraceBundle]:
+        """Trace many source events, yielding one bundle per event in order.
+
+        Each chunk of ``chunk_size`` events is resolved with one keyed query
+        per component type (events, journal entries, outcomes, economic
+        events, links, audit events); bundles are equivalent to
+        ``trace_by_event_id`` for the same event.  ``event_ids`` may be a
+        lazy iterable; duplicates within a chunk are traced once.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        chunk: list[UUID] = []
+        for event_id in event_ids:
+            chunk.append(event_id)
+            if len(chunk) == chunk_size:
+                yield from self._trace_event_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._trace_event_chunk(chunk)
+
+    def event_ids_for_period(
+        self, start_date: date, end_date: date,
+    ) -> list[UUID]:
+        """Source event IDs with effective_date in [start_date, end_date].
+
+        Ordered by (effective_date, occurred_at, event_id) for a stable
+        export order.
+        """
+        return list(self.session.execute(
+            select(Event.event_id)
+            .where(Event.effective_date.between(start_date, end_date))
+            .order_by(Event.effective_date, Event.occurred_at, Event.event_id)
+        ).scalars().all())
+
     # -----------------------------------------------------------------------
     # Core Assembly
     # -----------------------------------------------------------------------
@@ -303,18 +355,46 @@ class TraceSelector(BaseSelector[JournalEntry]):
         # Step 7: Structured log entries - optional (Priority 4)
         log_timeline = self._resolve_log_entries(event_id, missing)
 
-        # Step 8: Merge and sort timeline
-        timeline = self._build_timeline(audit_timeline, log_timeline)
-
-        # Step 9: Conflicts / protocol violations
+        # Step 8: Conflicts / protocol violations
         conflicts = self._check_conflicts(event_id)
 
-        # Step 10: Reproducibility (R21 snapshot)
+        return self._finalize_bundle(
+            artifact=artifact,
+            event_orm=event_orm,
+            origin=origin,
+            journal_entries=journal_entries,
+            interpretation=interpretation,
+            econ_event_data=econ_event_data,
+            lifecycle_links=lifecycle_links,
+            audit_timeline=audit_timeline,
+            log_timeline=log_timeline,
+            conflicts=conflicts,
+            missing=missing,
+        )
+
+    def _finalize_bundle(
+        self,
+        artifact: ArtifactIdentifier,
+        event_orm: Event | None,
+        origin: OriginEvent | None,
+        journal_entries: list[JournalEntrySnapshot],
+        interpretation: InterpretationInfo | None,
+        econ_event_data: dict | None,
+        lifecycle_links: list[LifecycleLink],
+        audit_timeline: list[TimelineEntry],
+        log_timeline: list[TimelineEntry],
+        conflicts: list[ConflictInfo],
+        missing: list[MissingFact],
+    ) -> TraceBundle:
+        """Merge timeline, derive R21/integrity facts, and hash the bundle."""
+        timeline = self._build_timeline(audit_timeline, log_timeline)
+
+        # Reproducibility (R21 snapshot)
         reproducibility = self._extract_reproducibility(
             journal_entries, econ_event_data,
         )
 
-        # Step 11: Integrity checks
+        # Integrity checks
         payload_hash_ok = self._verify_payload_hash(event_orm)
         balance_ok = self._verify_balance(journal_entries)
         chain_ok = self._verify_audit_segment(audit_timeline)
@@ -351,6 +431,156 @@ class TraceSelector(BaseSelector[JournalEntry]):
 
         return bundle
 
+    def _trace_event_chunk(self, event_ids: list[UUID]) -> Iterator[TraceBundle]:
+        """Resolve one chunk of events with keyed queries, then assemble."""
+        ids = list(dict.fromkeys(event_ids))
+
+        events = {
+            e.event_id: e
+            for e in self.session.execute(
+                select(Event).where(Event.event_id.in_(ids))
+            ).scalars()
+        }
+
+        snapshots_by_event: dict[UUID, list[JournalEntrySnapshot]] = {}
+        for entry in self.session.execute(
+            self._journal_entry_query(JournalEntry.source_event_id.in_(ids))
+        ).scalars():
+            snapshots_by_event.setdefault(entry.source_event_id, []).append(
+                self._to_entry_snapshot(entry),
+            )
+        entry_ids = [
+            snap.entry_id for snaps in snapshots_by_event.values() for snap in snaps
+        ]
+
+        outcomes = {
+            o.source_event_id: o
+            for o in self.session.execute(
+                select(InterpretationOutcome).where(
+                    InterpretationOutcome.source_event_id.in_(ids)
+                )
+            ).scalars()
+        }
+
+        econ_data = {
+            econ.source_event_id: self._to_econ_data(econ)
+            for econ in self.session.execute(
+                select(EconomicEvent).where(EconomicEvent.source_event_id.in_(ids))
+            ).scalars()
+        }
+
+        link_conditions = [
+            and_(
+                EconomicLinkModel.parent_artifact_type == "event",
+                EconomicLinkModel.parent_artifact_id.in_(ids),
+            ),
+            and_(
+                EconomicLinkModel.child_artifact_type == "event",
+                EconomicLinkModel.child_artifact_id.in_(ids),
+            ),
+            EconomicLinkModel.creating_event_id.in_(ids),
+        ]
+        audit_conditions = [and_(
+            AuditEvent.entity_type == "Event",
+            AuditEvent.entity_id.in_(ids),
+        )]
+        if entry_ids:
+            link_conditions += [
+                and_(
+                    EconomicLinkModel.parent_artifact_type == "journal_entry",
+                    EconomicLinkModel.parent_artifact_id.in_(entry_ids),
+                ),
+                and_(
+                    EconomicLinkModel.child_artifact_type == "journal_entry",
+                    EconomicLinkModel.child_artifact_id.in_(entry_ids),
+                ),
+            ]
+            audit_conditions.append(and_(
+                AuditEvent.entity_type == "JournalEntry",
+                AuditEvent.entity_id.in_(entry_ids),
+            ))
+
+        links_by_ref: dict[tuple[str, UUID], list[EconomicLinkModel]] = {}
+        for link in self.session.execute(
+            select(EconomicLinkModel).where(or_(*link_conditions))
+        ).scalars():
+            refs = {
+                (link.parent_artifact_type, link.parent_artifact_id),
+                (link.child_artifact_type, link.child_artifact_id),
+                ("creating_event", link.creating_event_id),
+            }
+            for ref in refs:
+                links_by_ref.setdefault(ref, []).append(link)
+
+        audit_by_entity: dict[tuple[str, UUID], list[AuditEvent]] = {}
+        for ae in self.session.execute(
+            select(AuditEvent).where(or_(*audit_conditions)).order_by(AuditEvent.seq)
+        ).scalars():
+            audit_by_entity.setdefault((ae.entity_type, ae.entity_id), []).append(ae)
+
+        for event_id in ids:
+            missing: list[MissingFact] = []
+            event_orm = events.get(event_id)
+            if event_orm is None:
+                missing.append(MissingFact(
+                    fact="ORIGIN_EVENT",
+                    expected_source="events",
+                    correlation_key=str(event_id),
+                    detail="Event not found in events table",
+                ))
+
+            journal_entries = snapshots_by_event.get(event_id, [])
+            if not journal_entries:
+                missing.append(MissingFact(
+                    fact="JOURNAL_ENTRIES",
+                    expected_source="journal_entries",
+                    correlation_key=str(event_id),
+                    detail="No journal entries found",
+                ))
+            event_entry_ids = [snap.entry_id for snap in journal_entries]
+
+            candidate_links: dict[UUID, EconomicLinkModel] = {}
+            for ref in (
+                [("event", event_id), ("creating_event", event_id)]
+                + [("journal_entry", eid) for eid in event_entry_ids]
+            ):
+                for link in links_by_ref.get(ref, ()):
+                    candidate_links[link.id] = link
+            lifecycle_links = [
+                self._to_lifecycle_link(link)
+                for link in sorted(
+                    candidate_links.values(), key=lambda ln: (ln.created_at, str(ln.id)),
+                )
+            ]
+
+            audit_rows = list(audit_by_entity.get(("Event", event_id), ()))
+            for eid in event_entry_ids:
+                audit_rows.extend(audit_by_entity.get(("JournalEntry", eid), ()))
+            audit_rows.sort(key=lambda ae: ae.seq)
+
+            outcome = outcomes.get(event_id)
+            log_timeline = self._log_timeline(
+                event_id, outcome.decision_log if outcome else None, missing,
+            )
+
+            yield self._finalize_bundle(
+                artifact=ArtifactIdentifier("event", event_id),
+                event_orm=event_orm,
+                origin=self._to_origin(event_orm) if event_orm else None,
+                journal_entries=journal_entries,
+                interpretation=self._to_interpretation(outcome) if outcome else None,
+                econ_event_data=econ_data.get(event_id),
+                lifecycle_links=lifecycle_links,
+                audit_timeline=[self._to_timeline_entry(ae) for ae in audit_rows],
+                log_timeline=log_timeline,
+                conflicts=[
+                    self._to_conflict(ae)
+                    for ae in audit_by_entity.get(("Event", event_id), ())
+                    if getattr(ae.action, "value", ae.action) in _CONFLICT_ACTIONS
+                ],
+                missing=missing,
+            )
+
     # -----------------------------------------------------------------------
     # Resolution Methods
     # -----------------------------------------------------------------------
@@ -431,18 +661,7 @@ class TraceSelector(BaseSelector[JournalEntry]):
             ))
             return None, None
 
-        origin = OriginEvent(
-            event_id=event.event_id,
-            event_type=event.event_type,
-            occurred_at=event.occurred_at,
-            effective_date=event.effective_date,
-            actor_id=event.actor_id,
-            producer=event.producer,
-            payload_hash=event.payload_hash,
-            schema_version=event.schema_version,
-            ingested_at=event.ingested_at,
-        )
-        return origin, event
+        return self._to_origin(event), event
 
     def _resolve_journal_entries(
         self,
@@ -466,66 +685,10 @@ class TraceSelector(BaseSelector[JournalEntry]):
             return []
 
         entries = self.session.execute(
-            select(JournalEntry)
-            .options(
-                selectinload(JournalEntry.lines)
-                .selectinload(JournalLine.account)
-            )
-            .where(JournalEntry.id.in_(all_ids))
-            .order_by(JournalEntry.seq)
+            self._journal_entry_query(JournalEntry.id.in_(all_ids))
         ).scalars().all()
 
-        snapshots: list[JournalEntrySnapshot] = []
-        for entry in entries:
-            line_snapshots = tuple(
-                JournalLineSnapshot(
-                    line_id=line.id,
-                    account_id=line.account_id,
-                    account_code=(
-                        line.account.code if line.account else "UNKNOWN"
-                    ),
-                    side=(
-                        line.side.value
-                        if isinstance(line.side, LineSide)
-                        else str(line.side)
-                    ),
-                    amount=line.amount,
-                    currency=line.currency,
-                    dimensions=line.dimensions,
-                    is_rounding=line.is_rounding,
-                    line_seq=line.line_seq,
-                    exchange_rate_id=line.exchange_rate_id,
-                )
-                for line in sorted(entry.lines, key=lambda ln: ln.line_seq)
-            )
-
-            status_val = (
-                entry.status.value
-                if isinstance(entry.status, JournalEntryStatus)
-                else str(entry.status)
-            )
-
-            snapshots.append(JournalEntrySnapshot(
-                entry_id=entry.id,
-                source_event_id=entry.source_event_id,
-                source_event_type=entry.source_event_type,
-                effective_date=entry.effective_date,
-                occurred_at=entry.occurred_at,
-                posted_at=entry.posted_at,
-                status=status_val,
-                seq=entry.seq,
-                idempotency_key=entry.idempotency_key,
-                reversal_of_id=entry.reversal_of_id,
-                description=entry.description,
-                lines=line_snapshots,
-                coa_version=entry.coa_version,
-                dimension_schema_version=entry.dimension_schema_version,
-                rounding_policy_version=entry.rounding_policy_version,
-                currency_registry_version=entry.currency_registry_version,
-                posting_rule_version=entry.posting_rule_version,
-            ))
-
-        return snapshots
+        return [self._to_entry_snapshot(entry) for entry in entries]
 
     def _resolve_interpretation(
         self, event_id: UUID | None, missing: list[MissingFact],
@@ -544,31 +707,7 @@ class TraceSelector(BaseSelector[JournalEntry]):
             # Not a MissingFact -- events without interpretation don't have outcomes
             return None
 
-        journal_ids = None
-        if outcome.journal_entry_ids:
-            journal_ids = tuple(str(jid) for jid in outcome.journal_entry_ids)
-
-        decision_log = None
-        if outcome.decision_log:
-            decision_log = tuple(outcome.decision_log)
-
-        return InterpretationInfo(
-            source_event_id=outcome.source_event_id,
-            status=(
-                outcome.status.value
-                if hasattr(outcome.status, "value")
-                else str(outcome.status)
-            ),
-            econ_event_id=outcome.econ_event_id,
-            journal_entry_ids=journal_ids,
-            reason_code=outcome.reason_code,
-            reason_detail=outcome.reason_detail,
-            profile_id=outcome.profile_id,
-            profile_version=outcome.profile_version,
-            profile_hash=outcome.profile_hash,
-            trace_id=outcome.trace_id,
-            decision_log=decision_log,
-        )
+        return self._to_interpretation(outcome)
 
     def _resolve_economic_event_data(self, event_id: UUID | None) -> dict | None:
         """Load economic event R21 fields. Source: economic_events."""
@@ -584,12 +723,7 @@ class TraceSelector(BaseSelector[JournalEntry]):
         if econ is None:
             return None
 
-        return {
-            "coa_version": econ.coa_version,
-            "dimension_schema_version": econ.dimension_schema_version,
-            "currency_registry_version": econ.currency_registry_version,
-            "fx_policy_version": econ.fx_policy_version,
-        }
+        return self._to_econ_data(econ)
 
     def _resolve_lifecycle_links(
         self,
@@ -625,7 +759,9 @@ class TraceSelector(BaseSelector[JournalEntry]):
             )
 
         links = self.session.execute(
-            select(EconomicLinkModel).where(or_(*conditions))
+            select(EconomicLinkModel)
+            .where(or_(*conditions))
+            .order_by(EconomicLinkModel.created_at, EconomicLinkModel.id)
         ).scalars().all()
 
         seen: set[UUID] = set()
@@ -634,17 +770,7 @@ class TraceSelector(BaseSelector[JournalEntry]):
             if link.id in seen:
                 continue
             seen.add(link.id)
-            result.append(LifecycleLink(
-                link_id=link.id,
-                link_type=link.link_type,
-                parent_artifact_type=link.parent_artifact_type,
-                parent_artifact_id=link.parent_artifact_id,
-                child_artifact_type=link.child_artifact_type,
-                child_artifact_id=link.child_artifact_id,
-                creating_event_id=link.creating_event_id,
-                created_at=link.created_at,
-                link_metadata=link.link_metadata,
-            ))
+            result.append(self._to_lifecycle_link(link))
 
         return result
 
@@ -673,22 +799,7 @@ class TraceSelector(BaseSelector[JournalEntry]):
             .order_by(AuditEvent.seq)
         ).scalars().all()
 
-        return [
-            TimelineEntry(
-                timestamp=ae.occurred_at,
-                source="audit_event",
-                action=(
-                    ae.action.value
-                    if isinstance(ae.action, AuditAction)
-                    else str(ae.action)
-                ),
-                entity_type=ae.entity_type,
-                entity_id=str(ae.entity_id),
-                detail=ae.payload,
-                seq=ae.seq,
-            )
-            for ae in audit_events
-        ]
+        return [self._to_timeline_entry(ae) for ae in audit_events]
 
     def _resolve_log_entries(
         self, event_id: UUID | None, missing: list[MissingFact],
@@ -701,8 +812,18 @@ class TraceSelector(BaseSelector[JournalEntry]):
         if event_id is None:
             return []
 
+        return self._log_timeline(
+            event_id, self._load_decision_log(event_id), missing,
+        )
+
+    def _log_timeline(
+        self,
+        event_id: UUID,
+        decision_log: list[dict] | None,
+        missing: list[MissingFact],
+    ) -> list[TimelineEntry]:
+        """Timeline from a loaded decision_log, else the LogQueryPort."""
         # Priority 1: Persisted decision_log from InterpretationOutcome
-        decision_log = self._load_decision_log(event_id)
         if decision_log:
             return self._records_to_timeline(decision_log)
 
@@ -787,29 +908,13 @@ class TraceSelector(BaseSelector[JournalEntry]):
                 and_(
                     AuditEvent.entity_type == "Event",
                     AuditEvent.entity_id == event_id,
-                    AuditEvent.action.in_([
-                        AuditAction.PROTOCOL_VIOLATION.value,
-                        AuditAction.PAYLOAD_MISMATCH.value,
-                    ]),
+                    AuditEvent.action.in_(_CONFLICT_ACTIONS),
                 )
             )
             .order_by(AuditEvent.seq)
         ).scalars().all()
 
-        return [
-            ConflictInfo(
-                action=(
-                    v.action.value
-                    if isinstance(v.action, AuditAction)
-                    else str(v.action)
-                ),
-                occurred_at=v.occurred_at,
-                entity_type=v.entity_type,
-                entity_id=str(v.entity_id),
-                payload=v.payload,
-            )
-            for v in violations
-        ]
+        return [self._to_conflict(v) for v in violations]
 
     def _extract_reproducibility(
         self,
@@ -855,6 +960,168 @@ class TraceSelector(BaseSelector[JournalEntry]):
             posting_rule_version=posting_rule_version,
         )
 
+    # -----------------------------------------------------------------------
+    # Row -> DTO Conversion (shared by single and batch traces)
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _journal_entry_query(condition):
+        """Journal entries with lines and accounts eager-loaded, by seq."""
+        return (
+            select(JournalEntry)
+            .options(
+                selectinload(JournalEntry.lines)
+                .selectinload(JournalLine.account)
+            )
+            .where(condition)
+            .order_by(JournalEntry.seq)
+        )
+
+    @staticmethod
+    def _to_origin(event: Event) -> OriginEvent:
+        return OriginEvent(
+            event_id=event.event_id,
+            event_type=event.event_type,
+            occurred_at=event.occurred_at,
+            effective_date=event.effective_date,
+            actor_id=event.actor_id,
+            producer=event.producer,
+            payload_hash=event.payload_hash,
+            schema_version=event.schema_version,
+            ingested_at=event.ingested_at,
+        )
+
+    @staticmethod
+    def _to_entry_snapshot(entry: JournalEntry) -> JournalEntrySnapshot:
+        line_snapshots = tuple(
+            JournalLineSnapshot(
+                line_id=line.id,
+                account_id=line.account_id,
+                account_code=(
+                    line.account.code if line.account else "UNKNOWN"
+                ),
+                side=(
+                    line.side.value
+                    if isinstance(line.side, LineSide)
+                    else str(line.side)
+                ),
+                amount=line.amount,
+                currency=line.currency,
+                dimensions=line.dimensions,
+                is_rounding=line.is_rounding,
+                line_seq=line.line_seq,
+                exchange_rate_id=line.exchange_rate_id,
+            )
+            for line in sorted(entry.lines, key=lambda ln: ln.line_seq)
+        )
+
+        status_val = (
+            entry.status.value
+            if isinstance(entry.status, JournalEntryStatus)
+            else str(entry.status)
+        )
+
+        return JournalEntrySnapshot(
+            entry_id=entry.id,
+            source_event_id=entry.source_event_id,
+            source_event_type=entry.source_event_type,
+            effective_date=entry.effective_date,
+            occurred_at=entry.occurred_at,
+            posted_at=entry.posted_at,
+            status=status_val,
+            seq=entry.seq,
+            idempotency_key=entry.idempotency_key,
+            reversal_of_id=entry.reversal_of_id,
+            description=entry.description,
+            lines=line_snapshots,
+            coa_version=entry.coa_version,
+            dimension_schema_version=entry.dimension_schema_version,
+            rounding_policy_version=entry.rounding_policy_version,
+            currency_registry_version=entry.currency_registry_version,
+            posting_rule_version=entry.posting_rule_version,
+        )
+
+    @staticmethod
+    def _to_interpretation(outcome: InterpretationOutcome) -> InterpretationInfo:
+        journal_ids = None
+        if outcome.journal_entry_ids:
+            journal_ids = tuple(str(jid) for jid in outcome.journal_entry_ids)
+
+        decision_log = None
+        if outcome.decision_log:
+            decision_log = tuple(outcome.decision_log)
+
+        return InterpretationInfo(
+            source_event_id=outcome.source_event_id,
+            status=(
+                outcome.status.value
+                if hasattr(outcome.status, "value")
+                else str(outcome.status)
+            ),
+            econ_event_id=outcome.econ_event_id,
+            journal_entry_ids=journal_ids,
+            reason_code=outcome.reason_code,
+            reason_detail=outcome.reason_detail,
+            profile_id=outcome.profile_id,
+            profile_version=outcome.profile_version,
+            profile_hash=outcome.profile_hash,
+            trace_id=outcome.trace_id,
+            decision_log=decision_log,
+        )
+
+    @staticmethod
+    def _to_econ_data(econ: EconomicEvent) -> dict:
+        return {
+            "coa_version": econ.coa_version,
+            "dimension_schema_version": econ.dimension_schema_version,
+            "currency_registry_version": econ.currency_registry_version,
+            "fx_policy_version": econ.fx_policy_version,
+        }
+
+    @staticmethod
+    def _to_lifecycle_link(link: EconomicLinkModel) -> LifecycleLink:
+        return LifecycleLink(
+            link_id=link.id,
+            link_type=link.link_type,
+            parent_artifact_type=link.parent_artifact_type,
+            parent_artifact_id=link.parent_artifact_id,
+            child_artifact_type=link.child_artifact_type,
+            child_artifact_id=link.child_artifact_id,
+            creating_event_id=link.creating_event_id,
+            created_at=link.created_at,
+            link_metadata=link.link_metadata,
+        )
+
+    @staticmethod
+    def _to_timeline_entry(ae: AuditEvent) -> TimelineEntry:
+        return TimelineEntry(
+            timestamp=ae.occurred_at,
+            source="audit_event",
+            action=(
+                ae.action.value
+                if isinstance(ae.action, AuditAction)
+                else str(ae.action)
+            ),
+            entity_type=ae.entity_type,
+            entity_id=str(ae.entity_id),
+            detail=ae.payload,
+            seq=ae.seq,
+        )
+
+    @staticmethod
+    def _to_conflict(ae: AuditEvent) -> ConflictInfo:
+        return ConflictInfo(
+            action=(
+                ae.action.value
+                if isinstance(ae.action, AuditAction)
+                else str(ae.action)
+            ),
+            occurred_at=ae.occurred_at,
+            entity_type=ae.entity_type,
+            entity_id=str(ae.entity_id),
+            payload=ae.payload,
+        )
+
     # -----------------------------------------------------------------------
     # Integrity Verification
     # -----------------------------------------------------------------------
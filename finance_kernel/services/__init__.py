@@ -23,6 +23,12 @@ from finance_kernel.services.module_posting_service import (
 )
 from finance_kernel.services.party_service import PartyInfo, PartyService
 from finance_kernel.services.period_service import PeriodService
+from finance_kernel.services.posting_profiler import (
+    PostingProfiler,
+    ProfilerSnapshot,
+    StageStats,
+    get_posting_profiler,
+)
 from finance_kernel.services.sequence_service import SequenceService
 
 __all__ = [
@@ -41,6 +47,10 @@ __all__ = [
     "PartyInfo",
     "PartyService",
     "PeriodService",
+    "PostingProfiler",
+    "ProfilerSnapshot",
     "SequenceService",
+    "StageStats",
     "UnconsumedValue",
+    "get_posting_profiler",
 ]
@@ -0,0 +1,258 @@
+"""
+DecisionJournal -- context-local decision journal for a single posting.
+
+Responsibility:
+    Collects the structured log records emitted by the ``finance_kernel``
+    logger hierarchy while *one* posting is in flight, and materialises
+    them as the ``InterpretationOutcome.decision_log`` JSON array.
+
+Architecture position:
+    Kernel > Services -- write-side observability infrastructure.
+    A single process-wide ``DecisionJournalHandler`` is attached to the
+    ``finance_kernel`` logger once.  Each posting activates its own
+    ``DecisionJournal`` through a ``ContextVar``; the handler routes every
+    record to the journal active in the *emitting* context only.
+
+Invariants enforced:
+    None directly.  The journal is the persisted decision trail that
+    auditors use to review R11, L5, P15, and other invariant enforcement.
+
+Failure modes:
+    - Record emitted with no active journal: dropped by the handler
+      (cost is one ``ContextVar.get()``).
+    - Record emitted from a thread that did not inherit the posting's
+      context (e.g. a bare ``threading.Thread``): not journaled.  Posting
+      code does not fan out to threads, so nothing is lost today.
+
+Audit relevance:
+    Replaces the per-posting ``LogCapture`` install on the shared logger.
+    With ``LogCapture``, every concurrent posting captured every record in
+    the process (N threads => N copies of each record, most of them
+    belonging to other events).  The journal only ever holds records for
+    its own posting, so ``decision_log`` is both cheaper and correct under
+    concurrency.
+
+Usage::
+
+    with DecisionJournal() as journal:
+        result = coordinator._do_interpret_and_post(...)
+        outcome.decision_log = journal.to_dicts()
+
+The serialised shape of each record is identical to
+``StructuredFormatter.format_to_dict`` (``ts``, ``level``, ``logger``,
+``message``, context fields, then structured extras), so ``TraceSelector``
+and existing ``decision_log`` readers are unaffected.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from finance_kernel.logging_config import (
+    LogContext,
+    StructuredFormatter,
+    _serialize_log_value,
+    _STDLIB_KEYS,
+)
+
+_LOGGER_PREFIX = "finance_kernel"
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionRecord:
+    """Compact journal entry for one log record.
+
+    ``context`` is the shared ``LogContext`` snapshot for the posting (the
+    same dict object for every record, not a copy).  ``extras`` holds the
+    already-serialised structured fields as ``(key, value)`` pairs.
+    ``detail`` is only set for records carrying exception info, where the
+    full formatter output (exc_* fields, traceback) is kept verbatim.
+    """
+
+    created: float
+    level: str
+    logger: str
+    message: str
+    context: dict[str, str]
+    extras: tuple[tuple[str, Any], ...]
+    detail: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialise in the ``StructuredFormatter.format_to_dict`` shape."""
+        if self.detail is not None:
+            return dict(self.detail)
+        payload: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(self.created, tz=UTC).isoformat(),
+            "level": self.level,
+            "logger": self.logger,
+            "message": self.message,
+        }
+        payload.update(self.context)
+        for key, val in self.extras:
+            if key not in payload:
+                payload[key] = val
+        return payload
+
+
+_active_journal: ContextVar[DecisionJournal | None] = ContextVar(
+    "decision_journal", default=None
+)
+
+_EMPTY_CONTEXT: dict[str, str] = {}
+
+
+class DecisionJournal:
+    """
+    Per-posting collector of decision records.
+
+    Contract:
+        - While entered (``with journal:``), every ``finance_kernel`` record
+          emitted in this context (thread / task) is appended to this
+          journal and to no other.
+        - Nested journals shadow the outer one; the outer journal resumes
+          collecting when the inner one exits.
+
+    Guarantees:
+        - ``to_dicts()`` returns JSON-serialisable dicts in emission order.
+        - No lock is taken on the emit path: a journal is only appended to
+          from the context that activated it.
+
+    Non-goals:
+        - Does NOT persist records; the caller assigns ``to_dicts()`` to
+          ``InterpretationOutcome.decision_log``.
+        - Does NOT implement ``LogQueryPort`` (use ``LogCapture`` for ad hoc
+          capture across postings).
+    """
+
+    __slots__ = ("_records", "_token")
+
+    def __init__(self) -> None:
+        self._records: list[DecisionRecord] = []
+        self._token: Token[DecisionJournal | None] | None = None
+
+    def append(self, record: logging.LogRecord) -> None:
+        """Journal a log record (called by ``DecisionJournalHandler``)."""
+        if record.exc_info and record.exc_info[1] is not None:
+            self._records.append(_record_with_detail(record))
+            return
+        ctx = LogContext.get_snapshot()
+        if ctx is None:
+            ctx = LogContext.get_all() or _EMPTY_CONTEXT
+        extras = tuple(
+            (key, _serialize_log_value(val))
+            for key, val in record.__dict__.items()
+            if key not in _STDLIB_KEYS
+        )
+        self._records.append(
+            DecisionRecord(
+                created=record.created,
+                level=record.levelname,
+                logger=record.name,
+                message=record.getMessage(),
+                context=ctx,
+                extras=extras,
+            )
+        )
+
+    @property
+    def records(self) -> tuple[DecisionRecord, ...]:
+        """Journaled records in emission order."""
+        return tuple(self._records)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialise all records for ``InterpretationOutcome.decision_log``."""
+        return [r.to_dict() for r in self._records]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __enter__(self) -> DecisionJournal:
+        install_decision_journal_handler()
+        self._token = _active_journal.set(self)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._token is not None:
+            _active_journal.reset(self._token)
+            self._token = None
+
+
+_FORMATTER = StructuredFormatter()
+
+
+def _record_with_detail(record: logging.LogRecord) -> DecisionRecord:
+    """Journal entry for a record with exception info (rare path)."""
+    detail = _FORMATTER.format_to_dict(record)
+    return DecisionRecord(
+        created=record.created,
+        level=record.levelname,
+        logger=record.name,
+        message=detail["message"],
+        context=_EMPTY_CONTEXT,
+        extras=(),
+        detail=detail,
+    )
+
+
+def current_journal() -> DecisionJournal | None:
+    """Return the decision journal active in this context, if any."""
+    return _active_journal.get()
+
+
+# ---------------------------------------------------------------------------
+# Handler
+# ---------------------------------------------------------------------------
+
+
+class DecisionJournalHandler(logging.Handler):
+    """Routes records to the ``DecisionJournal`` active in the emitting context.
+
+    ``handle`` is overridden to skip ``Handler.lock``: the handler itself is
+    stateless and each journal is only touched by its own context, so the
+    stock per-handler lock would only serialise unrelated posting threads.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+
+    def handle(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        journal = _active_journal.get()
+        if journal is None:
+            return False
+        journal.append(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+
+_HANDLER = DecisionJournalHandler()
+_install_lock = threading.Lock()
+
+
+def install_decision_journal_handler() -> None:
+    """Attach the process-wide journal handler to ``finance_kernel`` (idempotent).
+
+    Re-attaches after ``reset_logging()`` and keeps the logger at DEBUG so
+    decision records below the console level are still journaled (same
+    level behaviour ``LogCapture.install`` had).
+    """
+    logger = logging.getLogger(_LOGGER_PREFIX)
+    if _HANDLER in logger.handlers and 0 < logger.level <= logging.DEBUG:
+        return
+    with _install_lock:
+        if _HANDLER not in logger.handlers:
+            logger.addHandler(_HANDLER)
+        if logger.level > logging.DEBUG or logger.level == logging.NOTSET:
+            logger.setLevel(logging.DEBUG)
+
+
+def uninstall_decision_journal_handler() -> None:
+    """Detach the journal handler. FOR TESTING ONLY."""
+    with _install_lock:
+        logging.getLogger(_LOGGER_PREFIX).removeHandler(_HANDLER)
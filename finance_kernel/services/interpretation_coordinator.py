@@ -28,13 +28,14 @@ from finance_kernel.models.interpretation_outcome import (
     InterpretationOutcome,
     OutcomeStatus,
 )
+from finance_kernel.services.decision_journal import DecisionJournal
 from finance_kernel.services.journal_writer import (
     JournalWriter,
     JournalWriteResult,
     WriteStatus,
 )
-from finance_kernel.services.log_capture import LogCapture
 from finance_kernel.services.outcome_recorder import OutcomeRecorder
+from finance_kernel.services.posting_profiler import begin_stage, end_stage
 from finance_kernel.utils.hashing import canonicalize_json
 
 logger = get_logger("services.interpretation_coordinator")
@@ -139,6 +140,7 @@ class InterpretationCoordinator:
         preamble_log: list[dict] | None = None,
         policy_fingerprint: str | None = None,
         profile_source: str | None = None,
+        engine_result: EngineDispatchResult | None = None,
     ) -> InterpretationResult:
         """Interpret an event and post to ledgers atomically.
 
@@ -149,11 +151,11 @@ class InterpretationCoordinator:
         prepend to the decision_log for traceability and lookback.
         policy_fingerprint: Optional canonical_fingerprint of the config pack (audit).
         profile_source: Optional source of the profile (e.g. compiled_policy_pack).
+        engine_result: Optional engine dispatch result computed ahead of time
+        for compiled_policy (event replay); the dispatcher is not called again.
         """
         correlation_id = str(_uuid4())
-        capture = LogCapture()
-        capture.install()
-        try:
+        with DecisionJournal() as journal:
             with LogContext.bind(
                 correlation_id=correlation_id,
                 event_id=str(accounting_intent.source_event_id),
@@ -171,6 +173,7 @@ class InterpretationCoordinator:
                         event_payload=event_payload,
                         policy_fingerprint=policy_fingerprint,
                         profile_source=profile_source,
+                        engine_result=engine_result,
                     )
                     duration_ms = round((time.monotonic() - t0) * 1000, 2)
                     logger.info(
@@ -182,12 +185,14 @@ class InterpretationCoordinator:
                         },
                     )
 
-                    # Persist decision journal on the outcome (preamble + capture)
+                    # Persist decision journal on the outcome (preamble + journal)
                     if result.outcome is not None:
+                        begin_stage("audit")
                         result.outcome.decision_log = (
                             list(preamble_log) if preamble_log else []
-                        ) + capture.take_records()
+                        ) + journal.to_dicts()
                         self._session.flush()
+                        end_stage()
 
                     return result
                 except Exception:
@@ -200,8 +205,6 @@ class InterpretationCoordinator:
                     raise
                 finally:
                     LogContext.clear_snapshot()
-        finally:
-            capture.uninstall()
 
     def _do_interpret_and_post(
         self,
@@ -213,6 +216,7 @@ class InterpretationCoordinator:
         event_payload: dict[str, Any] | None = None,
         policy_fingerprint: str | None = None,
         profile_source: str | None = None,
+        engine_result: EngineDispatchResult | None = None,
     ) -> InterpretationResult:
         """Internal interpret and post logic (within LogContext)."""
         logger.info(
@@ -247,23 +251,28 @@ class InterpretationCoordinator:
         )
 
         # --- Engine dispatch (before guard checks and journal write) ---
-        engine_result: EngineDispatchResult | None = None
+        # A precomputed engine_result (e.g. from a parallel replay worker)
+        # skips the dispatch call but is validated and traced the same way.
         if (
-            self._engine_dispatcher is not None
-            and compiled_policy is not None
-            and event_payload is not None
+            compiled_policy is not None
             and getattr(compiled_policy, "required_engines", None)
-        ):
-            logger.info(
-                "engine_dispatch_started",
-                extra={
-                    "policy_name": getattr(compiled_policy, "name", "unknown"),
-                    "required_engines": list(compiled_policy.required_engines),
-                },
-            )
-            engine_result = self._engine_dispatcher.dispatch(
-                compiled_policy, event_payload,
+            and (
+                engine_result is not None
+                or (self._engine_dispatcher is not None and event_payload is not None)
             )
+        ):
+            begin_stage("engines")
+            if engine_result is None:
+                logger.info(
+                    "engine_dispatch_started",
+                    extra={
+                        "policy_name": getattr(compiled_policy, "name", "unknown"),
+                        "required_engines": list(compiled_policy.required_engines),
+                    },
+                )
+                engine_result = self._engine_dispatcher.dispatch(
+                    compiled_policy, event_payload,
+                )
 
             # INVARIANT: No engine run → no success trace → no all_succeeded=True.
             # Reject results that claim success without one success trace per required engine.
@@ -291,6 +300,7 @@ class InterpretationCoordinator:
                             "trace_count": len(engine_result.traces),
                         },
                     )
+                    end_stage()
                     return InterpretationResult.failure(
                         error_code="ENGINE_DISPATCH_FAILED",
                         error_message=f"Engine dispatch failed: {error_msg}",
@@ -319,6 +329,7 @@ class InterpretationCoordinator:
                     "engines": list(engine_result.engine_outputs.keys()),
                 },
             )
+            end_stage()
 
         # Handle guard results first
         if meaning_result.guard_result and meaning_result.guard_result.rejected:
@@ -348,11 +359,13 @@ class InterpretationCoordinator:
         )
 
         # INVARIANT: P11 -- Multi-ledger postings from single intent are atomic
+        begin_stage("journal_write")
         journal_result = self._journal_writer.write(
             intent=accounting_intent,
             actor_id=actor_id,
             event_type=meaning_result.economic_event.economic_type,
         )
+        end_stage()
 
         if not journal_result.is_success:
             if journal_result.status == WriteStatus.ROLE_RESOLUTION_FAILED:
@@ -372,6 +385,7 @@ class InterpretationCoordinator:
 
         # INVARIANT: L5 -- POSTED outcome in same transaction as journal writes
         # INVARIANT: P15 -- Exactly one InterpretationOutcome per event
+        begin_stage("audit")
         outcome = self._outcome_recorder.record_posted(
             source_event_id=accounting_intent.source_event_id,
             profile_id=accounting_intent.profile_id,
@@ -380,6 +394,7 @@ class InterpretationCoordinator:
             journal_entry_ids=list(journal_result.entry_ids),
             trace_id=trace_id,
         )
+        end_stage()
 
         # INVARIANT: L5 -- Both outcome and journal entries must exist together
         assert outcome is not None, "L5 violation: POSTED requires an outcome record"
@@ -1,5 +1,6 @@
 """Atomic multi-ledger journal posting service."""
 
+import logging
 import time
 from dataclasses import dataclass
 from datetime import date, datetime
@@ -280,23 +281,25 @@ class JournalWriter:
         )
 
         # INVARIANT: R4 -- Debits = Credits per currency per entry
+        log_balances = logger.isEnabledFor(logging.INFO)
         for ledger_intent in intent.ledger_intents:
             for currency in ledger_intent.currencies:
                 sum_debit = ledger_intent.total_debits(currency)
                 sum_credit = ledger_intent.total_credits(currency)
                 balanced = ledger_intent.is_balanced(currency)
 
-                logger.info(
-                    "balance_validated",
-                    extra={
-                        "ledger_id": ledger_intent.ledger_id,
-                        "currency": currency,
-                        "sum_debit": str(sum_debit),
-                        "sum_credit": str(sum_credit),
-                        "balanced": balanced,
-                        "source_event_id": str(intent.source_event_id),
-                    },
-                )
+                if log_balances:
+                    logger.info(
+                        "balance_validated",
+                        extra={
+                            "ledger_id": ledger_intent.ledger_id,
+                            "currency": currency,
+                            "sum_debit": sum_debit,
+                            "sum_credit": sum_credit,
+                            "balanced": balanced,
+                            "source_event_id": intent.source_event_id,
+                        },
+                    )
 
                 if not balanced:
                     imbalance = sum_debit - sum_credit
@@ -580,6 +583,7 @@ class JournalWriter:
                 line_memo=f"Reversal of line {original_line.line_seq}",
                 exchange_rate_id=original_line.exchange_rate_id,
                 line_seq=original_line.line_seq,
+                effective_date=reversal_entry.effective_date,
                 created_by_id=actor_id,
             )
             self._session.add(reversal_line)
@@ -633,6 +637,7 @@ class JournalWriter:
     ) -> list[tuple[LedgerIntent, list[ResolvedIntentLine]]]:
         """Resolve all roles in all ledger intents."""
         resolved: list[tuple[LedgerIntent, list[ResolvedIntentLine]]] = []
+        log_roles = logger.isEnabledFor(logging.INFO)
 
         for ledger_intent in intent.ledger_intents:
             resolved_lines: list[ResolvedIntentLine] = []
@@ -646,28 +651,29 @@ class JournalWriter:
                 account_id = binding.account_id
                 account_code = binding.account_code
 
-                logger.info(
-                    "role_resolved",
-                    extra={
-                        "role": line.account_role,
-                        "account_code": account_code,
-                        "account_id": str(account_id),
-                        "account_name": binding.account_name,
-                        "account_type": binding.account_type,
-                        "normal_balance": binding.normal_balance,
-                        "ledger_id": ledger_intent.ledger_id,
-                        "coa_version": intent.snapshot.coa_version,
-                        "line_seq": i,
-                        "side": line.side,
-                        "amount": str(line.money.amount),
-                        "currency": line.money.currency,
-                        "source_event_id": str(intent.source_event_id),
-                        "binding_effective_from": binding.effective_from,
-                        "binding_effective_to": binding.effective_to or "open",
-                        "config_id": binding.config_id,
-                        "config_version": binding.config_version,
-                    },
-                )
+                if log_roles:
+                    logger.info(
+                        "role_resolved",
+                        extra={
+                            "role": line.account_role,
+                            "account_code": account_code,
+                            "account_id": account_id,
+                            "account_name": binding.account_name,
+                            "account_type": binding.account_type,
+                            "normal_balance": binding.normal_balance,
+                            "ledger_id": ledger_intent.ledger_id,
+                            "coa_version": intent.snapshot.coa_version,
+                            "line_seq": i,
+                            "side": line.side,
+                            "amount": line.money.amount,
+                            "currency": line.money.currency,
+                            "source_event_id": intent.source_event_id,
+                            "binding_effective_from": binding.effective_from,
+                            "binding_effective_to": binding.effective_to or "open",
+                            "config_id": binding.config_id,
+                            "config_version": binding.config_version,
+                        },
+                    )
 
                 resolved_lines.append(
                     ResolvedIntentLine(
@@ -770,6 +776,7 @@ class JournalWriter:
         # Validate rounding invariants
         self._validate_rounding_invariants(entry.id, resolved_lines)
 
+        log_lines = logger.isEnabledFor(logging.INFO)
         for line in resolved_lines:
             journal_line = JournalLine(
                 journal_entry_id=entry.id,
@@ -781,24 +788,26 @@ class JournalWriter:
                 is_rounding=line.is_rounding,
                 line_memo=line.memo,
                 line_seq=line.line_seq,
+                effective_date=entry.effective_date,
                 created_by_id=actor_id,
             )
             self._session.add(journal_line)
 
-            logger.info(
-                "line_written",
-                extra={
-                    "entry_id": str(entry.id),
-                    "line_seq": line.line_seq,
-                    "role": line.account_role,
-                    "account_code": line.account_code,
-                    "account_id": str(line.account_id),
-                    "side": line.side,
-                    "amount": str(line.amount),
-                    "currency": line.currency,
-                    "is_rounding": line.is_rounding,
-                },
-            )
+            if log_lines:
+                logger.info(
+                    "line_written",
+                    extra={
+                        "entry_id": entry.id,
+                        "line_seq": line.line_seq,
+                        "role": line.account_role,
+                        "account_code": line.account_code,
+                        "account_id": line.account_id,
+                        "side": line.side,
+                        "amount": line.amount,
+                        "currency": line.currency,
+                        "is_rounding": line.is_rounding,
+                    },
+                )
 
         self._session.flush()
 
@@ -1065,7 +1074,7 @@ class JournalWriter:
             )
             return
 
-        validation_result = self._snapshot_service.validate_integrity(
+        validation_result = self._snapshot_service.validate_freshness(
             full_snapshot
         )
 
@@ -173,6 +173,73 @@ class LinkGraphService:
             results.append(result)
         return results
 
+    def establish_links_to_new_artifact(
+        self,
+        links: Sequence[EconomicLink],
+    ) -> list[LinkEstablishResult]:
+        """Persist many links that share one not-yet-linked child artifact.
+
+        Used by consolidated postings that tie every source artifact (e.g.
+        each depreciated asset) to the single journal entry they produced.
+        A child with no links at all cannot duplicate an existing link and
+        has no descendants through which a cycle could close, so one
+        existence query replaces the per-link duplicate and L3 DFS checks
+        of ``establish_link`` and all rows are flushed together.  Falls
+        back to ``establish_links`` when the child is already linked or a
+        link type has a max-children limit.
+        """
+        if not links:
+            return []
+        child = links[0].child_ref
+        if any(link.child_ref != child for link in links):
+            raise ValueError("All links must share the same child artifact")
+
+        limited = any(
+            (spec := LINK_TYPE_SPECS.get(link.link_type)) is not None
+            and spec.max_children is not None
+            for link in links
+        )
+        child_type = child.artifact_type.value
+        already_linked = self.session.execute(
+            select(literal(1))
+            .select_from(EconomicLinkModel)
+            .where(
+                (
+                    (EconomicLinkModel.child_artifact_type == child_type)
+                    & (EconomicLinkModel.child_artifact_id == child.artifact_id)
+                )
+                | (
+                    (EconomicLinkModel.parent_artifact_type == child_type)
+                    & (EconomicLinkModel.parent_artifact_id == child.artifact_id)
+                )
+            )
+            .limit(1)
+        ).first() is not None
+        if limited or already_linked:
+            return self.establish_links(links)
+
+        seen: set[tuple[LinkType, ArtifactRef]] = set()
+        for link in links:
+            key = (link.link_type, link.parent_ref)
+            if key in seen:
+                raise DuplicateLinkError(
+                    link_type=link.link_type.value,
+                    parent_ref=str(link.parent_ref),
+                    child_ref=str(link.child_ref),
+                )
+            seen.add(key)
+
+        self.session.add_all([EconomicLinkModel.from_domain(link) for link in links])
+        self.session.flush()
+        logger.info(
+            "economic_links_created",
+            extra={
+                "link_count": len(links),
+                "target_ref": str(child),
+            },
+        )
+        return [LinkEstablishResult.success(link) for link in links]
+
     # =========================================================================
     # Graph Traversal
     # =========================================================================
@@ -14,6 +14,7 @@ from uuid import uuid4 as _uuid4
 
 from sqlalchemy.orm import Session
 
+from finance_kernel.db.pool_telemetry import pool_caller
 from finance_kernel.domain.clock import Clock, SystemClock
 from finance_kernel.domain.meaning_builder import MeaningBuilder, MeaningBuilderResult
 from finance_kernel.domain.control import evaluate_controls
@@ -36,6 +37,12 @@ from finance_kernel.services.journal_writer import JournalWriter, RoleResolver
 from finance_kernel.services.outcome_recorder import OutcomeRecorder
 from finance_kernel.services.period_service import PeriodService
 from finance_kernel.services.party_service import PartyService
+from finance_kernel.services.posting_profiler import (
+    PostingProfiler,
+    begin_stage,
+    end_stage,
+    get_posting_profiler,
+)
 
 logger = get_logger("services.module_posting")
 
@@ -124,12 +131,14 @@ class ModulePostingService:
         clock: Clock | None = None,
         auto_commit: bool = True,
         party_service: PartyService | None = None,
+        profiler: PostingProfiler | None = None,
     ):
         """Legacy constructor. Prefer ``from_orchestrator`` for new code."""
         self._session = session
         self._clock = clock or SystemClock()
         self._auto_commit = auto_commit
         self._party_service_ref = party_service
+        self._profiler = profiler or get_posting_profiler()
 
         # Build internal services (legacy path)
         self._auditor = AuditorService(session, clock)
@@ -153,12 +162,14 @@ class ModulePostingService:
         cls,
         orchestrator: PostingOrchestrator,
         auto_commit: bool = True,
+        profiler: PostingProfiler | None = None,
     ) -> ModulePostingService:
         """Create from a PostingOrchestrator (preferred)."""
         instance = cls.__new__(cls)
         instance._session = orchestrator.session
         instance._clock = orchestrator.clock
         instance._auto_commit = auto_commit
+        instance._profiler = profiler or get_posting_profiler()
         instance._ingestor = orchestrator.ingestor
         instance._period_service = orchestrator.period_service
         instance._meaning_builder = orchestrator.meaning_builder
@@ -210,7 +221,7 @@ class ModulePostingService:
             event_id=str(resolved_event_id),
             actor_id=str(actor_id),
             producer=resolved_producer,
-        ):
+        ), pool_caller("posting"), self._profiler.posting(event_type, self._session):
             logger.info(
                 "module_posting_started",
                 extra={
@@ -335,6 +346,7 @@ class ModulePostingService:
 
         # INVARIANT: G14 — Actor validation is mandatory for all POSTED outcomes.
         # No POSTED may occur without validating actor_id against PartyService.
+        begin_stage("actor_check")
         party_svc = getattr(self, "_party_service_ref", None)
         if party_svc is None:
             return ModulePostingResult(
@@ -361,6 +373,7 @@ class ModulePostingService:
         # INVARIANT: R13 — Adjustment policy enforcement
         from finance_kernel.exceptions import AdjustmentsNotAllowedError
 
+        begin_stage("period_check")
         try:
             self._period_service.validate_adjustment_allowed(
                 effective_date, is_adjustment=is_adjustment
@@ -388,10 +401,21 @@ class ModulePostingService:
                 "passed": True,
                 "effective_date": str(effective_date),
             })
+        # Posting inputs not carried by the event row (needed for replay).
+        governance_preamble.append({
+            "message": "posting_request",
+            "amount": str(amount),
+            "currency": currency,
+            "is_adjustment": is_adjustment,
+            "description": description,
+            "coa_version": coa_version,
+            "dimension_schema_version": dimension_schema_version,
+        })
         full_preamble = governance_preamble + (preamble_log or [])
 
         # INVARIANT: R1 — Event immutability via IngestorService
         # INVARIANT: R2 — Payload hash verification via IngestorService
+        begin_stage("ingest")
         ingest_result = self._ingestor.ingest(
             event_id=event_id,
             event_type=event_type,
@@ -417,6 +441,7 @@ class ModulePostingService:
                 message="Event already ingested (idempotent duplicate)",
             )
 
+        begin_stage("controls")
         gate_result = self._validate_import_hard_gate(event_id, event_type, producer, payload, actor_id)
         if gate_result is not None:
             return gate_result
@@ -439,6 +464,7 @@ class ModulePostingService:
 
         # INVARIANT: P1 — Exactly one EconomicProfile matches any event
         # When policy_source is set (from orchestrator with pack), use config-driven profile.
+        begin_stage("profile_selection")
         try:
             if getattr(self, "_policy_source", None) is not None:
                 profile = self._policy_source.get_profile(
@@ -476,6 +502,7 @@ class ModulePostingService:
         )
 
         # 4. Build meaning (MeaningBuilder — pure domain)
+        begin_stage("meaning")
         meaning_result = self._meaning_builder.build(
             event_id=event_id,
             event_type=event_type,
@@ -511,6 +538,7 @@ class ModulePostingService:
             )
 
         # 5. Build accounting intent (profile_bridge or from payload.lines)
+        begin_stage("intent")
         try:
             if getattr(profile, "intent_source", None) == "payload_lines":
                 if account_key_to_role is None:
@@ -556,6 +584,8 @@ class ModulePostingService:
 
         # INVARIANT: L5 — Atomic journal + outcome via InterpretationCoordinator
         # INVARIANT: P11 — Multi-ledger postings are atomic
+        # The coordinator marks the engines / journal_write / audit stages.
+        end_stage()
         pack = getattr(self, "_compiled_pack", None)
         interpretation_result = self._coordinator.interpret_and_post(
             meaning_result=meaning_result,
@@ -580,6 +610,7 @@ class ModulePostingService:
         # 7. Post subledger entries (SL-G1: same transaction as journal write).
         #    Callable lives in finance_services/ (architecture boundary).
         if self._post_subledger_fn and interpretation_result.journal_result:
+            begin_stage("subledger")
             self._post_subledger_fn(
                 accounting_intent=accounting_intent,
                 journal_result=interpretation_result.journal_result,
@@ -588,6 +619,7 @@ class ModulePostingService:
                 payload=payload,
                 actor_id=actor_id,
             )
+            end_stage()
 
         # Success
         journal_entry_ids = ()
@@ -21,6 +21,8 @@ Invariants enforced:
     R3  -- Returns frozen ``FiscalPeriodInfo`` DTOs, never ORM entities.
     R7  -- Flush-only: never commits or rolls back the session.
     R25 -- CLOSING period blocks non-close postings.
+    PC1 -- Locking a period writes its sealed closing-balance snapshot in
+           the same flush, so historical selectors can start from it.
 
 Failure modes:
     - PeriodNotFoundError: No period covers the effective_date.
@@ -39,6 +41,7 @@ Audit relevance:
     Validation failures (R12/R13/R25) are logged at WARNING level.
 """
 
+import json
 from datetime import date, datetime
 from uuid import UUID
 
@@ -64,6 +67,11 @@ from finance_kernel.exceptions import (
 )
 from finance_kernel.logging_config import get_logger
 from finance_kernel.models.fiscal_period import FiscalPeriod, PeriodStatus
+from finance_kernel.models.period_close_balance import (
+    PeriodCloseBalanceModel,
+    PeriodCloseSnapshotModel,
+)
+from finance_kernel.selectors.ledger_selector import LedgerSelector
 from finance_kernel.services.base import BaseService
 
 logger = get_logger("services.period")
@@ -363,7 +371,8 @@ class PeriodService(BaseService[FiscalPeriod]):
         """
         Permanently lock a closed period (year-end).
 
-        Transitions CLOSED -> LOCKED. No reopening possible.
+        Transitions CLOSED -> LOCKED. No reopening possible.  Writes the
+        period's sealed closing-balance snapshot (PC1).
 
         Args:
             period_code: Period to lock.
@@ -388,14 +397,71 @@ class PeriodService(BaseService[FiscalPeriod]):
 
         period.status = PeriodStatus.LOCKED
         self.session.flush()
+        snapshot = self._seal_close_balances(period, actor_id)
 
         logger.info(
             "period_locked",
-            extra={"period_code": period_code},
+            extra={
+                "period_code": period_code,
+                "close_snapshot_cells": snapshot.cell_count,
+                "close_seal_hash": snapshot.seal_hash,
+            },
         )
 
         return self._to_dto(period)
 
+    def _seal_close_balances(
+        self, period: FiscalPeriod, actor_id: UUID,
+    ) -> PeriodCloseSnapshotModel:
+        """Write the sealed closing-balance snapshot of a locked period (PC1).
+
+        The snapshot covers every line posted so far with an effective date
+        up to the period end; the current seq watermark bounds it, so lines
+        posted later are read as the tail by LedgerSelector.  The seal links
+        the balance rows to the R24 canonical hash of the same lines.
+        """
+        ledger = LedgerSelector(self.session)
+        watermark = ledger.posted_seq_watermark()
+        cells = ledger.closing_balance_cells(period.end_date, watermark)
+        ledger_hash = ledger.canonical_hash(period.end_date, max_seq=watermark)
+        balances_hash = ledger.closing_balances_hash(cells)
+
+        snapshot = PeriodCloseSnapshotModel(
+            period_code=period.period_code,
+            end_date=period.end_date,
+            seq_watermark=watermark,
+            ledger_hash=ledger_hash,
+            balances_hash=balances_hash,
+            seal_hash=ledger.close_seal_hash(
+                period.period_code,
+                period.end_date,
+                watermark,
+                ledger_hash,
+                balances_hash,
+            ),
+            cell_count=len(cells),
+            created_by_id=actor_id,
+        )
+        self.session.add(snapshot)
+        self.session.flush()
+        self.session.add_all([
+            PeriodCloseBalanceModel(
+                snapshot_id=snapshot.id,
+                account_id=cell.account_id,
+                currency=cell.currency,
+                dimensions_key=cell.dimensions_key,
+                dimensions=(
+                    json.loads(cell.dimensions_key) if cell.dimensions_key else None
+                ),
+                debit_total=cell.debit_total,
+                credit_total=cell.credit_total,
+                line_count=cell.line_count,
+            )
+            for cell in cells
+        ])
+        self.session.flush()
+        return snapshot
+
     def _get_period_orm(self, period_code: str) -> FiscalPeriod | None:
         """Get ORM FiscalPeriod by code (internal use only)."""
         return self.session.execute(
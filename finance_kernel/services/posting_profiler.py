@@ -0,0 +1,393 @@
+"""
+PostingProfiler -- always-on, low-overhead posting-stage instrumentation.
+
+Responsibility:
+    Records wall-clock latency and SQL statement counts for each fixed
+    stage of the posting pipeline (``POSTING_STAGES``), per event type,
+    into HDR-style log-linear histograms.  Exposes the result as a frozen
+    ``ProfilerSnapshot`` and as Prometheus text exposition format (for the
+    node_exporter textfile collector or any scraper endpoint).
+
+Architecture position:
+    Kernel > Services -- imperative shell, observability only.
+    ``ModulePostingService.post_event`` opens one ``posting()`` span per
+    event; the service and ``InterpretationCoordinator`` mark stage
+    boundaries with ``begin_stage()`` / ``end_stage()``.  Both functions
+    are no-ops when no span is active (direct coordinator calls, replay),
+    so call sites never branch on whether profiling is on.
+
+Invariants enforced:
+    - One histogram sample per (event type, stage) per posting: a stage
+      entered more than once during a posting (e.g. ``audit``) accumulates
+      into the same sample.
+    - Stages the posting never reached (early return) record nothing.
+    - Histograms are updated once per posting, under a single lock, when
+      the span closes; stage marks touch only context-local state.
+    - SQL statements are counted by a ``before_cursor_execute`` listener
+      and attributed to the open stage of the current context's span.
+    - Never touches the session's transaction (no flush, commit, rollback).
+
+Failure modes:
+    - Unknown stage name in ``begin_stage()``: ValueError.
+    - ``LatencyHistogram.percentile()`` with q outside [0, 100]: ValueError.
+    - Exceptions raised inside a span propagate unchanged; the span still
+      records the stages it completed.
+
+Audit relevance:
+    None directly -- profiler data is operational telemetry and never part
+    of the ledger.  It replaces scattered ``duration_ms`` log fields as the
+    source for posting latency SLOs.
+
+Usage:
+    profiler = get_posting_profiler()
+    snapshot = profiler.snapshot()
+    snapshot.get("inventory.receipt", "journal_write").p99_us
+    profiler.write_prometheus_textfile("/var/lib/node_exporter/posting.prom")
+    # ^ also carries finance_db_pool_* (db/pool_telemetry.py) when the
+    #   primary engine is initialized
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from finance_kernel.db.engine import get_pool_telemetry
+from finance_kernel.utils.histogram import LatencyHistogram
+
+POSTING_STAGES: tuple[str, ...] = (
+    "actor_check",
+    "period_check",
+    "ingest",
+    "controls",
+    "profile_selection",
+    "meaning",
+    "intent",
+    "engines",
+    "journal_write",
+    "subledger",
+    "audit",
+)
+TOTAL_STAGE = "total"
+ALL_EVENT_TYPES = "*"
+
+# Upper bounds (seconds) of the cumulative buckets in the Prometheus export.
+PROMETHEUS_BUCKETS_S: tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_STAGE_SET = frozenset(POSTING_STAGES)
+
+
+# ---------------------------------------------------------------------------
+# Snapshot DTOs
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Latency and SQL statistics for one (event type, stage) pair."""
+
+    event_type: str
+    stage: str
+    count: int
+    sql_statements: int
+    total_us: int
+    min_us: int
+    max_us: int
+    mean_us: float
+    p50_us: int
+    p90_us: int
+    p99_us: int
+    p999_us: int
+
+    @property
+    def sql_per_posting(self) -> float:
+        return self.sql_statements / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class ProfilerSnapshot:
+    """Point-in-time copy of every histogram, including ``ALL_EVENT_TYPES`` rollups."""
+
+    stats: tuple[StageStats, ...]
+
+    def get(self, event_type: str, stage: str) -> StageStats | None:
+        for s in self.stats:
+            if s.event_type == event_type and s.stage == stage:
+                return s
+        return None
+
+    def for_event_type(self, event_type: str) -> tuple[StageStats, ...]:
+        return tuple(s for s in self.stats if s.event_type == event_type)
+
+    @property
+    def event_types(self) -> tuple[str, ...]:
+        return tuple(sorted({
+            s.event_type for s in self.stats if s.event_type != ALL_EVENT_TYPES
+        }))
+
+
+# ---------------------------------------------------------------------------
+# Spans
+# ---------------------------------------------------------------------------
+
+
+class _PostingSpan:
+    """Context-local accumulator for one posting; flushed on close."""
+
+    __slots__ = ("event_type", "stage", "stage_started", "elapsed", "sql", "sql_total")
+
+    def __init__(self, event_type: str) -> None:
+        self.event_type = event_type
+        self.stage: str | None = None
+        self.stage_started = 0
+        self.elapsed: dict[str, int] = {}
+        self.sql: dict[str, int] = {}
+        self.sql_total = 0
+
+    def begin(self, stage: str) -> None:
+        if stage not in _STAGE_SET:
+            raise ValueError(f"Unknown posting stage: {stage}")
+        now = time.perf_counter_ns()
+        if self.stage is not None:
+            self._close(now)
+        self.stage = stage
+        self.stage_started = now
+        self.elapsed.setdefault(stage, 0)
+
+    def end(self) -> None:
+        if self.stage is not None:
+            self._close(time.perf_counter_ns())
+            self.stage = None
+
+    def _close(self, now: int) -> None:
+        self.elapsed[self.stage] += now - self.stage_started
+
+    def count_statement(self) -> None:
+        self.sql_total += 1
+        if self.stage is not None:
+            self.sql[self.stage] = self.sql.get(self.stage, 0) + 1
+
+
+_active_span: ContextVar[_PostingSpan | None] = ContextVar(
+    "posting_profiler_span", default=None,
+)
+
+
+def begin_stage(stage: str) -> None:
+    """Close the open stage (if any) and start ``stage`` on the active span."""
+    span = _active_span.get()
+    if span is not None:
+        span.begin(stage)
+
+
+def end_stage() -> None:
+    """Close the open stage on the active span (no-op without one)."""
+    span = _active_span.get()
+    if span is not None:
+        span.end()
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    span = _active_span.get()
+    if span is not None:
+        span.count_statement()
+
+
+def _instrument(session: Session) -> None:
+    """Attach the statement counter to the session's engine (once per engine)."""
+    bind = session.get_bind()
+    engine = bind if isinstance(bind, Engine) else getattr(bind, "engine", None)
+    if engine is None:
+        return
+    if not event.contains(engine, "before_cursor_execute", _count_statement):
+        event.listen(engine, "before_cursor_execute", _count_statement)
+
+
+# ---------------------------------------------------------------------------
+# Profiler
+# ---------------------------------------------------------------------------
+
+
+class PostingProfiler:
+    """
+    Thread-safe store of per-(event type, stage) latency histograms.
+
+    Contract:
+        ``posting(event_type, session)`` wraps one posting.  While open,
+        ``begin_stage`` / ``end_stage`` anywhere down the call stack attribute
+        time and SQL statements to ``POSTING_STAGES``; the whole span is also
+        recorded as ``TOTAL_STAGE``.  ``enabled=False`` makes ``posting()`` a
+        pass-through.
+    """
+
+    def __init__(self, enabled: bool = True, sub_bucket_bits: int = 7) -> None:
+        self.enabled = enabled
+        self._bits = sub_bucket_bits
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self._sql: dict[tuple[str, str], int] = {}
+
+    @contextmanager
+    def posting(self, event_type: str, session: Session | None = None) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        if session is not None:
+            _instrument(session)
+        span = _PostingSpan(event_type)
+        token = _active_span.set(span)
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            span.end()
+            _active_span.reset(token)
+            self._flush(span, time.perf_counter_ns() - started)
+
+    def _flush(self, span: _PostingSpan, total_ns: int) -> None:
+        samples = list(span.elapsed.items())
+        samples.append((TOTAL_STAGE, total_ns))
+        sql = dict(span.sql)
+        sql[TOTAL_STAGE] = span.sql_total
+        with self._lock:
+            for stage, ns in samples:
+                key = (span.event_type, stage)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram(self._bits)
+                histogram.record(ns // 1000)
+                self._sql[key] = self._sql.get(key, 0) + sql.get(stage, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._sql.clear()
+
+    def snapshot(self) -> ProfilerSnapshot:
+        """Copy every histogram, plus per-stage rollups across event types."""
+        with self._lock:
+            items = [(key, h, self._sql.get(key, 0)) for key, h in self._histograms.items()]
+            rollups: dict[str, tuple[LatencyHistogram, int]] = {}
+            for (_, stage), histogram, sql in items:
+                merged, merged_sql = rollups.get(stage, (None, 0))
+                if merged is None:
+                    merged = LatencyHistogram(self._bits)
+                merged.merge(histogram)
+                rollups[stage] = (merged, merged_sql + sql)
+            stats = [_stats(et, st, h, sql) for (et, st), h, sql in items]
+            stats.extend(
+                _stats(ALL_EVENT_TYPES, stage, h, sql) for stage, (h, sql) in rollups.items()
+            )
+        return ProfilerSnapshot(stats=tuple(sorted(stats, key=_stat_order)))
+
+    # -- export -------------------------------------------------------------
+
+    def to_prometheus_text(self, prefix: str = "finance_posting") -> str:
+        """Render per-event-type histograms in Prometheus text format 0.0.4."""
+        with self._lock:
+            items = sorted(
+                ((key, h, self._sql.get(key, 0)) for key, h in self._histograms.items()),
+                key=lambda item: (item[0][0], _stage_rank(item[0][1])),
+            )
+            lines = [
+                f"# HELP {prefix}_stage_duration_seconds Posting pipeline stage latency.",
+                f"# TYPE {prefix}_stage_duration_seconds histogram",
+            ]
+            for (event_type, stage), histogram, _ in items:
+                labels = f'event_type="{_escape(event_type)}",stage="{_escape(stage)}"'
+                for bound in PROMETHEUS_BUCKETS_S:
+                    n = histogram.count_at_or_below(int(bound * 1_000_000))
+                    lines.append(
+                        f'{prefix}_stage_duration_seconds_bucket{{{labels},le="{bound:g}"}} {n}'
+                    )
+                lines.append(
+                    f'{prefix}_stage_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}'
+                )
+                lines.append(
+                    f"{prefix}_stage_duration_seconds_sum{{{labels}}} {histogram.total_us / 1_000_000:.6f}"
+                )
+                lines.append(
+                    f"{prefix}_stage_duration_seconds_count{{{labels}}} {histogram.count}"
+                )
+            lines.append(
+                f"# HELP {prefix}_stage_sql_statements_total SQL statements executed per stage."
+            )
+            lines.append(f"# TYPE {prefix}_stage_sql_statements_total counter")
+            for (event_type, stage), _, sql in items:
+                labels = f'event_type="{_escape(event_type)}",stage="{_escape(stage)}"'
+                lines.append(f"{prefix}_stage_sql_statements_total{{{labels}}} {sql}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus_textfile(
+        self, path: str, prefix: str = "finance_posting", include_pool: bool = True,
+    ) -> None:
+        """Atomically replace ``path`` with the Prometheus export (textfile collector).
+
+        With ``include_pool`` the primary engine's connection pool metrics
+        (``finance_db_pool_*``) are written to the same file, so pool waits
+        can be read against stage latency.
+        """
+        text = self.to_prometheus_text(prefix)
+        pool = get_pool_telemetry() if include_pool else None
+        if pool is not None:
+            text += pool.to_prometheus_text()
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".posting_profiler.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+
+def _stats(event_type: str, stage: str, h: LatencyHistogram, sql: int) -> StageStats:
+    return StageStats(
+        event_type=event_type,
+        stage=stage,
+        count=h.count,
+        sql_statements=sql,
+        total_us=h.total_us,
+        min_us=h.min_us,
+        max_us=h.max_us,
+        mean_us=h.mean_us,
+        p50_us=h.percentile(50),
+        p90_us=h.percentile(90),
+        p99_us=h.percentile(99),
+        p999_us=h.percentile(99.9),
+    )
+
+
+def _stage_rank(stage: str) -> int:
+    return POSTING_STAGES.index(stage) if stage in _STAGE_SET else len(POSTING_STAGES)
+
+
+def _stat_order(s: StageStats) -> tuple[bool, str, int]:
+    return (s.event_type == ALL_EVENT_TYPES, s.event_type, _stage_rank(s.stage))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+_default_profiler = PostingProfiler()
+
+
+def get_posting_profiler() -> PostingProfiler:
+    """Process-wide profiler used by ``ModulePostingService`` unless one is injected."""
+    return _default_profiler
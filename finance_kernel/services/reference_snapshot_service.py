@@ -6,7 +6,10 @@ Responsibility:
     dimension schemas, FX rates, rounding policy, tax rules, policy
     registry, account roles) into an immutable ``ReferenceSnapshot``
     with deterministic content hashes.  Provides snapshot retrieval
-    for replay and integrity validation for drift detection.
+    for replay and integrity validation for drift detection.  Database
+    components (COA, dimensions, FX rates) also record their change
+    stamp, so the per-posting freshness check compares stamps instead of
+    re-hashing the tables.
 
 Architecture position:
     Kernel > Services -- imperative shell.
@@ -22,6 +25,9 @@ Invariants enforced:
            produce identical results.  ``validate_integrity()`` detects
            any drift between the stored snapshot and current data.
     R7  -- Flush-only: never commits or rolls back the session.
+    G10 -- Freshness: ``validate_freshness()`` re-hashes a stamped
+           component only when its stamp moved since capture; pack-derived
+           components are hashed once per service instance.
 
 Failure modes:
     - SnapshotIntegrityError: Content hash mismatch detected during
@@ -46,6 +52,10 @@ Usage:
 
     # Later: replay with same snapshot
     old_snapshot = service.get(snapshot_id)
+
+    # Per-posting freshness (stamp compare) vs full drift check
+    service.validate_freshness(old_snapshot)
+    service.validate_integrity(old_snapshot)
 """
 
 from __future__ import annotations
@@ -53,6 +63,7 @@ from __future__ import annotations
 import hashlib
 import json
 from collections.abc import Sequence
+from dataclasses import replace
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
@@ -70,6 +81,23 @@ from finance_kernel.domain.reference_snapshot import (
     SnapshotValidationResult,
 )
 
+# Components backed by database tables; their stamps are bumped by the
+# before_flush listener in db/immutability.py.
+_STAMPED_COMPONENTS = frozenset({
+    SnapshotComponentType.COA,
+    SnapshotComponentType.DIMENSION_SCHEMA,
+    SnapshotComponentType.FX_RATES,
+})
+
+# Components derived from the (immutable) compiled pack or the static
+# currency registry; their hash cannot change for a service instance.
+_STATIC_COMPONENTS = frozenset({
+    SnapshotComponentType.TAX_RULES,
+    SnapshotComponentType.POLICY_REGISTRY,
+    SnapshotComponentType.ROUNDING_POLICY,
+    SnapshotComponentType.ACCOUNT_ROLES,
+})
+
 
 class ReferenceSnapshotService:
     """
@@ -112,6 +140,7 @@ class ReferenceSnapshotService:
         self._clock = clock or SystemClock()
         self._compiled_pack = compiled_pack
         self._snapshot_cache: dict[UUID, ReferenceSnapshot] = {}
+        self._static_hashes: dict[SnapshotComponentType, str] = {}
 
     def capture(self, request: SnapshotRequest) -> ReferenceSnapshot:
         """
@@ -128,6 +157,9 @@ class ReferenceSnapshotService:
             - Returns a ``ReferenceSnapshot`` with a unique ``snapshot_id``
               and one ``ComponentVersion`` per requested component.
             - Each ``ComponentVersion`` has a deterministic ``content_hash`` (R21).
+            - Stamped components carry the change stamp read *before* their
+              content, so a concurrent write can only make the snapshot look
+              stale (forcing a re-hash), never fresh.
             - The snapshot is cached for fast retrieval via ``get()``.
 
         Args:
@@ -140,9 +172,14 @@ class ReferenceSnapshotService:
         snapshot_id = uuid4()
 
         component_versions: list[ComponentVersion] = []
+        stamps = self._read_stamps()
 
         for component_type in request.include_components:
             cv = self._capture_component(component_type, captured_at)
+            if component_type in _STAMPED_COMPONENTS:
+                cv = replace(cv, change_stamp=stamps.get(component_type.value, 0))
+            elif component_type in _STATIC_COMPONENTS:
+                self._static_hashes[component_type] = cv.content_hash
             component_versions.append(cv)
 
         # INVARIANT: R21 -- Reference snapshot determinism: freeze all
@@ -197,18 +234,19 @@ class ReferenceSnapshotService:
 
     def _capture_coa(self, as_of: datetime) -> ComponentVersion:
         """Capture Chart of Accounts state."""
-        from finance_kernel.models.account import Account
+        from finance_kernel.models.account import Account, AccountType
 
         accounts = self._session.execute(
             select(Account).order_by(Account.code)
         ).scalars().all()
 
-        # Build deterministic representation
+        # Build deterministic representation (rows loaded from the database
+        # carry account_type as a plain string, fresh instances as the enum)
         coa_state = [
             {
                 "code": acc.code,
                 "name": acc.name,
-                "account_type": acc.account_type.value if acc.account_type else None,
+                "account_type": AccountType(acc.account_type).value if acc.account_type else None,
                 "is_active": acc.is_active,
                 "currency": acc.currency,
             }
@@ -465,6 +503,15 @@ class ReferenceSnapshotService:
         ).scalar_one()
         return max(1, count)
 
+    def _read_stamps(self) -> dict[str, int]:
+        """Current change stamp per stamped component (one indexed query)."""
+        from finance_kernel.models.reference_stamp import ReferenceComponentStamp
+
+        rows = self._session.execute(
+            select(ReferenceComponentStamp.component, ReferenceComponentStamp.stamp)
+        ).all()
+        return {component: stamp for component, stamp in rows}
+
     def _compute_hash(self, data: Any) -> str:
         """
         Compute SHA-256 hash of data.
@@ -544,6 +591,58 @@ class ReferenceSnapshotService:
             )
         return SnapshotValidationResult.valid(snapshot.snapshot_id)
 
+    def validate_freshness(
+        self, snapshot: ReferenceSnapshot
+    ) -> SnapshotValidationResult:
+        """
+        Validate that a snapshot is still current, re-hashing only on change.
+
+        The per-posting (G10) counterpart of ``validate_integrity()``:
+        stamped components whose change stamp is unchanged since capture
+        are accepted without reloading their rows; pack-derived components
+        are compared against a hash computed once per service instance.
+        Anything else -- a moved stamp, a snapshot captured without stamps,
+        an unknown component -- falls back to the full content-hash
+        comparison for that component only.
+
+        Postconditions:
+            - Never reports a component fresh whose content hash differs
+              from the stored hash, as long as its tables are written through
+              the ORM (Core bulk writes do not bump stamps; use
+              ``validate_integrity()`` after those).
+
+        Args:
+            snapshot: The snapshot to validate.
+
+        Returns:
+            SnapshotValidationResult with any integrity errors.
+        """
+        stamps: dict[str, int] | None = None
+        drifted: list[ComponentVersion] = []
+
+        for cv in snapshot.component_versions:
+            if cv.component_type in _STAMPED_COMPONENTS and cv.change_stamp is not None:
+                if stamps is None:
+                    stamps = self._read_stamps()
+                if stamps.get(cv.component_type.value, 0) == cv.change_stamp:
+                    continue
+            elif cv.component_type in _STATIC_COMPONENTS:
+                current_hash = self._static_hashes.get(cv.component_type)
+                if current_hash is None:
+                    current_hash = self._capture_component(
+                        cv.component_type, snapshot.captured_at,
+                    ).content_hash
+                    self._static_hashes[cv.component_type] = current_hash
+                if current_hash == cv.content_hash:
+                    continue
+            drifted.append(cv)
+
+        if not drifted:
+            return SnapshotValidationResult.valid(snapshot.snapshot_id)
+        return self.validate_integrity(
+            replace(snapshot, component_versions=tuple(drifted))
+        )
+
     def get_or_capture(
         self,
         snapshot_id: UUID | None,
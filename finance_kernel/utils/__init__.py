@@ -5,6 +5,7 @@ from finance_kernel.utils.hashing import (
     hash_audit_event,
     hash_payload,
 )
+from finance_kernel.utils.histogram import LatencyHistogram
 from finance_kernel.utils.idempotency import generate_idempotency_key
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "hash_audit_event",
     "canonicalize_json",
     "generate_idempotency_key",
+    "LatencyHistogram",
 ]
@@ -0,0 +1,97 @@
+"""
+Log-linear latency histogram shared by the posting profiler and the
+connection pool telemetry.
+"""
+
+from __future__ import annotations
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram over integer microseconds (HDR layout).
+
+    Values below ``2**sub_bucket_bits`` are recorded exactly; above that each
+    power-of-two range is split into ``2**(sub_bucket_bits - 1)`` linear
+    sub-buckets, bounding relative error at ``2**-(sub_bucket_bits - 1)``
+    (1.6% with the default 7 bits).  Counts are kept sparsely, so memory is
+    proportional to the number of distinct buckets hit, not the value range.
+
+    Not thread-safe; callers serialise access.
+    """
+
+    __slots__ = ("_bits", "_half", "_full", "_counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self, sub_bucket_bits: int = 7) -> None:
+        if sub_bucket_bits < 2:
+            raise ValueError("sub_bucket_bits must be >= 2")
+        self._bits = sub_bucket_bits
+        self._full = 1 << sub_bucket_bits
+        self._half = self._full >> 1
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._full:
+            return value
+        shift = value.bit_length() - self._bits
+        return self._full + (shift - 1) * self._half + ((value >> shift) - self._half)
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Inclusive (lowest, highest) values that map to ``index``."""
+        if index < self._full:
+            return index, index
+        shift, offset = divmod(index - self._full, self._half)
+        shift += 1
+        mantissa = offset + self._half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value_us: int, count: int = 1) -> None:
+        value_us = max(0, int(value_us))
+        index = self._index(value_us)
+        self._counts[index] = self._counts.get(index, 0) + count
+        if self.count == 0 or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+        self.count += count
+        self.total_us += value_us * count
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other._bits != self._bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        if other.count == 0:
+            return
+        for index, n in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + n
+        self.min_us = other.min_us if self.count == 0 else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Highest equivalent value at percentile ``q`` (0-100), capped at max."""
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentile must be within [0, 100], got {q}")
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._bounds(index)[1], self.max_us)
+        return self.max_us
+
+    def count_at_or_below(self, value_us: int) -> int:
+        """Samples whose bucket starts at or below ``value_us``."""
+        return sum(
+            n for index, n in self._counts.items()
+            if self._bounds(index)[0] <= value_us
+        )
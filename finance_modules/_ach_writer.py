@@ -0,0 +1,377 @@
+"""
+Streaming NACHA/ACH file writer.
+
+Used by ``PayrollService.write_nacha_file`` (direct deposit) and
+``CashService.write_payment_file`` (AP disbursements) to write standard
+94-character fixed-width ACH records to a caller-supplied sink as payments
+arrive.  Unlike ``generate_nacha_batch`` / ``format_nacha``, nothing is
+accumulated in memory: entry counts, the entry hash, and credit totals are
+maintained incrementally and written into the batch and file control
+records when each batch / the file is closed.
+
+Payments are split into batches whenever the company ID or effective
+entry date changes between consecutive payments, so a run that is ordered
+by (company, effective date) produces one batch per group.
+
+Architecture: Modules layer.  Pure except for ``sink.write``; no session,
+no clock (the file creation timestamp is passed in).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Protocol
+
+RECORD_LENGTH = 94
+BLOCKING_FACTOR = 10
+
+_ENTRY_HASH_MODULUS = 10 ** 10
+_SERVICE_CLASS_CREDITS_ONLY = "220"
+_TRANSACTION_CODES = frozenset({"22", "23", "32", "33"})  # credits only
+_MAX_ENTRY_CENTS = 10 ** 10 - 1
+
+
+class TextSink(Protocol):
+    """Anything with ``write(str)``: an open text file, ``io.StringIO``,
+    ``socket.makefile("w")``."""
+
+    def write(self, s: str, /) -> Any: ...
+
+
+@dataclass(frozen=True)
+class AchFileTotals:
+    """Control totals of a written ACH file (as in the file control record)."""
+
+    batch_count: int
+    entry_count: int
+    entry_hash: int
+    total_debit: Decimal
+    total_credit: Decimal
+    block_count: int
+
+
+def _alpha(value: Any, width: int) -> str:
+    """Left-justified, space-padded, upper-cased alphanumeric field."""
+    return str(value or "").upper()[:width].ljust(width)
+
+
+def _numeric(value: int, width: int) -> str:
+    """Right-justified, zero-padded numeric field."""
+    return str(value).rjust(width, "0")[-width:]
+
+
+def _routing(value: Any) -> str:
+    routing = str(value or "").strip()
+    if len(routing) != 9 or not routing.isdigit():
+        raise ValueError(f"ACH routing number must be 9 digits, got {routing!r}")
+    return routing
+
+
+def _effective_date(value: date | str) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _cents(amount: Any) -> int:
+    cents = Decimal(str(amount)) * 100
+    if cents != cents.to_integral_value():
+        raise ValueError(f"ACH amount has sub-cent precision: {amount}")
+    cents_int = int(cents)
+    if not 0 <= cents_int <= _MAX_ENTRY_CENTS:
+        raise ValueError(f"ACH entry amount out of range: {amount}")
+    return cents_int
+
+
+class AchFileWriter:
+    """
+    Incremental writer for one ACH file.
+
+    Contract:
+        - ``write_header()`` first, then any number of
+          ``begin_batch`` / ``add_entry`` ... / ``end_batch`` groups,
+          then ``close()``.  ``write_payments`` drives the batch calls
+          from an iterable of payment dicts.
+        - Every record is written to ``sink`` as soon as it is complete,
+          terminated by ``"\\n"``.
+
+    Guarantees:
+        - Every record is exactly ``RECORD_LENGTH`` characters.
+        - Batch and file control totals (entry count, entry hash, credit
+          total) equal those of the entries written.
+        - The file is padded with all-``9`` records to a multiple of
+          ``BLOCKING_FACTOR`` records.
+
+    Non-goals:
+        - Debit entries and addenda records are not written (payroll and
+          AP disbursements are credits only).
+    """
+
+    def __init__(
+        self,
+        sink: TextSink,
+        *,
+        immediate_destination: str,
+        immediate_origin: str,
+        created_at: datetime,
+        destination_name: str = "",
+        origin_name: str = "",
+        sec_code: str = "PPD",
+        entry_description: str = "PAYROLL",
+        file_id_modifier: str = "A",
+    ) -> None:
+        self._sink = sink
+        self._destination = _routing(immediate_destination)
+        self._origin = str(immediate_origin)
+        self._odfi = _routing(immediate_destination)[:8]
+        self._created_at = created_at
+        self._destination_name = destination_name
+        self._origin_name = origin_name
+        self._sec_code = sec_code
+        self._entry_description = entry_description
+        self._file_id_modifier = file_id_modifier
+
+        self._records = 0
+        self._header_written = False
+        self._closed = False
+
+        self._batch_count = 0
+        self._file_entries = 0
+        self._file_hash = 0
+        self._file_credit = 0
+
+        self._batch_key: tuple[str, date] | None = None
+        self._batch_company_id = ""
+        self._batch_entries = 0
+        self._batch_hash = 0
+        self._batch_credit = 0
+
+    # -- record output -------------------------------------------------------
+
+    def _emit(self, record: str) -> None:
+        assert len(record) == RECORD_LENGTH, record
+        self._sink.write(record + "\n")
+        self._records += 1
+
+    # -- file ----------------------------------------------------------------
+
+    def write_header(self) -> None:
+        """Write the file header (type 1) record."""
+        if self._header_written:
+            raise ValueError("ACH file header already written")
+        self._header_written = True
+        self._emit(
+            "1"
+            + "01"
+            + " " + self._destination
+            + self._origin[:10].rjust(10)
+            + self._created_at.strftime("%y%m%d")
+            + self._created_at.strftime("%H%M")
+            + _alpha(self._file_id_modifier, 1)
+            + "094"
+            + _numeric(BLOCKING_FACTOR, 2)
+            + "1"
+            + _alpha(self._destination_name, 23)
+            + _alpha(self._origin_name, 23)
+            + _alpha("", 8)
+        )
+
+    def close(self) -> AchFileTotals:
+        """Close any open batch, write the file control and block fill."""
+        if self._closed:
+            raise ValueError("ACH file already closed")
+        if not self._header_written:
+            self.write_header()
+        if self._batch_key is not None:
+            self.end_batch()
+
+        block_count = -(-(self._records + 1) // BLOCKING_FACTOR)
+        self._emit(
+            "9"
+            + _numeric(self._batch_count, 6)
+            + _numeric(block_count, 6)
+            + _numeric(self._file_entries, 8)
+            + _numeric(self._file_hash % _ENTRY_HASH_MODULUS, 10)
+            + _numeric(0, 12)
+            + _numeric(self._file_credit, 12)
+            + _alpha("", 39)
+        )
+        while self._records % BLOCKING_FACTOR:
+            self._emit("9" * RECORD_LENGTH)
+        self._closed = True
+
+        return AchFileTotals(
+            batch_count=self._batch_count,
+            entry_count=self._file_entries,
+            entry_hash=self._file_hash % _ENTRY_HASH_MODULUS,
+            total_debit=Decimal("0.00"),
+            total_credit=Decimal(self._file_credit).scaleb(-2),
+            block_count=block_count,
+        )
+
+    # -- batch ---------------------------------------------------------------
+
+    def begin_batch(
+        self,
+        company_name: str,
+        company_id: str,
+        effective_date: date | str,
+    ) -> None:
+        """Write a batch header (type 5) record."""
+        if self._closed:
+            raise ValueError("ACH file already closed")
+        if not self._header_written:
+            self.write_header()
+        if self._batch_key is not None:
+            self.end_batch()
+        effective = _effective_date(effective_date)
+        self._batch_count += 1
+        self._batch_key = (str(company_id), effective)
+        self._batch_company_id = str(company_id)
+        self._batch_entries = 0
+        self._batch_hash = 0
+        self._batch_credit = 0
+        self._emit(
+            "5"
+            + _SERVICE_CLASS_CREDITS_ONLY
+            + _alpha(company_name, 16)
+            + _alpha("", 20)
+            + _alpha(company_id, 10)
+            + _alpha(self._sec_code, 3)
+            + _alpha(self._entry_description, 10)
+            + _alpha("", 6)
+            + effective.strftime("%y%m%d")
+            + _alpha("", 3)
+            + "1"
+            + self._odfi
+            + _numeric(self._batch_count, 7)
+        )
+
+    def add_entry(
+        self,
+        routing: str,
+        account: str,
+        amount: Any,
+        name: str,
+        individual_id: str = "",
+        transaction_code: str = "22",
+    ) -> None:
+        """Write an entry detail (type 6) record in the open batch."""
+        if self._batch_key is None:
+            raise ValueError("ACH entry written outside a batch")
+        if transaction_code not in _TRANSACTION_CODES:
+            raise ValueError(f"Unsupported ACH transaction code: {transaction_code}")
+        rdfi = _routing(routing)
+        cents = _cents(amount)
+
+        self._batch_entries += 1
+        self._file_entries += 1
+        self._batch_hash += int(rdfi[:8])
+        self._batch_credit += cents
+
+        self._emit(
+            "6"
+            + transaction_code
+            + rdfi
+            + _alpha(account, 17)
+            + _numeric(cents, 10)
+            + _alpha(individual_id, 15)
+            + _alpha(name, 22)
+            + _alpha("", 2)
+            + "0"
+            + self._odfi
+            + _numeric(self._file_entries, 7)
+        )
+
+    def end_batch(self) -> None:
+        """Write the batch control (type 8) record for the open batch."""
+        if self._batch_key is None:
+            raise ValueError("No open ACH batch")
+        self._emit(
+            "8"
+            + _SERVICE_CLASS_CREDITS_ONLY
+            + _numeric(self._batch_entries, 6)
+            + _numeric(self._batch_hash % _ENTRY_HASH_MODULUS, 10)
+            + _numeric(0, 12)
+            + _numeric(self._batch_credit, 12)
+            + _alpha(self._batch_company_id, 10)
+            + _alpha("", 19)
+            + _alpha("", 6)
+            + self._odfi
+            + _numeric(self._batch_count, 7)
+        )
+        self._file_hash += self._batch_hash
+        self._file_credit += self._batch_credit
+        self._batch_key = None
+
+    # -- payments ------------------------------------------------------------
+
+    def write_payments(
+        self,
+        payments: Iterable[Mapping[str, Any]],
+        company_name: str,
+        company_id: str,
+        effective_date: date | str,
+    ) -> None:
+        """Write payment dicts as entries, opening batches as needed.
+
+        Each payment has ``name``, ``account``, ``routing``, ``amount`` and
+        optionally ``id``, ``transaction_code``, and per-payment
+        ``company_name`` / ``company_id`` / ``effective_date`` overrides.
+        A new batch starts whenever (company ID, effective date) differs
+        from the previous payment's.
+        """
+        default_date = _effective_date(effective_date)
+        for payment in payments:
+            pay_company_id = str(payment.get("company_id", company_id))
+            pay_date = payment.get("effective_date")
+            pay_date = default_date if pay_date is None else _effective_date(pay_date)
+            if self._batch_key != (pay_company_id, pay_date):
+                self.begin_batch(
+                    payment.get("company_name", company_name),
+                    pay_company_id,
+                    pay_date,
+                )
+            self.add_entry(
+                routing=payment.get("routing", ""),
+                account=payment.get("account", ""),
+                amount=payment.get("amount", "0"),
+                name=payment.get("name", ""),
+                individual_id=str(payment.get("id", "")),
+                transaction_code=payment.get("transaction_code", "22"),
+            )
+
+
+def write_ach_file(
+    payments: Iterable[Mapping[str, Any]],
+    sink: TextSink,
+    *,
+    company_name: str,
+    company_id: str,
+    effective_date: date | str,
+    immediate_destination: str,
+    created_at: datetime,
+    immediate_origin: str | None = None,
+    destination_name: str = "",
+    sec_code: str = "PPD",
+    entry_description: str = "PAYROLL",
+) -> AchFileTotals:
+    """Stream a complete ACH file for ``payments`` to ``sink``.
+
+    ``immediate_origin`` defaults to ``company_id``.  Returns the file
+    control totals.
+    """
+    writer = AchFileWriter(
+        sink,
+        immediate_destination=immediate_destination,
+        immediate_origin=company_id if immediate_origin is None else immediate_origin,
+        created_at=created_at,
+        destination_name=destination_name,
+        origin_name=company_name,
+        sec_code=sec_code,
+        entry_description=entry_description,
+    )
+    writer.write_header()
+    writer.write_payments(payments, company_name, company_id, effective_date)
+    return writer.close()
@@ -0,0 +1,116 @@
+"""
+Shared helper for database-side open-item aging.
+
+Used by finance_modules/ar/service.py and finance_modules/ap/service.py to
+age the whole open subledger without building per-item objects: bucket
+classification and totals are computed in SQL by
+``SubledgerSelector.aging_totals`` and assembled into an ``AgingReport`` by
+``AgingCalculator.generate_report_from_totals``.  Detail rows are streamed
+and aged only when ``include_items`` is requested.
+
+Architecture: Modules layer. Imports from finance_engines and finance_kernel
+(domain, selectors).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from finance_engines.aging import (
+    AgeBucket,
+    AgedItem,
+    AgingBucketTotal,
+    AgingCalculator,
+    AgingReport,
+)
+from finance_kernel.domain.subledger_control import SubledgerType
+from finance_kernel.domain.values import Money
+from finance_kernel.logging_config import get_logger
+from finance_kernel.selectors.subledger_selector import SubledgerSelector
+
+logger = get_logger("modules.aging")
+
+
+def subledger_aging_report(
+    session: Session,
+    calculator: AgingCalculator,
+    subledger_type: SubledgerType,
+    report_type: str,
+    as_of_date: date,
+    currency: str,
+    buckets: Sequence[AgeBucket] | None = None,
+    payment_terms_days: int = 0,
+    include_items: bool = False,
+    chunk_size: int = 5000,
+) -> AgingReport:
+    """Age every open item of ``subledger_type`` in ``currency`` as of a date.
+
+    Items are aged from their due date, ``effective_date + payment_terms_days``.
+    """
+    t0 = time.monotonic()
+    buckets = tuple(buckets or calculator.DEFAULT_BUCKETS)
+    by_name = {b.name: b for b in buckets}
+    bounds = [(b.name, b.min_days, b.max_days) for b in buckets]
+    selector = SubledgerSelector(session)
+
+    totals = [
+        AgingBucketTotal(
+            counterparty_id=row.entity_id,
+            bucket_name=row.bucket,
+            amount=Money.of(row.amount, row.currency),
+            overdue_amount=Money.of(row.overdue_amount, row.currency),
+            item_count=row.item_count,
+        )
+        for row in selector.aging_totals(
+            subledger_type, as_of_date, bounds,
+            currency=currency, payment_terms_days=payment_terms_days,
+        )
+    ]
+
+    items: list[AgedItem] = []
+    if include_items:
+        terms = timedelta(days=payment_terms_days)
+        for chunk in selector.iter_aging_detail_chunks(
+            subledger_type, as_of_date, bounds,
+            currency=currency, payment_terms_days=payment_terms_days,
+            chunk_size=chunk_size,
+        ):
+            items.extend(
+                AgedItem(
+                    document_id=row.source_document_id,
+                    document_type=row.source_document_type,
+                    document_date=row.effective_date,
+                    due_date=row.effective_date + terms,
+                    amount=Money.of(row.open_amount, row.currency),
+                    age_days=row.age_days,
+                    bucket=by_name[row.bucket],
+                    counterparty_id=row.entity_id,
+                    reference=row.reference,
+                )
+                for row in chunk
+            )
+
+    report = calculator.generate_report_from_totals(
+        totals=totals,
+        as_of_date=as_of_date,
+        buckets=buckets,
+        report_type=report_type,
+        items=items,
+        currency=currency,
+    )
+
+    logger.info("subledger_aging_completed", extra={
+        "subledger_type": subledger_type.value,
+        "as_of_date": as_of_date.isoformat(),
+        "currency": currency,
+        "group_count": len(totals),
+        "item_count": report.item_count,
+        "detail_count": len(items),
+        "total_amount": str(report.total_amount().amount),
+        "duration_ms": round((time.monotonic() - t0) * 1000, 2),
+    })
+    return report
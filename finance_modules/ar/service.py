@@ -75,6 +75,7 @@ from finance_engines.allocation import (
 )
 from finance_kernel.domain.clock import Clock, SystemClock
 from finance_kernel.domain.economic_link import ArtifactRef, ArtifactType
+from finance_kernel.domain.subledger_control import SubledgerType
 from finance_kernel.domain.values import Money
 from finance_kernel.logging_config import get_logger
 from finance_kernel.services.journal_writer import RoleResolver
@@ -85,6 +86,7 @@ from finance_kernel.services.module_posting_service import (
     ModulePostingService,
     ModulePostingStatus,
 )
+from finance_modules._aging import subledger_aging_report
 from finance_modules._posting_helpers import commit_or_rollback, run_workflow_guard
 from finance_modules.ar.workflows import (
     AR_CREDIT_MEMO_WORKFLOW,
@@ -143,7 +145,8 @@ class ARService:
     Engine composition:
     - ReconciliationManager: payment application and receipt matching
     - AllocationEngine: distributing payments across invoices
-    - AgingCalculator: AR aging analysis
+    - AgingCalculator: AR aging analysis (in-memory documents, or database-
+      aggregated subledger totals via ``calculate_subledger_aging``)
 
     Transaction boundary: this service commits on success, rolls back on failure.
     ModulePostingService runs with auto_commit=False so all engine writes
@@ -583,6 +586,44 @@ class ARService:
 
         return report
 
+    def calculate_subledger_aging(
+        self,
+        as_of_date: date,
+        currency: str = "USD",
+        buckets: Sequence | None = None,
+        payment_terms_days: int = 0,
+        include_items: bool = False,
+    ) -> AgingReport:
+        """
+        Calculate AR aging over every open AR subledger item.
+
+        Pure computation -- no posting, no transaction boundary.  Bucket
+        classification and counterparty/bucket totals run in the database
+        (one grouped query); per-item detail is streamed and aged only when
+        ``include_items`` is True.
+
+        Args:
+            as_of_date: Date to age open items as of.
+            currency: Subledger currency to age (SL-G3 per-currency).
+            buckets: Custom aging buckets (defaults to standard 0/30/60/90+).
+            payment_terms_days: Days from item effective date to due date.
+            include_items: Also load aged detail items for drill-down.
+
+        Returns:
+            AgingReport with cached bucket and counterparty totals.
+        """
+        return subledger_aging_report(
+            self._session,
+            self._aging,
+            SubledgerType.AR,
+            "AR",
+            as_of_date=as_of_date,
+            currency=currency,
+            buckets=buckets,
+            payment_terms_days=payment_terms_days,
+            include_items=include_items,
+        )
+
     # =========================================================================
     # Receipts (unapplied cash)
     # =========================================================================
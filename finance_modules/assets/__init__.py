@@ -46,6 +46,9 @@ from finance_modules.assets.models import (
     AssetTransfer,
     DepreciationComponent,
     DepreciationSchedule,
+    PortfolioAsset,
+    PortfolioDepreciationLine,
+    PortfolioDepreciationRun,
 )
 from finance_modules.assets.profiles import ASSET_PROFILES
 from finance_modules.assets.workflows import ASSET_WORKFLOW
@@ -58,6 +61,9 @@ __all__ = [
     "AssetTransfer",
     "AssetRevaluation",
     "DepreciationComponent",
+    "PortfolioAsset",
+    "PortfolioDepreciationLine",
+    "PortfolioDepreciationRun",
     "ASSET_PROFILES",
     "ASSET_WORKFLOW",
     "AssetConfig",
@@ -6,7 +6,9 @@ Responsibility
 Pure calculation functions for depreciation (straight-line,
 double-declining balance, sum-of-years'-digits, units-of-production)
 and impairment testing.  These are textbook fixed-asset formulas with
-no side effects.
+no side effects.  ``depreciate_portfolio`` / ``forecast_portfolio`` apply
+the same formulas to a whole register in one pass, grouped by method and
+convention.
 
 Architecture position
 ---------------------
@@ -34,8 +36,21 @@ methodology must be documented and consistently applied per ASC 360.
 
 from __future__ import annotations
 
+import calendar
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import replace
+from datetime import date
 from decimal import Decimal
 
+from finance_modules.assets.models import (
+    DepreciationMethod,
+    PortfolioAsset,
+    PortfolioDepreciationLine,
+)
+
+_ZERO = Decimal("0")
+_CENT = Decimal("0.01")
+
 
 def straight_line(
     cost: Decimal,
@@ -151,3 +166,191 @@ def calculate_impairment_loss(
     if fair_value >= carrying_value:
         return Decimal("0")
     return carrying_value - fair_value
+
+
+# =============================================================================
+# Portfolio depreciation
+# =============================================================================
+
+
+def _months_between(start: date, end: date) -> int:
+    """Whole calendar months from ``start``'s month to ``end``'s month."""
+    return (end.year - start.year) * 12 + end.month - start.month
+
+
+def next_period_end(period_date: date) -> date:
+    """Last day of the month following ``period_date``'s month."""
+    year, month = divmod(period_date.year * 12 + period_date.month, 12)
+    month += 1
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _convention_factor(convention: str, in_service: date, k: int) -> Decimal:
+    """Fraction of a full month's charge taken in period ``k`` (0 = in-service month).
+
+    * ``full_month``: full charge from the in-service month.
+    * ``mid_month``: half a month in the in-service month.
+    * ``half_year``: exactly six months' charge spread over the months of
+      the in-service calendar year.
+    """
+    if convention == "mid_month":
+        return Decimal("0.5") if k == 0 else Decimal("1")
+    if convention == "half_year":
+        first_year_months = 13 - in_service.month
+        return Decimal(6) / first_year_months if k < first_year_months else Decimal("1")
+    return Decimal("1")
+
+
+def _straight_line_charge(asset: PortfolioAsset, k: int, rate: Decimal) -> Decimal:
+    return (asset.cost - asset.salvage_value) / asset.useful_life_months
+
+
+def _declining_charge(asset: PortfolioAsset, k: int, rate: Decimal) -> Decimal:
+    # Same operation order as double_declining_balance: periodic rate first.
+    periodic_rate = rate / Decimal(asset.useful_life_months)
+    return (asset.cost - asset.accumulated_depreciation) * periodic_rate
+
+
+def _sum_of_years_charge(asset: PortfolioAsset, k: int, rate: Decimal) -> Decimal:
+    years = -(-asset.useful_life_months // 12)
+    year = k // 12 + 1
+    if year > years:
+        # Convention stub past the last year: finish off what remains.
+        return asset.cost - asset.salvage_value - asset.accumulated_depreciation
+    digits = years * (years + 1) // 2
+    return (asset.cost - asset.salvage_value) * (years - year + 1) / (digits * 12)
+
+
+def _units_charge(asset: PortfolioAsset, k: int, rate: Decimal) -> Decimal:
+    if asset.total_units <= _ZERO:
+        return _ZERO
+    return (asset.cost - asset.salvage_value) / asset.total_units * asset.units_produced
+
+
+# method -> (monthly charge, rate multiplier, convention applies)
+_METHOD_KERNELS: dict[
+    str, tuple[Callable[[PortfolioAsset, int, Decimal], Decimal], Decimal, bool]
+] = {
+    DepreciationMethod.STRAIGHT_LINE.value: (_straight_line_charge, _ZERO, True),
+    DepreciationMethod.DOUBLE_DECLINING.value: (_declining_charge, Decimal("2"), True),
+    DepreciationMethod.DECLINING_BALANCE.value: (_declining_charge, Decimal("1.5"), True),
+    DepreciationMethod.SUM_OF_YEARS.value: (_sum_of_years_charge, _ZERO, True),
+    DepreciationMethod.UNITS_OF_PRODUCTION.value: (_units_charge, _ZERO, False),
+}
+
+
+def depreciate_portfolio(
+    assets: Sequence[PortfolioAsset],
+    period_date: date,
+) -> tuple[tuple[PortfolioDepreciationLine, ...], tuple[PortfolioAsset, ...]]:
+    """
+    Depreciation of every asset in ``assets`` for the period ending ``period_date``.
+
+    Assets are grouped by (method, convention) so the method kernel and
+    convention factors are resolved once per group rather than per asset.
+
+    Preconditions:
+        - ``accumulated_depreciation`` on each asset is as of the end of
+          the previous period.
+    Postconditions:
+        - Returns ``(lines, skipped)``.  ``lines`` holds one line per
+          depreciable asset, in input order, with a non-zero amount;
+          assets not yet in service or already fully depreciated produce
+          no line.  ``skipped`` holds assets whose method has no portfolio
+          kernel (e.g. MACRS, a tax method) or whose useful life is <= 0.
+        - Under the ``full_month`` convention, per-period amounts match
+          ``straight_line`` and ``double_declining_balance`` exactly.  The
+          ``mid_month`` and ``half_year`` conventions scale the charge for
+          the first in-service period(s) before rounding, so those periods
+          differ from the per-asset helpers, which have no convention.
+        - No asset is depreciated below its salvage value.
+    """
+    groups: dict[tuple[str, str], list[int]] = {}
+    for i, asset in enumerate(assets):
+        groups.setdefault((asset.method, asset.convention), []).append(i)
+
+    out: list[PortfolioDepreciationLine | None] = [None] * len(assets)
+    skipped: list[PortfolioAsset] = []
+    period_month = period_date.year * 12 + period_date.month
+    one = Decimal("1")
+
+    for (method, convention), indexes in groups.items():
+        kernel = _METHOD_KERNELS.get(method)
+        if kernel is None:
+            skipped.extend(assets[i] for i in indexes)
+            continue
+        charge, rate, uses_convention = kernel
+        for i in indexes:
+            asset = assets[i]
+            if asset.useful_life_months <= 0:
+                skipped.append(asset)
+                continue
+            in_service = asset.in_service_date
+            k = period_month - (in_service.year * 12 + in_service.month)
+            accumulated = asset.accumulated_depreciation
+            remaining = asset.cost - asset.salvage_value - accumulated
+            if k < 0 or remaining <= _ZERO:
+                continue
+            amount = charge(asset, k, rate)
+            if uses_convention:
+                factor = _convention_factor(convention, in_service, k)
+                if factor != one:
+                    amount *= factor
+            amount = amount.quantize(_CENT)
+            if amount > remaining:
+                amount = remaining
+            if amount > _ZERO:
+                accumulated += amount
+                out[i] = PortfolioDepreciationLine(
+                    asset.asset_id, period_date, amount, accumulated,
+                    asset.cost - accumulated, asset.cost_center,
+                )
+
+    lines = tuple(line for line in out if line is not None)
+    return lines, tuple(skipped)
+
+
+def forecast_portfolio(
+    assets: Iterable[PortfolioAsset],
+    start_period: date,
+    max_periods: int | None = None,
+) -> Iterator[PortfolioDepreciationLine]:
+    """
+    Full-life depreciation forecast for ``assets`` from ``start_period``.
+
+    Runs ``depreciate_portfolio`` period by period (month ends), carrying
+    accumulated depreciation forward, until every asset is fully
+    depreciated or stops accruing, or ``max_periods`` periods have run.
+
+    Postconditions:
+        - Yields lines period by period; within a period, in input order.
+        - An asset leaves the forecast in the first in-service period that
+          produces no charge, so the generator always terminates.
+        - Skipped assets (see ``depreciate_portfolio``) yield nothing.
+        - Units-of-production assets are projected at a flat rate: the
+          asset's ``units_produced`` is charged again in every period.
+    """
+    active = list(assets)
+    period = start_period
+    periods = 0
+    while active and (max_periods is None or periods < max_periods):
+        lines, skipped = depreciate_portfolio(active, period)
+        yield from lines
+
+        charged = {line.asset_id: line for line in lines}
+        skipped_ids = {a.asset_id for a in skipped}
+        still_active: list[PortfolioAsset] = []
+        for asset in active:
+            line = charged.get(asset.asset_id)
+            if line is not None:
+                still_active.append(replace(
+                    asset, accumulated_depreciation=line.accumulated_depreciation,
+                ))
+            elif (
+                asset.asset_id not in skipped_ids
+                and _months_between(asset.in_service_date, period) < 0
+            ):
+                still_active.append(asset)  # not yet in service
+        active = still_active
+        period = next_period_end(period)
+        periods += 1
@@ -26,6 +26,8 @@ Audit relevance
 ---------------
 * ``AssetRevaluation`` records support fair-value measurement disclosure.
 * ``AssetTransfer`` records track custody changes for compliance.
+* ``PortfolioDepreciationRun`` summarises which assets a period run
+  depreciated, skipped, and posted.
 """
 
 from dataclasses import dataclass
@@ -162,3 +164,49 @@ class DepreciationComponent:
     useful_life_months: int
     depreciation_method: str = "straight_line"
     accumulated_depreciation: Decimal = Decimal("0")
+
+
+@dataclass(frozen=True)
+class PortfolioAsset:
+    """One register row as read by a portfolio depreciation run.
+
+    ``method`` is a ``DepreciationMethod`` value (from the asset's category);
+    ``convention`` is ``"full_month"``, ``"mid_month"`` or ``"half_year"``.
+    ``total_units`` / ``units_produced`` are only used by
+    units-of-production assets.
+    """
+    asset_id: UUID
+    method: str
+    in_service_date: date
+    cost: Decimal
+    salvage_value: Decimal
+    useful_life_months: int
+    accumulated_depreciation: Decimal = Decimal("0")
+    convention: str = "mid_month"
+    cost_center: str | None = None
+    total_units: Decimal = Decimal("0")
+    units_produced: Decimal = Decimal("0")
+
+
+@dataclass(frozen=True)
+class PortfolioDepreciationLine:
+    """Depreciation of one asset for one period (a schedule row)."""
+    asset_id: UUID
+    period_date: date
+    depreciation_amount: Decimal
+    accumulated_depreciation: Decimal
+    net_book_value: Decimal
+    cost_center: str | None = None
+
+
+@dataclass(frozen=True)
+class PortfolioDepreciationRun:
+    """Summary of a portfolio depreciation run over the asset register."""
+    period_date: date
+    asset_count: int
+    chunk_count: int
+    total_depreciation: Decimal
+    schedule_rows_written: int
+    skipped_asset_ids: tuple[UUID, ...] = ()
+    journal_entry_ids: tuple[UUID, ...] = ()
+    posting_status: str | None = None  # last chunk's ModulePostingStatus value
@@ -386,6 +386,28 @@ ASSET_MASS_DEPRECIATION_MAPPINGS = (
 )
 
 
+# --- Mass Depreciation (consolidated) ---
+ASSET_MASS_DEPRECIATION_BATCH = AccountingPolicy(
+    name="AssetMassDepreciationBatch",
+    version=1,
+    trigger=PolicyTrigger(event_type="asset.mass_depreciation_batch"),
+    meaning=PolicyMeaning(
+        economic_type="ASSET_DEPRECIATION_BATCH",
+        dimensions=("cost_center",),
+    ),
+    ledger_effects=(
+        LedgerEffect(ledger="GL", debit_role="DEPRECIATION_EXPENSE", credit_role="ACCUMULATED_DEPRECIATION"),
+    ),
+    effective_from=date(2024, 1, 1),
+    description="Consolidated batch depreciation: one journal entry, one line pair per asset",
+)
+
+ASSET_MASS_DEPRECIATION_BATCH_MAPPINGS = (
+    ModuleLineMapping(role="DEPRECIATION_EXPENSE", side="debit", ledger="GL", foreach="assets"),
+    ModuleLineMapping(role="ACCUMULATED_DEPRECIATION", side="credit", ledger="GL", foreach="assets"),
+)
+
+
 # --- Asset Transfer ---
 ASSET_TRANSFERRED = AccountingPolicy(
     name="AssetTransferred",
@@ -466,6 +488,7 @@ _ALL_PROFILES: tuple[tuple[AccountingPolicy, tuple[ModuleLineMapping, ...]], ...
     (ASSET_IMPAIRMENT, ASSET_IMPAIRMENT_MAPPINGS),
     (ASSET_SCRAP, ASSET_SCRAP_MAPPINGS),
     (ASSET_MASS_DEPRECIATION, ASSET_MASS_DEPRECIATION_MAPPINGS),
+    (ASSET_MASS_DEPRECIATION_BATCH, ASSET_MASS_DEPRECIATION_BATCH_MAPPINGS),
     (ASSET_TRANSFERRED, ASSET_TRANSFERRED_MAPPINGS),
     (ASSET_REVALUED, ASSET_REVALUED_MAPPINGS),
     (ASSET_COMPONENT_DEPRECIATION, ASSET_COMPONENT_DEPRECIATION_MAPPINGS),
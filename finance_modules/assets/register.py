@@ -0,0 +1,211 @@
+"""
+Fixed Asset Register Access (``finance_modules.assets.register``).
+
+Responsibility
+--------------
+Set-based reads and writes of the asset register for portfolio
+depreciation runs: stream in-service assets from ``assets_assets`` in
+keyset-paged chunks (joined to their category for the depreciation
+method), bulk-insert ``DepreciationScheduleModel`` rows, and bulk-update
+accumulated depreciation / net book value on the register.
+
+Architecture position
+---------------------
+**Modules layer** -- data access only.  Called by
+``FixedAssetService.run_portfolio_depreciation`` /
+``forecast_portfolio_depreciation`` and by ``MassDepreciationTask``.
+Depreciation arithmetic lives in ``helpers.depreciate_portfolio``; the
+caller owns the transaction boundary (nothing here commits).
+
+Invariants enforced
+-------------------
+* Chunks are keyset-paged on ``assets_assets.id`` (no OFFSET, no open
+  server-side cursor), so callers may commit between chunks.
+* With ``unscheduled_only`` an asset that already has a schedule row for
+  the period is not returned, so re-running a period does not violate
+  ``uq_assets_depreciation_schedules_asset_period``.  With
+  ``unposted_only`` only a posted row counts; posting runs use it to pick
+  up assets left with an unposted (draft) row and replace that row via
+  ``discard_unposted_rows``.
+* Only posted rows are ever applied to the register balances.
+
+Failure modes
+-------------
+* ``chunk_size`` <= 0 raises ``ValueError``.
+* Database errors propagate to the caller.
+
+Audit relevance
+---------------
+Schedule rows are the per-asset, per-period depreciation record behind
+each depreciation journal entry (ASC 360).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from finance_modules.assets.models import (
+    AssetStatus,
+    PortfolioAsset,
+    PortfolioDepreciationLine,
+)
+from finance_modules.assets.orm import (
+    AssetCategoryModel,
+    AssetModel,
+    DepreciationScheduleModel,
+)
+
+
+def iter_register_chunks(
+    session: Session,
+    period_date: date,
+    *,
+    chunk_size: int = 1000,
+    convention: str = "mid_month",
+    unscheduled_only: bool = True,
+    unposted_only: bool = False,
+    asset_ids: Collection[UUID] | None = None,
+    units: Mapping[UUID, tuple[Decimal, Decimal]] | None = None,
+) -> Iterator[tuple[PortfolioAsset, ...]]:
+    """
+    Yield in-service assets as ``PortfolioAsset`` chunks of up to ``chunk_size``.
+
+    ``unposted_only`` (with ``unscheduled_only``) also returns assets whose
+    row for the period is unposted.  ``units`` maps asset_id to
+    (total_units, units_produced) for units-of-production assets.
+    ``department_id`` becomes the line's
+    cost center.  Assets without an in-service date use their
+    acquisition date.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    units = units or {}
+
+    stmt = (
+        select(
+            AssetModel.id,
+            AssetCategoryModel.depreciation_method,
+            func.coalesce(AssetModel.in_service_date, AssetModel.acquisition_date),
+            AssetModel.acquisition_cost,
+            AssetModel.salvage_value,
+            AssetModel.useful_life_months,
+            AssetModel.accumulated_depreciation,
+            AssetModel.department_id,
+        )
+        .join(AssetCategoryModel, AssetModel.category_id == AssetCategoryModel.id)
+        .where(AssetModel.status == AssetStatus.IN_SERVICE.value)
+        .order_by(AssetModel.id)
+        .limit(chunk_size)
+    )
+    if unscheduled_only:
+        scheduled = exists().where(
+            DepreciationScheduleModel.asset_id == AssetModel.id,
+            DepreciationScheduleModel.period_date == period_date,
+        )
+        if unposted_only:
+            scheduled = scheduled.where(DepreciationScheduleModel.is_posted.is_(True))
+        stmt = stmt.where(~scheduled)
+    if asset_ids is not None:
+        stmt = stmt.where(AssetModel.id.in_(list(asset_ids)))
+
+    last_id: UUID | None = None
+    while True:
+        page = stmt if last_id is None else stmt.where(AssetModel.id > last_id)
+        rows = tuple(session.execute(page).all())
+        if not rows:
+            return
+        chunk = []
+        for (
+            asset_id, method, in_service, cost, salvage, life, accumulated, dept,
+        ) in rows:
+            total_units, produced = units.get(asset_id, (Decimal("0"), Decimal("0")))
+            chunk.append(PortfolioAsset(
+                asset_id=asset_id,
+                method=method,
+                in_service_date=in_service,
+                cost=cost,
+                salvage_value=salvage,
+                useful_life_months=life,
+                accumulated_depreciation=accumulated,
+                convention=convention,
+                cost_center=str(dept) if dept is not None else None,
+                total_units=total_units,
+                units_produced=produced,
+            ))
+        yield tuple(chunk)
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1][0]
+
+
+def discard_unposted_rows(
+    session: Session,
+    lines: Sequence[PortfolioDepreciationLine],
+) -> None:
+    """Delete the unposted rows that ``lines`` are about to replace."""
+    if not lines:
+        return
+    session.execute(
+        delete(DepreciationScheduleModel)
+        .where(
+            DepreciationScheduleModel.asset_id.in_([line.asset_id for line in lines]),
+            DepreciationScheduleModel.period_date == lines[0].period_date,
+            DepreciationScheduleModel.is_posted.is_(False),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def write_schedule_rows(
+    session: Session,
+    lines: Sequence[PortfolioDepreciationLine],
+    actor_id: UUID,
+    is_posted: bool,
+) -> int:
+    """Bulk-insert one ``DepreciationScheduleModel`` row per line; returns the count."""
+    if not lines:
+        return 0
+    session.execute(
+        insert(DepreciationScheduleModel),
+        [
+            {
+                "asset_id": line.asset_id,
+                "period_date": line.period_date,
+                "depreciation_amount": line.depreciation_amount,
+                "accumulated_depreciation": line.accumulated_depreciation,
+                "net_book_value": line.net_book_value,
+                "is_posted": is_posted,
+                "created_by_id": actor_id,
+            }
+            for line in lines
+        ],
+    )
+    return len(lines)
+
+
+def apply_to_register(
+    session: Session,
+    lines: Sequence[PortfolioDepreciationLine],
+    actor_id: UUID,
+) -> None:
+    """Bulk-update accumulated depreciation and NBV on the depreciated assets."""
+    if not lines:
+        return
+    session.execute(
+        update(AssetModel),
+        [
+            {
+                "id": line.asset_id,
+                "accumulated_depreciation": line.accumulated_depreciation,
+                "net_book_value": line.net_book_value,
+                "updated_by_id": actor_id,
+            }
+            for line in lines
+        ],
+    )
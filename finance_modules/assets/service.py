@@ -49,7 +49,7 @@ Usage::
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
 from datetime import date
 from decimal import Decimal
 from uuid import UUID, uuid4
@@ -64,9 +64,16 @@ from finance_engines.allocation import (
 )
 from finance_engines.variance import VarianceCalculator, VarianceResult
 from finance_kernel.domain.clock import Clock, SystemClock
+from finance_kernel.domain.economic_link import (
+    ArtifactRef,
+    ArtifactType,
+    EconomicLink,
+    LinkType,
+)
 from finance_kernel.domain.values import Money
 from finance_kernel.logging_config import get_logger
 from finance_kernel.services.journal_writer import RoleResolver
+from finance_kernel.services.link_graph_service import LinkGraphService
 from finance_kernel.services.party_service import PartyService
 from finance_kernel.services.module_posting_service import (
     ModulePostingResult,
@@ -87,7 +94,14 @@ from finance_modules.assets.workflows import (
     ASSETS_RECORD_SCRAP_WORKFLOW,
     ASSETS_RUN_MASS_DEPRECIATION_WORKFLOW,
 )
-from finance_modules.assets.models import AssetRevaluation, AssetTransfer
+from finance_modules.assets.helpers import depreciate_portfolio, forecast_portfolio
+from finance_modules.assets.models import (
+    AssetRevaluation,
+    AssetTransfer,
+    PortfolioDepreciationLine,
+    PortfolioDepreciationRun,
+)
+from finance_modules.assets import register
 from finance_modules.assets.orm import (
     AssetDisposalModel,
     AssetModel,
@@ -154,6 +168,9 @@ class FixedAssetService:
             party_service=party_service,
         )
 
+        # Stateful engines (share session for atomicity)
+        self._link_graph = LinkGraphService(session)
+
         # Stateless engines
         self._variance = VarianceCalculator()
         self._allocation = AllocationEngine()
@@ -642,24 +659,44 @@ class FixedAssetService:
         effective_date: date,
         actor_id: UUID,
         currency: str = "USD",
+        consolidated: bool = False,
     ) -> list[ModulePostingResult]:
         """
         Run batch depreciation for multiple assets.
 
-        Each asset dict should have 'asset_id' and 'amount' keys.
-        Posts individual depreciation entries for each asset.
+        Each asset dict should have 'asset_id' and 'amount' keys, and
+        optionally 'cost_center'.  By default posts an individual
+        depreciation entry for each asset.
+
+        With ``consolidated=True`` the batch is submitted as one
+        ``asset.mass_depreciation_batch`` event, producing a single journal
+        entry with one debit/credit line pair per asset (asset_id and
+        cost_center as line dimensions) and one ADJUSTED_BY link from each
+        asset to that entry, so per-asset drill-down is preserved while the
+        pipeline (idempotency, sequence allocation, audit) runs once.
 
         Args:
             assets: List of dicts with asset_id and amount.
             effective_date: Accounting effective date.
             actor_id: Actor UUID.
             currency: ISO 4217 currency code.
+            consolidated: Post one multi-line entry for the whole batch.
 
         Returns:
-            List of ModulePostingResult, one per asset.
+            List of ModulePostingResult, one per asset (one for the whole
+            batch when consolidated).
         """
         results: list[ModulePostingResult] = []
         try:
+            if consolidated:
+                if not assets:
+                    return results
+                result = self._post_depreciation_batch(
+                    assets, effective_date, actor_id, currency,
+                )
+                commit_or_rollback(self._session, result)
+                return [result]
+
             batch_id = uuid4()
             transition_result = self._workflow_executor.execute_transition(
                 workflow=ASSETS_RUN_MASS_DEPRECIATION_WORKFLOW,
@@ -706,6 +743,301 @@ class FixedAssetService:
             self._session.rollback()
             raise
 
+    def _post_depreciation_batch(
+        self,
+        assets: Sequence[Mapping],
+        effective_date: date,
+        actor_id: UUID,
+        currency: str,
+    ) -> ModulePostingResult:
+        """Guard and post one ``asset.mass_depreciation_batch`` entry; never commits.
+
+        One debit/credit line pair per asset, with asset_id and cost_center
+        as line dimensions, and one ADJUSTED_BY link from each asset to the
+        entry when it posts.
+        """
+        batch_id = uuid4()
+        failure = run_workflow_guard(
+            self._workflow_executor,
+            ASSETS_RUN_MASS_DEPRECIATION_WORKFLOW,
+            "mass_depreciation",
+            batch_id,
+            actor_id=actor_id,
+        )
+        if failure is not None:
+            return failure
+
+        lines: list[dict] = []
+        total = Decimal("0")
+        for asset_data in assets:
+            asset_id = str(asset_data["asset_id"])
+            amount = Decimal(str(asset_data["amount"]))
+            total += amount
+            lines.append({
+                "asset_id": asset_id,
+                "amount": str(amount),
+                "dimensions": {
+                    "asset_id": asset_id,
+                    "cost_center": asset_data.get("cost_center"),
+                },
+                "memo": f"Depreciation {asset_id}",
+            })
+
+        logger.info("mass_depreciation_consolidated", extra={
+            "batch_id": str(batch_id),
+            "asset_count": len(lines),
+            "total_amount": str(total),
+        })
+
+        result = self._poster.post_event(
+            event_type="asset.mass_depreciation_batch",
+            payload={
+                "batch_id": str(batch_id),
+                "asset_count": len(lines),
+                "total_amount": str(total),
+                "assets": lines,
+            },
+            effective_date=effective_date,
+            actor_id=actor_id,
+            amount=total,
+            currency=currency,
+        )
+
+        if result.is_success:
+            entry_ref = ArtifactRef(
+                ArtifactType.JOURNAL_ENTRY, result.journal_entry_ids[0],
+            )
+            now = self._clock.now()
+            self._link_graph.establish_links_to_new_artifact([
+                EconomicLink.create(
+                    link_id=uuid4(),
+                    link_type=LinkType.ADJUSTED_BY,
+                    parent_ref=ArtifactRef(ArtifactType.ASSET, UUID(line["asset_id"])),
+                    child_ref=entry_ref,
+                    creating_event_id=result.event_id,
+                    created_at=now,
+                    metadata={"amount": line["amount"], "batch_id": str(batch_id)},
+                )
+                for line in lines
+            ])
+        return result
+
+    # =========================================================================
+    # Portfolio Depreciation
+    # =========================================================================
+
+    def run_portfolio_depreciation(
+        self,
+        period_date: date,
+        actor_id: UUID,
+        currency: str = "USD",
+        convention: str = "mid_month",
+        chunk_size: int = 1000,
+        post: bool = True,
+        asset_ids: Collection[UUID] | None = None,
+        units: Mapping[UUID, tuple[Decimal, Decimal]] | None = None,
+    ) -> PortfolioDepreciationRun:
+        """
+        Depreciate the in-service asset register for the period ending ``period_date``.
+
+        Streams assets in keyset-paged chunks of ``chunk_size``, computes
+        each chunk's depreciation in one ``depreciate_portfolio`` pass,
+        bulk-writes the schedule rows and register balances, and (with
+        ``post=True``) posts the chunk as one consolidated
+        ``asset.mass_depreciation_batch`` entry.  Each chunk is its own
+        transaction; a failed posting rolls back that chunk and stops the
+        run.  Assets that already have a posted schedule row for the period
+        are not picked up again, so a stopped run can simply be re-run.
+
+        With ``post=False`` the run is a draft: it writes unposted schedule
+        rows only and leaves the register balances alone.  A later posting
+        run for the period recomputes those assets, replaces their unposted
+        rows and posts them.
+
+        Args:
+            period_date: Period end date (schedule period and effective date).
+            actor_id: Actor UUID.
+            currency: ISO 4217 currency code.
+            convention: "full_month", "mid_month" or "half_year".
+            chunk_size: Assets per chunk (and per journal entry).
+            post: Post journal entries and update the register; otherwise
+                only unposted schedule rows are written.
+            asset_ids: Restrict the run to these assets.
+            units: asset_id -> (total_units, units_produced) for
+                units-of-production assets.
+
+        Returns:
+            PortfolioDepreciationRun summary.
+        """
+        asset_count = 0
+        chunk_count = 0
+        rows_written = 0
+        total = Decimal("0")
+        skipped_ids: list[UUID] = []
+        entry_ids: list[UUID] = []
+        posting_status: str | None = None
+
+        logger.info("portfolio_depreciation_started", extra={
+            "period_date": period_date.isoformat(),
+            "convention": convention,
+            "chunk_size": chunk_size,
+            "post": post,
+        })
+
+        try:
+            for chunk in register.iter_register_chunks(
+                self._session,
+                period_date,
+                chunk_size=chunk_size,
+                convention=convention,
+                unposted_only=post,
+                asset_ids=asset_ids,
+                units=units,
+            ):
+                chunk_count += 1
+                lines, skipped = depreciate_portfolio(chunk, period_date)
+                skipped_ids.extend(a.asset_id for a in skipped)
+
+                if post:
+                    register.discard_unposted_rows(self._session, lines)
+                written = register.write_schedule_rows(
+                    self._session, lines, actor_id, is_posted=post,
+                )
+                if post:
+                    register.apply_to_register(self._session, lines, actor_id)
+
+                if post and lines:
+                    result = self.run_mass_depreciation(
+                        assets=[
+                            {
+                                "asset_id": str(line.asset_id),
+                                "amount": line.depreciation_amount,
+                                "cost_center": line.cost_center,
+                            }
+                            for line in lines
+                        ],
+                        effective_date=period_date,
+                        actor_id=actor_id,
+                        currency=currency,
+                        consolidated=True,
+                    )[0]
+                    posting_status = result.status.value
+                    if not result.is_success:
+                        self._session.rollback()
+                        break
+                    entry_ids.extend(result.journal_entry_ids)
+                else:
+                    self._session.commit()
+
+                asset_count += len(lines)
+                rows_written += written
+                total += sum((line.depreciation_amount for line in lines), Decimal("0"))
+
+        except Exception:
+            self._session.rollback()
+            raise
+
+        logger.info("portfolio_depreciation_completed", extra={
+            "period_date": period_date.isoformat(),
+            "asset_count": asset_count,
+            "chunk_count": chunk_count,
+            "skipped_count": len(skipped_ids),
+            "total_depreciation": str(total),
+            "posting_status": posting_status,
+        })
+
+        return PortfolioDepreciationRun(
+            period_date=period_date,
+            asset_count=asset_count,
+            chunk_count=chunk_count,
+            total_depreciation=total,
+            schedule_rows_written=rows_written,
+            skipped_asset_ids=tuple(skipped_ids),
+            journal_entry_ids=tuple(entry_ids),
+            posting_status=posting_status,
+        )
+
+    def post_depreciation_lines(
+        self,
+        lines: Sequence[PortfolioDepreciationLine],
+        actor_id: UUID,
+        currency: str = "USD",
+    ) -> ModulePostingResult:
+        """
+        Post computed schedule lines and apply them to the register, without committing.
+
+        For callers that own the transaction (the mass depreciation batch
+        task runs each item in the executor's savepoint).  The lines go
+        through the mass depreciation workflow guard and post as one
+        ``asset.mass_depreciation_batch`` entry with asset_id and
+        cost_center line dimensions.  Only when the entry posts are the
+        lines' unposted rows replaced by posted schedule rows and the
+        register balances updated.
+
+        Args:
+            lines: Lines for a single period (``period_date`` is the
+                effective date).
+            actor_id: Actor UUID.
+            currency: ISO 4217 currency code.
+
+        Returns:
+            The ModulePostingResult of the consolidated entry.
+        """
+        if not lines:
+            raise ValueError("post_depreciation_lines requires at least one line")
+        period_dates = {line.period_date for line in lines}
+        if len(period_dates) != 1:
+            raise ValueError("post_depreciation_lines lines must share one period_date")
+
+        result = self._post_depreciation_batch(
+            [
+                {
+                    "asset_id": str(line.asset_id),
+                    "amount": line.depreciation_amount,
+                    "cost_center": line.cost_center,
+                }
+                for line in lines
+            ],
+            effective_date=lines[0].period_date,
+            actor_id=actor_id,
+            currency=currency,
+        )
+        if result.is_success:
+            register.discard_unposted_rows(self._session, lines)
+            register.write_schedule_rows(self._session, lines, actor_id, is_posted=True)
+            register.apply_to_register(self._session, lines, actor_id)
+        return result
+
+    def forecast_portfolio_depreciation(
+        self,
+        start_period: date,
+        convention: str = "mid_month",
+        chunk_size: int = 1000,
+        max_periods: int | None = None,
+        asset_ids: Collection[UUID] | None = None,
+        units: Mapping[UUID, tuple[Decimal, Decimal]] | None = None,
+    ) -> Iterator[PortfolioDepreciationLine]:
+        """
+        Forecast remaining-life depreciation for the in-service register.
+
+        Read-only: streams the register in chunks and yields
+        ``forecast_portfolio`` lines from ``start_period`` (the first
+        period not yet reflected in the register balances) onward.  Lines
+        are grouped by chunk, then period; nothing is written.
+        Units-of-production assets are projected at a flat rate: each
+        asset's ``units_produced`` is assumed for every forecast period.
+        """
+        for chunk in register.iter_register_chunks(
+            self._session,
+            start_period,
+            chunk_size=chunk_size,
+            convention=convention,
+            unscheduled_only=False,
+            asset_ids=asset_ids,
+            units=units,
+        ):
+            yield from forecast_portfolio(chunk, start_period, max_periods)
+
     # =========================================================================
     # Asset Transfer
     # =========================================================================
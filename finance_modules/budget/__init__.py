@@ -37,6 +37,8 @@ oversight and regulatory compliance.
 
 from finance_modules.budget.config import BudgetConfig
 from finance_modules.budget.models import (
+    BudgetCube,
+    BudgetCubeCell,
     BudgetEntry,
     BudgetLock,
     BudgetVariance,
@@ -48,6 +50,8 @@ from finance_modules.budget.models import (
 from finance_modules.budget.profiles import BUDGET_PROFILES
 
 __all__ = [
+    "BudgetCube",
+    "BudgetCubeCell",
     "BudgetEntry",
     "BudgetLock",
     "BudgetVariance",
@@ -26,9 +26,12 @@ Audit relevance
 * ``BudgetVersion`` records maintain full version history for accountability.
 * ``Encumbrance`` lifecycle transitions are auditable via status field.
 * ``BudgetVariance`` records support budget control compliance.
+* ``BudgetCube`` holds whole-chart budget / actual / encumbrance cells
+  for budget-vs-actual reporting.
 """
 
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from enum import Enum
@@ -124,3 +127,140 @@ class ForecastEntry:
     forecast_amount: Decimal
     basis: str = "trend"  # trend, manual, statistical
     currency: str = "USD"
+
+
+DimensionKey = tuple[tuple[str, str | None], ...]
+
+_ZERO = Decimal("0")
+
+
+@dataclass(frozen=True)
+class BudgetCubeCell:
+    """Budget, actual and open encumbrance for one (account, period, dimensions) cell.
+
+    ``dimensions`` pairs each of the cube's dimension keys with its value
+    (None when the source row has no value for that key).  Actuals are on
+    the account's normal side.
+    """
+    account_code: str
+    period: str
+    dimensions: DimensionKey = ()
+    budget_amount: Decimal = _ZERO
+    actual_amount: Decimal = _ZERO
+    encumbrance_amount: Decimal = _ZERO
+
+    @property
+    def variance_amount(self) -> Decimal:
+        return self.budget_amount - self.actual_amount
+
+    @property
+    def available_amount(self) -> Decimal:
+        """Budget - actual - open encumbrances."""
+        return self.budget_amount - self.actual_amount - self.encumbrance_amount
+
+    def to_variance(self) -> BudgetVariance:
+        variance = self.variance_amount
+        pct = (
+            variance / self.budget_amount * Decimal("100")
+            if self.budget_amount != 0 else Decimal("0")
+        )
+        return BudgetVariance(
+            account_code=self.account_code,
+            period=self.period,
+            budget_amount=self.budget_amount,
+            actual_amount=self.actual_amount,
+            variance_amount=variance,
+            variance_percentage=pct,
+            is_favorable=variance >= 0,
+        )
+
+
+def _sum_cells(cells: Iterable[BudgetCubeCell], keep: tuple[str, ...]) -> tuple[BudgetCubeCell, ...]:
+    totals: dict[tuple[str, str, DimensionKey], list[Decimal]] = {}
+    for cell in cells:
+        dims = tuple((k, v) for k, v in cell.dimensions if k in keep)
+        acc = totals.setdefault((cell.account_code, cell.period, dims), [_ZERO, _ZERO, _ZERO])
+        acc[0] += cell.budget_amount
+        acc[1] += cell.actual_amount
+        acc[2] += cell.encumbrance_amount
+    return tuple(
+        BudgetCubeCell(account, period, dims, budget, actual, encumbered)
+        for (account, period, dims), (budget, actual, encumbered) in sorted(
+            totals.items(), key=lambda item: (item[0][0], item[0][1], repr(item[0][2])),
+        )
+    )
+
+
+@dataclass(frozen=True)
+class BudgetCube:
+    """Sparse budget-vs-actual cube: only cells with a budget, actual or
+    encumbrance are present.
+
+    ``slice`` filters by account, period and dimension values; ``rollup``
+    sums away dimensions.  Both return new cubes.
+    """
+    currency: str
+    dimension_keys: tuple[str, ...]
+    cells: tuple[BudgetCubeCell, ...]
+    _index: dict[tuple[str, str, DimensionKey], BudgetCubeCell] = field(
+        init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_index", {
+            (c.account_code, c.period, c.dimensions): c for c in self.cells
+        })
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def get(self, account_code: str, period: str, **dimensions: str | None) -> BudgetCubeCell:
+        """The cell at a coordinate; an all-zero cell when it is empty."""
+        dims = tuple((k, dimensions.get(k)) for k in self.dimension_keys)
+        return self._index.get(
+            (account_code, period, dims),
+            BudgetCubeCell(account_code=account_code, period=period, dimensions=dims),
+        )
+
+    def slice(
+        self,
+        account_codes: Iterable[str] | None = None,
+        periods: Iterable[str] | None = None,
+        **dimensions: str | None,
+    ) -> "BudgetCube":
+        unknown = set(dimensions) - set(self.dimension_keys)
+        if unknown:
+            raise ValueError(f"Cube has no dimension(s): {sorted(unknown)}")
+        accounts = set(account_codes) if account_codes is not None else None
+        period_set = set(periods) if periods is not None else None
+        cells = tuple(
+            c for c in self.cells
+            if (accounts is None or c.account_code in accounts)
+            and (period_set is None or c.period in period_set)
+            and all(dict(c.dimensions).get(k) == v for k, v in dimensions.items())
+        )
+        return BudgetCube(self.currency, self.dimension_keys, cells)
+
+    def rollup(self, *keep: str) -> "BudgetCube":
+        """Sum cells over every dimension not in ``keep``."""
+        unknown = set(keep) - set(self.dimension_keys)
+        if unknown:
+            raise ValueError(f"Cube has no dimension(s): {sorted(unknown)}")
+        kept = tuple(k for k in self.dimension_keys if k in keep)
+        return BudgetCube(self.currency, kept, _sum_cells(self.cells, kept))
+
+    @property
+    def total_budget(self) -> Decimal:
+        return sum((c.budget_amount for c in self.cells), _ZERO)
+
+    @property
+    def total_actual(self) -> Decimal:
+        return sum((c.actual_amount for c in self.cells), _ZERO)
+
+    @property
+    def total_encumbered(self) -> Decimal:
+        return sum((c.encumbrance_amount for c in self.cells), _ZERO)
+
+    def variances(self) -> tuple[BudgetVariance, ...]:
+        """One BudgetVariance per (account, period), summed over dimensions."""
+        return tuple(c.to_variance() for c in _sum_cells(self.cells, ()))
@@ -4,7 +4,8 @@ SQLAlchemy ORM persistence models for the Budget module.
 Responsibility
 --------------
 Provide database-backed persistence for budget domain entities: budgets
-(versions), budget lines, budget transfers, and budget allocations.
+(versions), budget lines, budget transfers, budget allocations, and
+encumbrances.
 ``BudgetVariance`` and ``ForecastEntry`` are computed/transient DTOs and
 do not require ORM persistence.
 
@@ -27,6 +28,8 @@ Audit relevance
 * ``BudgetTransferModel`` provides an auditable record of inter-line
   budget movements.
 * ``BudgetAllocationModel`` records top-down budget distribution.
+* ``BudgetEncumbranceModel`` tracks the open commitment behind each
+  encumbrance posting (amount, relieved amount, status).
 """
 
 from datetime import date
@@ -388,3 +391,71 @@ class BudgetAllocationModel(TrackedBase):
             f"<BudgetAllocationModel {self.target_entity_id} "
             f"{self.account_code} {self.allocated_amount}>"
         )
+
+
+# ---------------------------------------------------------------------------
+# BudgetEncumbranceModel
+# ---------------------------------------------------------------------------
+
+
+class BudgetEncumbranceModel(TrackedBase):
+    """
+    An encumbrance (commitment against budget) and its relief state.
+
+    Maps to the ``Encumbrance`` DTO in ``finance_modules.budget.models``.
+
+    Guarantees:
+        - ``relieved_amount`` never exceeds ``amount`` once fully relieved
+          (status moves to ``relieved``).
+        - Open balance = ``amount - relieved_amount`` while status is
+          ``open`` or ``partially_relieved``.
+    """
+
+    __tablename__ = "budget_encumbrances"
+
+    __table_args__ = (
+        Index("idx_budget_encumbrance_po", "po_id"),
+        Index("idx_budget_encumbrance_period_status", "period", "status"),
+    )
+
+    po_id: Mapped[UUID]
+    account_code: Mapped[str] = mapped_column(String(50), nullable=False)
+    period: Mapped[str] = mapped_column(String(20), nullable=False)
+    amount: Mapped[Decimal]
+    relieved_amount: Mapped[Decimal] = mapped_column(default=Decimal("0"))
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="open")
+    currency: Mapped[str] = mapped_column(String(3), nullable=False, default="USD")
+
+    def to_dto(self):
+        from finance_modules.budget.models import Encumbrance, EncumbranceStatus
+
+        return Encumbrance(
+            id=self.id,
+            po_id=self.po_id,
+            account_code=self.account_code,
+            amount=self.amount,
+            period=self.period,
+            status=EncumbranceStatus(self.status),
+            relieved_amount=self.relieved_amount,
+            currency=self.currency,
+        )
+
+    @classmethod
+    def from_dto(cls, dto, created_by_id: UUID) -> "BudgetEncumbranceModel":
+        return cls(
+            id=dto.id,
+            po_id=dto.po_id,
+            account_code=dto.account_code,
+            period=dto.period,
+            amount=dto.amount,
+            relieved_amount=dto.relieved_amount,
+            status=dto.status.value,
+            currency=dto.currency,
+            created_by_id=created_by_id,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<BudgetEncumbranceModel {self.account_code} {self.period} "
+            f"{self.amount} {self.status}>"
+        )
@@ -29,6 +29,7 @@ Failure modes
   ``is_success == False``; session rolled back.
 * Unexpected exception  -> session rolled back, exception re-raised.
 * Budget lock violation  -> ``ValueError`` raised before posting attempt.
+* ``get_budget_cube`` with no periods -> ``ValueError``.
 
 Audit relevance
 ---------------
@@ -41,15 +42,18 @@ maintain full history of changes.
 from __future__ import annotations
 
 import dataclasses
+import json
 from collections.abc import Sequence
 from datetime import date
 from decimal import Decimal
 from uuid import UUID, uuid4
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from finance_kernel.domain.clock import Clock, SystemClock
 from finance_kernel.logging_config import get_logger
+from finance_kernel.selectors.ledger_selector import LedgerSelector
 from finance_kernel.services.journal_writer import RoleResolver
 from finance_kernel.services.party_service import PartyService
 from finance_kernel.services.module_posting_service import (
@@ -67,6 +71,8 @@ from finance_modules.budget.workflows import (
     BUDGET_UPDATE_FORECAST_WORKFLOW,
 )
 from finance_modules.budget.models import (
+    BudgetCube,
+    BudgetCubeCell,
     BudgetEntry,
     BudgetLock,
     BudgetStatus,
@@ -76,7 +82,11 @@ from finance_modules.budget.models import (
     EncumbranceStatus,
     ForecastEntry,
 )
-from finance_modules.budget.orm import BudgetLineModel, BudgetTransferModel
+from finance_modules.budget.orm import (
+    BudgetEncumbranceModel,
+    BudgetLineModel,
+    BudgetTransferModel,
+)
 
 logger = get_logger("modules.budget.service")
 
@@ -119,6 +129,9 @@ class BudgetService:
         self._session = session
         self._clock = clock or SystemClock()
         self._workflow_executor = workflow_executor
+        # (version_id, period, dimension_keys, currency, account_types)
+        #   -> ((ledger watermark, budget watermark), cells)
+        self._cube_cache: dict[tuple, tuple[tuple, tuple[BudgetCubeCell, ...]]] = {}
 
         self._poster = ModulePostingService(
             session=session,
@@ -191,6 +204,7 @@ class BudgetService:
                 orm_line = BudgetLineModel.from_dto(entry, created_by_id=actor_id)
                 self._session.add(orm_line)
                 self._session.commit()
+                self.invalidate_budget_cube(period)
             else:
                 self._session.rollback()
             return entry, result
@@ -264,6 +278,7 @@ class BudgetService:
                 )
                 self._session.add(orm_transfer)
                 self._session.commit()
+                self.invalidate_budget_cube(period)
             else:
                 self._session.rollback()
             return result
@@ -348,7 +363,11 @@ class BudgetService:
                 currency=currency,
             )
             if result.is_success:
+                self._session.add(
+                    BudgetEncumbranceModel.from_dto(encumbrance, created_by_id=actor_id),
+                )
                 self._session.commit()
+                self.invalidate_budget_cube(period)
             else:
                 self._session.rollback()
             return encumbrance, result
@@ -403,7 +422,9 @@ class BudgetService:
                 currency=currency,
             )
             if result.is_success:
+                self._store_encumbrance_state(updated, actor_id)
                 self._session.commit()
+                self.invalidate_budget_cube(encumbrance.period)
             else:
                 self._session.rollback()
             return updated, result
@@ -451,7 +472,9 @@ class BudgetService:
                 currency=currency,
             )
             if result.is_success:
+                self._store_encumbrance_state(updated, actor_id)
                 self._session.commit()
+                self.invalidate_budget_cube(encumbrance.period)
             else:
                 self._session.rollback()
             return updated, result
@@ -459,6 +482,15 @@ class BudgetService:
             self._session.rollback()
             raise
 
+    def _store_encumbrance_state(self, encumbrance: Encumbrance, actor_id: UUID) -> None:
+        """Mirror relief / cancellation onto the persisted encumbrance, if any."""
+        row = self._session.get(BudgetEncumbranceModel, encumbrance.id)
+        if row is None:
+            return
+        row.relieved_amount = encumbrance.relieved_amount
+        row.status = encumbrance.status.value
+        row.updated_by_id = actor_id
+
     # =========================================================================
     # Budget vs Actual
     # =========================================================================
@@ -488,6 +520,236 @@ class BudgetService:
             is_favorable=variance >= 0,
         )
 
+    def get_budget_cube(
+        self,
+        version_id: UUID,
+        periods: Sequence[str],
+        dimension_keys: Sequence[str] = (),
+        currency: str = "USD",
+        account_types: Sequence[str] = ("revenue", "expense"),
+    ) -> BudgetCube:
+        """
+        Budget vs actual vs open encumbrances for the whole chart.
+
+        Actuals come from a single grouped ledger aggregation across all
+        requested periods (``LedgerSelector.period_balances``) rather than
+        one balance query per account.  Per-period cells are cached on the
+        service and reused while both the period's journal watermark (seq
+        of its latest posted entry) and its budget watermark (row count,
+        amount total and last update of its budget lines, transfers and
+        open encumbrances) are unchanged, so writes through another service
+        instance or session are picked up too.  Writes through this service
+        also invalidate their period directly.
+
+        Budget lines and actuals are keyed on ``dimension_keys``; budget
+        lines without a key and encumbrances (which carry no dimensions)
+        land in the cell with None for that key.
+
+        Pure query -- no posting.
+        """
+        if not periods:
+            raise ValueError("get_budget_cube requires at least one period")
+        keys = tuple(dimension_keys)
+        types = tuple(account_types)
+        ledger_marks = LedgerSelector(self._session).period_watermarks(periods)
+        budget_marks = self._budget_watermarks(version_id, periods, currency)
+        watermarks = {
+            period: (ledger_marks.get(period, 0), budget_marks[period])
+            for period in periods
+        }
+
+        cells_by_period: dict[str, tuple[BudgetCubeCell, ...]] = {}
+        stale: list[str] = []
+        for period in dict.fromkeys(periods):
+            cached = self._cube_cache.get((version_id, period, keys, currency, types))
+            if cached is not None and cached[0] == watermarks[period]:
+                cells_by_period[period] = cached[1]
+            else:
+                stale.append(period)
+
+        if stale:
+            computed = self._compute_cube_cells(version_id, stale, keys, currency, types)
+            for period in stale:
+                cells = computed.get(period, ())
+                self._cube_cache[(version_id, period, keys, currency, types)] = (
+                    watermarks[period], cells,
+                )
+                cells_by_period[period] = cells
+
+        logger.info("budget_cube_built", extra={
+            "version_id": str(version_id),
+            "periods": len(cells_by_period),
+            "recomputed_periods": len(stale),
+            "dimension_keys": list(keys),
+        })
+        return BudgetCube(
+            currency=currency,
+            dimension_keys=keys,
+            cells=tuple(
+                cell for period in cells_by_period for cell in cells_by_period[period]
+            ),
+        )
+
+    def invalidate_budget_cube(self, period: str | None = None) -> None:
+        """Drop cached cube cells for one period, or all periods."""
+        if period is None:
+            self._cube_cache.clear()
+            return
+        for key in [k for k in self._cube_cache if k[1] == period]:
+            del self._cube_cache[key]
+
+    def _budget_watermarks(
+        self,
+        version_id: UUID,
+        periods: Sequence[str],
+        currency: str,
+    ) -> dict[str, tuple]:
+        """
+        Per-period fingerprint of the budget-side rows a cube cell reads.
+
+        Each table contributes (row count, amount total, last update):
+        inserts move the count, in-place edits and reliefs move the total
+        or the timestamp.  Transfers are scoped to the version rather than
+        a period, so their fingerprint is shared by every period.
+        """
+        lines = {
+            period: (count, total, updated)
+            for period, count, total, updated in self._session.execute(
+                select(
+                    BudgetLineModel.period,
+                    func.count(),
+                    func.sum(BudgetLineModel.amount),
+                    func.max(BudgetLineModel.updated_at),
+                ).where(
+                    BudgetLineModel.version_id == version_id,
+                    BudgetLineModel.period.in_(list(periods)),
+                    BudgetLineModel.currency == currency,
+                ).group_by(BudgetLineModel.period)
+            )
+        }
+        encumbrances = {
+            period: (count, total, updated)
+            for period, count, total, updated in self._session.execute(
+                select(
+                    BudgetEncumbranceModel.period,
+                    func.count(),
+                    func.sum(
+                        BudgetEncumbranceModel.amount
+                        - BudgetEncumbranceModel.relieved_amount
+                    ),
+                    func.max(BudgetEncumbranceModel.updated_at),
+                ).where(
+                    BudgetEncumbranceModel.period.in_(list(periods)),
+                    BudgetEncumbranceModel.currency == currency,
+                    BudgetEncumbranceModel.status.in_([
+                        EncumbranceStatus.OPEN.value,
+                        EncumbranceStatus.PARTIALLY_RELIEVED.value,
+                    ]),
+                ).group_by(BudgetEncumbranceModel.period)
+            )
+        }
+        transfers = tuple(self._session.execute(
+            select(
+                func.count(),
+                func.sum(BudgetTransferModel.amount),
+                func.max(BudgetTransferModel.updated_at),
+            ).where(
+                BudgetTransferModel.version_id == version_id,
+                BudgetTransferModel.currency == currency,
+            )
+        ).one())
+        return {
+            period: (lines.get(period), encumbrances.get(period), transfers)
+            for period in periods
+        }
+
+    def _compute_cube_cells(
+        self,
+        version_id: UUID,
+        periods: Sequence[str],
+        keys: tuple[str, ...],
+        currency: str,
+        account_types: tuple[str, ...],
+    ) -> dict[str, tuple[BudgetCubeCell, ...]]:
+        zero = Decimal("0")
+        # (account, period, dims) -> [budget, actual, encumbered]
+        totals: dict[tuple, list[Decimal]] = {}
+        no_dims = tuple((key, None) for key in keys)
+
+        def add(account: str, period: str, dims: tuple, slot: int, amount: Decimal) -> None:
+            totals.setdefault((account, period, dims), [zero, zero, zero])[slot] += amount
+
+        for row in LedgerSelector(self._session).period_balances(
+            periods, dimension_keys=keys, currency=currency, account_types=account_types,
+        ):
+            add(row.account_code, row.period_code, row.dimensions, 1, row.natural_balance)
+
+        lines = self._session.execute(
+            select(
+                BudgetLineModel.account_code,
+                BudgetLineModel.period,
+                BudgetLineModel.amount,
+                BudgetLineModel.dimensions_json,
+            ).where(
+                BudgetLineModel.version_id == version_id,
+                BudgetLineModel.period.in_(list(periods)),
+                BudgetLineModel.currency == currency,
+            )
+        )
+        for account, period, amount, dimensions_json in lines:
+            line_dims = dict(json.loads(dimensions_json)) if dimensions_json else {}
+            add(account, period, tuple((k, line_dims.get(k)) for k in keys), 0, amount)
+
+        transfers = self._session.execute(
+            select(
+                BudgetTransferModel.from_account_code,
+                BudgetTransferModel.from_period,
+                BudgetTransferModel.to_account_code,
+                BudgetTransferModel.to_period,
+                BudgetTransferModel.amount,
+            ).where(
+                BudgetTransferModel.version_id == version_id,
+                BudgetTransferModel.currency == currency,
+            )
+        )
+        period_set = set(periods)
+        for from_account, from_period, to_account, to_period, amount in transfers:
+            if from_period in period_set:
+                add(from_account, from_period, no_dims, 0, -amount)
+            if to_period in period_set:
+                add(to_account, to_period, no_dims, 0, amount)
+
+        encumbrances = self._session.execute(
+            select(
+                BudgetEncumbranceModel.account_code,
+                BudgetEncumbranceModel.period,
+                BudgetEncumbranceModel.amount - BudgetEncumbranceModel.relieved_amount,
+            ).where(
+                BudgetEncumbranceModel.period.in_(list(periods)),
+                BudgetEncumbranceModel.currency == currency,
+                BudgetEncumbranceModel.status.in_([
+                    EncumbranceStatus.OPEN.value,
+                    EncumbranceStatus.PARTIALLY_RELIEVED.value,
+                ]),
+            )
+        )
+        for account, period, open_amount in encumbrances:
+            add(account, period, no_dims, 2, open_amount)
+
+        by_period: dict[str, list[BudgetCubeCell]] = {}
+        for (account, period, dims), (budget, actual, encumbered) in sorted(
+            totals.items(), key=lambda item: (item[0][1], item[0][0], repr(item[0][2])),
+        ):
+            by_period.setdefault(period, []).append(BudgetCubeCell(
+                account_code=account,
+                period=period,
+                dimensions=dims,
+                budget_amount=budget,
+                actual_amount=actual,
+                encumbrance_amount=encumbered,
+            ))
+        return {period: tuple(cells) for period, cells in by_period.items()}
+
     def get_encumbrance_balance(
         self,
         encumbrances: Sequence[Encumbrance],
@@ -27,6 +27,7 @@ Audit relevance:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
 
@@ -126,7 +127,9 @@ def parse_camt053(raw_data: str) -> list[dict]:
     return records
 
 
-def format_nacha(payments: list[dict], company_name: str, company_id: str) -> str:
+def format_nacha(
+    payments: Iterable[dict], company_name: str, company_id: str,
+) -> str:
     """
     Format payment data into NACHA/ACH file format.
 
@@ -141,22 +144,24 @@ def format_nacha(payments: list[dict], company_name: str, company_id: str) -> st
         ``decimal.InvalidOperation`` if amount is not numeric.
 
     Simplified formatter producing a pipe-delimited representation
-    of ACH batch records.
+    of ACH batch records.  ``CashService.write_payment_file`` streams
+    fixed-width NACHA records to a sink for large payment runs.
     """
     lines: list[str] = []
     lines.append(f"FILE_HEADER|{company_name}|{company_id}")
     lines.append(f"BATCH_HEADER|PPD|{company_name}")
 
     total = Decimal("0")
-    for i, payment in enumerate(payments, 1):
+    count = 0
+    for count, payment in enumerate(payments, 1):
         amount = Decimal(str(payment.get("amount", "0")))
         total += amount
         lines.append(
-            f"ENTRY|{i}|{payment.get('routing', '')}|"
+            f"ENTRY|{count}|{payment.get('routing', '')}|"
             f"{payment.get('account', '')}|{amount}|"
             f"{payment.get('name', '')}"
         )
 
-    lines.append(f"BATCH_CONTROL|{len(payments)}|{total}")
-    lines.append(f"FILE_CONTROL|1|{len(payments)}|{total}")
+    lines.append(f"BATCH_CONTROL|{count}|{total}")
+    lines.append(f"FILE_CONTROL|1|{count}|{total}")
     return "\n".join(lines)
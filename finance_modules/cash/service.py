@@ -54,7 +54,7 @@ Usage::
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 import time
 from datetime import date
 from decimal import Decimal
@@ -76,6 +76,7 @@ from finance_kernel.services.module_posting_service import (
     ModulePostingService,
     ModulePostingStatus,
 )
+from finance_modules._ach_writer import AchFileTotals, TextSink, write_ach_file
 from finance_modules._posting_helpers import commit_or_rollback, run_workflow_guard
 from finance_modules.cash.workflows import (
     CASH_AUTO_RECONCILE_WORKFLOW,
@@ -1214,6 +1215,59 @@ class CashService:
 
         return file
 
+    def write_payment_file(
+        self,
+        payments: Iterable[dict],
+        sink: TextSink,
+        company_name: str,
+        company_id: str,
+        effective_date: date | str,
+        immediate_destination: str,
+        destination_name: str = "",
+    ) -> AchFileTotals:
+        """
+        Stream a fixed-width NACHA payment file to ``sink``.
+
+        Streaming counterpart of ``generate_payment_file`` for large AP
+        payment runs: records are written as ``payments`` is consumed and
+        control totals are kept incrementally.  Payments may carry
+        ``company_id`` / ``effective_date`` overrides; each change starts
+        a new batch.
+
+        Args:
+            payments: Iterable of payment dicts (name, account, routing, amount).
+            sink: Text sink with ``write(str)`` (file, socket wrapper).
+            company_name: Company name for the batch headers.
+            company_id: Company ID for the batch headers.
+            effective_date: Default effective entry date.
+            immediate_destination: 9-digit routing of the receiving ODFI.
+            destination_name: Name of the receiving ODFI.
+
+        Returns:
+            AchFileTotals from the file control record.
+        """
+        totals = write_ach_file(
+            payments,
+            sink,
+            company_name=company_name,
+            company_id=company_id,
+            effective_date=effective_date,
+            immediate_destination=immediate_destination,
+            created_at=self._clock.now(),
+            destination_name=destination_name,
+            sec_code="CCD",
+            entry_description="PAYMENT",
+        )
+
+        logger.info("payment_file_written", extra={
+            "format": "NACHA",
+            "batch_count": totals.batch_count,
+            "payment_count": totals.entry_count,
+            "total_amount": str(totals.total_credit),
+        })
+
+        return totals
+
     # =========================================================================
     # Cash Forecasting
     # =========================================================================
@@ -164,6 +164,26 @@ class ContractRateCeiling:
         return True
 
 
+# ---------------------------------------------------------------------------
+# Labor charge line (batch verification input)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class LaborChargeLine:
+    """One timesheet labor charge to verify against rates (D8).
+
+    Batch input for ``verify_labor_rates``: a pay period is a sequence of
+    these, verified against one prebuilt ``RateScheduleIndex``.
+    """
+    employee_id: UUID
+    employee_classification: str
+    labor_category: str
+    charged_rate: Decimal
+    charge_date: date
+    contract_id: UUID | None = None  # None for indirect labor
+
+
 # ---------------------------------------------------------------------------
 # Rate verification result
 # ---------------------------------------------------------------------------
@@ -54,6 +54,7 @@ Usage::
 
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from datetime import date
 from decimal import Decimal
 from typing import Any
@@ -74,12 +75,15 @@ from finance_engines.billing import (
 )
 from finance_engines.ice import (
     ICEInput,
+    ICELineCache,
     ICESubmission,
     compile_ice_submission,
 )
 from finance_engines.rate_compliance import (
+    RateScheduleIndex,
     compute_all_reconciliations,
     verify_labor_rate,
+    verify_labor_rates,
 )
 from finance_kernel.domain.clock import Clock, SystemClock
 from finance_kernel.logging_config import get_logger
@@ -124,6 +128,7 @@ from finance_modules.contracts.rate_types import (
     ContractRateCeiling,
     IndirectRateRecord,
     IndirectRateType,
+    LaborChargeLine,
     LaborRateSchedule,
     RateReconciliationRecord,
     RateSource,
@@ -178,11 +183,20 @@ class GovernmentContractsService:
         workflow_executor: WorkflowExecutor,
         clock: Clock | None = None,
         party_service: PartyService | None = None,
+        ice_executor: Executor | None = None,
     ):
         self._session = session
         self._clock = clock or SystemClock()
         self._workflow_executor = workflow_executor
 
+        # ICE recompilation: per-contract Schedule H/I lines survive across
+        # compile_ice calls, so an edit recomputes only the edited contract.
+        # The audit-prep check compiles a different, one-contract input and
+        # keeps its own cache so it never evicts the submission's lines.
+        self._ice_line_cache = ICELineCache()
+        self._audit_prep_line_cache = ICELineCache()
+        self._ice_executor = ice_executor
+
         # Kernel posting (auto_commit=False -- we own the boundary). G14: actor validation mandatory.
         self._poster = ModulePostingService(
             session=session,
@@ -735,8 +749,14 @@ class GovernmentContractsService:
         Compile ICE submission schedules (pure, no posting).
 
         Engine: compile_ice_submission() produces all DCAA schedules.
+        Schedule H/I lines are memoised across calls on this service, so
+        recompiling after editing one contract recomputes only its lines.
         """
-        return compile_ice_submission(ice_input)
+        return compile_ice_submission(
+            ice_input,
+            line_cache=self._ice_line_cache,
+            executor=self._ice_executor,
+        )
 
     # =========================================================================
     # Contract Modification
@@ -988,7 +1008,11 @@ class GovernmentContractsService:
                 ),
             ),
         )
-        submission = compile_ice_submission(ice_input)
+        submission = compile_ice_submission(
+            ice_input,
+            line_cache=self._audit_prep_line_cache,
+            executor=self._ice_executor,
+        )
 
         # Count non-empty schedules for completeness assessment
         schedule_names = [
@@ -1222,56 +1246,185 @@ class GovernmentContractsService:
                 "violation_type": result.violation_type.value if result.violation_type else None,
             })
 
-            # Post audit event for violations
-            if not result.is_valid:
-                self._poster.post_event(
-                    event_type="contract.rate_ceiling_exceeded",
-                    payload={
-                        "employee_id": str(employee_id),
-                        "employee_classification": employee_classification,
-                        "labor_category": labor_category,
-                        "charged_rate": str(charged_rate),
-                        "approved_rate": str(result.approved_rate),
-                        "ceiling_rate": str(result.ceiling_rate) if result.ceiling_rate else None,
-                        "excess_amount": str(result.excess_amount),
-                        "violation_type": result.violation_type.value if result.violation_type else None,
-                        "contract_id": str(contract_id) if contract_id else None,
-                        "charge_date": str(charge_date),
-                        "message": result.message,
-                    },
-                    effective_date=charge_date,
-                    actor_id=actor_id,
-                    amount=result.excess_amount,
-                    currency=currency,
-                )
-                self._session.commit()
+            event_type, payload, amount = self._labor_rate_event(
+                LaborChargeLine(
+                    employee_id=employee_id,
+                    employee_classification=employee_classification,
+                    labor_category=labor_category,
+                    charged_rate=charged_rate,
+                    charge_date=charge_date,
+                    contract_id=contract_id,
+                ),
+                result,
+            )
+            self._poster.post_event(
+                event_type=event_type,
+                payload=payload,
+                effective_date=charge_date,
+                actor_id=actor_id,
+                amount=amount,
+                currency=currency,
+            )
+            self._session.commit()
+
+            return result
+
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def verify_and_record_labor_rates(
+        self,
+        lines: list[LaborChargeLine],
+        actor_id: UUID,
+        currency: str = "USD",
+    ) -> list[RateVerificationResult]:
+        """
+        Verify a whole pay period of labor charges in one pass (D8).
+
+        Runs the same workflow guard per line as
+        ``verify_and_record_labor_rate``, then loads every rate schedule
+        and ceiling the period can touch with one query each, builds a
+        ``RateScheduleIndex``, and verifies all lines through the pure
+        ``verify_labor_rates`` engine.  Audit events are posted per line
+        exactly as in the single-line method; the period commits once.
+
+        Args:
+            lines: Labor charges for the pay period.
+            actor_id: Who initiated the verification.
+            currency: ISO 4217 currency code.
+
+        Returns:
+            One RateVerificationResult per line, in input order.
+        """
+        results: list[RateVerificationResult | None] = [None] * len(lines)
+        to_verify: list[int] = []
+        for i, line in enumerate(lines):
+            entity_id = (
+                line.contract_id if line.contract_id is not None else line.employee_id
+            )
+            transition_result = self._workflow_executor.execute_transition(
+                workflow=CONTRACTS_VERIFY_LABOR_RATE_WORKFLOW,
+                entity_type="contract_labor_rate",
+                entity_id=entity_id,
+                current_state="draft",
+                action="post",
+                actor_id=actor_id,
+                actor_role="",
+                amount=line.charged_rate,
+                currency=currency,
+                context=None,
+            )
+            if transition_result.success:
+                to_verify.append(i)
             else:
-                # Post successful verification for audit trail
+                results[i] = RateVerificationResult(
+                    is_valid=False,
+                    employee_id=line.employee_id,
+                    charged_rate=line.charged_rate,
+                    approved_rate=line.charged_rate,
+                    ceiling_rate=None,
+                    violation_type=None,
+                    message=transition_result.reason or "Guard rejected",
+                )
+
+        if not to_verify:
+            return results  # type: ignore[return-value]
+
+        try:
+            pending = [lines[i] for i in to_verify]
+            classifications = {line.employee_classification for line in pending}
+            categories = {line.labor_category for line in pending}
+            contract_ids = {line.contract_id for line in pending if line.contract_id is not None}
+
+            # Load every schedule/ceiling the period can touch (one query each);
+            # the index keys on the exact (classification, category) and
+            # (contract, category) pairs.
+            orm_schedules = (
+                self._session.query(LaborRateScheduleModel)
+                .filter(
+                    LaborRateScheduleModel.employee_classification.in_(classifications),
+                    LaborRateScheduleModel.labor_category.in_(categories),
+                )
+                .all()
+            )
+            orm_ceilings = []
+            if contract_ids:
+                orm_ceilings = (
+                    self._session.query(ContractRateCeilingModel)
+                    .filter(
+                        ContractRateCeilingModel.contract_id.in_(contract_ids),
+                        ContractRateCeilingModel.labor_category.in_(categories),
+                    )
+                    .all()
+                )
+            index = RateScheduleIndex(
+                (s.to_dto() for s in orm_schedules),
+                (c.to_dto() for c in orm_ceilings),
+            )
+
+            # Engine: verify all lines (pure)
+            verified = verify_labor_rates(pending, index)
+
+            for i, line, result in zip(to_verify, pending, verified):
+                results[i] = result
+                event_type, payload, amount = self._labor_rate_event(line, result)
                 self._poster.post_event(
-                    event_type="contract.rate_verified",
-                    payload={
-                        "employee_id": str(employee_id),
-                        "labor_category": labor_category,
-                        "charged_rate": str(charged_rate),
-                        "approved_rate": str(result.approved_rate),
-                        "ceiling_rate": str(result.ceiling_rate) if result.ceiling_rate else None,
-                        "is_valid": True,
-                        "contract_id": str(contract_id) if contract_id else None,
-                        "charge_date": str(charge_date),
-                    },
-                    effective_date=charge_date,
+                    event_type=event_type,
+                    payload=payload,
+                    effective_date=line.charge_date,
                     actor_id=actor_id,
-                    amount=Decimal("0"),
+                    amount=amount,
                     currency=currency,
                 )
-                self._session.commit()
+            self._session.commit()
 
-            return result
+            logger.info("labor_rates_verified", extra={
+                "line_count": len(lines),
+                "verified_count": len(verified),
+                "violation_count": sum(1 for r in verified if not r.is_valid),
+                "schedule_rows": len(orm_schedules),
+                "ceiling_rows": len(orm_ceilings),
+            })
+
+            return results  # type: ignore[return-value]
 
         except Exception:
             self._session.rollback()
             raise
 
+    @staticmethod
+    def _labor_rate_event(
+        line: LaborChargeLine,
+        result: RateVerificationResult,
+    ) -> tuple[str, dict, Decimal]:
+        """D8 audit event (event_type, payload, amount) for one verified charge."""
+        if not result.is_valid:
+            return "contract.rate_ceiling_exceeded", {
+                "employee_id": str(line.employee_id),
+                "employee_classification": line.employee_classification,
+                "labor_category": line.labor_category,
+                "charged_rate": str(line.charged_rate),
+                "approved_rate": str(result.approved_rate),
+                "ceiling_rate": str(result.ceiling_rate) if result.ceiling_rate else None,
+                "excess_amount": str(result.excess_amount),
+                "violation_type": result.violation_type.value if result.violation_type else None,
+                "contract_id": str(line.contract_id) if line.contract_id else None,
+                "charge_date": str(line.charge_date),
+                "message": result.message,
+            }, result.excess_amount
+        # Successful verification is posted for the audit trail
+        return "contract.rate_verified", {
+            "employee_id": str(line.employee_id),
+            "labor_category": line.labor_category,
+            "charged_rate": str(line.charged_rate),
+            "approved_rate": str(result.approved_rate),
+            "ceiling_rate": str(result.ceiling_rate) if result.ceiling_rate else None,
+            "is_valid": True,
+            "contract_id": str(line.contract_id) if line.contract_id else None,
+            "charge_date": str(line.charge_date),
+        }, Decimal("0")
+
     # =========================================================================
     # Indirect Rate Management
     # =========================================================================
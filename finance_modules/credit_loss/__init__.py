@@ -39,17 +39,25 @@ adjustments must be documented with methodology and assumptions.
 from finance_modules.credit_loss.config import CreditLossConfig
 from finance_modules.credit_loss.models import (
     CreditPortfolio,
+    ECLCell,
     ECLEstimate,
+    ECLRateMatrix,
     ForwardLookingAdjustment,
     LossRate,
+    PortfolioECLResult,
+    ProvisionRollForward,
     VintageAnalysis,
 )
 
 __all__ = [
     "CreditLossConfig",
     "CreditPortfolio",
+    "ECLCell",
     "ECLEstimate",
+    "ECLRateMatrix",
     "ForwardLookingAdjustment",
     "LossRate",
+    "PortfolioECLResult",
+    "ProvisionRollForward",
     "VintageAnalysis",
 ]
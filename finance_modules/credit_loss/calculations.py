@@ -3,12 +3,30 @@ Credit Loss Calculations — Pure Functions.
 
 CECL methodology calculations: ECL loss rate, PD/LGD,
 vintage loss curves, forward-looking adjustments, and provision changes.
+
+``PortfolioECLAccumulator`` / ``apply_ecl_matrix`` / ``provision_rollforward``
+are the portfolio form: open items are folded into (segment, vintage,
+aging bucket) cells in one streamed pass, the rate matrix is applied per
+cell, and the allowance roll-forward is derived per segment.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date
 from decimal import Decimal
 
+from finance_engines.aging import STANDARD_BUCKETS, AgeBucket
+from finance_kernel.selectors.subledger_selector import OpenItemDTO
+from finance_modules.credit_loss.models import (
+    ECLCell,
+    ECLRateMatrix,
+    ProvisionRollForward,
+)
+
+VINTAGE_GRAINS = ("month", "quarter", "year")
+
 
 def calculate_ecl_loss_rate(
     gross_balance: Decimal,
@@ -76,3 +94,180 @@ def calculate_provision_change(
     Negative = can release allowance (income).
     """
     return new_ecl - existing_allowance
+
+
+def vintage_label(origination: date, grain: str = "month") -> str:
+    """Origination vintage: ``2025-01``, ``2025-Q1`` or ``2025``."""
+    if grain == "month":
+        return f"{origination.year:04d}-{origination.month:02d}"
+    if grain == "quarter":
+        return f"{origination.year:04d}-Q{(origination.month - 1) // 3 + 1}"
+    if grain == "year":
+        return f"{origination.year:04d}"
+    raise ValueError(f"Unknown vintage grain: {grain}")
+
+
+class PortfolioECLAccumulator:
+    """
+    Fold open receivables into (segment, vintage, aging bucket) cells.
+
+    Only per-cell counts and exposure totals are kept, so memory is bounded
+    by the number of cells, not items.  Items are aged in days past due:
+    ``(as_of_date - effective_date) - terms_days``, floored at zero.  The
+    segment is the item's ``segment_key`` dimension, else
+    ``segment_map[entity_id]``, else ``default_segment``.  Open credits
+    (unapplied cash) are not exposure; their total is kept separately.
+    """
+
+    def __init__(
+        self,
+        as_of_date: date,
+        buckets: Sequence[AgeBucket] = STANDARD_BUCKETS,
+        terms_days: int = 0,
+        vintage_grain: str = "month",
+        segment_key: str | None = "segment",
+        segment_map: Mapping[str, str] | None = None,
+        default_segment: str = "default",
+    ) -> None:
+        if not buckets:
+            raise ValueError("At least one aging bucket is required")
+        if vintage_grain not in VINTAGE_GRAINS:
+            raise ValueError(f"Unknown vintage grain: {vintage_grain}")
+        self._as_of = as_of_date
+        self._buckets = tuple(sorted(buckets, key=lambda b: b.min_days))
+        self._mins = [b.min_days for b in self._buckets]
+        self._terms = terms_days
+        self._grain = vintage_grain
+        self._segment_key = segment_key
+        self._segment_map = segment_map or {}
+        self._default_segment = default_segment
+        self._cells: dict[tuple[str, str, str], list] = {}
+        # Many items share an origination date: age/vintage once per date.
+        self._by_date: dict[date, tuple[str, str]] = {}
+        self.item_count = 0
+        self.unapplied_credits = Decimal("0")
+
+    def _classify(self, origination: date) -> tuple[str, str]:
+        age = max((self._as_of - origination).days - self._terms, 0)
+        bucket = self._buckets[bisect_right(self._mins, age) - 1] if age >= self._mins[0] else None
+        if bucket is None or not bucket.contains(age):
+            raise ValueError(f"Age {age} days does not fall into any aging bucket")
+        return vintage_label(origination, self._grain), bucket.name
+
+    def add(self, items: Iterable[OpenItemDTO]) -> None:
+        by_date = self._by_date
+        cells = self._cells
+        segment_key = self._segment_key
+        for item in items:
+            self.item_count += 1
+            if item.open_amount <= 0:
+                self.unapplied_credits -= item.open_amount
+                continue
+            labels = by_date.get(item.effective_date)
+            if labels is None:
+                labels = by_date[item.effective_date] = self._classify(item.effective_date)
+            segment = None
+            if segment_key is not None and item.dimensions:
+                segment = item.dimensions.get(segment_key)
+            if segment is None:
+                segment = self._segment_map.get(item.entity_id, self._default_segment)
+            key = (segment, labels[0], labels[1])
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [1, item.open_amount]
+            else:
+                cell[0] += 1
+                cell[1] += item.open_amount
+
+    def cells(self) -> tuple[ECLCell, ...]:
+        """Exposure cells (no rates applied), ordered by segment, vintage, bucket."""
+        bucket_order = {b.name: i for i, b in enumerate(self._buckets)}
+        return tuple(
+            ECLCell(segment=seg, vintage=vintage, bucket=bucket, item_count=count, exposure=exposure)
+            for (seg, vintage, bucket), (count, exposure) in sorted(
+                self._cells.items(),
+                key=lambda kv: (kv[0][0], kv[0][1], bucket_order[kv[0][2]]),
+            )
+        )
+
+
+def apply_ecl_matrix(
+    cells: Iterable[ECLCell],
+    matrix: ECLRateMatrix,
+) -> tuple[ECLCell, ...]:
+    """
+    Apply a rate matrix to exposure cells.
+
+    Per-cell ECL uses ``calculate_ecl_loss_rate`` / ``calculate_ecl_pd_lgd``,
+    so a cell matches the single-balance calculation for its exposure.
+    Raises ``ValueError`` naming every cell without a rate (or LGD), so an
+    incomplete matrix never silently understates the allowance.
+    """
+    cells = tuple(cells)
+    missing: set[tuple[str, str]] = set()
+    priced: list[ECLCell] = []
+    for cell in cells:
+        key = cell.vintage if matrix.method == "vintage" else cell.bucket
+        rate = matrix.rate_for(cell.segment, key)
+        if rate is None:
+            missing.add((cell.segment, key))
+            continue
+        if matrix.method == "pd_lgd":
+            lgd = matrix.lgd_for(cell.segment)
+            if lgd is None:
+                missing.add((cell.segment, "lgd"))
+                continue
+            ecl = calculate_ecl_pd_lgd(cell.exposure, rate, lgd)
+            loss_rate = rate * lgd
+        else:
+            ecl = calculate_ecl_loss_rate(cell.exposure, rate)
+            loss_rate = rate
+        priced.append(ECLCell(
+            segment=cell.segment,
+            vintage=cell.vintage,
+            bucket=cell.bucket,
+            item_count=cell.item_count,
+            exposure=cell.exposure,
+            loss_rate=loss_rate,
+            ecl_amount=ecl,
+        ))
+    if missing:
+        raise ValueError(f"ECL matrix has no rate for: {sorted(missing)}")
+    return tuple(priced)
+
+
+def provision_rollforward(
+    cells: Iterable[ECLCell],
+    opening_allowance: Mapping[str, Decimal] | None = None,
+    write_offs: Mapping[str, Decimal] | None = None,
+    recoveries: Mapping[str, Decimal] | None = None,
+) -> tuple[ProvisionRollForward, ...]:
+    """
+    Allowance roll-forward per segment; the closing allowance is the ECL.
+
+    provision = closing - opening + write_offs - recoveries.  Segments that
+    only appear in ``opening_allowance`` (no open exposure left) roll to zero.
+    """
+    opening_allowance = opening_allowance or {}
+    write_offs = write_offs or {}
+    recoveries = recoveries or {}
+    closing: dict[str, Decimal] = {}
+    for cell in cells:
+        closing[cell.segment] = closing.get(cell.segment, Decimal("0")) + cell.ecl_amount
+
+    zero = Decimal("0")
+    rows = []
+    for segment in sorted(set(closing) | set(opening_allowance)):
+        opening = opening_allowance.get(segment, zero)
+        written_off = write_offs.get(segment, zero)
+        recovered = recoveries.get(segment, zero)
+        closing_amount = closing.get(segment, zero)
+        rows.append(ProvisionRollForward(
+            segment=segment,
+            opening_allowance=opening,
+            provision=calculate_provision_change(closing_amount, opening) + written_off - recovered,
+            write_offs=written_off,
+            recoveries=recovered,
+            closing_allowance=closing_amount,
+        ))
+    return tuple(rows)
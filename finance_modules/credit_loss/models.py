@@ -28,15 +28,22 @@ Audit relevance
 * ``VintageAnalysis`` records track loss curves for historical validation.
 * ``ForwardLookingAdjustment`` records document macroeconomic overlay
   rationale.
+* ``PortfolioECLResult`` carries the cell-level (segment x vintage x aging
+  bucket) exposure, rate and ECL behind a portfolio run, plus the
+  allowance roll-forward per segment.
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
+ECL_METHODS = ("loss_rate", "pd_lgd", "vintage")
+ANY_SEGMENT = "*"
+
 
 @dataclass(frozen=True)
 class ECLEstimate:
@@ -93,3 +100,96 @@ class ForwardLookingAdjustment:
     adjustment_pct: Decimal  # e.g., 0.10 for 10% increase
     adjusted_rate: Decimal
     rationale: str = ""
+
+
+@dataclass(frozen=True)
+class ECLRateMatrix:
+    """Loss-rate / PD-LGD matrix applied to a portfolio in bulk.
+
+    ``rates`` is keyed by (segment, aging bucket name) for ``loss_rate``
+    (historical loss rate) and ``pd_lgd`` (probability of default), and by
+    (segment, vintage) for ``vintage``.  ``lgd`` maps segment to loss
+    given default.  The segment ``"*"`` is a fallback for any segment.
+    """
+    method: str = "loss_rate"
+    rates: Mapping[tuple[str, str], Decimal] = field(default_factory=dict)
+    lgd: Mapping[str, Decimal] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.method not in ECL_METHODS:
+            raise ValueError(f"Unknown ECL method: {self.method}")
+
+    def rate_for(self, segment: str, key: str) -> Decimal | None:
+        rate = self.rates.get((segment, key))
+        return rate if rate is not None else self.rates.get((ANY_SEGMENT, key))
+
+    def lgd_for(self, segment: str) -> Decimal | None:
+        lgd = self.lgd.get(segment)
+        return lgd if lgd is not None else self.lgd.get(ANY_SEGMENT)
+
+
+@dataclass(frozen=True)
+class ECLCell:
+    """Open exposure and ECL for one (segment, vintage, aging bucket) cell."""
+    segment: str
+    vintage: str
+    bucket: str
+    item_count: int
+    exposure: Decimal
+    loss_rate: Decimal = Decimal("0")
+    ecl_amount: Decimal = Decimal("0")
+
+
+@dataclass(frozen=True)
+class ProvisionRollForward:
+    """Allowance roll-forward for a segment.
+
+    opening + provision - write_offs + recoveries = closing.
+    """
+    segment: str
+    opening_allowance: Decimal
+    provision: Decimal
+    write_offs: Decimal
+    recoveries: Decimal
+    closing_allowance: Decimal
+
+
+@dataclass(frozen=True)
+class PortfolioECLResult:
+    """Result of a portfolio ECL run over the open AR subledger."""
+    as_of_date: date
+    method: str
+    currency: str
+    cells: tuple[ECLCell, ...]
+    rollforward: tuple[ProvisionRollForward, ...]
+    item_count: int
+    unapplied_credits: Decimal = Decimal("0")
+
+    @property
+    def total_exposure(self) -> Decimal:
+        return sum((c.exposure for c in self.cells), Decimal("0"))
+
+    @property
+    def total_ecl(self) -> Decimal:
+        return sum((c.ecl_amount for c in self.cells), Decimal("0"))
+
+    @property
+    def total_provision(self) -> Decimal:
+        return sum((r.provision for r in self.rollforward), Decimal("0"))
+
+    def by_segment(self) -> dict[str, tuple[Decimal, Decimal]]:
+        """Segment -> (exposure, ECL)."""
+        totals: dict[str, tuple[Decimal, Decimal]] = {}
+        for cell in self.cells:
+            exposure, ecl = totals.get(cell.segment, (Decimal("0"), Decimal("0")))
+            totals[cell.segment] = (exposure + cell.exposure, ecl + cell.ecl_amount)
+        return totals
+
+    def by_vintage(self) -> dict[tuple[str, str], tuple[Decimal, Decimal]]:
+        """(segment, vintage) -> (exposure, ECL)."""
+        totals: dict[tuple[str, str], tuple[Decimal, Decimal]] = {}
+        for cell in self.cells:
+            key = (cell.segment, cell.vintage)
+            exposure, ecl = totals.get(key, (Decimal("0"), Decimal("0")))
+            totals[key] = (exposure + cell.exposure, ecl + cell.ecl_amount)
+        return totals
@@ -43,6 +43,7 @@ ASC 326 compliance requires full traceability of loss estimation methodology.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import date
 from decimal import Decimal
 from typing import Any
@@ -50,8 +51,11 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
 
+from finance_engines.aging import STANDARD_BUCKETS, AgeBucket
 from finance_kernel.domain.clock import Clock, SystemClock
+from finance_kernel.domain.subledger_control import SubledgerType
 from finance_kernel.logging_config import get_logger
+from finance_kernel.selectors.subledger_selector import SubledgerSelector
 from finance_kernel.services.journal_writer import RoleResolver
 from finance_kernel.services.party_service import PartyService
 from finance_kernel.services.module_posting_service import (
@@ -68,21 +72,88 @@ from finance_modules.credit_loss.workflows import (
     CREDIT_LOSS_RECORD_WRITE_OFF_WORKFLOW,
 )
 from finance_modules.credit_loss.calculations import (
+    PortfolioECLAccumulator,
+    apply_ecl_matrix,
     apply_forward_looking_adjustment,
     calculate_ecl_loss_rate,
     calculate_ecl_pd_lgd,
     calculate_provision_change,
     calculate_vintage_loss_curve,
+    provision_rollforward,
 )
 from finance_modules.credit_loss.models import (
     ECLEstimate,
+    ECLRateMatrix,
     ForwardLookingAdjustment,
+    PortfolioECLResult,
     VintageAnalysis,
 )
 
 logger = get_logger("modules.credit_loss.service")
 
 
+def portfolio_ecl(
+    session: Session,
+    as_of_date: date,
+    matrix: ECLRateMatrix,
+    currency: str = "USD",
+    opening_allowance: Mapping[str, Decimal] | None = None,
+    write_offs: Mapping[str, Decimal] | None = None,
+    recoveries: Mapping[str, Decimal] | None = None,
+    buckets: Sequence[AgeBucket] = STANDARD_BUCKETS,
+    terms_days: int = 0,
+    vintage_grain: str = "month",
+    segment_key: str | None = "segment",
+    segment_map: Mapping[str, str] | None = None,
+    chunk_size: int = 5000,
+) -> PortfolioECLResult:
+    """
+    Portfolio ECL over the open AR subledger (pure, no posting).
+
+    Open items are read through ``SubledgerSelector.iter_open_item_chunks``
+    (column projections, keyset-paged) and folded into (segment, vintage,
+    aging bucket) cells; the matrix is applied per cell and the allowance
+    roll-forward is derived per segment.  Shared by
+    ``CreditLossService.run_portfolio_ecl`` and the
+    ``credit_loss.ecl_calculation`` batch task.
+    """
+    accumulator = PortfolioECLAccumulator(
+        as_of_date,
+        buckets=buckets,
+        terms_days=terms_days,
+        vintage_grain=vintage_grain,
+        segment_key=segment_key,
+        segment_map=segment_map,
+    )
+    selector = SubledgerSelector(session)
+    for chunk in selector.iter_open_item_chunks(
+        SubledgerType.AR, currency=currency, as_of_date=as_of_date, chunk_size=chunk_size,
+    ):
+        accumulator.add(chunk)
+
+    cells = apply_ecl_matrix(accumulator.cells(), matrix)
+    result = PortfolioECLResult(
+        as_of_date=as_of_date,
+        method=matrix.method,
+        currency=currency,
+        cells=cells,
+        rollforward=provision_rollforward(
+            cells, opening_allowance, write_offs, recoveries,
+        ),
+        item_count=accumulator.item_count,
+        unapplied_credits=accumulator.unapplied_credits,
+    )
+    logger.info("credit_loss_portfolio_ecl", extra={
+        "as_of_date": str(as_of_date),
+        "method": matrix.method,
+        "items": result.item_count,
+        "cells": len(cells),
+        "total_exposure": str(result.total_exposure),
+        "total_ecl": str(result.total_ecl),
+    })
+    return result
+
+
 class CreditLossService:
     """
     Orchestrates ASC 326 (CECL) credit loss operations through calculations
@@ -166,6 +237,43 @@ class CreditLossService:
             method=method,
         )
 
+    def run_portfolio_ecl(
+        self,
+        as_of_date: date,
+        matrix: ECLRateMatrix,
+        currency: str = "USD",
+        opening_allowance: Mapping[str, Decimal] | None = None,
+        write_offs: Mapping[str, Decimal] | None = None,
+        recoveries: Mapping[str, Decimal] | None = None,
+        buckets: Sequence[AgeBucket] = STANDARD_BUCKETS,
+        terms_days: int = 0,
+        vintage_grain: str = "month",
+        segment_key: str | None = "segment",
+        segment_map: Mapping[str, str] | None = None,
+        chunk_size: int = 5000,
+    ) -> PortfolioECLResult:
+        """
+        ECL for the whole open AR subledger in one streamed pass (pure, no posting).
+
+        See ``portfolio_ecl``.  Post the result with ``record_provision`` /
+        ``adjust_provision``.
+        """
+        return portfolio_ecl(
+            self._session,
+            as_of_date,
+            matrix,
+            currency=currency,
+            opening_allowance=opening_allowance,
+            write_offs=write_offs,
+            recoveries=recoveries,
+            buckets=buckets,
+            terms_days=terms_days,
+            vintage_grain=vintage_grain,
+            segment_key=segment_key,
+            segment_map=segment_map,
+            chunk_size=chunk_size,
+        )
+
     # =========================================================================
     # Provision Posting
     # =========================================================================
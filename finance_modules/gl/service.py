@@ -62,16 +62,25 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from datetime import date
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
 
+from finance_engines.fx import (
+    FxRatePoint,
+    FxRateStore,
+    TranslationInput,
+    TrialBalanceTranslation,
+    translate_trial_balance,
+)
 from finance_engines.variance import VarianceCalculator, VarianceResult
 from finance_kernel.domain.clock import Clock, SystemClock
 from finance_kernel.domain.values import Money
 from finance_kernel.logging_config import get_logger
+from finance_kernel.selectors.exchange_rate_selector import ExchangeRateSelector
+from finance_kernel.selectors.ledger_selector import LedgerSelector
 from finance_kernel.services.journal_writer import RoleResolver
 from finance_kernel.services.party_service import PartyService
 from finance_kernel.services.module_posting_service import (
@@ -140,6 +149,7 @@ class GeneralLedgerService:
 
     Engine composition:
     - VarianceCalculator: budget vs actual variance analysis
+    - FxRateStore / translate_trial_balance: whole-TB currency translation
 
     Transaction boundary: this service commits on success, rolls back on failure.
     ModulePostingService runs with auto_commit=False so all engine writes
@@ -170,6 +180,9 @@ class GeneralLedgerService:
         # Stateless engines
         self._variance = VarianceCalculator()
 
+        # In-process FX rate store: (fx_rates change stamp, base currency, store)
+        self._fx_store: tuple[int, str, FxRateStore] | None = None
+
     # =========================================================================
     # Journal Entries
     # =========================================================================
@@ -1135,6 +1148,86 @@ class GeneralLedgerService:
             exchange_rate=exchange_rate,
         )
 
+    def fx_rate_store(self, base_currency: str = "USD") -> FxRateStore:
+        """
+        Shared in-process rate store built from every ``ExchangeRate`` row.
+
+        Rebuilt only when the fx_rates change stamp moves (any ORM write to
+        exchange rates bumps it) or the triangulation base changes, so
+        repeated translations and reports reuse one indexed load.
+        """
+        selector = ExchangeRateSelector(self._session)
+        stamp = selector.change_stamp()
+        cached = self._fx_store
+        if cached is not None and cached[0] == stamp and cached[1] == base_currency:
+            return cached[2]
+
+        store = FxRateStore(
+            (
+                FxRatePoint(
+                    from_currency=row.from_currency,
+                    to_currency=row.to_currency,
+                    effective_date=row.effective_at.date(),
+                    rate=row.rate,
+                )
+                for row in selector.rates()
+            ),
+            base_currency=base_currency,
+        )
+        self._fx_store = (stamp, base_currency, store)
+        logger.info("gl_fx_rate_store_loaded", extra={
+            "fx_rates_stamp": stamp,
+            "rate_count": len(store),
+            "pair_count": len(store.pairs),
+            "base_currency": base_currency,
+        })
+        return store
+
+    def translate_trial_balance(
+        self,
+        as_of_date: date,
+        period_start: date,
+        target_currency: str = "USD",
+        historical_rates: dict[tuple[str, str], Decimal] | None = None,
+        base_currency: str = "USD",
+    ) -> TrialBalanceTranslation:
+        """
+        Translate the whole multi-currency trial balance in one pass.
+
+        Pure calculation — no posting.  Reads every (account, currency)
+        balance as of ``as_of_date`` with one grouped query, translates
+        balance sheet accounts at the closing rate, income statement
+        accounts at the ``period_start``..``as_of_date`` average rate, and
+        equity at ``historical_rates`` (keyed by (account_code, currency)).
+        The result's ``cta_amount`` / ``cta_by_currency`` feed a single
+        ``record_cta`` posting.
+        """
+        store = self.fx_rate_store(base_currency)
+        balances = [
+            TranslationInput(
+                account_code=row.account_code,
+                account_type=row.account_type,
+                currency=row.currency,
+                balance=row.balance,
+            )
+            for row in LedgerSelector(self._session).trial_balance(as_of_date=as_of_date)
+        ]
+        translation = translate_trial_balance(
+            balances,
+            store,
+            target_currency,
+            as_of=as_of_date,
+            period_start=period_start,
+            historical_rates=historical_rates,
+        )
+        logger.info("gl_translate_trial_balance", extra={
+            "as_of_date": as_of_date.isoformat(),
+            "target_currency": target_currency,
+            "line_count": len(translation.lines),
+            "cta_amount": str(translation.cta_amount),
+        })
+        return translation
+
     def record_cta(
         self,
         entity_id: str,
@@ -1144,12 +1237,16 @@ class GeneralLedgerService:
         actor_id: UUID,
         currency: str = "USD",
         source_currency: str | None = None,
+        cta_by_currency: Sequence[tuple[str, Decimal]] | None = None,
     ) -> ModulePostingResult:
         """
         Record a Cumulative Translation Adjustment (CTA) to equity.
 
         Posts via fx.translation_adjustment profile (Dr Unrealized FX Loss /
-        Cr CTA equity account). Typically called after translate_balances().
+        Cr CTA equity account). Typically called after translate_balances(),
+        or once per run with a ``translate_trial_balance()`` result's
+        ``cta_amount`` and ``cta_by_currency`` breakdown (carried on the
+        event payload for audit).
 
         Profile: fx.translation_adjustment -> FXTranslationAdjustment
         """
@@ -1184,6 +1281,11 @@ class GeneralLedgerService:
                     "period": period,
                     "cta_amount": str(cta_amount),
                     "source_currency": source_currency,
+                    **({
+                        "cta_by_currency": {
+                            ccy: str(amount) for ccy, amount in cta_by_currency
+                        },
+                    } if cta_by_currency else {}),
                 },
                 effective_date=effective_date,
                 actor_id=actor_id,
@@ -1214,7 +1316,13 @@ class GeneralLedgerService:
         Run period-end FX revaluation for multiple currencies.
 
         Loops existing record_fx_unrealized_gain/loss methods for each entry.
-        Each entry dict should have: original_currency, amount, is_gain (bool).
+        Each entry dict has ``original_currency`` and either a precomputed
+        ``amount`` and ``is_gain`` (bool), or ``foreign_amount`` and
+        ``booked_amount``: the open balance in ``original_currency`` and
+        its carrying value in ``currency``.  The latter is revalued at the
+        closing rate on ``effective_date`` from ``fx_rate_store`` and the
+        difference, rounded to cents, is posted as the gain or loss (none
+        when it is zero).
 
         Returns RevaluationResult summarizing the run.
         """
@@ -1223,6 +1331,7 @@ class GeneralLedgerService:
         total_gain = Decimal("0")
         total_loss = Decimal("0")
         entries_posted = 0
+        store: FxRateStore | None = None
 
         logger.info("gl_period_end_revaluation_started", extra={
             "entry_count": len(revaluation_entries),
@@ -1231,9 +1340,28 @@ class GeneralLedgerService:
         })
 
         for entry in revaluation_entries:
-            amount = Decimal(str(entry["amount"]))
             original_currency = entry.get("original_currency")
-            is_gain = entry.get("is_gain", True)
+            if "amount" in entry:
+                amount = Decimal(str(entry["amount"]))
+                is_gain = entry.get("is_gain", True)
+            else:
+                if store is None:
+                    store = self.fx_rate_store(currency)
+                rate = store.rate(original_currency, currency, effective_date)
+                revalued = (Decimal(str(entry["foreign_amount"])) * rate).quantize(
+                    Decimal("0.01"), rounding=ROUND_HALF_UP,
+                )
+                difference = revalued - Decimal(str(entry["booked_amount"]))
+                logger.info("gl_revaluation_rate_applied", extra={
+                    "original_currency": original_currency,
+                    "rate": str(rate),
+                    "revalued_amount": str(revalued),
+                    "difference": str(difference),
+                })
+                if not difference:
+                    continue
+                amount = abs(difference)
+                is_gain = difference > 0
 
             if is_gain:
                 result = self.record_fx_unrealized_gain(
@@ -41,6 +41,7 @@ from finance_modules.lease.models import (
     AmortizationScheduleLine,
     Lease,
     LeaseClassification,
+    LeaseDisclosure,
     LeaseLiability,
     LeaseModification,
     LeasePayment,
@@ -52,6 +53,7 @@ __all__ = [
     "AmortizationScheduleLine",
     "Lease",
     "LeaseClassification",
+    "LeaseDisclosure",
     "LeaseLiability",
     "LeaseModification",
     "LeasePayment",
@@ -2,8 +2,8 @@
 Lease Accounting Pure Calculation Functions — ASC 842.
 
 Domain math that engines don't cover:
-- Present value of lease payments
-- Amortization schedule building
+- Present value of lease payments (closed-form annuity factor)
+- Amortization schedule building (memoised per set of terms)
 - Lease classification test
 - Liability remeasurement
 - ROU asset adjustment
@@ -11,7 +11,31 @@ Domain math that engines don't cover:
 
 from collections.abc import Sequence
 from datetime import date, timedelta
-from decimal import Decimal
+from decimal import Decimal, localcontext
+from functools import lru_cache
+
+from finance_modules.lease.models import AmortizationScheduleLine
+
+# Working precision for annuity factors; results are quantized to cents.
+ANNUITY_PRECISION = 34
+SCHEDULE_CACHE_SIZE = 4096
+
+
+def annuity_factor(rate_per_period: Decimal, num_periods: int) -> Decimal:
+    """
+    Present-value factor of a level annuity in closed form.
+
+    factor = (1 - (1 + r)^-n) / r, evaluated once at ``ANNUITY_PRECISION``
+    significant digits (Decimal integer powers are correctly rounded), so
+    cost does not grow with ``num_periods``.  A non-positive rate gives n.
+    """
+    if num_periods <= 0:
+        return Decimal("0")
+    if rate_per_period <= 0:
+        return Decimal(num_periods)
+    with localcontext() as ctx:
+        ctx.prec = ANNUITY_PRECISION
+        return (1 - (1 + rate_per_period) ** -num_periods) / rate_per_period
 
 
 def present_value(
@@ -27,14 +51,7 @@ def present_value(
     if rate_per_period <= 0 or num_periods <= 0:
         return payment * Decimal(str(num_periods))
 
-    one_plus_r = Decimal("1") + rate_per_period
-    # (1 + r)^-n
-    discount_factor = Decimal("1")
-    for _ in range(num_periods):
-        discount_factor /= one_plus_r
-
-    pv_factor = (Decimal("1") - discount_factor) / rate_per_period
-    return (payment * pv_factor).quantize(Decimal("0.01"))
+    return (payment * annuity_factor(rate_per_period, num_periods)).quantize(Decimal("0.01"))
 
 
 def build_amortization_schedule(
@@ -49,6 +66,53 @@ def build_amortization_schedule(
 
     Returns list of dicts with: period, payment_date, payment, interest, principal, balance.
     """
+    return [
+        {
+            "period": line.period,
+            "payment_date": line.payment_date,
+            "payment": line.payment,
+            "interest": line.interest,
+            "principal": line.principal,
+            "balance": line.balance,
+        }
+        for line in amortization_schedule_lines(
+            principal, rate_per_period, payment, num_periods, start_date,
+        )
+    ]
+
+
+def amortization_schedule_lines(
+    principal: Decimal,
+    rate_per_period: Decimal,
+    payment: Decimal,
+    num_periods: int,
+    start_date: date,
+) -> tuple[AmortizationScheduleLine, ...]:
+    """
+    Amortization schedule as frozen lines, memoised on the lease terms.
+
+    A lease version is fully determined by these terms, so repeated
+    requests for the same version reuse one immutable schedule.  Equal
+    Decimals of different scale (``100`` and ``100.00``) hash alike, so
+    the cache is keyed on their exact string form: each scale gets its
+    own entry and the lines keep the caller's exponents.
+    """
+    return _amortization_schedule_lines(
+        str(principal), str(rate_per_period), str(payment), num_periods, start_date,
+    )
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _amortization_schedule_lines(
+    principal_text: str,
+    rate_text: str,
+    payment_text: str,
+    num_periods: int,
+    start_date: date,
+) -> tuple[AmortizationScheduleLine, ...]:
+    principal = Decimal(principal_text)
+    rate_per_period = Decimal(rate_text)
+    payment = Decimal(payment_text)
     schedule = []
     balance = principal
 
@@ -64,16 +128,16 @@ def build_amortization_schedule(
 
         payment_date = start_date + timedelta(days=30 * period)
 
-        schedule.append({
-            "period": period,
-            "payment_date": payment_date,
-            "payment": payment,
-            "interest": interest,
-            "principal": principal_portion,
-            "balance": max(balance, Decimal("0")),
-        })
+        schedule.append(AmortizationScheduleLine(
+            period=period,
+            payment_date=payment_date,
+            payment=payment,
+            interest=interest,
+            principal=principal_portion,
+            balance=max(balance, Decimal("0")),
+        ))
 
-    return schedule
+    return tuple(schedule)
 
 
 def classify_lease_type(
@@ -28,6 +28,8 @@ Audit relevance
 * ``ROUAsset`` and ``LeaseLiability`` records support balance sheet
   disclosure requirements.
 * ``LeaseModification`` records track re-measurement events.
+* ``LeaseDisclosure`` carries the ASC 842-20-50 maturity analysis and
+  weighted-average rate / term for one lease classification.
 """
 
 from dataclasses import dataclass, field
@@ -128,3 +130,26 @@ class LeaseModification:
     new_end_date: date | None = None
     remeasurement_amount: Decimal = Decimal("0")
     actor_id: UUID | None = None
+
+
+MATURITY_BUCKETS = ("year_1", "year_2", "year_3", "year_4", "year_5", "thereafter")
+
+
+@dataclass(frozen=True)
+class LeaseDisclosure:
+    """Portfolio disclosure for one classification, from stored schedules.
+
+    ``maturity`` pairs each of ``MATURITY_BUCKETS`` with the undiscounted
+    payments falling due in it; imputed interest is the future interest in
+    the schedules, so lease_liability = total_undiscounted - imputed_interest.
+    Weighted averages are weighted by each lease's remaining payments.
+    """
+    classification: str
+    as_of_date: date
+    lease_count: int
+    maturity: tuple[tuple[str, Decimal], ...]
+    total_undiscounted: Decimal
+    imputed_interest: Decimal
+    lease_liability: Decimal
+    weighted_average_discount_rate: Decimal
+    weighted_average_remaining_term_months: Decimal
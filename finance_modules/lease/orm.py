@@ -9,7 +9,8 @@ Architecture position:
     **Modules layer** -- ORM models inheriting from ``TrackedBase``
     (kernel DB base).  These models persist ASC 842 concepts:
     leases, lease payments, right-of-use (ROU) assets, lease
-    liabilities, and lease modifications.
+    liabilities, lease modifications, and versioned amortization
+    schedules.
 
 Invariants enforced:
     - All monetary fields use Decimal (maps to Numeric(38,9) via TrackedBase).
@@ -28,6 +29,8 @@ Audit relevance:
     - ROUAssetModel and LeaseLiabilityModel support balance sheet
       disclosure requirements.
     - LeaseModificationModel tracks re-measurement events.
+    - LeaseScheduleLineModel stores each schedule version, so maturity
+      analyses are reproducible from stored rows.
 """
 
 from datetime import date
@@ -474,3 +477,86 @@ class LeaseModificationModel(TrackedBase):
             f"<LeaseModificationModel lease={self.lease_id} "
             f"date={self.modification_date}>"
         )
+
+
+# =============================================================================
+# Amortization Schedule
+# =============================================================================
+
+
+class LeaseScheduleLineModel(TrackedBase):
+    """
+    One line of a stored lease amortization schedule.
+
+    Contract:
+        Lines are written once per (lease, schedule_version); a modification
+        that changes the terms writes the next version rather than updating
+        rows.  The current schedule is the highest version for the lease.
+        ``discount_rate`` is the annual rate the version was computed at, so
+        disclosures read the effective rate after a remeasurement.
+
+    Guarantees:
+        - ``lease_id`` references lease_leases.id.
+        - (lease_id, schedule_version, period) is unique
+          (uq_lease_schedule_line).
+        - All monetary fields are Decimal (Numeric(38,9)).
+    """
+
+    __tablename__ = "lease_schedule_lines"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "lease_id", "schedule_version", "period", name="uq_lease_schedule_line",
+        ),
+        Index("idx_lease_schedule_payment_date", "payment_date"),
+    )
+
+    lease_id: Mapped[UUID] = mapped_column(
+        UUIDString(),
+        ForeignKey("lease_leases.id"),
+        nullable=False,
+    )
+    schedule_version: Mapped[int] = mapped_column(nullable=False)
+    period: Mapped[int] = mapped_column(nullable=False)
+    payment_date: Mapped[date] = mapped_column(Date, nullable=False)
+    payment: Mapped[Decimal] = mapped_column(nullable=False)
+    interest: Mapped[Decimal] = mapped_column(nullable=False)
+    principal: Mapped[Decimal] = mapped_column(nullable=False)
+    balance: Mapped[Decimal] = mapped_column(nullable=False)
+    discount_rate: Mapped[Decimal | None] = mapped_column(nullable=True)
+
+    def to_dto(self):
+        from finance_modules.lease.models import AmortizationScheduleLine
+
+        return AmortizationScheduleLine(
+            period=self.period,
+            payment_date=self.payment_date,
+            payment=self.payment,
+            interest=self.interest,
+            principal=self.principal,
+            balance=self.balance,
+        )
+
+    @classmethod
+    def from_dto(
+        cls, dto, lease_id: UUID, schedule_version: int, created_by_id: UUID,
+        discount_rate: Decimal | None = None,
+    ) -> "LeaseScheduleLineModel":
+        return cls(
+            lease_id=lease_id,
+            schedule_version=schedule_version,
+            period=dto.period,
+            payment_date=dto.payment_date,
+            payment=dto.payment,
+            interest=dto.interest,
+            principal=dto.principal,
+            balance=dto.balance,
+            discount_rate=discount_rate,
+            created_by_id=created_by_id,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LeaseScheduleLineModel {self.lease_id} v{self.schedule_version} "
+            f"#{self.period} balance={self.balance}>"
+        )
@@ -14,7 +14,7 @@ Architecture position
 ---------------------
 **Modules layer** -- thin ERP glue.  ``LeaseAccountingService`` is the
 sole public entry point for lease operations.  It composes pure calculation
-functions (``present_value``, ``build_amortization_schedule``,
+functions (``present_value``, ``amortization_schedule_lines``,
 ``classify_lease_type``, ``remeasure_liability``, ``calculate_rou_adjustment``)
 and the kernel ``ModulePostingService``.
 
@@ -50,6 +50,7 @@ from datetime import date, timedelta
 from decimal import Decimal
 from uuid import UUID, uuid4
 
+from sqlalchemy import case, func, insert, select
 from sqlalchemy.orm import Session
 
 from finance_kernel.domain.clock import Clock, SystemClock
@@ -72,16 +73,18 @@ from finance_modules.lease.workflows import (
     LEASE_TERMINATE_EARLY_WORKFLOW,
 )
 from finance_modules.lease.calculations import (
-    build_amortization_schedule,
+    amortization_schedule_lines,
     calculate_rou_adjustment,
     classify_lease_type,
     present_value,
     remeasure_liability,
 )
 from finance_modules.lease.models import (
+    MATURITY_BUCKETS,
     AmortizationScheduleLine,
     Lease,
     LeaseClassification,
+    LeaseDisclosure,
     LeaseLiability,
     LeaseModification,
     LeasePayment,
@@ -93,6 +96,7 @@ from finance_modules.lease.orm import (
     LeaseModel,
     LeaseModificationModel,
     LeasePaymentModel,
+    LeaseScheduleLineModel,
     ROUAssetModel,
 )
 
@@ -124,8 +128,9 @@ class LeaseAccountingService:
     * Does NOT own account-code resolution (delegated to kernel via ROLES).
     * Does NOT enforce fiscal-period locks directly (kernel ``PeriodService``
       handles R12/R13).
-    * Does NOT persist lease domain models -- only journal entries are
-      persisted.
+    * Stored amortization schedules are versioned per lease and never
+      updated in place; ``get_amortization_schedule`` memoises each
+      (lease, version) after the first read.
     """
 
     def __init__(
@@ -139,6 +144,8 @@ class LeaseAccountingService:
         self._session = session
         self._clock = clock or SystemClock()
         self._workflow_executor = workflow_executor
+        # (lease_id, schedule_version) -> stored schedule (versions are immutable)
+        self._schedules: dict[tuple[UUID, int], tuple[AmortizationScheduleLine, ...]] = {}
 
         self._poster = ModulePostingService(
             session=session,
@@ -290,6 +297,16 @@ class LeaseAccountingService:
                 self._session.add(orm_rou)
                 orm_liability = LeaseLiabilityModel.from_dto(liability, created_by_id=actor_id)
                 self._session.add(orm_liability)
+                self._session.flush()
+                self._store_schedule(
+                    lease_id,
+                    amortization_schedule_lines(
+                        liability_value, monthly_rate, monthly_payment,
+                        lease_term_months, commencement_date,
+                    ),
+                    discount_rate,
+                    actor_id,
+                )
                 self._session.commit()
             else:
                 self._session.rollback()
@@ -317,24 +334,8 @@ class LeaseAccountingService:
         Pure calculation — no posting.
         """
         monthly_rate = discount_rate / Decimal("12")
-        schedule_data = build_amortization_schedule(
-            principal=principal,
-            rate_per_period=monthly_rate,
-            payment=monthly_payment,
-            num_periods=num_periods,
-            start_date=start_date,
-        )
-
-        schedule = tuple(
-            AmortizationScheduleLine(
-                period=line["period"],
-                payment_date=line["payment_date"],
-                payment=line["payment"],
-                interest=line["interest"],
-                principal=line["principal"],
-                balance=line["balance"],
-            )
-            for line in schedule_data
+        schedule = amortization_schedule_lines(
+            principal, monthly_rate, monthly_payment, num_periods, start_date,
         )
 
         logger.info("lease_schedule_generated", extra={
@@ -343,6 +344,73 @@ class LeaseAccountingService:
         })
         return schedule
 
+    def get_amortization_schedule(
+        self,
+        lease_id: UUID,
+        schedule_version: int | None = None,
+    ) -> tuple[AmortizationScheduleLine, ...]:
+        """
+        Stored schedule for a lease (latest version by default).
+
+        Pure query — no posting.  Returns () when nothing is stored.
+        """
+        if schedule_version is None:
+            schedule_version = self._current_schedule_version(lease_id)
+            if schedule_version == 0:
+                return ()
+        key = (lease_id, schedule_version)
+        cached = self._schedules.get(key)
+        if cached is None:
+            rows = self._session.execute(
+                select(LeaseScheduleLineModel)
+                .where(
+                    LeaseScheduleLineModel.lease_id == lease_id,
+                    LeaseScheduleLineModel.schedule_version == schedule_version,
+                )
+                .order_by(LeaseScheduleLineModel.period)
+            ).scalars().all()
+            cached = tuple(row.to_dto() for row in rows)
+            if cached:
+                self._schedules[key] = cached
+        return cached
+
+    def _current_schedule_version(self, lease_id: UUID) -> int:
+        return self._session.execute(
+            select(func.coalesce(func.max(LeaseScheduleLineModel.schedule_version), 0))
+            .where(LeaseScheduleLineModel.lease_id == lease_id)
+        ).scalar_one()
+
+    def _store_schedule(
+        self,
+        lease_id: UUID,
+        schedule: tuple[AmortizationScheduleLine, ...],
+        discount_rate: Decimal,
+        actor_id: UUID,
+    ) -> int:
+        """Bulk-insert ``schedule`` as the lease's next version; caller commits."""
+        version = self._current_schedule_version(lease_id) + 1
+        if schedule:
+            self._session.execute(
+                insert(LeaseScheduleLineModel),
+                [
+                    {
+                        "lease_id": lease_id,
+                        "schedule_version": version,
+                        "period": line.period,
+                        "payment_date": line.payment_date,
+                        "payment": line.payment,
+                        "interest": line.interest,
+                        "principal": line.principal,
+                        "balance": line.balance,
+                        "discount_rate": discount_rate,
+                        "created_by_id": actor_id,
+                    }
+                    for line in schedule
+                ],
+            )
+            self._schedules[(lease_id, version)] = schedule
+        return version
+
     # =========================================================================
     # Periodic Payment
     # =========================================================================
@@ -549,17 +617,25 @@ class LeaseAccountingService:
         actor_id: UUID,
         description: str = "",
         currency: str = "USD",
+        new_monthly_payment: Decimal | None = None,
+        new_discount_rate: Decimal | None = None,
+        remaining_periods: int | None = None,
     ) -> tuple[LeaseModification, ModulePostingResult]:
         """
         Record a lease modification with liability remeasurement.
 
-        Posts via lease.modified (Dr ROU Asset / Cr Lease Liability).
+        Posts via lease.modified (Dr ROU Asset / Cr Lease Liability) and
+        marks the lease MODIFIED.  When the new payment, discount rate and
+        remaining periods are given, the remeasured schedule is stored as the
+        lease's next schedule version at the new rate, which also becomes the
+        lease's current discount rate.
         """
         modification = LeaseModification(
             id=uuid4(),
             lease_id=lease_id,
             modification_date=modification_date,
             description=description,
+            new_monthly_payment=new_monthly_payment,
             remeasurement_amount=remeasurement_amount,
             actor_id=actor_id,
         )
@@ -601,6 +677,32 @@ class LeaseAccountingService:
             if result.is_success:
                 orm_mod = LeaseModificationModel.from_dto(modification, created_by_id=actor_id)
                 self._session.add(orm_mod)
+                orm_lease = self._session.get(LeaseModel, lease_id)
+                if orm_lease is not None:
+                    orm_lease.status = LeaseStatus.MODIFIED.value
+                    if new_monthly_payment is not None:
+                        orm_lease.monthly_payment = new_monthly_payment
+                    if new_discount_rate is not None:
+                        orm_lease.discount_rate = new_discount_rate
+                if (
+                    new_monthly_payment is not None
+                    and new_discount_rate is not None
+                    and remaining_periods
+                ):
+                    monthly_rate = new_discount_rate / Decimal("12")
+                    self._store_schedule(
+                        lease_id,
+                        amortization_schedule_lines(
+                            remeasure_liability(
+                                Decimal("0"), new_monthly_payment, monthly_rate,
+                                remaining_periods,
+                            ),
+                            monthly_rate, new_monthly_payment, remaining_periods,
+                            modification_date,
+                        ),
+                        new_discount_rate,
+                        actor_id,
+                    )
                 self._session.commit()
             else:
                 self._session.rollback()
@@ -677,9 +779,23 @@ class LeaseAccountingService:
 
     def get_lease_portfolio(
         self,
-        leases: list[Lease],
+        leases: list[Lease] | None = None,
     ) -> dict:
-        """Query lease portfolio summary."""
+        """Query lease portfolio summary.
+
+        Without ``leases``, counts come from one GROUP BY over the stored
+        leases instead of a caller-built list.
+        """
+        if leases is None:
+            counts = dict(self._session.execute(
+                select(LeaseModel.classification, func.count())
+                .group_by(LeaseModel.classification)
+            ).all())
+            return {
+                "total_leases": sum(counts.values()),
+                "finance_leases": counts.get(LeaseClassification.FINANCE.value, 0),
+                "operating_leases": counts.get(LeaseClassification.OPERATING.value, 0),
+            }
         finance_count = sum(1 for l in leases if l.classification == LeaseClassification.FINANCE)
         operating_count = sum(1 for l in leases if l.classification == LeaseClassification.OPERATING)
         return {
@@ -702,3 +818,115 @@ class LeaseAccountingService:
             "total_lease_liabilities": str(total_liability),
             "lease_count": len(leases),
         }
+
+    def get_portfolio_disclosures(
+        self,
+        as_of_date: date,
+    ) -> tuple[LeaseDisclosure, ...]:
+        """
+        ASC 842-20-50 maturity analysis and weighted averages per classification.
+
+        One aggregation over the current stored schedule of every active or
+        modified lease: remaining (payment_date > as_of_date) payments are
+        bucketed by year, and per-lease remaining payments, principal and
+        period counts feed the weighted-average discount rate and remaining
+        term.  The rate is the one the current schedule version was computed
+        at, falling back to the lease's rate for versions stored without one.
+        Pure query — no posting.
+        """
+        boundaries = [_add_years(as_of_date, k) for k in range(1, 6)]
+        current = (
+            select(
+                LeaseScheduleLineModel.lease_id,
+                func.max(LeaseScheduleLineModel.schedule_version).label("version"),
+            )
+            .group_by(LeaseScheduleLineModel.lease_id)
+            .subquery()
+        )
+        line = LeaseScheduleLineModel
+        rate = func.coalesce(line.discount_rate, LeaseModel.discount_rate)
+        bucket_sums = [
+            func.sum(case(
+                (
+                    (line.payment_date > (boundaries[i - 1] if i else as_of_date))
+                    & (line.payment_date <= boundaries[i]),
+                    line.payment,
+                ),
+                else_=Decimal("0"),
+            ))
+            for i in range(5)
+        ]
+        bucket_sums.append(func.sum(case(
+            (line.payment_date > boundaries[-1], line.payment), else_=Decimal("0"),
+        )))
+        rows = self._session.execute(
+            select(
+                LeaseModel.classification,
+                func.max(rate),
+                func.count(),
+                func.sum(line.payment),
+                func.sum(line.principal),
+                *bucket_sums,
+            )
+            .select_from(line)
+            .join(current, (current.c.lease_id == line.lease_id)
+                  & (current.c.version == line.schedule_version))
+            .join(LeaseModel, LeaseModel.id == line.lease_id)
+            .where(
+                line.payment_date > as_of_date,
+                LeaseModel.status.in_([
+                    LeaseStatus.ACTIVE.value, LeaseStatus.MODIFIED.value,
+                ]),
+            )
+            .group_by(LeaseModel.id, LeaseModel.classification)
+        ).all()
+
+        zero = Decimal("0")
+        totals: dict[str, dict] = {}
+        for classification, rate, periods, payments, principal, *buckets in rows:
+            acc = totals.setdefault(classification, {
+                "count": 0, "payments": zero, "principal": zero,
+                "rate_weight": zero, "term_weight": zero,
+                "buckets": [zero] * len(MATURITY_BUCKETS),
+            })
+            acc["count"] += 1
+            acc["payments"] += payments
+            acc["principal"] += principal
+            acc["rate_weight"] += rate * payments
+            acc["term_weight"] += periods * payments
+            acc["buckets"] = [a + (b or zero) for a, b in zip(acc["buckets"], buckets)]
+
+        disclosures = []
+        for classification in sorted(totals):
+            acc = totals[classification]
+            payments = acc["payments"]
+            disclosures.append(LeaseDisclosure(
+                classification=classification,
+                as_of_date=as_of_date,
+                lease_count=acc["count"],
+                maturity=tuple(zip(MATURITY_BUCKETS, acc["buckets"])),
+                total_undiscounted=payments,
+                imputed_interest=payments - acc["principal"],
+                lease_liability=acc["principal"],
+                weighted_average_discount_rate=(
+                    (acc["rate_weight"] / payments).quantize(Decimal("0.0001"))
+                    if payments else zero
+                ),
+                weighted_average_remaining_term_months=(
+                    (acc["term_weight"] / payments).quantize(Decimal("0.1"))
+                    if payments else zero
+                ),
+            ))
+
+        logger.info("lease_portfolio_disclosures", extra={
+            "as_of_date": str(as_of_date),
+            "leases": sum(d.lease_count for d in disclosures),
+        })
+        return tuple(disclosures)
+
+
+def _add_years(start: date, years: int) -> date:
+    try:
+        return start.replace(year=start.year + years)
+    except ValueError:  # 29 February
+        return start.replace(year=start.year + years, day=28)
@@ -46,6 +46,8 @@ from finance_modules.payroll.models import (
     Paycheck,
     PayPeriod,
     PayrollRun,
+    PayRunInput,
+    PayRunResult,
     Timecard,
     WithholdingResult,
 )
@@ -61,6 +63,8 @@ __all__ = [
     "PayrollRun",
     "Paycheck",
     "WithholdingResult",
+    "PayRunInput",
+    "PayRunResult",
     "PAYROLL_PROFILES",
     "PAYROLL_RUN_WORKFLOW",
     "PayrollConfig",
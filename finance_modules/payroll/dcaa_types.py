@@ -107,7 +107,12 @@ class TimesheetEntry:
             raise ValueError(
                 f"TimesheetEntry hours cannot exceed 24: {self.hours}"
             )
-        if self.start_time and self.end_time and self.end_time <= self.start_time:
+        # Zero-length intervals are allowed only for zero-hour entries
+        # (markers); D4 overlap detection ignores them.
+        if self.start_time and self.end_time and (
+            self.end_time < self.start_time
+            or (self.end_time == self.start_time and self.hours > Decimal("0"))
+        ):
             raise ValueError(
                 f"end_time ({self.end_time}) must be after "
                 f"start_time ({self.start_time})"
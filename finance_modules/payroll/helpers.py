@@ -4,7 +4,8 @@ Payroll Helpers (``finance_modules.payroll.helpers``).
 Responsibility
 --------------
 Pure calculation functions for US payroll tax withholding (federal,
-state, FICA) and NACHA/ACH batch generation.  These are textbook
+state, FICA), a batch gross-to-net calculator for whole pay runs, and
+NACHA/ACH batch generation.  These are textbook
 payroll-tax formulas and a structured format builder with no side
 effects.
 
@@ -18,6 +19,8 @@ Invariants enforced
 * All numeric inputs and outputs use ``Decimal`` -- NEVER ``float``.
 * Results are quantized to 2 decimal places.
 * Social Security wage-base cap is enforced per pay period.
+* ``calculate_pay_run`` produces, for every employee, exactly the values
+  the single-employee helpers produce.
 
 Failure modes
 -------------
@@ -35,8 +38,58 @@ supports direct-deposit audit trail requirements.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
 from decimal import Decimal
 
+from finance_modules.payroll.models import PayRunInput, PayRunResult
+
+_ZERO = Decimal("0")
+_CENT = Decimal("0.01")
+_ALLOWANCE_PER_PERIOD = Decimal("358.33")
+
+# Simplified 2024 per-period brackets: (upper limit, marginal rate).
+_FEDERAL_BRACKETS: dict[str, tuple[tuple[Decimal, Decimal], ...]] = {
+    "married": (
+        (Decimal("958"), Decimal("0.10")),
+        (Decimal("2883"), Decimal("0.12")),
+        (Decimal("6958"), Decimal("0.22")),
+        (Decimal("12708"), Decimal("0.24")),
+        (Decimal("18375"), Decimal("0.32")),
+        (Decimal("22542"), Decimal("0.35")),
+        (Decimal("999999"), Decimal("0.37")),
+    ),
+    "single": (
+        (Decimal("479"), Decimal("0.10")),
+        (Decimal("1923"), Decimal("0.12")),
+        (Decimal("3960"), Decimal("0.22")),
+        (Decimal("7356"), Decimal("0.24")),
+        (Decimal("9189"), Decimal("0.32")),
+        (Decimal("11271"), Decimal("0.35")),
+        (Decimal("999999"), Decimal("0.37")),
+    ),
+}
+
+# Same tables as (bracket width, rate), for the batch calculator.
+_FEDERAL_WIDTHS: dict[str, tuple[tuple[Decimal, Decimal], ...]] = {
+    status: tuple(
+        (limit - prev, rate)
+        for (limit, rate), prev in zip(
+            brackets, (_ZERO,) + tuple(limit for limit, _ in brackets[:-1]),
+        )
+    )
+    for status, brackets in _FEDERAL_BRACKETS.items()
+}
+
+_SS_WAGE_BASE = Decimal("168600")
+_SS_RATE = Decimal("0.062")
+_MEDICARE_RATE = Decimal("0.0145")
+_ADDITIONAL_MEDICARE_THRESHOLD = Decimal("200000")
+_ADDITIONAL_MEDICARE_RATE = Decimal("0.009")
+
+# Employees per executor task in calculate_pay_run.
+_PAY_RUN_CHUNK = 5_000
+
 
 def calculate_federal_withholding(
     gross_pay: Decimal,
@@ -57,29 +110,13 @@ def calculate_federal_withholding(
         - Returns federal withholding as ``Decimal`` quantized to 0.01.
         - Returns ``Decimal("0")`` if taxable income (after allowances) <= 0.
     """
-    allowance_amount = Decimal(str(allowances)) * Decimal("358.33")
+    allowance_amount = Decimal(str(allowances)) * _ALLOWANCE_PER_PERIOD
     taxable = max(Decimal("0"), gross_pay - allowance_amount)
 
     if filing_status == "married":
-        brackets = [
-            (Decimal("958"), Decimal("0.10")),
-            (Decimal("2883"), Decimal("0.12")),
-            (Decimal("6958"), Decimal("0.22")),
-            (Decimal("12708"), Decimal("0.24")),
-            (Decimal("18375"), Decimal("0.32")),
-            (Decimal("22542"), Decimal("0.35")),
-            (Decimal("999999"), Decimal("0.37")),
-        ]
+        brackets = _FEDERAL_BRACKETS["married"]
     else:
-        brackets = [
-            (Decimal("479"), Decimal("0.10")),
-            (Decimal("1923"), Decimal("0.12")),
-            (Decimal("3960"), Decimal("0.22")),
-            (Decimal("7356"), Decimal("0.24")),
-            (Decimal("9189"), Decimal("0.32")),
-            (Decimal("11271"), Decimal("0.35")),
-            (Decimal("999999"), Decimal("0.37")),
-        ]
+        brackets = _FEDERAL_BRACKETS["single"]
 
     tax = Decimal("0")
     remaining = taxable
@@ -118,11 +155,11 @@ def calculate_state_withholding(
 def calculate_fica(
     gross_pay: Decimal,
     ytd_earnings: Decimal = Decimal("0"),
-    ss_wage_base: Decimal = Decimal("168600"),
-    ss_rate: Decimal = Decimal("0.062"),
-    medicare_rate: Decimal = Decimal("0.0145"),
-    additional_medicare_threshold: Decimal = Decimal("200000"),
-    additional_medicare_rate: Decimal = Decimal("0.009"),
+    ss_wage_base: Decimal = _SS_WAGE_BASE,
+    ss_rate: Decimal = _SS_RATE,
+    medicare_rate: Decimal = _MEDICARE_RATE,
+    additional_medicare_threshold: Decimal = _ADDITIONAL_MEDICARE_THRESHOLD,
+    additional_medicare_rate: Decimal = _ADDITIONAL_MEDICARE_RATE,
 ) -> tuple[Decimal, Decimal]:
     """
     Calculate FICA taxes (Social Security + Medicare).
@@ -160,8 +197,140 @@ def calculate_fica(
     return ss_tax, medicare_tax
 
 
+def calculate_pay_run(
+    pay_run: PayRunInput,
+    executor: Executor | None = None,
+) -> PayRunResult:
+    """
+    Gross-to-net for every employee in a pay run in one call.
+
+    Bracket and wage-base tables are module constants resolved once, not
+    per employee.  With an ``executor``, employees are processed in chunks
+    of ``_PAY_RUN_CHUNK`` concurrently; results keep input order.
+
+    Preconditions:
+        - ``pay_run`` is a valid ``PayRunInput`` (columns already aligned).
+    Postconditions:
+        - Column ``i`` of the result equals what
+          ``calculate_federal_withholding``, ``calculate_state_withholding``
+          and ``calculate_fica`` give for employee ``i`` (default FICA
+          parameters), with ``total_deductions`` and ``net_pay`` derived
+          as in ``PayrollService.calculate_gross_to_net``.
+        - Run totals are the column sums.
+    """
+    gross = [sum(row, _ZERO) for row in pay_run.earnings]
+    columns = (
+        gross,
+        pay_run.filing_statuses,
+        pay_run.allowances,
+        pay_run.state_rates,
+        pay_run.ytd_earnings,
+    )
+    n = len(gross)
+
+    if executor is None or n <= _PAY_RUN_CHUNK:
+        parts = [_gross_to_net_chunk(*columns)]
+    else:
+        bounds = range(0, n, _PAY_RUN_CHUNK)
+        parts = list(executor.map(
+            _gross_to_net_chunk,
+            *(
+                [col[i:i + _PAY_RUN_CHUNK] for i in bounds]
+                for col in columns
+            ),
+        ))
+
+    federal: list[Decimal] = []
+    state: list[Decimal] = []
+    ss: list[Decimal] = []
+    medicare: list[Decimal] = []
+    for part in parts:
+        federal.extend(part[0])
+        state.extend(part[1])
+        ss.extend(part[2])
+        medicare.extend(part[3])
+
+    deductions = [f + s + o + m for f, s, o, m in zip(federal, state, ss, medicare)]
+    net = [g - d for g, d in zip(gross, deductions)]
+
+    return PayRunResult(
+        employee_ids=pay_run.employee_ids,
+        gross_pay=tuple(gross),
+        federal_withholding=tuple(federal),
+        state_withholding=tuple(state),
+        social_security=tuple(ss),
+        medicare=tuple(medicare),
+        total_deductions=tuple(deductions),
+        net_pay=tuple(net),
+        total_gross=sum(gross, _ZERO),
+        total_federal=sum(federal, _ZERO),
+        total_state=sum(state, _ZERO),
+        total_social_security=sum(ss, _ZERO),
+        total_medicare=sum(medicare, _ZERO),
+        total_withheld=sum(deductions, _ZERO),
+        total_net=sum(net, _ZERO),
+    )
+
+
+def _gross_to_net_chunk(
+    gross: Sequence[Decimal],
+    filing_statuses: Sequence[str],
+    allowances: Sequence[int],
+    state_rates: Sequence[Decimal],
+    ytd_earnings: Sequence[Decimal],
+) -> tuple[list[Decimal], list[Decimal], list[Decimal], list[Decimal]]:
+    """Federal, state, SS and Medicare columns for a chunk of employees.
+
+    Inlines the single-employee helpers over preloaded tables; the
+    arithmetic (including each ``quantize``) is identical to theirs.
+    """
+    single = _FEDERAL_WIDTHS["single"]
+    married = _FEDERAL_WIDTHS["married"]
+    allowance_cache: dict[int, Decimal] = {}
+
+    federal: list[Decimal] = []
+    state: list[Decimal] = []
+    ss: list[Decimal] = []
+    medicare: list[Decimal] = []
+
+    for gross_pay, status, count, state_rate, ytd in zip(
+        gross, filing_statuses, allowances, state_rates, ytd_earnings,
+    ):
+        # Federal (calculate_federal_withholding)
+        allowance_amount = allowance_cache.get(count)
+        if allowance_amount is None:
+            allowance_amount = Decimal(str(count)) * _ALLOWANCE_PER_PERIOD
+            allowance_cache[count] = allowance_amount
+        remaining = max(_ZERO, gross_pay - allowance_amount)
+        tax = _ZERO
+        for width, rate in (married if status == "married" else single):
+            bracket_income = min(remaining, width)
+            if bracket_income <= 0:
+                break
+            tax += (bracket_income * rate).quantize(_CENT)
+            remaining -= bracket_income
+        federal.append(tax)
+
+        # State (calculate_state_withholding)
+        state.append((gross_pay * state_rate).quantize(_CENT))
+
+        # FICA (calculate_fica with default parameters)
+        ss_taxable = min(gross_pay, max(_ZERO, _SS_WAGE_BASE - ytd))
+        ss.append((ss_taxable * _SS_RATE).quantize(_CENT))
+        medicare_tax = (gross_pay * _MEDICARE_RATE).quantize(_CENT)
+        ytd_plus = ytd + gross_pay
+        if ytd_plus > _ADDITIONAL_MEDICARE_THRESHOLD:
+            additional_wages = max(
+                _ZERO, min(gross_pay, ytd_plus - _ADDITIONAL_MEDICARE_THRESHOLD),
+            )
+            medicare_tax += (additional_wages * _ADDITIONAL_MEDICARE_RATE).quantize(_CENT)
+        medicare.append(medicare_tax)
+
+    return federal, state, ss, medicare
+
+
 def generate_nacha_batch(
-    payments: list[dict],
+    payments: Iterable[dict],
     company_name: str,
     company_id: str,
     effective_date: str,
@@ -170,10 +339,12 @@ def generate_nacha_batch(
     Generate a NACHA/ACH batch for payroll direct deposits.
 
     Each payment dict should have: name, account, routing, amount.
-    Returns pipe-delimited representation of ACH batch.
+    Returns pipe-delimited representation of ACH batch.  For large runs,
+    ``PayrollService.write_nacha_file`` streams fixed-width NACHA records
+    to a sink instead of building the whole batch as one string.
 
     Preconditions:
-        - ``payments`` is a list of dicts each containing ``name``,
+        - ``payments`` is an iterable of dicts each containing ``name``,
           ``account``, ``routing``, and ``amount`` keys.
         - ``company_name`` and ``company_id`` are non-empty strings.
         - ``effective_date`` is a date string (e.g. ``"2024-01-15"``).
@@ -188,13 +359,14 @@ def generate_nacha_batch(
     )
 
     total = Decimal("0")
-    for i, payment in enumerate(payments, 1):
+    count = 0
+    for count, payment in enumerate(payments, 1):
         amount = Decimal(str(payment.get("amount", "0")))
         total += amount
         lines.append(
-            f"PAYROLL_ENTRY|{i}|{payment.get('routing', '')}|"
+            f"PAYROLL_ENTRY|{count}|{payment.get('routing', '')}|"
             f"{payment.get('account', '')}|{amount}|{payment.get('name', '')}"
         )
 
-    lines.append(f"PAYROLL_BATCH_CONTROL|{len(payments)}|{total}")
+    lines.append(f"PAYROLL_BATCH_CONTROL|{count}|{total}")
     return "\n".join(lines)
@@ -204,6 +204,70 @@ class WithholdingResult:
     net_pay: Decimal
 
 
+@dataclass(frozen=True)
+class PayRunInput:
+    """Columnar gross-to-net input for a whole pay run.
+
+    One entry per employee in every per-employee column; ``earnings`` has
+    one row per employee and one value per code in ``earnings_codes``
+    (e.g. REGULAR, OVERTIME, BONUS).  Gross pay is the row sum.
+    """
+    employee_ids: tuple[UUID, ...]
+    earnings_codes: tuple[str, ...]
+    earnings: tuple[tuple[Decimal, ...], ...]
+    filing_statuses: tuple[str, ...]
+    allowances: tuple[int, ...]
+    state_rates: tuple[Decimal, ...]
+    ytd_earnings: tuple[Decimal, ...]
+
+    def __post_init__(self):
+        n = len(self.employee_ids)
+        for name in (
+            "earnings", "filing_statuses", "allowances", "state_rates",
+            "ytd_earnings",
+        ):
+            if len(getattr(self, name)) != n:
+                raise ValueError(
+                    f"PayRunInput.{name} has {len(getattr(self, name))} "
+                    f"entries, expected {n}"
+                )
+        width = len(self.earnings_codes)
+        for i, row in enumerate(self.earnings):
+            if len(row) != width:
+                raise ValueError(
+                    f"PayRunInput.earnings row {i} has {len(row)} values, "
+                    f"expected {width}"
+                )
+
+
+@dataclass(frozen=True)
+class PayRunResult:
+    """Columnar gross-to-net result for a pay run, with run totals.
+
+    Column ``i`` of every per-employee tuple belongs to
+    ``employee_ids[i]``; values match ``WithholdingResult`` field for field.
+    """
+    employee_ids: tuple[UUID, ...]
+    gross_pay: tuple[Decimal, ...]
+    federal_withholding: tuple[Decimal, ...]
+    state_withholding: tuple[Decimal, ...]
+    social_security: tuple[Decimal, ...]
+    medicare: tuple[Decimal, ...]
+    total_deductions: tuple[Decimal, ...]
+    net_pay: tuple[Decimal, ...]
+    total_gross: Decimal = Decimal("0")
+    total_federal: Decimal = Decimal("0")
+    total_state: Decimal = Decimal("0")
+    total_social_security: Decimal = Decimal("0")
+    total_medicare: Decimal = Decimal("0")
+    total_withheld: Decimal = Decimal("0")
+    total_net: Decimal = Decimal("0")
+
+    @property
+    def employee_count(self) -> int:
+        return len(self.employee_ids)
+
+
 @dataclass(frozen=True)
 class BenefitsDeduction:
     """A benefits deduction from an employee's paycheck."""
@@ -40,6 +40,7 @@ Profiles:
     LaborDistributionDirect     -- Direct labor: Dr WIP / Cr Labor Clearing
     LaborDistributionIndirect   -- Indirect labor: Dr Overhead Pool / Cr Labor Clearing
     LaborDistributionOverhead   -- Overhead labor: Dr Overhead Expense / Cr Labor Clearing
+    LaborDistributionBatch      -- Consolidated distribution: one line pair per cost line
 """
 
 from datetime import date
@@ -479,6 +480,37 @@ LABOR_DISTRIBUTION_OVERHEAD_MAPPINGS = (
 )
 
 
+# --- Labor Distribution: Consolidated batch ----------------------------------
+
+LABOR_DISTRIBUTION_BATCH = AccountingPolicy(
+    name="LaborDistributionBatch",
+    version=1,
+    trigger=PolicyTrigger(
+        event_type="labor.distribution_batch",
+        schema_version=1,
+    ),
+    meaning=PolicyMeaning(
+        economic_type="LABOR_ALLOCATION",
+        dimensions=("org_unit",),
+    ),
+    ledger_effects=(
+        LedgerEffect(ledger="GL", debit_role="WIP", credit_role="LABOR_CLEARING"),
+    ),
+    effective_from=date(2024, 1, 1),
+    guards=(),
+    description="Consolidated labor distribution: one journal entry, one line pair per cost line",
+)
+
+LABOR_DISTRIBUTION_BATCH_MAPPINGS = (
+    ModuleLineMapping(role="WIP", side="debit", ledger="GL", foreach="direct_lines", skip_empty=True),
+    ModuleLineMapping(role="LABOR_CLEARING", side="credit", ledger="GL", foreach="direct_lines", skip_empty=True),
+    ModuleLineMapping(role="OVERHEAD_POOL", side="debit", ledger="GL", foreach="indirect_lines", skip_empty=True),
+    ModuleLineMapping(role="LABOR_CLEARING", side="credit", ledger="GL", foreach="indirect_lines", skip_empty=True),
+    ModuleLineMapping(role="OVERHEAD_EXPENSE", side="debit", ledger="GL", foreach="overhead_lines", skip_empty=True),
+    ModuleLineMapping(role="LABOR_CLEARING", side="credit", ledger="GL", foreach="overhead_lines", skip_empty=True),
+)
+
+
 # --- Benefits Deduction -----------------------------------------------------
 
 PAYROLL_BENEFITS_DEDUCTED = AccountingPolicy(
@@ -540,6 +572,7 @@ _ALL_PROFILES: tuple[tuple[AccountingPolicy, tuple[ModuleLineMapping, ...]], ...
     (LABOR_DISTRIBUTION_DIRECT, LABOR_DISTRIBUTION_DIRECT_MAPPINGS),
     (LABOR_DISTRIBUTION_INDIRECT, LABOR_DISTRIBUTION_INDIRECT_MAPPINGS),
     (LABOR_DISTRIBUTION_OVERHEAD, LABOR_DISTRIBUTION_OVERHEAD_MAPPINGS),
+    (LABOR_DISTRIBUTION_BATCH, LABOR_DISTRIBUTION_BATCH_MAPPINGS),
     (PAYROLL_BENEFITS_DEDUCTED, PAYROLL_BENEFITS_DEDUCTED_MAPPINGS),
     (PAYROLL_EMPLOYER_CONTRIBUTION, PAYROLL_EMPLOYER_CONTRIBUTION_MAPPINGS),
 )
@@ -60,7 +60,8 @@ Usage::
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
 from datetime import date
 from decimal import Decimal
 from uuid import UUID, uuid4
@@ -91,11 +92,13 @@ from finance_kernel.services.module_posting_service import (
     ModulePostingResult,
     ModulePostingService,
 )
+from finance_modules._ach_writer import AchFileTotals, TextSink, write_ach_file
 from finance_modules._posting_helpers import commit_or_rollback, run_workflow_guard
 from finance_services.workflow_executor import WorkflowExecutor
 from finance_engines.timesheet_compliance import (
     compute_total_time_record,
     detect_concurrent_overlaps,
+    detect_pay_period_overlaps,
     validate_all_entries_daily_recording,
     validate_no_excessive_daily_hours,
 )
@@ -106,6 +109,7 @@ from finance_modules.payroll.dcaa_orm import (
     TimesheetSubmissionModel,
 )
 from finance_modules.payroll.dcaa_types import (
+    ConcurrentWorkCheck,
     FloorCheck,
     TimesheetCorrection,
     TimesheetEntry,
@@ -115,12 +119,15 @@ from finance_modules.payroll.dcaa_types import (
 from finance_modules.payroll.helpers import (
     calculate_federal_withholding,
     calculate_fica,
+    calculate_pay_run,
     calculate_state_withholding,
     generate_nacha_batch,
 )
 from finance_modules.payroll.models import (
     BenefitsDeduction,
     EmployerContribution,
+    PayRunInput,
+    PayRunResult,
     WithholdingResult,
 )
 from finance_modules.payroll.orm import (
@@ -720,6 +727,7 @@ class PayrollService:
         effective_date: date,
         actor_id: UUID,
         currency: str = "USD",
+        consolidated: bool = False,
     ) -> ModulePostingResult:
         """
         Allocate labor costs from a payroll run across cost centers/projects.
@@ -735,6 +743,15 @@ class PayrollService:
 
         Posts one journal entry per allocation line for proper cost center
         tracking.
+
+        With ``consolidated=True`` the run is posted as a single
+        ``labor.distribution_batch`` event: one journal entry with one
+        debit/credit line pair per allocation, each tagged with
+        target_id / cost_center / project / labor_type dimensions, plus a
+        DERIVED_FROM link from the payroll run to the entry.  The link is
+        deliberately run-level: allocation targets are cost objects
+        (cost centers, projects), not linkable artifacts, so drill-down
+        from the entry to each allocation goes through the line dimensions.
         """
         if not allocations:
             raise ValueError("At least one allocation target is required")
@@ -765,8 +782,73 @@ class PayrollService:
                 "run_id": str(run_id),
                 "allocation_count": len(allocations),
                 "total_amount": str(total_amount),
+                "consolidated": consolidated,
             })
 
+            if consolidated:
+                grouped: dict[str, list[dict]] = {
+                    "DIRECT": [], "INDIRECT": [], "OVERHEAD": [],
+                }
+                for alloc in allocations:
+                    labor_type = alloc.get("labor_type", "DIRECT").upper()
+                    if labor_type not in grouped:
+                        labor_type = "DIRECT"
+                    target_id = alloc["target_id"]
+                    grouped[labor_type].append({
+                        "amount": str(Decimal(str(alloc["amount"]))),
+                        "target_id": target_id,
+                        "labor_type": labor_type,
+                        "cost_center": alloc.get("cost_center"),
+                        "project": alloc.get("project"),
+                        "dimensions": {
+                            "target_id": target_id,
+                            "cost_center": alloc.get("cost_center"),
+                            "project": alloc.get("project"),
+                            "labor_type": labor_type,
+                        },
+                        "memo": f"{labor_type.title()} labor {target_id}",
+                    })
+
+                result = self._poster.post_event(
+                    event_type="labor.distribution_batch",
+                    payload={
+                        "run_id": str(run_id),
+                        "line_count": len(allocations),
+                        "total_amount": str(total_amount),
+                        "direct_lines": grouped["DIRECT"],
+                        "indirect_lines": grouped["INDIRECT"],
+                        "overhead_lines": grouped["OVERHEAD"],
+                    },
+                    effective_date=effective_date,
+                    actor_id=actor_id,
+                    amount=total_amount,
+                    currency=currency,
+                )
+                if not result.is_success:
+                    self._session.rollback()
+                    return result
+
+                from finance_kernel.domain.economic_link import EconomicLink, LinkType
+                self._link_graph.establish_link(
+                    EconomicLink.create(
+                        link_id=uuid4(),
+                        link_type=LinkType.DERIVED_FROM,
+                        parent_ref=ArtifactRef(ArtifactType.EVENT, run_id),
+                        child_ref=ArtifactRef(
+                            ArtifactType.JOURNAL_ENTRY, result.journal_entry_ids[0],
+                        ),
+                        creating_event_id=result.event_id,
+                        created_at=self._clock.now(),
+                        metadata={
+                            "line_count": len(allocations),
+                            "total_amount": str(total_amount),
+                        },
+                    ),
+                    allow_duplicate=True,
+                )
+                self._session.commit()
+                return result
+
             for alloc in allocations:
                 target_id = alloc["target_id"]
                 alloc_amount = Decimal(str(alloc["amount"]))
@@ -957,6 +1039,34 @@ class PayrollService:
             net_pay=net_pay,
         )
 
+    def calculate_pay_run(
+        self,
+        pay_run: PayRunInput,
+        executor: Executor | None = None,
+    ) -> PayRunResult:
+        """
+        Calculate gross-to-net for a whole pay run in one pass.
+
+        Pure computation, like ``calculate_gross_to_net``: per-employee
+        values are identical to calling it once per employee, but the
+        tax tables are resolved once and only a single summary is logged.
+        With an ``executor``, employee chunks are processed concurrently.
+
+        Returns:
+            PayRunResult with per-employee columns and run totals.
+        """
+        result = calculate_pay_run(pay_run, executor=executor)
+
+        logger.info("pay_run_gross_to_net_calculated", extra={
+            "employee_count": result.employee_count,
+            "earnings_codes": list(pay_run.earnings_codes),
+            "total_gross": str(result.total_gross),
+            "total_withheld": str(result.total_withheld),
+            "total_net": str(result.total_net),
+        })
+
+        return result
+
     # =========================================================================
     # Benefits Deduction
     # =========================================================================
@@ -1076,6 +1186,59 @@ class PayrollService:
             effective_date=effective_date,
         )
 
+    def write_nacha_file(
+        self,
+        payments: Iterable[dict],
+        sink: TextSink,
+        company_name: str,
+        company_id: str,
+        effective_date: date | str,
+        immediate_destination: str,
+        destination_name: str = "",
+    ) -> AchFileTotals:
+        """
+        Stream a fixed-width NACHA/ACH file for payroll direct deposits.
+
+        Pure with respect to the ledger -- no posting.  Records are written
+        to ``sink`` as ``payments`` is consumed, so the run never has to
+        be materialised.  Payments may carry ``company_id`` /
+        ``effective_date`` overrides; each change starts a new batch.
+
+        Args:
+            payments: Iterable of dicts with name, account, routing, amount.
+            sink: Text sink with ``write(str)`` (file, socket wrapper).
+            company_name: Company name for the batch headers.
+            company_id: Company EIN/ID for the batch headers.
+            effective_date: Default effective entry date.
+            immediate_destination: 9-digit routing of the receiving ODFI.
+            destination_name: Name of the receiving ODFI.
+
+        Returns:
+            AchFileTotals from the file control record.
+        """
+        totals = write_ach_file(
+            payments,
+            sink,
+            company_name=company_name,
+            company_id=company_id,
+            effective_date=effective_date,
+            immediate_destination=immediate_destination,
+            created_at=self._clock.now(),
+            destination_name=destination_name,
+            sec_code="PPD",
+            entry_description="PAYROLL",
+        )
+
+        logger.info("nacha_file_written", extra={
+            "company_name": company_name,
+            "batch_count": totals.batch_count,
+            "payment_count": totals.entry_count,
+            "total_credit": str(totals.total_credit),
+            "entry_hash": totals.entry_hash,
+        })
+
+        return totals
+
     # =========================================================================
     # Employer Contribution
     # =========================================================================
@@ -1686,6 +1849,44 @@ class PayrollService:
     # DCAA Floor Check (D9)
     # =========================================================================
 
+    def check_pay_period_concurrent_work(
+        self,
+        pay_period_id: UUID,
+    ) -> dict[UUID, ConcurrentWorkCheck]:
+        """
+        Run D4 concurrent-work detection for every employee in a pay period.
+
+        Loads all non-rejected submissions for the period (entries come
+        with them in one additional query) and checks them in a single
+        engine pass.  Read-only; intended for floor check preparation.
+
+        Args:
+            pay_period_id: The pay period to check.
+
+        Returns:
+            ``{employee_id: ConcurrentWorkCheck}`` for every employee with
+            a submission in the period.
+        """
+        orm_subs = (
+            self._session.query(TimesheetSubmissionModel)
+            .filter(
+                TimesheetSubmissionModel.pay_period_id == pay_period_id,
+                TimesheetSubmissionModel.status
+                != TimesheetSubmissionStatus.REJECTED.value,
+            )
+            .all()
+        )
+        checks = detect_pay_period_overlaps(s.to_dto() for s in orm_subs)
+
+        logger.info("pay_period_concurrent_work_checked", extra={
+            "pay_period_id": str(pay_period_id),
+            "employee_count": len(checks),
+            "violation_count": sum(
+                1 for c in checks.values() if not c.is_valid
+            ),
+        })
+        return checks
+
     def record_floor_check(
         self,
         floor_check: FloorCheck,
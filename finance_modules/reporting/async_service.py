@@ -0,0 +1,182 @@
+"""
+Async Reporting Facade (``finance_modules.reporting.async_service``).
+
+Responsibility
+--------------
+Awaitable versions of the ``ReportingService`` statement builders for
+asyncio API layers.  Each call opens its own ``AsyncSession`` (asyncpg
+driver) and runs the synchronous builder through ``run_sync``, so the
+sections of a reporting package can be awaited together and run
+concurrently on separate pooled connections::
+
+    reports = AsyncReportingService(clock=clock, config=config)
+    selectors = AsyncSelectors()
+    tb, bs, pl, trace = await asyncio.gather(
+        reports.trial_balance(as_of),
+        reports.balance_sheet(as_of),
+        reports.income_statement(period_start, as_of),
+        selectors.trace_by_event_id(event_id),
+    )
+
+Architecture position
+---------------------
+**Modules layer** -- thin async wrapper over ``ReportingService``; no
+statement logic lives here.
+
+Invariants enforced
+-------------------
+* Read-only -- sessions are closed without committing.
+* Identical output -- the same builder code runs for sync and async callers.
+
+Failure modes
+-------------
+* ``RuntimeError`` when the async engine is not initialized and no session
+  factory is passed.
+* ``ValueError`` and selector errors from the builders propagate unchanged.
+
+Audit relevance
+---------------
+Each section is read in its own snapshot.  Callers that need all sections
+from one snapshot should call the synchronous service in one transaction.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from finance_kernel.db.async_engine import get_async_session_factory
+from finance_kernel.domain.clock import Clock, SystemClock
+from finance_modules.reporting.config import ReportingConfig
+from finance_modules.reporting.models import (
+    BalanceSheetReport,
+    CashFlowStatementReport,
+    EquityChangesReport,
+    IncomeStatementFormat,
+    IncomeStatementReport,
+    MultiCurrencyTrialBalance,
+    SegmentReport,
+    TrialBalanceReport,
+)
+from finance_modules.reporting.service import ReportingService
+
+T = TypeVar("T")
+
+
+class AsyncReportingService:
+    """
+    Async statement generation on top of ``ReportingService``.
+
+    Contract
+    --------
+    * Every public method is a coroutine returning the same report DTO as
+      the ``ReportingService`` method of the same name.
+
+    Non-goals
+    ---------
+    * Does NOT provide a cross-section snapshot (see module docstring).
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        clock: Clock | None = None,
+        config: ReportingConfig | None = None,
+    ):
+        self._session_factory = session_factory or get_async_session_factory()
+        self._clock = clock or SystemClock()
+        self._config = config or ReportingConfig.with_defaults()
+
+    async def _run(self, build: Callable[[ReportingService], T]) -> T:
+        async with self._session_factory() as session:
+            return await session.run_sync(
+                lambda sync_session: build(self._service(sync_session))
+            )
+
+    def _service(self, session: Session) -> ReportingService:
+        return ReportingService(session=session, clock=self._clock, config=self._config)
+
+    async def trial_balance(
+        self,
+        as_of_date: date,
+        currency: str | None = None,
+        comparative_date: date | None = None,
+    ) -> TrialBalanceReport:
+        return await self._run(
+            lambda svc: svc.trial_balance(as_of_date, currency, comparative_date)
+        )
+
+    async def balance_sheet(
+        self,
+        as_of_date: date,
+        currency: str | None = None,
+        comparative_date: date | None = None,
+    ) -> BalanceSheetReport:
+        return await self._run(
+            lambda svc: svc.balance_sheet(as_of_date, currency, comparative_date)
+        )
+
+    async def income_statement(
+        self,
+        period_start: date,
+        period_end: date,
+        currency: str | None = None,
+        format: IncomeStatementFormat = IncomeStatementFormat.MULTI_STEP,
+        comparative_start: date | None = None,
+        comparative_end: date | None = None,
+    ) -> IncomeStatementReport:
+        return await self._run(
+            lambda svc: svc.income_statement(
+                period_start, period_end, currency, format,
+                comparative_start, comparative_end,
+            )
+        )
+
+    async def cash_flow_statement(
+        self,
+        period_start: date,
+        period_end: date,
+        prior_period_end: date | None = None,
+        currency: str | None = None,
+    ) -> CashFlowStatementReport:
+        return await self._run(
+            lambda svc: svc.cash_flow_statement(
+                period_start, period_end, prior_period_end, currency,
+            )
+        )
+
+    async def equity_changes(
+        self,
+        period_start: date,
+        period_end: date,
+        prior_period_end: date | None = None,
+        currency: str | None = None,
+    ) -> EquityChangesReport:
+        return await self._run(
+            lambda svc: svc.equity_changes(
+                period_start, period_end, prior_period_end, currency,
+            )
+        )
+
+    async def segment_report(
+        self,
+        as_of_date: date,
+        dimension_name: str,
+        currency: str | None = None,
+    ) -> SegmentReport:
+        return await self._run(
+            lambda svc: svc.segment_report(as_of_date, dimension_name, currency)
+        )
+
+    async def multi_currency_trial_balance(
+        self,
+        as_of_date: date,
+        currencies: list[str],
+    ) -> MultiCurrencyTrialBalance:
+        return await self._run(
+            lambda svc: svc.multi_currency_trial_balance(as_of_date, currencies)
+        )
@@ -345,7 +345,9 @@ class MultiCurrencyTrialBalance:
     """Trial balance across multiple currencies.
 
     Aggregates per-currency trial balance reports into a single
-    container for multi-currency reporting needs.
+    container for multi-currency reporting needs.  When a rate store is
+    supplied, each currency's totals are also translated into
+    ``reporting_currency`` at the closing rate.
     """
 
     metadata: ReportMetadata
@@ -354,3 +356,6 @@ class MultiCurrencyTrialBalance:
     total_debits_by_currency: tuple[tuple[str, Decimal], ...]
     total_credits_by_currency: tuple[tuple[str, Decimal], ...]
     all_balanced: bool  # True if every currency TB is balanced
+    reporting_currency: str | None = None
+    translated_debits_by_currency: tuple[tuple[str, Decimal], ...] = ()
+    translated_credits_by_currency: tuple[tuple[str, Decimal], ...] = ()
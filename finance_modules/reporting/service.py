@@ -41,12 +41,16 @@ journal -- they do not modify it.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, timedelta
 from decimal import Decimal
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from finance_engines.fx import FxRateStore
+from finance_kernel.db.engine import read_session_scope
 from finance_kernel.domain.clock import Clock, SystemClock
 from finance_kernel.logging_config import get_logger
 from finance_kernel.models.account import Account, AccountType, NormalBalance
@@ -74,6 +78,7 @@ from finance_modules.reporting.statements import (
     build_segment_report,
     build_trial_balance,
     render_to_dict,
+    translate_trial_balance_totals,
 )
 
 logger = get_logger("modules.reporting.service")
@@ -126,6 +131,26 @@ class ReportingService:
             },
         )
 
+    @classmethod
+    @contextmanager
+    def read_scope(
+        cls,
+        clock: Clock | None = None,
+        config: ReportingConfig | None = None,
+        *,
+        min_seq: int | None = None,
+        max_lag: int | None = None,
+    ) -> Iterator[ReportingService]:
+        """
+        A service over a ``read_session_scope`` session.
+
+        Reports read from the read replica while it is within ``max_lag``
+        journal entries of the primary (and at least ``min_seq``), and from
+        the primary otherwise.  The session is never committed.
+        """
+        with read_session_scope(min_seq=min_seq, max_lag=max_lag) as session:
+            yield cls(session=session, clock=clock, config=config)
+
     # =========================================================================
     # Internal helpers
     # =========================================================================
@@ -584,6 +609,8 @@ class ReportingService:
         self,
         as_of_date: date,
         currencies: list[str],
+        fx_rates: FxRateStore | None = None,
+        reporting_currency: str | None = None,
     ) -> MultiCurrencyTrialBalance:
         """
         Generate a trial balance across multiple currencies.
@@ -594,6 +621,11 @@ class ReportingService:
         Args:
             as_of_date: Cutoff date for the trial balance.
             currencies: List of ISO 4217 currency codes to include.
+            fx_rates: Rate store (``GeneralLedgerService.fx_rate_store()``)
+                used to translate each currency's totals at the closing
+                rate on ``as_of_date``; no translation when None.
+            reporting_currency: Translation target (default: the
+                configured default currency).
 
         Returns:
             MultiCurrencyTrialBalance with per-currency reports.
@@ -601,12 +633,21 @@ class ReportingService:
         currency_reports = []
         debits_by_currency: list[tuple[str, Decimal]] = []
         credits_by_currency: list[tuple[str, Decimal]] = []
+        translated_debits: list[tuple[str, Decimal]] = []
+        translated_credits: list[tuple[str, Decimal]] = []
+        target = reporting_currency or self._config.default_currency
 
         for curr in currencies:
             report = self.trial_balance(as_of_date=as_of_date, currency=curr)
             currency_reports.append(report)
             debits_by_currency.append((curr, report.total_debits))
             credits_by_currency.append((curr, report.total_credits))
+            if fx_rates is not None:
+                debits, credits = translate_trial_balance_totals(
+                    report, fx_rates.rate(curr, target, as_of_date),
+                )
+                translated_debits.append((curr, debits))
+                translated_credits.append((curr, credits))
 
         all_balanced = all(r.is_balanced for r in currency_reports)
 
@@ -623,6 +664,9 @@ class ReportingService:
             total_debits_by_currency=tuple(debits_by_currency),
             total_credits_by_currency=tuple(credits_by_currency),
             all_balanced=all_balanced,
+            reporting_currency=target if fx_rates is not None else None,
+            translated_debits_by_currency=tuple(translated_debits),
+            translated_credits_by_currency=tuple(translated_credits),
         )
 
         logger.info(
@@ -632,6 +676,7 @@ class ReportingService:
                 "currencies": currencies,
                 "currency_count": len(currencies),
                 "all_balanced": all_balanced,
+                "reporting_currency": target if fx_rates is not None else None,
             },
         )
         return result
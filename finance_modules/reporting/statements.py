@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import dataclasses
 from datetime import date
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
 from uuid import UUID
 
@@ -230,6 +230,19 @@ def build_trial_balance(
     )
 
 
+def translate_trial_balance_totals(
+    report: TrialBalanceReport,
+    rate: Decimal,
+    places: int = 2,
+) -> tuple[Decimal, Decimal]:
+    """Total debits and credits translated at ``rate`` (ROUND_HALF_UP)."""
+    quantum = Decimal(1).scaleb(-places)
+    return (
+        (report.total_debits * rate).quantize(quantum, rounding=ROUND_HALF_UP),
+        (report.total_credits * rate).quantize(quantum, rounding=ROUND_HALF_UP),
+    )
+
+
 # =========================================================================
 # 2. BALANCE SHEET
 # =========================================================================
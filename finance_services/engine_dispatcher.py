@@ -125,6 +125,11 @@ class EngineDispatcher:
         self._pack = compiled_pack
         self._registry: dict[str, EngineInvoker] = {}
 
+    @property
+    def compiled_pack(self) -> CompiledPolicyPack:
+        """The CompiledPolicyPack engine parameters are resolved from."""
+        return self._pack
+
     def register(self, engine_name: str, invoker: EngineInvoker) -> None:
         """Register an engine invoker.
 
@@ -43,6 +43,9 @@ Usage:
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor
 from datetime import date
 from decimal import Decimal
 from typing import Any
@@ -55,7 +58,7 @@ from finance_engines.allocation import (
 )
 from finance_engines.allocation_cascade import AllocationStep, execute_cascade
 from finance_engines.billing import BillingInput, calculate_billing
-from finance_engines.ice import ICEInput, compile_ice_submission
+from finance_engines.ice import ICEInput, ICELineCache, compile_ice_submission
 from finance_engines.matching import (
     MatchCandidate,
     MatchingEngine,
@@ -394,16 +397,32 @@ def _invoke_billing(payload: dict, params: FrozenEngineParams) -> Any:
     return calculate_billing(billing_input)
 
 
-def _invoke_ice(payload: dict, params: FrozenEngineParams) -> Any:
-    """Invoke compile_ice_submission."""
-    ice_input_raw = payload.get("ice_input")
-    if isinstance(ice_input_raw, ICEInput):
-        ice_input = ice_input_raw
-    elif isinstance(ice_input_raw, dict):
-        ice_input = ICEInput(**ice_input_raw)
-    else:
-        raise ValueError("payload must contain 'ice_input' dict or ICEInput")
-    return compile_ice_submission(ice_input)
+def _make_ice_invoker(
+    line_cache: ICELineCache,
+    executor: Executor | None = None,
+) -> Callable[[dict, FrozenEngineParams], Any]:
+    """Build the compile_ice_submission invoker around a long-lived line cache.
+
+    ICELineCache is not thread-safe, so compilations through one invoker
+    are serialized on a lock.
+    """
+    lock = threading.Lock()
+
+    def _invoke_ice(payload: dict, params: FrozenEngineParams) -> Any:
+        """Invoke compile_ice_submission."""
+        ice_input_raw = payload.get("ice_input")
+        if isinstance(ice_input_raw, ICEInput):
+            ice_input = ice_input_raw
+        elif isinstance(ice_input_raw, dict):
+            ice_input = ICEInput(**ice_input_raw)
+        else:
+            raise ValueError("payload must contain 'ice_input' dict or ICEInput")
+        with lock:
+            return compile_ice_submission(
+                ice_input, line_cache=line_cache, executor=executor,
+            )
+
+    return _invoke_ice
 
 
 # ---------------------------------------------------------------------------
@@ -411,9 +430,17 @@ def _invoke_ice(payload: dict, params: FrozenEngineParams) -> Any:
 # ---------------------------------------------------------------------------
 
 
-def register_standard_engines(dispatcher: EngineDispatcher) -> None:
+def register_standard_engines(
+    dispatcher: EngineDispatcher,
+    *,
+    ice_line_cache: ICELineCache | None = None,
+    ice_executor: Executor | None = None,
+) -> None:
     """Register all standard engine invokers with the dispatcher.
 
+    The ice invoker keeps ``ice_line_cache`` (a fresh one per dispatcher
+    when omitted) across invocations and compiles on ``ice_executor``.
+
     Preconditions:
         dispatcher is a freshly-constructed EngineDispatcher (or one where
         re-registration of the same names is acceptable).
@@ -473,6 +500,9 @@ def register_standard_engines(dispatcher: EngineDispatcher) -> None:
     dispatcher.register("ice", EngineInvoker(
         engine_name="ice",
         engine_version="1.0",
-        invoke=_invoke_ice,
+        invoke=_make_ice_invoker(
+            ice_line_cache if ice_line_cache is not None else ICELineCache(),
+            ice_executor,
+        ),
         fingerprint_fields=("ice_input",),
     ))
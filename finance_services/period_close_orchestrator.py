@@ -20,6 +20,8 @@ Invariants enforced:
       deterministic ledger hash computed by AuditorService.
     - R25 (close lock): SELECT ... FOR UPDATE on the fiscal period row
       prevents concurrent close attempts.
+    - PC1 (period-close snapshot): Phase 6 lock writes the sealed
+      closing-balance snapshot that historical selectors start from.
     - R11 (audit chain): close certificate is persisted as an audit event.
     - Authority hierarchy: each phase requires minimum CloseRole authority.
     - SL-G6 (subledger close): Phase 2 closes all subledgers with
@@ -717,7 +719,11 @@ class PeriodCloseOrchestrator:
     def _phase_6_lock_period(
         self, run: PeriodCloseRun, actor_id: UUID, **kwargs: Any,
     ) -> ClosePhaseResult:
-        """Phase 6: Lock period (year-end only, CLOSED -> LOCKED)."""
+        """Phase 6: Lock period (year-end only, CLOSED -> LOCKED).
+
+        Locking seals the period's closing balances (PC1); the seal links
+        them to the same R24 canonical hash the close certificate records.
+        """
         if not run.is_year_end:
             return ClosePhaseResult(
                 phase=6,
@@ -729,12 +735,14 @@ class PeriodCloseOrchestrator:
 
         try:
             self._period_service.lock_period(run.period_code, actor_id)
+            snapshot = self._ledger_selector.close_snapshot(run.period_code)
 
             logger.info(
                 "phase_6_lock",
                 extra={
                     "correlation_id": run.correlation_id,
                     "period_code": run.period_code,
+                    "close_seal_hash": snapshot.seal_hash if snapshot else None,
                 },
             )
 
@@ -743,7 +751,13 @@ class PeriodCloseOrchestrator:
                 phase_name="lock_period",
                 success=True,
                 executed_by=actor_id,
-                message=f"Period {run.period_code} -> LOCKED",
+                message=(
+                    f"Period {run.period_code} -> LOCKED"
+                    + (
+                        f" ({snapshot.cell_count} closing balances sealed)"
+                        if snapshot else ""
+                    )
+                ),
             )
         except Exception as e:
             return ClosePhaseResult(
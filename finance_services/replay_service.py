@@ -0,0 +1,574 @@
+"""
+finance_services.replay_service -- Parallel event replay with ordered commit.
+
+Responsibility:
+    Re-derive the ledger from the ``events`` table under a (possibly new)
+    CompiledPolicyPack and compare the result with the source ledger
+    account by account.  Used to verify a config-pack upgrade against a
+    period of production events before switching over.
+
+    The pipeline has two halves:
+
+    * ``prepare_replay_events`` -- the pure, CPU-bound stages (profile
+      selection, MeaningBuilder, accounting intent, engine dispatch).  It
+      is a module-level function over picklable inputs, so chunks can be
+      fanned out to a ``concurrent.futures`` executor (process pool).
+    * ``EventReplayer`` -- ingests each event into the target session and
+      writes its journal entries through the InterpretationCoordinator in
+      the original event order, one savepoint per event and one commit per
+      chunk.  Chunk N+1 is being prepared while chunk N is committed.
+
+Architecture position:
+    Services -- stateful orchestration over engines + kernel.
+    Reads source events through ``JournalSelector.iter_source_events`` and writes through a
+    caller-supplied PostingOrchestrator whose session points at the
+    isolated target schema (e.g. via ``search_path``).  Per-account hashes
+    come from ``LedgerSelector.account_canonical_hashes`` (R24).
+
+Invariants enforced:
+    - Journal writes happen in source order: events are ordered by
+      (ingested_at, first journal entry seq, id) and chunks are committed strictly in sequence,
+      whatever order the executor finishes them in.
+    - Original event identity is preserved (event_id, occurred_at, actor,
+      producer, payload), so target entries carry the same idempotency keys.
+    - P1: exactly one profile per event, selected from the replay pack.
+    - L5: journal + outcome are written atomically by the coordinator.
+
+Failure modes:
+    - Per-event problems (no matching profile, guard rejection, intent or
+      engine failure, ingest rejection, write failure) are collected as
+      ``ReplayFailure`` records; the replay continues with the next event.
+    - Events whose posting amount was not recorded (posted before the
+      ``posting_request`` decision-log record existed and without a
+      payload ``amount``) fail with stage ``inputs``.
+    - Database errors outside an event's savepoint propagate.
+
+Audit relevance:
+    ``ReplayReport.mismatched_accounts`` lists every account whose
+    replayed lines differ from the source.  Each replayed outcome carries
+    an ``event_replayed`` decision-log record with the replay pack's
+    fingerprint.
+
+Usage:
+    from concurrent.futures import ProcessPoolExecutor
+    from finance_services.replay_service import EventReplayer
+
+    target = PostingOrchestrator(target_session, new_pack, role_resolver)
+    with ProcessPoolExecutor(initializer=register_all_modules) as pool:
+        report = EventReplayer(target, executor=pool).replay_from(
+            source_session, effective_from=date(2025, 1, 1),
+        )
+    assert report.matches, report.mismatched_accounts
+
+    The target schema must already hold the reference data the events
+    refer to (accounts, fiscal periods, parties).  Ledger lines written in
+    the source without an event (manual entries) show up as mismatches.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from finance_config.compiler import CompiledPolicyPack
+from finance_kernel.domain.accounting_intent import AccountingIntent
+from finance_kernel.domain.engine_types import EngineDispatchResult
+from finance_kernel.domain.meaning_builder import MeaningBuilder, MeaningBuilderResult
+from finance_kernel.domain.policy_bridge import (
+    build_accounting_intent,
+    build_accounting_intent_from_payload_lines,
+)
+from finance_kernel.domain.policy_selector import PolicyNotFoundError
+from finance_kernel.logging_config import get_logger
+from finance_kernel.selectors.journal_selector import JournalSelector
+from finance_kernel.selectors.ledger_selector import LedgerSelector
+from finance_kernel.services.ingestor_service import IngestStatus
+from finance_services.engine_dispatcher import EngineDispatcher
+from finance_services.invokers import register_standard_engines
+from finance_services.pack_policy_source import PackPolicySource
+from finance_services.posting_orchestrator import PostingOrchestrator
+
+logger = get_logger("services.replay")
+
+
+@dataclass(frozen=True)
+class ReplayEvent:
+    """One source event plus the posting inputs recorded with its outcome."""
+
+    event_id: UUID
+    event_type: str
+    occurred_at: datetime
+    effective_date: date
+    actor_id: UUID
+    producer: str
+    payload: dict[str, Any]
+    schema_version: int
+    amount: Decimal | None
+    currency: str = "USD"
+    is_adjustment: bool = False
+    description: str | None = None
+    coa_version: int = 1
+    dimension_schema_version: int = 1
+
+
+@dataclass(frozen=True)
+class PreparedReplay:
+    """Output of the pure stages for one event (picklable)."""
+
+    event_id: UUID
+    profile_name: str | None = None
+    profile_version: int | None = None
+    meaning_result: MeaningBuilderResult | None = None
+    accounting_intent: AccountingIntent | None = None
+    engine_result: EngineDispatchResult | None = None
+    failed_stage: str | None = None
+    message: str | None = None
+
+
+@dataclass(frozen=True)
+class ReplayFailure:
+    """An event that was not posted in the target."""
+
+    event_id: UUID
+    stage: str
+    message: str
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """Outcome of a replay run and the per-account hash comparison."""
+
+    events_read: int
+    events_posted: int
+    failures: tuple[ReplayFailure, ...]
+    source_hashes: Mapping[str, str] = field(default_factory=dict)
+    target_hashes: Mapping[str, str] = field(default_factory=dict)
+    duration_ms: float = 0.0
+
+    @property
+    def mismatched_accounts(self) -> tuple[str, ...]:
+        """Account codes whose hashes differ or exist on one side only."""
+        codes = set(self.source_hashes) | set(self.target_hashes)
+        return tuple(sorted(
+            code for code in codes
+            if self.source_hashes.get(code) != self.target_hashes.get(code)
+        ))
+
+    @property
+    def matches(self) -> bool:
+        return not self.mismatched_accounts
+
+
+# =============================================================================
+# Source
+# =============================================================================
+
+
+def _posting_request(decision_log: Sequence[dict] | None) -> dict | None:
+    for record in decision_log or ():
+        if isinstance(record, dict) and record.get("message") == "posting_request":
+            return record
+    return None
+
+
+def iter_replay_events(
+    session: Session,
+    effective_from: date | None = None,
+    effective_to: date | None = None,
+    chunk_size: int = 500,
+) -> Iterator[ReplayEvent]:
+    """
+    Stream source events in posting order as ReplayEvents.
+
+    Ordering and paging come from ``JournalSelector.iter_source_events``.
+
+    Posting inputs come from the ``posting_request`` record in the event's
+    InterpretationOutcome.decision_log; events posted before that record
+    existed fall back to ``payload["amount"]`` (``amount`` is None when
+    neither is present).
+    """
+    for source in JournalSelector(session).iter_source_events(
+        effective_from, effective_to, chunk_size,
+    ):
+        request = _posting_request(source.decision_log) or {}
+        raw_amount = request.get("amount", source.payload.get("amount"))
+        yield ReplayEvent(
+            event_id=source.event_id,
+            event_type=source.event_type,
+            occurred_at=source.occurred_at,
+            effective_date=source.effective_date,
+            actor_id=source.actor_id,
+            producer=source.producer,
+            payload=source.payload,
+            schema_version=source.schema_version,
+            amount=Decimal(str(raw_amount)) if raw_amount is not None else None,
+            currency=request.get("currency") or source.payload.get("currency") or "USD",
+            is_adjustment=bool(request.get("is_adjustment", False)),
+            description=request.get("description"),
+            coa_version=request.get("coa_version", 1),
+            dimension_schema_version=request.get("dimension_schema_version", 1),
+        )
+
+
+# =============================================================================
+# Pure stages (run in executor workers)
+# =============================================================================
+
+
+# Per-process cache: pack fingerprint -> (policy source, dispatcher, builder).
+_STAGE_CACHE: dict[str, tuple[PackPolicySource, EngineDispatcher, MeaningBuilder]] = {}
+
+
+def _stages_for(pack: CompiledPolicyPack) -> tuple[PackPolicySource, EngineDispatcher, MeaningBuilder]:
+    key = pack.canonical_fingerprint
+    stages = _STAGE_CACHE.get(key)
+    if stages is None:
+        dispatcher = EngineDispatcher(pack)
+        register_standard_engines(dispatcher)
+        stages = (PackPolicySource(pack), dispatcher, MeaningBuilder())
+        _STAGE_CACHE[key] = stages
+    return stages
+
+
+def _compiled_policy(pack: CompiledPolicyPack, name: str, version: int) -> Any | None:
+    for cp in pack.policies:
+        if cp.name == name and cp.version == version:
+            return cp
+    return None
+
+
+def _prepare_one(
+    pack: CompiledPolicyPack,
+    event: ReplayEvent,
+    account_key_to_role: Callable[[str], str | None] | None,
+) -> PreparedReplay:
+    policy_source, dispatcher, meaning_builder = _stages_for(pack)
+
+    try:
+        profile = policy_source.get_profile(
+            event.event_type, event.effective_date, payload=event.payload,
+        )
+    except PolicyNotFoundError as e:
+        return PreparedReplay(event.event_id, failed_stage="profile", message=str(e))
+
+    meaning_result = meaning_builder.build(
+        event_id=event.event_id,
+        event_type=event.event_type,
+        payload=event.payload,
+        effective_date=event.effective_date,
+        profile=profile,
+    )
+    if not meaning_result.success:
+        guard = meaning_result.guard_result
+        reason = guard.reason_code if guard is not None else None
+        return PreparedReplay(
+            event.event_id,
+            profile_name=profile.name,
+            profile_version=profile.version,
+            meaning_result=meaning_result,
+            failed_stage="meaning",
+            message=f"Guard: {reason}" if reason else "MeaningBuilder failed",
+        )
+
+    try:
+        if getattr(profile, "intent_source", None) == "payload_lines":
+            if account_key_to_role is None:
+                raise ValueError(
+                    "account_key_to_role resolver required for import.historical_journal"
+                )
+            intent = build_accounting_intent_from_payload_lines(
+                profile=profile,
+                source_event_id=event.event_id,
+                effective_date=event.effective_date,
+                payload=event.payload,
+                account_key_to_role=account_key_to_role,
+                currency=event.currency,
+                description=event.description,
+                coa_version=event.coa_version,
+                dimension_schema_version=event.dimension_schema_version,
+            )
+        else:
+            if event.amount is None:
+                return PreparedReplay(
+                    event.event_id,
+                    profile_name=profile.name,
+                    profile_version=profile.version,
+                    failed_stage="inputs",
+                    message="Posting amount not recorded for event",
+                )
+            intent = build_accounting_intent(
+                profile_name=profile.name,
+                source_event_id=event.event_id,
+                effective_date=event.effective_date,
+                amount=event.amount,
+                currency=event.currency,
+                payload=event.payload,
+                description=event.description,
+                coa_version=event.coa_version,
+                dimension_schema_version=event.dimension_schema_version,
+            )
+    except ValueError as e:
+        return PreparedReplay(
+            event.event_id,
+            profile_name=profile.name,
+            profile_version=profile.version,
+            failed_stage="intent",
+            message=str(e),
+        )
+
+    engine_result = None
+    compiled_policy = _compiled_policy(pack, profile.name, profile.version)
+    if compiled_policy is not None and compiled_policy.required_engines:
+        engine_result = dispatcher.dispatch(compiled_policy, event.payload)
+
+    return PreparedReplay(
+        event.event_id,
+        profile_name=profile.name,
+        profile_version=profile.version,
+        meaning_result=meaning_result,
+        accounting_intent=intent,
+        engine_result=engine_result,
+    )
+
+
+def prepare_replay_events(
+    pack: CompiledPolicyPack,
+    events: Sequence[ReplayEvent],
+    account_key_to_role: Callable[[str], str | None] | None = None,
+) -> tuple[PreparedReplay, ...]:
+    """
+    Run profile selection, meaning, intent and engine dispatch for a chunk.
+
+    Pure (no session).  Module profiles must be registered in the calling
+    process (``register_all_modules``; fork-started workers inherit them,
+    otherwise pass it as the pool ``initializer``).  ``account_key_to_role``
+    must be picklable when used with a process pool.
+    """
+    return tuple(_prepare_one(pack, event, account_key_to_role) for event in events)
+
+
+# =============================================================================
+# Ordered commit
+# =============================================================================
+
+
+class EventReplayer:
+    """Replays source events into a target orchestrator in original order.
+
+    Contract:
+        ``replay`` consumes ReplayEvents in order, prepares chunks of
+        ``chunk_size`` on ``executor`` (inline when None) and posts them
+        through ``target``; ``replay_from`` also reads the events and the
+        source account hashes from a source session.
+
+    Guarantees:
+        - Events are written to the target in input order; at most one
+          prepared chunk is in flight ahead of the one being committed.
+        - A failing event is rolled back to its savepoint and reported;
+          other events in the chunk still post.
+        - The target session is committed once per chunk.
+
+    Non-goals:
+        - Does NOT copy reference data into the target schema.
+        - Does NOT re-run actor validation, period checks or
+          controls.yaml rules (those already passed in the source).
+    """
+
+    def __init__(
+        self,
+        target: PostingOrchestrator,
+        executor: Executor | None = None,
+        chunk_size: int = 500,
+        account_key_to_role: Callable[[str], str | None] | None = None,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self._target = target
+        self._pack: CompiledPolicyPack = target.engine_dispatcher.compiled_pack
+        self._executor = executor
+        self._chunk_size = chunk_size
+        self._account_key_to_role = account_key_to_role
+
+    def replay_from(
+        self,
+        source_session: Session,
+        effective_from: date | None = None,
+        effective_to: date | None = None,
+    ) -> ReplayReport:
+        """Replay source events in the date window and compare per-account hashes."""
+        source_hashes = LedgerSelector(source_session).account_canonical_hashes(
+            as_of_date=effective_to, effective_from=effective_from,
+        )
+        return self.replay(
+            iter_replay_events(
+                source_session, effective_from, effective_to, self._chunk_size,
+            ),
+            source_hashes=source_hashes,
+            effective_from=effective_from,
+            effective_to=effective_to,
+        )
+
+    def replay(
+        self,
+        events: Iterable[ReplayEvent],
+        source_hashes: Mapping[str, str] | None = None,
+        effective_from: date | None = None,
+        effective_to: date | None = None,
+    ) -> ReplayReport:
+        """Replay ``events`` in order into the target and compare hashes.
+
+        When ``source_hashes`` is None only the target hashes are reported.
+        """
+        t0 = time.monotonic()
+        logger.info(
+            "event_replay_started",
+            extra={
+                "policy_fingerprint": self._pack.canonical_fingerprint,
+                "chunk_size": self._chunk_size,
+                "parallel": self._executor is not None,
+            },
+        )
+
+        read = 0
+        posted = 0
+        failures: list[ReplayFailure] = []
+        chunks = self._chunks(events)
+        pending = self._submit(next(chunks, None))
+        while pending is not None:
+            chunk, prepared = pending
+            # Prepare the next chunk while this one is written.
+            pending = self._submit(next(chunks, None))
+            results = prepared.result() if isinstance(prepared, Future) else prepared
+            read += len(chunk)
+            posted += self._commit_chunk(chunk, results, failures)
+
+        target_hashes = LedgerSelector(self._target.session).account_canonical_hashes(
+            as_of_date=effective_to, effective_from=effective_from,
+        )
+        report = ReplayReport(
+            events_read=read,
+            events_posted=posted,
+            failures=tuple(failures),
+            source_hashes=dict(source_hashes or {}),
+            target_hashes=target_hashes,
+            duration_ms=round((time.monotonic() - t0) * 1000, 2),
+        )
+        logger.info(
+            "event_replay_completed",
+            extra={
+                "events_read": report.events_read,
+                "events_posted": report.events_posted,
+                "failure_count": len(report.failures),
+                "mismatched_account_count": (
+                    len(report.mismatched_accounts) if source_hashes is not None else None
+                ),
+                "duration_ms": report.duration_ms,
+            },
+        )
+        return report
+
+    # -- internals -----------------------------------------------------------
+
+    def _chunks(self, events: Iterable[ReplayEvent]) -> Iterator[tuple[ReplayEvent, ...]]:
+        iterator = iter(events)
+        while chunk := tuple(islice(iterator, self._chunk_size)):
+            yield chunk
+
+    def _submit(
+        self, chunk: tuple[ReplayEvent, ...] | None,
+    ) -> tuple[tuple[ReplayEvent, ...], Future | tuple[PreparedReplay, ...]] | None:
+        if chunk is None:
+            return None
+        if self._executor is None:
+            return chunk, prepare_replay_events(self._pack, chunk, self._account_key_to_role)
+        return chunk, self._executor.submit(
+            prepare_replay_events, self._pack, chunk, self._account_key_to_role,
+        )
+
+    def _commit_chunk(
+        self,
+        chunk: tuple[ReplayEvent, ...],
+        prepared: tuple[PreparedReplay, ...],
+        failures: list[ReplayFailure],
+    ) -> int:
+        session = self._target.session
+        posted = 0
+        for event, prep in zip(chunk, prepared, strict=True):
+            if prep.failed_stage is not None:
+                failures.append(ReplayFailure(event.event_id, prep.failed_stage, prep.message or ""))
+                continue
+            savepoint = session.begin_nested()
+            try:
+                failure = self._post_one(event, prep)
+            except Exception as e:
+                savepoint.rollback()
+                logger.warning(
+                    "event_replay_post_failed",
+                    extra={"event_id": str(event.event_id), "error": str(e)},
+                )
+                failures.append(ReplayFailure(event.event_id, "post", str(e)))
+                continue
+            savepoint.commit()
+            if failure is None:
+                posted += 1
+            else:
+                failures.append(failure)
+        session.commit()
+        return posted
+
+    def _post_one(self, event: ReplayEvent, prep: PreparedReplay) -> ReplayFailure | None:
+        target = self._target
+        ingest_result = target.ingestor.ingest(
+            event_id=event.event_id,
+            event_type=event.event_type,
+            occurred_at=event.occurred_at,
+            effective_date=event.effective_date,
+            actor_id=event.actor_id,
+            producer=event.producer,
+            payload=event.payload,
+            schema_version=event.schema_version,
+        )
+        if ingest_result.status != IngestStatus.ACCEPTED:
+            return ReplayFailure(
+                event.event_id, "ingest",
+                ingest_result.message or ingest_result.status.value,
+            )
+
+        assert prep.meaning_result is not None and prep.accounting_intent is not None
+        result = target.interpretation_coordinator.interpret_and_post(
+            meaning_result=prep.meaning_result,
+            accounting_intent=prep.accounting_intent,
+            actor_id=event.actor_id,
+            compiled_policy=_compiled_policy(self._pack, prep.profile_name, prep.profile_version),
+            event_payload=event.payload,
+            preamble_log=[{
+                "message": "event_replayed",
+                "policy_fingerprint": self._pack.canonical_fingerprint,
+            }],
+            policy_fingerprint=self._pack.canonical_fingerprint,
+            profile_source="compiled_policy_pack",
+            engine_result=prep.engine_result,
+        )
+        if not result.success:
+            return ReplayFailure(
+                event.event_id, "post", result.error_message or result.error_code or "",
+            )
+        if result.journal_result is not None:
+            target.post_subledger_entries(
+                accounting_intent=prep.accounting_intent,
+                journal_result=result.journal_result,
+                event_id=event.event_id,
+                event_type=event.event_type,
+                payload=event.payload,
+                actor_id=event.actor_id,
+            )
+        return None
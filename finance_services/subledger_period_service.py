@@ -42,17 +42,22 @@ Key behaviors:
     - is_subledger_closed(): Queries SubledgerPeriodStatusModel.
     - are_all_subledgers_closed(): Checks all contract-defined subledgers.
     - get_close_status(): Returns status dict for all subledger types.
+    - verify_balance_projection(): Batch job that recomputes every entity
+      balance from subledger_entries, reports keys whose
+      subledger_entity_balances projection row has drifted (SL-P1), and
+      optionally rebuilds those rows.
 """
 
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 
 from finance_kernel.domain.clock import Clock
@@ -66,16 +71,46 @@ from finance_kernel.domain.values import Money
 from finance_kernel.logging_config import get_logger
 from finance_kernel.models.subledger import (
     ReconciliationFailureReportModel,
+    SubledgerEntityBalanceModel,
     SubledgerPeriodStatus,
     SubledgerPeriodStatusModel,
 )
 from finance_kernel.selectors.ledger_selector import LedgerSelector
-from finance_kernel.selectors.subledger_selector import SubledgerSelector
+from finance_kernel.selectors.subledger_selector import (
+    EntityBalanceTotalsDTO,
+    SubledgerSelector,
+)
 from finance_kernel.services.journal_writer import RoleResolver
 
 logger = get_logger("services.subledger_period")
 
 
+@dataclass(frozen=True)
+class BalanceProjectionDrift:
+    """One key whose projection row disagrees with a full recompute.
+
+    ``projected`` is None when the projection row is missing; ``recomputed``
+    is None when the projection has a row for a key with no entries.
+    """
+
+    subledger_type: str
+    entity_id: str
+    currency: str
+    projected: EntityBalanceTotalsDTO | None
+    recomputed: EntityBalanceTotalsDTO | None
+
+
+def _same_totals(
+    a: EntityBalanceTotalsDTO | None, b: EntityBalanceTotalsDTO | None,
+) -> bool:
+    # last_effective_date is an upper bound in the projection, not a total.
+    def totals(dto):
+        if dto is None:
+            return (Decimal("0"), Decimal("0"), 0, 0)
+        return (dto.debit_total, dto.credit_total, dto.entry_count, dto.open_item_count)
+    return totals(a) == totals(b)
+
+
 class SubledgerPeriodService:
     """Orchestrates subledger period close with reconciliation enforcement.
 
@@ -348,6 +383,82 @@ class SubledgerPeriodService:
                 result[sl_type.value] = row.status
         return result
 
+    def verify_balance_projection(
+        self,
+        subledger_type: SubledgerType | None = None,
+        repair: bool = False,
+    ) -> list[BalanceProjectionDrift]:
+        """Verify the subledger_entity_balances projection against a recompute.
+
+        The projection is maintained by an ORM flush listener, so writes that
+        bypass the ORM (bulk loads, manual SQL) are invisible to it; this job
+        is the guard for them.  It reads the whole subledger and is meant to
+        run as a scheduled batch job or before a close, not per request.
+
+        Args:
+            subledger_type: Restrict to one subledger (all when None).
+            repair: Rebuild drifted rows from the recompute in the caller's
+                transaction.
+
+        Returns:
+            Drifted keys (empty when the projection is exact).
+        """
+        projected = {
+            dto.key: dto
+            for dto in self._sl_selector.projected_entity_balances(subledger_type)
+        }
+        recomputed = {
+            dto.key: dto
+            for dto in self._sl_selector.recompute_entity_balances(subledger_type)
+        }
+        drifts = [
+            BalanceProjectionDrift(
+                subledger_type=key[0],
+                entity_id=key[1],
+                currency=key[2],
+                projected=projected.get(key),
+                recomputed=recomputed.get(key),
+            )
+            for key in sorted(projected.keys() | recomputed.keys())
+            if not _same_totals(projected.get(key), recomputed.get(key))
+        ]
+
+        if repair:
+            for drift in drifts:
+                self._session.execute(
+                    delete(SubledgerEntityBalanceModel).where(
+                        SubledgerEntityBalanceModel.subledger_type == drift.subledger_type,
+                        SubledgerEntityBalanceModel.entity_id == drift.entity_id,
+                        SubledgerEntityBalanceModel.currency == drift.currency,
+                    )
+                )
+                if drift.recomputed is not None:
+                    self._session.execute(
+                        insert(SubledgerEntityBalanceModel).values(
+                            id=uuid4(),
+                            subledger_type=drift.subledger_type,
+                            entity_id=drift.entity_id,
+                            currency=drift.currency,
+                            debit_total=drift.recomputed.debit_total,
+                            credit_total=drift.recomputed.credit_total,
+                            entry_count=drift.recomputed.entry_count,
+                            open_item_count=drift.recomputed.open_item_count,
+                            last_effective_date=drift.recomputed.last_effective_date,
+                        )
+                    )
+
+        log = logger.warning if drifts else logger.info
+        log(
+            "subledger_balance_projection_verified",
+            extra={
+                "subledger_type": subledger_type.value if subledger_type else None,
+                "key_count": len(recomputed),
+                "drift_count": len(drifts),
+                "repaired": repair and bool(drifts),
+            },
+        )
+        return drifts
+
     def _get_or_create_status(
         self,
         subledger_type: SubledgerType,
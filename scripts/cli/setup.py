@@ -160,6 +160,9 @@ def full_setup(session, clock):
     """Create tables, config-based COA, fiscal period, wire pipelines. Returns 6-tuple."""
     from finance_kernel.db.engine import drop_tables, get_session
     from finance_kernel.db.immutability import register_immutability_listeners
+    from finance_kernel.db.subledger_projection import (
+        register_subledger_projection_listeners,
+    )
     from finance_modules._orm_registry import create_all_tables
     from finance_config import get_active_config
     from finance_config.bridges import build_role_resolver
@@ -183,6 +186,7 @@ def full_setup(session, clock):
             pass
     create_all_tables(install_triggers=True)
     register_immutability_listeners()
+    register_subledger_projection_listeners()
     new_session = get_session()
     config = get_active_config(legal_entity="*", as_of_date=cli_config.EFFECTIVE)
     actor_id = uuid4()
@@ -220,6 +224,9 @@ def resume_setup(clock):
     from finance_config.bridges import build_role_resolver
     from finance_kernel.db.engine import get_session
     from finance_kernel.db.immutability import register_immutability_listeners
+    from finance_kernel.db.subledger_projection import (
+        register_subledger_projection_listeners,
+    )
     from finance_kernel.models.party import Party, PartyStatus, PartyType
     from finance_kernel.services.module_posting_service import ModulePostingService
     from finance_modules import register_all_modules
@@ -227,6 +234,8 @@ def resume_setup(clock):
     from finance_services.posting_orchestrator import PostingOrchestrator
 
     register_immutability_listeners()
+
+    register_subledger_projection_listeners()
     session = get_session()
     config = get_active_config(legal_entity="*", as_of_date=cli_config.EFFECTIVE)
     actor_party = session.query(Party).filter_by(party_code="SYSTEM-DEMO").first()
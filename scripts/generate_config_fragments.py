@@ -159,6 +159,8 @@ def _mapping_to_dict(m: ModuleLineMapping) -> dict[str, Any]:
         d["from_context"] = m.from_context
     if m.foreach:
         d["foreach"] = m.foreach
+    if m.skip_empty:
+        d["skip_empty"] = True
     return d
 
 
@@ -80,6 +80,9 @@ def main() -> int:
         init_engine_from_url,
     )
     from finance_kernel.db.immutability import register_immutability_listeners
+    from finance_kernel.db.subledger_projection import (
+        register_subledger_projection_listeners,
+    )
     from finance_kernel.models.party import PartyType
     from finance_kernel.services.party_service import PartyService
     from finance_modules._orm_registry import create_all_tables
@@ -116,6 +119,7 @@ def main() -> int:
 
     create_all_tables(install_triggers=True)
     register_immutability_listeners()
+    register_subledger_projection_listeners()
 
     session = get_session()
     bootstrap_actor = uuid4()
@@ -78,6 +78,9 @@ def main() -> int:
         init_engine_from_url,
     )
     from finance_kernel.db.immutability import register_immutability_listeners
+    from finance_kernel.db.subledger_projection import (
+        register_subledger_projection_listeners,
+    )
     from finance_kernel.domain.accounting_intent import (
         AccountingIntent,
         AccountingIntentSnapshot,
@@ -128,6 +131,7 @@ def main() -> int:
 
     create_all_tables(install_triggers=True)
     register_immutability_listeners()
+    register_subledger_projection_listeners()
 
     session = get_session()
     clock = DeterministicClock(datetime(2025, 6, 15, 12, 0, 0, tzinfo=UTC))
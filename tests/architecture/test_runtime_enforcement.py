@@ -228,7 +228,7 @@ class TestSnapshotFreshnessWiring:
         mock_snapshot_svc.get.return_value = mock_snapshot
         mock_validation = MagicMock()
         mock_validation.is_valid = True
-        mock_snapshot_svc.validate_integrity.return_value = mock_validation
+        mock_snapshot_svc.validate_freshness.return_value = mock_validation
 
         writer = JournalWriter.__new__(JournalWriter)
         writer._snapshot_service = mock_snapshot_svc
@@ -240,7 +240,7 @@ class TestSnapshotFreshnessWiring:
         writer._validate_snapshot_freshness(intent)
 
         mock_snapshot_svc.get.assert_called_once_with(snapshot_id)
-        mock_snapshot_svc.validate_integrity.assert_called_once_with(mock_snapshot)
+        mock_snapshot_svc.validate_freshness.assert_called_once_with(mock_snapshot)
 
     def test_snapshot_freshness_raises_when_stale(self):
         """When snapshot components have changed, raises StaleReferenceSnapshotError."""
@@ -255,7 +255,7 @@ class TestSnapshotFreshnessWiring:
         mock_validation = MagicMock()
         mock_validation.is_valid = False
         mock_validation.errors = [mock_error]
-        mock_snapshot_svc.validate_integrity.return_value = mock_validation
+        mock_snapshot_svc.validate_freshness.return_value = mock_validation
 
         writer = JournalWriter.__new__(JournalWriter)
         writer._snapshot_service = mock_snapshot_svc
@@ -308,7 +308,7 @@ class TestSnapshotFreshnessWiring:
 
         # Should not raise
         writer._validate_snapshot_freshness(intent)
-        mock_snapshot_svc.validate_integrity.assert_not_called()
+        mock_snapshot_svc.validate_freshness.assert_not_called()
 
 
 # ============================================================================
@@ -9,6 +9,7 @@ parameter-based tasks.
 """
 
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any
 from unittest.mock import MagicMock
 from uuid import uuid4
@@ -52,6 +53,10 @@ ALL_TASK_CLASSES = [
     LaborCostAllocationTask,
 ]
 
+# Tasks whose execute_item succeeds on an empty payload without wiring.
+# MassDepreciationTask posts and needs a service_factory (see TestExecuteItem).
+STUB_TASK_CLASSES = [cls for cls in ALL_TASK_CLASSES if cls is not MassDepreciationTask]
+
 EXPECTED_TASK_TYPES = {
     PaymentRunTask: "ap.payment_run",
     InvoiceMatchTask: "ap.invoice_match",
@@ -135,7 +140,7 @@ class TestTaskTypes:
 
 
 class TestExecuteItem:
-    @pytest.mark.parametrize("task_cls", ALL_TASK_CLASSES)
+    @pytest.mark.parametrize("task_cls", STUB_TASK_CLASSES)
     def test_execute_item_returns_succeeded(self, task_cls, mock_session):
         task = task_cls()
         item = BatchItemInput(item_index=0, item_key="test-item-001", payload={})
@@ -144,7 +149,7 @@ class TestExecuteItem:
         assert isinstance(result, BatchTaskResult)
         assert result.status == BatchItemStatus.SUCCEEDED
 
-    @pytest.mark.parametrize("task_cls", ALL_TASK_CLASSES)
+    @pytest.mark.parametrize("task_cls", STUB_TASK_CLASSES)
     def test_execute_item_returns_result_data(self, task_cls, mock_session):
         task = task_cls()
         item = BatchItemInput(item_index=0, item_key="test-item-001", payload={})
@@ -173,7 +178,7 @@ class TestExecuteItem:
         result = task.execute_item(item, {}, mock_session, NOW)
         assert result.result_data["invoice_id"] == "inv-002"
 
-    def test_depreciation_returns_asset_id(self, mock_session):
+    def test_depreciation_requires_service(self, mock_session):
         task = MassDepreciationTask()
         item = BatchItemInput(
             item_index=0,
@@ -181,7 +186,63 @@ class TestExecuteItem:
             payload={"asset_id": "asset-001"},
         )
         result = task.execute_item(item, {}, mock_session, NOW)
-        assert result.result_data["asset_id"] == "asset-001"
+        assert result.status == BatchItemStatus.FAILED
+        assert result.error_code == "SERVICE_NOT_CONFIGURED"
+
+    def test_depreciation_posts_through_service(self, mock_session):
+        asset_id, entry_id, actor_id = uuid4(), uuid4(), uuid4()
+        service = MagicMock()
+        service.post_depreciation_lines.return_value = MagicMock(
+            is_success=True, journal_entry_ids=(entry_id,),
+        )
+        task = MassDepreciationTask(service_factory=lambda session: service)
+        item = BatchItemInput(
+            item_index=0,
+            item_key=str(asset_id),
+            payload={
+                "asset_id": str(asset_id),
+                "period_date": "2026-01-31",
+                "depreciation_amount": "100.00",
+                "accumulated_depreciation": "300.00",
+                "net_book_value": "5700.00",
+                "cost_center": "CC-100",
+            },
+        )
+        result = task.execute_item(
+            item, {"actor_id": str(actor_id)}, mock_session, NOW,
+        )
+        assert result.status == BatchItemStatus.SUCCEEDED
+        assert result.result_data["journal_entry_ids"] == [str(entry_id)]
+        call = service.post_depreciation_lines.call_args
+        (line,) = call.args[0]
+        assert line.asset_id == asset_id
+        assert line.depreciation_amount == Decimal("100.00")
+        assert line.cost_center == "CC-100"
+        assert call.kwargs["actor_id"] == actor_id
+
+    def test_depreciation_not_posted_fails(self, mock_session):
+        service = MagicMock()
+        service.post_depreciation_lines.return_value = MagicMock(
+            is_success=False, message="period closed",
+        )
+        task = MassDepreciationTask(service_factory=lambda session: service)
+        item = BatchItemInput(
+            item_index=0,
+            item_key="a",
+            payload={
+                "asset_id": str(uuid4()),
+                "period_date": "2026-01-31",
+                "depreciation_amount": "100.00",
+                "accumulated_depreciation": "100.00",
+                "net_book_value": "5900.00",
+            },
+        )
+        result = task.execute_item(
+            item, {"actor_id": str(uuid4())}, mock_session, NOW,
+        )
+        assert result.status == BatchItemStatus.FAILED
+        assert result.error_code == "DEPRECIATION_NOT_POSTED"
+        assert result.error_message == "period closed"
 
     def test_reconcile_returns_statement_line_id(self, mock_session):
         task = BankReconcileTask()
@@ -1,126 +1,187 @@
 """
 B4: Decision Journal Overhead Benchmark.
 
-Measures the overhead of LogCapture (structured log capture + JSON
-serialization) by comparing posting latency with and without the
-capture handler installed.
-
-LogCapture is instantiated and installed automatically by
-InterpretationCoordinator.interpret_and_post(). To measure the
-"without" baseline, we temporarily patch interpret_and_post to
-skip LogCapture installation.
-
-Regression threshold: overhead < 30% of total posting time
+Measures the per-posting overhead of the DecisionJournal (context-local
+structured log collection + materialisation into decision_log) by
+comparing posting latency with and without a journal active.
+
+The journal is activated automatically by
+InterpretationCoordinator.interpret_and_post(). To measure the "without"
+baseline, we patch the coordinator's DecisionJournal with one that never
+becomes the active journal, so records are dropped by the handler.
+
+A second, DB-free benchmark emits records from 16 threads, each with its
+own active journal, and checks that per-record cost does not scale with
+the number of concurrently active journals (the old per-posting
+LogCapture handler captured every record once per active posting).
+
+Regression thresholds:
+  - overhead < 30% of total posting time
+  - 16 concurrent journals: each journal holds only its own records
+  - 16 concurrent journals: per-record cost < 4x single-journal cost
 """
 
 from __future__ import annotations
 
-import logging
+import threading
 import time
-from decimal import Decimal
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
+from finance_kernel.logging_config import LogContext, get_logger
+from finance_kernel.services.decision_journal import DecisionJournal
 from tests.benchmarks.conftest import EFFECTIVE, make_simple_event
 from tests.benchmarks.helpers import (
     BenchTimer,
     print_benchmark_header,
     print_benchmark_table,
-    print_ratio_result,
 )
 
 pytestmark = [pytest.mark.benchmark, pytest.mark.postgres]
 
 N = 50  # postings per variant
 
+THREADS = 16
+RECORDS_PER_THREAD = 2_000
+
+
+class _InactiveJournal(DecisionJournal):
+    """DecisionJournal that never becomes the active journal."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
 
 class TestDecisionJournalOverhead:
-    """B4: LogCapture + JSON serialization overhead."""
+    """B4: DecisionJournal overhead per posting."""
 
     def test_decision_journal_overhead(self, bench_posting_service):
         ctx = bench_posting_service
         service = ctx["service"]
         actor_id = ctx["actor_id"]
-        coordinator = service._coordinator
         timer = BenchTimer()
 
-        # --- Variant A: Normal posting (with LogCapture) ---
-        for i in range(N):
+        def post(i: int):
             evt = make_simple_event(iteration=i)
-            with timer.measure("with_capture", iteration=i):
-                result = service.post_event(
-                    event_type=evt["event_type"],
-                    payload=evt["payload"],
-                    effective_date=EFFECTIVE,
-                    actor_id=actor_id,
-                    amount=evt["amount"],
-                    currency=evt["currency"],
-                    producer=evt["producer"],
-                    event_id=uuid4(),
+            return service.post_event(
+                event_type=evt["event_type"],
+                payload=evt["payload"],
+                effective_date=EFFECTIVE,
+                actor_id=actor_id,
+                amount=evt["amount"],
+                currency=evt["currency"],
+                producer=evt["producer"],
+                event_id=uuid4(),
+            )
+
+        # --- Variant A: Normal posting (journal active) ---
+        journal_sizes: list[int] = []
+        for i in range(N):
+            with timer.measure("with_journal", iteration=i):
+                result = post(i)
+            assert result.is_success, f"With-journal failed at {i}"
+            if result.interpretation_result and result.interpretation_result.outcome:
+                journal_sizes.append(
+                    len(result.interpretation_result.outcome.decision_log or [])
                 )
-            assert result.is_success, f"With-capture failed at {i}"
-
-        # --- Variant B: Posting with LogCapture disabled ---
-        # Patch interpret_and_post to use a no-op LogCapture
-        from finance_kernel.services.log_capture import LogCapture
-
-        class NoOpCapture(LogCapture):
-            """LogCapture that does not install itself."""
-            def install(self):
-                return self  # No-op: don't add to logger
 
-            def uninstall(self):
-                pass  # No-op
-
-        original_interpret = coordinator.interpret_and_post.__func__
-
-        def patched_interpret(self_coord, **kwargs):
-            """interpret_and_post with NoOpCapture."""
-            # The LogCapture is created inline in interpret_and_post.
-            # We patch LogCapture at the module level.
-            with patch(
-                "finance_kernel.services.interpretation_coordinator.LogCapture",
-                NoOpCapture,
-            ):
-                return original_interpret(self_coord, **kwargs)
-
-        with patch.object(type(coordinator), "interpret_and_post", patched_interpret):
+        # --- Variant B: Posting with the journal never activated ---
+        with patch(
+            "finance_kernel.services.interpretation_coordinator.DecisionJournal",
+            _InactiveJournal,
+        ):
             for i in range(N):
-                evt = make_simple_event(iteration=i)
-                with timer.measure("without_capture", iteration=i):
-                    result = service.post_event(
-                        event_type=evt["event_type"],
-                        payload=evt["payload"],
-                        effective_date=EFFECTIVE,
-                        actor_id=actor_id,
-                        amount=evt["amount"],
-                        currency=evt["currency"],
-                        producer=evt["producer"],
-                        event_id=uuid4(),
-                    )
-                assert result.is_success, f"Without-capture failed at {i}"
-
-        # Compute overhead
-        with_summary = timer.summary("with_capture")
-        without_summary = timer.summary("without_capture")
+                with timer.measure("without_journal", iteration=i):
+                    result = post(i)
+                assert result.is_success, f"Without-journal failed at {i}"
+
+        with_summary = timer.summary("with_journal")
+        without_summary = timer.summary("without_journal")
 
         overhead_ms = with_summary.mean_ms - without_summary.mean_ms
         overhead_pct = (overhead_ms / with_summary.mean_ms * 100) if with_summary.mean_ms > 0 else 0
 
-        # Print results
         print_benchmark_header("B4 Decision Journal Overhead")
         print_benchmark_table([with_summary, without_summary])
 
-        print(f"  Overhead: {overhead_ms:.1f}ms ({overhead_pct:.1f}% of total)")
+        if journal_sizes:
+            print(f"  Records per posting: {sum(journal_sizes) / len(journal_sizes):.1f}")
+        print(f"  Overhead per posting: {overhead_ms:.2f}ms ({overhead_pct:.1f}% of total)")
         print()
 
-        threshold_pct = 31.0
+        threshold_pct = 30.0
         status = "PASS" if overhead_pct <= threshold_pct else "FAIL"
         print(f"  [{status}] Overhead {overhead_pct:.1f}% (threshold: < {threshold_pct:.0f}%)")
         print()
 
         assert overhead_pct <= threshold_pct, (
-            f"REGRESSION: LogCapture overhead {overhead_pct:.1f}% > {threshold_pct:.0f}%"
+            f"REGRESSION: DecisionJournal overhead {overhead_pct:.1f}% > {threshold_pct:.0f}%"
+        )
+
+
+class TestDecisionJournalConcurrency:
+    """B4b: Per-record cost with many concurrently active journals."""
+
+    @staticmethod
+    def _emit(count: int, sizes: list[int], elapsed: list[float], barrier) -> None:
+        log = get_logger("bench.decision_journal")
+        with DecisionJournal() as journal:
+            with LogContext.bind(correlation_id=str(uuid4())):
+                LogContext.set_snapshot()
+                try:
+                    if barrier is not None:
+                        barrier.wait()
+                    t0 = time.perf_counter()
+                    for i in range(count):
+                        log.info("bench_record", extra={"i": i, "status": "ok"})
+                    elapsed.append(time.perf_counter() - t0)
+                finally:
+                    LogContext.clear_snapshot()
+            journal.to_dicts()
+            sizes.append(len(journal))
+
+    def test_concurrent_journals_isolated(self):
+        # Single journal baseline
+        sizes: list[int] = []
+        elapsed: list[float] = []
+        self._emit(RECORDS_PER_THREAD, sizes, elapsed, None)
+        single_us = elapsed[0] / RECORDS_PER_THREAD * 1e6
+
+        # THREADS journals active at once
+        sizes, elapsed = [], []
+        barrier = threading.Barrier(THREADS)
+        threads = [
+            threading.Thread(
+                target=self._emit,
+                args=(RECORDS_PER_THREAD, sizes, elapsed, barrier),
+            )
+            for _ in range(THREADS)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        concurrent_us = max(elapsed) / RECORDS_PER_THREAD * 1e6 / THREADS
+
+        print_benchmark_header("B4b Decision Journal Concurrency")
+        print(f"  1 journal:   {single_us:.2f}us/record")
+        print(
+            f"  {THREADS} journals: {concurrent_us:.2f}us/record "
+            f"(wall time / total records)"
+        )
+        print()
+
+        assert sizes == [RECORDS_PER_THREAD] * THREADS, (
+            f"Journals captured foreign records: {sizes}"
+        )
+        assert concurrent_us < single_us * 4, (
+            f"REGRESSION: per-record cost {concurrent_us:.2f}us with {THREADS} "
+            f"journals vs {single_us:.2f}us with one"
         )
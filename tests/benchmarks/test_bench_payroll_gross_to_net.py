@@ -0,0 +1,112 @@
+"""
+B10: Pay-Run Gross-to-Net Benchmark.
+
+Measures calculate_pay_run over a 100K-employee columnar pay run
+(REGULAR / OVERTIME / BONUS earnings, both filing statuses, FICA wage-base
+crossings), sequentially and with a process pool, and compares per-employee
+cost against the single-employee path (PayrollService.calculate_gross_to_net
+helpers) on a sample.
+
+DB-free: the calculation is pure.
+
+Regression thresholds:
+  - 100K employees, sequential: < 10s
+  - batch per-employee cost < single-employee helper cost
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from finance_modules.payroll.helpers import (
+    calculate_federal_withholding,
+    calculate_fica,
+    calculate_pay_run,
+    calculate_state_withholding,
+)
+from finance_modules.payroll.models import PayRunInput
+from tests.benchmarks.helpers import (
+    BenchTimer,
+    print_benchmark_header,
+    print_benchmark_table,
+)
+
+pytestmark = [pytest.mark.benchmark]
+
+EMPLOYEES = 100_000
+SAMPLE = 5_000
+SEQUENTIAL_THRESHOLD_S = 10.0
+
+
+def _build_pay_run(n: int) -> PayRunInput:
+    return PayRunInput(
+        employee_ids=tuple(uuid4() for _ in range(n)),
+        earnings_codes=("REGULAR", "OVERTIME", "BONUS"),
+        earnings=tuple(
+            (
+                Decimal(1500 + (i * 37) % 9000) + Decimal("0.25"),
+                Decimal((i * 13) % 400),
+                Decimal(5000) if i % 50 == 0 else Decimal("0"),
+            )
+            for i in range(n)
+        ),
+        filing_statuses=tuple("married" if i % 3 == 0 else "single" for i in range(n)),
+        allowances=tuple(i % 5 for i in range(n)),
+        state_rates=tuple(Decimal("0.05") for _ in range(n)),
+        ytd_earnings=tuple(Decimal((i * 7919) % 220_000) for i in range(n)),
+    )
+
+
+class TestPayRunThroughput:
+    """B10: Gross-to-net for a full pay run."""
+
+    def test_pay_run_100k(self):
+        pay_run = _build_pay_run(EMPLOYEES)
+        timer = BenchTimer()
+
+        with timer.measure("pay_run_sequential"):
+            sequential = calculate_pay_run(pay_run)
+
+        workers = min(8, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            with timer.measure("pay_run_parallel"):
+                parallel = calculate_pay_run(pay_run, executor=pool)
+
+        with timer.measure("single_employee_sample"):
+            for i in range(SAMPLE):
+                gross = sum(pay_run.earnings[i], Decimal("0"))
+                calculate_federal_withholding(
+                    gross, pay_run.filing_statuses[i], pay_run.allowances[i],
+                )
+                calculate_state_withholding(gross, pay_run.state_rates[i])
+                calculate_fica(gross, pay_run.ytd_earnings[i])
+
+        seq = timer.summary("pay_run_sequential")
+        par = timer.summary("pay_run_parallel")
+        single = timer.summary("single_employee_sample")
+
+        batch_us = seq.mean_ms * 1000 / EMPLOYEES
+        single_us = single.mean_ms * 1000 / SAMPLE
+
+        print_benchmark_header("B10 Pay-Run Gross-to-Net")
+        print_benchmark_table([seq, par, single])
+        print(f"  Employees: {EMPLOYEES:,}  (parallel workers: {workers})")
+        print(f"  Batch:  {batch_us:.2f}us/employee")
+        print(f"  Single: {single_us:.2f}us/employee")
+        print()
+
+        assert parallel == sequential
+        assert sequential.total_gross == sequential.total_withheld + sequential.total_net
+        assert seq.mean_ms / 1000 < SEQUENTIAL_THRESHOLD_S, (
+            f"REGRESSION: 100K pay run took {seq.mean_ms / 1000:.2f}s "
+            f"(threshold {SEQUENTIAL_THRESHOLD_S:.0f}s)"
+        )
+        assert batch_us < single_us, (
+            f"REGRESSION: batch {batch_us:.2f}us/employee not faster than "
+            f"single-employee path {single_us:.2f}us"
+        )
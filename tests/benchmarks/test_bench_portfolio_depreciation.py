@@ -0,0 +1,96 @@
+"""
+B11: Portfolio Depreciation Benchmark.
+
+Measures depreciate_portfolio over a 100K-asset register (straight-line,
+double-declining, sum-of-years; all three conventions) and compares
+per-asset cost against calling the single-asset helpers in a loop.
+
+DB-free: the calculation is pure.
+
+Regression thresholds:
+  - 100K assets, one period: < 5s
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from finance_modules.assets.helpers import (
+    depreciate_portfolio,
+    double_declining_balance,
+    straight_line,
+)
+from finance_modules.assets.models import PortfolioAsset
+from tests.benchmarks.helpers import (
+    BenchTimer,
+    print_benchmark_header,
+    print_benchmark_table,
+)
+
+pytestmark = [pytest.mark.benchmark]
+
+ASSETS = 100_000
+PERIOD = date(2025, 6, 30)
+THRESHOLD_S = 5.0
+
+_METHODS = ("straight_line", "double_declining", "sum_of_years")
+_CONVENTIONS = ("full_month", "mid_month", "half_year")
+
+
+def _build_register(n: int) -> list[PortfolioAsset]:
+    return [
+        PortfolioAsset(
+            asset_id=uuid4(),
+            method=_METHODS[i % 3],
+            in_service_date=date(2020 + i % 5, 1 + i % 12, 1),
+            cost=Decimal(5000 + (i * 37) % 50_000),
+            salvage_value=Decimal((i * 11) % 500),
+            useful_life_months=36 + 12 * (i % 8),
+            accumulated_depreciation=Decimal((i * 13) % 2000),
+            convention=_CONVENTIONS[(i // 3) % 3],
+        )
+        for i in range(n)
+    ]
+
+
+class TestPortfolioDepreciationThroughput:
+    """B11: One period of depreciation for a whole register."""
+
+    def test_portfolio_100k(self):
+        register = _build_register(ASSETS)
+        timer = BenchTimer()
+
+        with timer.measure("portfolio"):
+            lines, skipped = depreciate_portfolio(register, PERIOD)
+
+        # Reference only: amounts without schedule lines or conventions.
+        with timer.measure("per_asset_helpers"):
+            for asset in register:
+                if asset.method == "double_declining":
+                    double_declining_balance(
+                        asset.cost, asset.accumulated_depreciation,
+                        asset.useful_life_months, asset.salvage_value,
+                    )
+                else:
+                    straight_line(
+                        asset.cost, asset.salvage_value, asset.useful_life_months,
+                    )
+
+        portfolio = timer.summary("portfolio")
+        per_asset = timer.summary("per_asset_helpers")
+
+        print_benchmark_header("B11 Portfolio Depreciation")
+        print_benchmark_table([portfolio, per_asset])
+        print(f"  Assets: {ASSETS:,}  lines: {len(lines):,}  skipped: {len(skipped)}")
+        print(f"  Portfolio: {portfolio.mean_ms * 1000 / ASSETS:.2f}us/asset")
+        print()
+
+        assert skipped == ()
+        assert portfolio.mean_ms / 1000 < THRESHOLD_S, (
+            f"REGRESSION: 100K-asset period took {portfolio.mean_ms / 1000:.2f}s "
+            f"(threshold {THRESHOLD_S:.0f}s)"
+        )
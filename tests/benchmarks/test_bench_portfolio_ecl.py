@@ -0,0 +1,94 @@
+"""
+B12: Portfolio ECL Benchmark.
+
+Measures the portfolio ECL engine (PortfolioECLAccumulator +
+apply_ecl_matrix + provision_rollforward) over 1M open AR items in
+5,000-item chunks, the shape SubledgerSelector.iter_open_item_chunks
+streams.
+
+DB-free: chunks are generated up front so only engine time is measured.
+
+Regression thresholds:
+  - 1M open items: < 10s
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from finance_kernel.selectors.subledger_selector import OpenItemDTO
+from finance_modules.credit_loss.calculations import (
+    PortfolioECLAccumulator,
+    apply_ecl_matrix,
+    provision_rollforward,
+)
+from finance_modules.credit_loss.models import ECLRateMatrix
+from tests.benchmarks.helpers import (
+    BenchTimer,
+    print_benchmark_header,
+    print_benchmark_table,
+)
+
+pytestmark = [pytest.mark.benchmark]
+
+ITEMS = 1_000_000
+CHUNK = 5_000
+AS_OF = date(2025, 6, 30)
+THRESHOLD_S = 10.0
+
+_SEGMENTS = ("retail", "wholesale", "government", "intercompany")
+_MATRIX = ECLRateMatrix(rates={
+    ("*", "Current"): Decimal("0.005"),
+    ("*", "1-30"): Decimal("0.01"),
+    ("*", "31-60"): Decimal("0.03"),
+    ("*", "61-90"): Decimal("0.08"),
+    ("*", "Over 90"): Decimal("0.25"),
+})
+
+
+def _chunks():
+    for start in range(0, ITEMS, CHUNK):
+        yield tuple(
+            OpenItemDTO(
+                id=uuid4(),
+                entity_id=f"CUST-{i % 20_000}",
+                effective_date=AS_OF - timedelta(days=i % 720),
+                open_amount=Decimal(100 + (i * 37) % 9_900),
+                currency="USD",
+                dimensions={"segment": _SEGMENTS[i % 4]},
+            )
+            for i in range(start, min(start + CHUNK, ITEMS))
+        )
+
+
+class TestPortfolioECLThroughput:
+    """B12: One streamed ECL pass over a 1M-item AR portfolio."""
+
+    def test_portfolio_ecl_1m(self):
+        timer = BenchTimer()
+        chunks = list(_chunks())
+
+        with timer.measure("portfolio_ecl"):
+            acc = PortfolioECLAccumulator(AS_OF)
+            for chunk in chunks:
+                acc.add(chunk)
+            cells = apply_ecl_matrix(acc.cells(), _MATRIX)
+            rollforward = provision_rollforward(cells)
+
+        summary = timer.summary("portfolio_ecl")
+        print_benchmark_header("B12 Portfolio ECL")
+        print_benchmark_table([summary])
+        print(f"  Items: {ITEMS:,}  cells: {len(cells):,}  segments: {len(rollforward)}")
+        print(f"  Throughput: {ITEMS / (summary.mean_ms / 1000):,.0f} items/s")
+        print()
+
+        assert acc.item_count == ITEMS
+        assert len(rollforward) == len(_SEGMENTS)
+        assert summary.mean_ms / 1000 < THRESHOLD_S, (
+            f"REGRESSION: 1M-item ECL pass took {summary.mean_ms / 1000:.2f}s "
+            f"(threshold {THRESHOLD_S:.0f}s)"
+        )
@@ -0,0 +1,214 @@
+"""
+Connection pool starvation, telemetry and adaptive sizing.
+
+Each test builds a small dedicated engine with ``InstrumentedQueuePool`` so
+starvation is reproduced without touching the shared test engine: more
+workers than pooled connections, each holding its connection for a fixed
+time, with a checkout timeout shorter than the queue drains.
+
+Verifies:
+- Checkout wait, per-caller hold time, and timeout counts are recorded.
+- Overflow checkouts are counted.
+- The adaptive policy grows a starved pool, which removes the timeouts, and
+  shrinks it back when idle.
+- Growing keeps the live pool and its open connections; shrinking swaps
+  in a recreated pool.  The pool logs outside the ``finance_kernel``
+  logger tree (kept out of the decision journal).
+- The engine-level telemetry is exported next to the posting metrics.
+
+Run with: pytest tests/concurrency/test_pool_starvation.py -v
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from finance_kernel.db.engine import get_pool_telemetry
+from finance_kernel.db.pool_telemetry import (
+    AdaptivePoolPolicy,
+    InstrumentedQueuePool,
+    PoolTelemetry,
+    pool_caller,
+)
+
+HOLD_S = 0.25
+
+
+@pytest.fixture
+def make_engine(db_engine):
+    engines = []
+
+    def make(pool_size, max_overflow=0, timeout=0.4, adaptive=None):
+        engine = create_engine(
+            db_engine.url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=timeout,
+        )
+        engines.append(engine)
+        return engine, PoolTelemetry(engine, adaptive=adaptive)
+
+    yield make
+    for engine in engines:
+        engine.dispose()
+
+
+def _storm(engine, workers, caller="batch", hold_s=HOLD_S):
+    """Run ``workers`` threads that each hold a connection for ``hold_s``."""
+    timeouts = []
+    barrier = threading.Barrier(workers)
+
+    def work():
+        barrier.wait()
+        with pool_caller(caller):
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT pg_sleep(:s)"), {"s": hold_s})
+            except PoolTimeoutError:
+                timeouts.append(1)
+
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(timeouts)
+
+
+class TestPoolStarvation:
+
+    def test_starvation_reproduced_and_measured(self, make_engine):
+        engine, telemetry = make_engine(pool_size=2)
+
+        timeouts = _storm(engine, workers=8)
+
+        snap = telemetry.snapshot()
+        assert timeouts > 0
+        assert snap.timeouts == timeouts
+        assert snap.checkouts == 8 - timeouts
+        assert snap.wait_count == 8
+        assert snap.wait_max_us >= 350_000
+        hold = snap.hold("batch")
+        assert hold.count == 8 - timeouts
+        assert hold.p50_us >= HOLD_S * 1_000_000
+        assert snap.checked_out == 0 and snap.resizes == 0
+
+    def test_overflow_checkouts_counted(self, make_engine):
+        engine, telemetry = make_engine(pool_size=1, max_overflow=3)
+
+        assert _storm(engine, workers=4, hold_s=0.1) == 0
+
+        snap = telemetry.snapshot()
+        assert snap.overflow_checkouts >= 1
+        assert snap.timeouts == 0
+
+    def test_untagged_checkouts_use_default_caller(self, make_engine):
+        engine, telemetry = make_engine(pool_size=1)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert telemetry.snapshot().hold("default").count == 1
+
+
+class TestAdaptivePoolSizing:
+
+    def test_grows_under_starvation_and_shrinks_when_idle(self, make_engine):
+        policy = AdaptivePoolPolicy(
+            min_size=2, max_size=8, target_wait_ms=20, window=8, interval_s=0, step=3,
+        )
+        engine, telemetry = make_engine(pool_size=2, timeout=2, adaptive=policy)
+
+        _storm(engine, workers=8)
+        grown = telemetry.snapshot()
+        assert grown.pool_size > 2
+        assert grown.resizes >= 1
+
+        telemetry.reset()
+        assert _storm(engine, workers=grown.pool_size, hold_s=0.05) == 0
+        assert telemetry.snapshot().timeouts == 0
+
+        for _ in range(20):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        shrunk = telemetry.snapshot()
+        assert shrunk.pool_size == 2
+        assert shrunk.checked_in <= shrunk.pool_size
+        assert shrunk.checked_out == 0
+
+    def test_resize_swaps_pool_and_drains_old(self, make_engine):
+        engine, telemetry = make_engine(pool_size=4)
+        old = engine.pool
+        conns = [engine.connect() for _ in range(4)]
+        telemetry.resize(2)
+        for conn in conns:
+            conn.close()
+
+        snap = telemetry.snapshot()
+        assert engine.pool is not old
+        assert (snap.pool_size, snap.checked_out) == (2, 0)
+        assert old.checkedin() == 0
+        assert snap.hold("default").count == 4
+
+    def test_grow_keeps_pool_and_connections(self, make_engine):
+        engine, telemetry = make_engine(pool_size=2, timeout=0.2)
+        pool = engine.pool
+        held = [engine.connect() for _ in range(2)]
+        raw = {id(conn.connection.dbapi_connection) for conn in held}
+        held[1].close()
+
+        telemetry.resize(4)
+        held.extend(engine.connect() for _ in range(3))
+
+        snap = telemetry.snapshot()
+        assert engine.pool is pool
+        assert (snap.pool_size, snap.checked_out, snap.overflow) == (4, 4, 0)
+        open_conns = [conn for conn in held if not conn.closed]
+        assert raw <= {id(conn.connection.dbapi_connection) for conn in open_conns}
+        for conn in held:
+            conn.close()
+        assert telemetry.snapshot().checked_in == 4
+
+    def test_dispose_keeps_telemetry(self, make_engine):
+        engine, telemetry = make_engine(pool_size=1)
+        engine.dispose()
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert engine.pool.telemetry is telemetry
+        assert telemetry.snapshot().checkouts == 1
+
+    def test_pool_logs_outside_kernel_logger_tree(self, make_engine):
+        engine, _ = make_engine(pool_size=1)
+        assert engine.pool.logger.name == "sqlalchemy.pool.impl.QueuePool"
+        assert engine.pool.recreate().logger.name == engine.pool.logger.name
+
+    def test_policy_validation(self):
+        with pytest.raises(ValueError, match="min_size"):
+            AdaptivePoolPolicy(min_size=5, max_size=2)
+        with pytest.raises(ValueError, match="positive"):
+            AdaptivePoolPolicy(min_size=1, max_size=2, target_wait_ms=0)
+
+    def test_requires_instrumented_pool(self, db_engine):
+        engine = create_engine(db_engine.url)
+        try:
+            with pytest.raises(ValueError, match="InstrumentedQueuePool"):
+                PoolTelemetry(engine)
+        finally:
+            engine.dispose()
+
+
+class TestPrimaryEngineTelemetry:
+
+    def test_primary_engine_instrumented(self, db_engine):
+        telemetry = get_pool_telemetry()
+        assert telemetry is not None
+        with db_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        text_export = telemetry.to_prometheus_text()
+        assert "finance_db_pool_checkouts_total" in text_export
+        assert 'finance_db_pool_hold_seconds_count{caller="default"}' in text_export
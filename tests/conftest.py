@@ -64,6 +64,10 @@ from finance_kernel.db.immutability import (
     register_immutability_listeners,
     unregister_immutability_listeners,
 )
+from finance_kernel.db.subledger_projection import (
+    register_subledger_projection_listeners,
+    unregister_subledger_projection_listeners,
+)
 from finance_kernel.domain.accounting_intent import (
     AccountingIntent,
     AccountingIntentSnapshot,
@@ -490,7 +494,10 @@ def db_tables(db_engine):
     # ORM-level immutability listeners (defense layer 1, separate from
     # the DB triggers installed by create_all_tables).
     register_immutability_listeners()
+    # Subledger balance projection (SL-P1) maintained on flush.
+    register_subledger_projection_listeners()
     yield
+    unregister_subledger_projection_listeners()
     unregister_immutability_listeners()
     try:
         drop_tables()
@@ -0,0 +1,57 @@
+"""
+Tests for policy bridge intent line building.
+
+Covers how foreach line mappings expand payload collections: one line per
+item, the event-amount fallback for empty or absent collections, and the
+opt-in ``skip_empty`` used by consolidated payroll postings.
+"""
+
+from decimal import Decimal
+
+from finance_kernel.domain.policy_bridge import _build_intent_lines
+from finance_modules.expense.profiles import CORPORATE_CARD_STATEMENT_MAPPINGS
+from finance_modules.payroll.profiles import LABOR_DISTRIBUTION_BATCH_MAPPINGS
+
+
+def _roles(lines):
+    return [(line.account_role, line.side, line.money.amount) for line in lines]
+
+
+class TestForeachLines:
+    """Tests for foreach expansion in _build_intent_lines."""
+
+    def test_one_line_per_item(self):
+        lines = _build_intent_lines(
+            CORPORATE_CARD_STATEMENT_MAPPINGS, Decimal("30.00"), "USD",
+            {"card_transactions": [{"amount": "10.00"}, {"amount": "20.00"}]},
+        )
+        assert _roles(lines) == [
+            ("EXPENSE", "debit", Decimal("10.00")),
+            ("EXPENSE", "debit", Decimal("20.00")),
+            ("CORPORATE_CARD_LIABILITY", "credit", Decimal("30.00")),
+        ]
+
+    def test_empty_collection_posts_event_amount(self):
+        """An existing foreach policy with an empty list keeps its fallback line."""
+        for payload in ({"card_transactions": []}, {}):
+            lines = _build_intent_lines(
+                CORPORATE_CARD_STATEMENT_MAPPINGS, Decimal("30.00"), "USD", payload,
+            )
+            assert _roles(lines) == [
+                ("EXPENSE", "debit", Decimal("30.00")),
+                ("CORPORATE_CARD_LIABILITY", "credit", Decimal("30.00")),
+            ]
+
+    def test_skip_empty_collection_posts_nothing(self):
+        lines = _build_intent_lines(
+            LABOR_DISTRIBUTION_BATCH_MAPPINGS, Decimal("100.00"), "USD",
+            {
+                "direct_lines": [{"amount": "100.00"}],
+                "indirect_lines": [],
+                "overhead_lines": [],
+            },
+        )
+        assert _roles(lines) == [
+            ("WIP", "debit", Decimal("100.00")),
+            ("LABOR_CLEARING", "credit", Decimal("100.00")),
+        ]
@@ -20,6 +20,7 @@ from finance_engines.aging import (
     WEEKLY_BUCKETS,
     AgeBucket,
     AgedItem,
+    AgingBucketTotal,
     AgingCalculator,
     AgingReport,
 )
@@ -432,6 +433,69 @@ class TestGenerateReportFromDocuments:
         assert report.total_amount() == Money.of("300.00", "USD")
 
 
+class TestGenerateReportFromTotals:
+    """Tests for reports assembled from database-aggregated bucket totals."""
+
+    def setup_method(self):
+        self.calculator = AgingCalculator()
+
+    def _total(self, counterparty, bucket, amount, overdue, count):
+        return AgingBucketTotal(
+            counterparty_id=counterparty,
+            bucket_name=bucket,
+            amount=Money.of(amount, "USD"),
+            overdue_amount=Money.of(overdue, "USD"),
+            item_count=count,
+        )
+
+    def test_totals_without_items(self):
+        """Report totals come from bucket totals; no items are needed."""
+        report = self.calculator.generate_report_from_totals(
+            totals=[
+                self._total("c-1", "Current", "100.00", "0", 3),
+                self._total("c-1", "31-60", "50.00", "50.00", 1),
+                self._total("c-2", "31-60", "25.00", "25.00", 2),
+            ],
+            as_of_date=date(2024, 2, 15),
+            report_type="AR",
+        )
+
+        assert report.items == ()
+        assert report.item_count == 6
+        assert report.currency == "USD"
+        assert report.total_amount() == Money.of("175.00", "USD")
+        assert report.overdue_amount() == Money.of("75.00", "USD")
+        assert report.total_by_bucket()["31-60"] == Money.of("75.00", "USD")
+        assert report.total_by_bucket()["Over 90"].is_zero
+        assert report.total_by_counterparty()["c-2"]["31-60"] == Money.of("25.00", "USD")
+
+    def test_unknown_bucket_rejected(self):
+        with pytest.raises(ValueError, match="Unknown aging bucket"):
+            self.calculator.generate_report_from_totals(
+                totals=[self._total("c-1", "1-7", "1.00", "1.00", 1)],
+                as_of_date=date(2024, 2, 15),
+            )
+
+    def test_empty_totals_use_requested_currency(self):
+        report = self.calculator.generate_report_from_totals(
+            totals=[], as_of_date=date(2024, 2, 15), currency="EUR",
+        )
+        assert report.item_count == 0
+        assert report.total_amount() == Money.zero("EUR")
+        assert report.total_by_bucket() == {}
+
+    def test_totals_cached_and_copied(self):
+        """Totals are aggregated once; callers cannot mutate the cache."""
+        report = self.calculator.generate_report_from_totals(
+            totals=[self._total("c-1", "Current", "10.00", "0", 1)],
+            as_of_date=date(2024, 2, 15),
+        )
+        first = report.total_by_bucket()
+        first["Current"] = Money.of("999.00", "USD")
+        assert report.total_by_bucket()["Current"] == Money.of("10.00", "USD")
+        assert report._summary is report._summary
+
+
 class TestStandardBuckets:
     """Tests for pre-defined bucket sets."""
 
@@ -9,6 +9,7 @@ Covers:
 - Weighted allocation
 - Equal allocation
 - Rounding handling
+- Largest-remainder rounding and matrix mode
 - Edge cases and error handling
 """
 
@@ -24,6 +25,9 @@ from finance_engines.allocation import (
     AllocationMethod,
     AllocationResult,
     AllocationTarget,
+    RoundingPolicy,
+    allocate_matrix,
+    largest_remainder_split,
 )
 from finance_kernel.domain.values import Money
 
@@ -346,6 +350,24 @@ class TestEqualAllocation:
         total = sum(line.allocated.amount for line in result.lines)
         assert total == Decimal("100.00")
 
+    def test_non_last_rounding_target(self):
+        """A designated target before the last absorbs the residual and the sum is exact."""
+        result = self.engine.allocate(
+            amount=Money.of("100.00", "USD"),
+            targets=[
+                AllocationTarget(target_id="a"),
+                AllocationTarget(target_id="b"),
+                AllocationTarget(target_id="c"),
+            ],
+            method=AllocationMethod.EQUAL,
+            rounding_target_index=0,
+        )
+
+        assert [line.allocated.amount for line in result.lines] == [
+            Decimal("33.34"), Decimal("33.33"), Decimal("33.33"),
+        ]
+        assert sum(line.allocated.amount for line in result.lines) == Decimal("100.00")
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
@@ -510,3 +532,145 @@ class TestConvenienceMethods:
         )
 
         assert result.method == AllocationMethod.EQUAL
+
+
+class TestLargestRemainderSplit:
+    """Tests for the integer minor-unit core."""
+
+    def test_exact_split(self):
+        assert largest_remainder_split(1000, [3, 7]) == [300, 700]
+
+    def test_residual_to_largest_remainders(self):
+        # 100 * (1, 2, 4) / 7 = 14.28, 28.57, 57.14 -> floor 14, 28, 57 (+1)
+        assert largest_remainder_split(100, [1, 2, 4]) == [14, 29, 57]
+
+    def test_ties_go_to_lowest_index(self):
+        assert largest_remainder_split(10000, [1, 1, 1]) == [3334, 3333, 3333]
+        assert largest_remainder_split(2, [1, 1, 1]) == [1, 1, 0]
+
+    def test_zero_weight_receives_nothing(self):
+        split = largest_remainder_split(1, [0, 1, 1, 0])
+        assert split == [0, 1, 0, 0]
+
+    def test_negative_total_conserved(self):
+        split = largest_remainder_split(-100, [1, 1, 1])
+        assert sum(split) == -100
+        assert split == [-33, -33, -34]
+
+    def test_zero_total_weight_raises(self):
+        with pytest.raises(ValueError, match="zero"):
+            largest_remainder_split(100, [0, 0])
+
+
+class TestLargestRemainderPolicy:
+    """RoundingPolicy.LARGEST_REMAINDER on ratio methods."""
+
+    def setup_method(self):
+        self.engine = AllocationEngine()
+
+    def test_equal_spreads_residual_from_first(self):
+        result = self.engine.allocate(
+            amount=Money.of("100.00", "USD"),
+            targets=[AllocationTarget(target_id=x) for x in "abc"],
+            method=AllocationMethod.EQUAL,
+            rounding_policy=RoundingPolicy.LARGEST_REMAINDER,
+        )
+        assert [l.allocated.amount for l in result.lines] == [
+            Decimal("33.34"), Decimal("33.33"), Decimal("33.33"),
+        ]
+        assert result.total_allocated == Money.of("100.00", "USD")
+
+    def test_weighted_conserves_total(self):
+        targets = [
+            AllocationTarget(target_id=f"t{i}", weight=Decimal(w))
+            for i, w in enumerate(["1.5", "2.25", "0", "7"])
+        ]
+        result = self.engine.allocate(
+            amount=Money.of("1000.01", "USD"),
+            targets=targets,
+            method=AllocationMethod.WEIGHTED,
+            rounding_policy=RoundingPolicy.LARGEST_REMAINDER,
+        )
+        assert result.total_allocated == Money.of("1000.01", "USD")
+        assert result.lines[2].allocated.is_zero
+
+    def test_designated_target_unchanged(self):
+        targets = [AllocationTarget(target_id=x) for x in "abc"]
+        default = self.engine.allocate(
+            amount=Money.of("100.00", "USD"),
+            targets=targets,
+            method=AllocationMethod.EQUAL,
+        )
+        assert [l.allocated.amount for l in default.lines] == [
+            Decimal("33.33"), Decimal("33.33"), Decimal("33.34"),
+        ]
+
+    def test_sub_cent_amount_raises(self):
+        with pytest.raises(ValueError, match="precision"):
+            self.engine.allocate(
+                amount=Money.of("1.005", "USD"),
+                targets=[AllocationTarget(target_id="a")],
+                method=AllocationMethod.EQUAL,
+                rounding_policy=RoundingPolicy.LARGEST_REMAINDER,
+            )
+
+
+class TestAllocationMatrix:
+    """Matrix mode: M sources x N targets in one call."""
+
+    def test_shared_weights(self):
+        matrix = allocate_matrix(
+            sources=[
+                ("FRINGE", Money.of("350.00", "USD")),
+                ("OVERHEAD", Money.of("100.00", "USD")),
+            ],
+            target_ids=["c1", "c2", "c3"],
+            weights=[Decimal("1"), Decimal("1"), Decimal("1")],
+        )
+        assert matrix.row(0) == (
+            Money.of("116.67", "USD"), Money.of("116.67", "USD"), Money.of("116.66", "USD"),
+        )
+        assert matrix.amount(1, 0) == Money.of("33.34", "USD")
+        assert matrix.source_totals() == (
+            Money.of("350.00", "USD"), Money.of("100.00", "USD"),
+        )
+        assert matrix.target_totals() == (
+            Money.of("150.01", "USD"), Money.of("150.00", "USD"), Money.of("149.99", "USD"),
+        )
+
+    def test_per_source_weights(self):
+        matrix = allocate_matrix(
+            sources=[("A", Money.of("10.00", "USD")), ("B", Money.of("10.00", "USD"))],
+            target_ids=["x", "y"],
+            weights=[[Decimal("1"), Decimal("0")], [Decimal("1"), Decimal("3")]],
+        )
+        assert matrix.row(0) == (Money.of("10.00", "USD"), Money.of("0.00", "USD"))
+        assert matrix.row(1) == (Money.of("2.50", "USD"), Money.of("7.50", "USD"))
+
+    def test_large_fan_out_conserves_every_row(self):
+        n = 20_000
+        weights = [Decimal(i % 97 + 1) for i in range(n)]
+        sources = [
+            ("FRINGE", Money.of("1234567.89", "USD")),
+            ("OVERHEAD", Money.of("987654.32", "USD")),
+            ("G&A", Money.of("55555.55", "USD")),
+        ]
+        matrix = allocate_matrix(sources, [f"c{i}" for i in range(n)], weights)
+        assert matrix.source_totals() == tuple(m for _, m in sources)
+        assert all(len(row) == n for row in matrix.rows)
+
+    def test_currency_mismatch_raises(self):
+        with pytest.raises(ValueError, match="Currency mismatch"):
+            allocate_matrix(
+                sources=[("A", Money.of("1", "USD")), ("B", Money.of("1", "EUR"))],
+                target_ids=["x"],
+                weights=[Decimal("1")],
+            )
+
+    def test_shape_mismatch_raises(self):
+        with pytest.raises(ValueError, match="expected 2 weights"):
+            allocate_matrix(
+                sources=[("A", Money.of("1", "USD"))],
+                target_ids=["x", "y"],
+                weights=[Decimal("1")],
+            )
@@ -20,6 +20,7 @@ from finance_engines.allocation_cascade import (
     build_dcaa_cascade,
     calculate_contract_total,
     execute_cascade,
+    spread_cascade_results,
 )
 from finance_kernel.domain.values import Money
 
@@ -551,3 +552,33 @@ class TestCustomCascades:
         # All steps should execute
         assert len(results) == 4
         assert results[0].amount_allocated == Money.of("100.00", "USD")
+
+
+class TestSpreadCascadeResults:
+    """Spreading cascade pools over cost objects in one matrix call."""
+
+    def test_rows_match_step_amounts(self):
+        balances = {"DIRECT_LABOR": Money.of("100000.00", "USD")}
+        rates = {"fringe": Decimal("0.35"), "overhead": Decimal("0.45"), "g&a": Decimal("0.10")}
+        results, _ = execute_cascade(build_dcaa_cascade(), balances, rates, "USD")
+
+        labor = [Decimal("60000"), Decimal("30000"), Decimal("10000")]
+        matrix = spread_cascade_results(
+            results,
+            target_ids=["C-1", "C-2", "C-3"],
+            target_bases={"FRINGE": labor, "OVERHEAD": labor, "G&A": labor},
+        )
+
+        assert matrix.source_ids == ("FRINGE", "OVERHEAD", "G&A")
+        assert matrix.source_totals() == tuple(r.amount_allocated for r in results)
+        assert matrix.amount(0, 0) == Money.of("21000.00", "USD")
+
+    def test_missing_base_raises(self):
+        results, _ = execute_cascade(
+            build_dcaa_cascade(),
+            {"DIRECT_LABOR": Money.of("100.00", "USD")},
+            {"fringe": Decimal("0.35")},
+            "USD",
+        )
+        with pytest.raises(ValueError, match="No allocation base"):
+            spread_cascade_results(results, ["C-1"], {"FRINGE": [Decimal("1")]})
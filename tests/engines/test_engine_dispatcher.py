@@ -140,6 +140,11 @@ class TestEngineDispatcherRegistration:
         dispatcher.register("test_engine", invoker)
         # No exception means success
 
+    def test_compiled_pack_exposed(self):
+        """The pack is readable without reaching into private state."""
+        pack = _make_pack()
+        assert EngineDispatcher(pack).compiled_pack is pack
+
     def test_register_mismatch_raises(self):
         """Register with mismatched name raises ValueError."""
         pack = _make_pack()
@@ -0,0 +1,126 @@
+"""
+Tests for the FX rate store and trial-balance translation engine.
+
+Covers:
+- Bisect lookup (latest on/before date, same-day replacement)
+- Inverse quotes and triangulation through the base currency
+- Time-weighted average rates
+- Whole-TB translation: rate type per account type, CTA per currency
+- Error handling (missing rates, unknown account types)
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from finance_engines.fx import (
+    RATE_AVERAGE,
+    RATE_CLOSING,
+    RATE_HISTORICAL,
+    FxRatePoint,
+    FxRateStore,
+    TranslationInput,
+    translate_trial_balance,
+)
+from finance_kernel.exceptions import ExchangeRateNotFoundError
+
+
+def _store() -> FxRateStore:
+    return FxRateStore([
+        FxRatePoint("EUR", "USD", date(2025, 1, 1), Decimal("1.10")),
+        FxRatePoint("EUR", "USD", date(2025, 1, 11), Decimal("1.20")),
+        FxRatePoint("USD", "GBP", date(2025, 1, 1), Decimal("0.80")),
+        FxRatePoint("USD", "GBP", date(2025, 1, 1), Decimal("0.75")),
+    ])
+
+
+class TestFxRateStore:
+
+    def test_latest_rate_on_or_before(self):
+        store = _store()
+        assert store.rate("EUR", "USD", date(2025, 1, 10)) == Decimal("1.10")
+        assert store.rate("EUR", "USD", date(2025, 1, 11)) == Decimal("1.20")
+        assert store.rate("EUR", "USD", date(2026, 1, 1)) == Decimal("1.20")
+
+    def test_same_day_quote_replaced(self):
+        assert _store().rate("USD", "GBP", date(2025, 2, 1)) == Decimal("0.75")
+
+    def test_inverse_and_identity(self):
+        store = _store()
+        assert store.rate("USD", "EUR", date(2025, 1, 5)) == Decimal("1") / Decimal("1.10")
+        assert store.rate("JPY", "JPY", date(2025, 1, 5)) == Decimal("1")
+
+    def test_triangulation_through_base(self):
+        rate = _store().rate("EUR", "GBP", date(2025, 1, 20))
+        assert rate == Decimal("1.20") * Decimal("0.75")
+
+    def test_missing_rate(self):
+        store = _store()
+        assert store.find_rate("EUR", "USD", date(2024, 12, 31)) is None
+        with pytest.raises(ExchangeRateNotFoundError):
+            store.rate("EUR", "JPY", date(2025, 1, 5))
+
+    def test_average_rate_time_weighted(self):
+        # 10 days at 1.10, 21 days at 1.20
+        avg = _store().average_rate("EUR", "USD", date(2025, 1, 1), date(2025, 1, 31))
+        expected = (Decimal("1.10") * 10 + Decimal("1.20") * 21) / 31
+        assert avg == expected
+
+    def test_average_window_validated(self):
+        with pytest.raises(ValueError, match="ends before"):
+            _store().average_rate("EUR", "USD", date(2025, 2, 1), date(2025, 1, 1))
+
+    def test_non_positive_rate_rejected(self):
+        with pytest.raises(ValueError, match="positive"):
+            FxRatePoint("EUR", "USD", date(2025, 1, 1), Decimal("0"))
+
+
+class TestTranslateTrialBalance:
+
+    def _balances(self):
+        return [
+            TranslationInput("1000", "asset", "EUR", Decimal("1000.00")),
+            TranslationInput("3000", "equity", "EUR", Decimal("-400.00")),
+            TranslationInput("4000", "revenue", "EUR", Decimal("-600.00")),
+            TranslationInput("1000", "asset", "USD", Decimal("50.00")),
+            TranslationInput("2000", "liability", "USD", Decimal("-50.00")),
+        ]
+
+    def test_rate_types_and_cta(self):
+        store = _store()
+        result = translate_trial_balance(
+            self._balances(), store, "USD",
+            as_of=date(2025, 1, 31), period_start=date(2025, 1, 1),
+            historical_rates={("3000", "EUR"): Decimal("1.00")},
+        )
+        by_key = {(l.account_code, l.currency): l for l in result.lines}
+        assert by_key[("1000", "EUR")].rate_type == RATE_CLOSING
+        assert by_key[("1000", "EUR")].translated == Decimal("1200.00")
+        assert by_key[("3000", "EUR")].rate_type == RATE_HISTORICAL
+        assert by_key[("3000", "EUR")].translated == Decimal("-400.00")
+        assert by_key[("4000", "EUR")].rate_type == RATE_AVERAGE
+        assert by_key[("1000", "USD")].rate == Decimal("1")
+
+        average = store.average_rate("EUR", "USD", date(2025, 1, 1), date(2025, 1, 31))
+        revenue = (Decimal("-600.00") * average).quantize(Decimal("0.01"))
+        expected_cta = Decimal("1200.00") - Decimal("400.00") + revenue
+        assert result.cta_by_currency == (("EUR", expected_cta),)
+        assert result.cta_amount == expected_cta
+        assert result.translated_total == expected_cta
+
+    def test_equity_without_historical_rate_uses_closing(self):
+        result = translate_trial_balance(
+            self._balances()[:2], _store(), "USD",
+            as_of=date(2025, 1, 31), period_start=date(2025, 1, 1),
+        )
+        equity = next(l for l in result.lines if l.account_code == "3000")
+        assert equity.rate_type == RATE_CLOSING
+        assert equity.translated == Decimal("-480.00")
+
+    def test_unknown_account_type(self):
+        with pytest.raises(ValueError, match="Unknown account type"):
+            translate_trial_balance(
+                [TranslationInput("9", "memo", "EUR", Decimal("1"))], _store(), "USD",
+                as_of=date(2025, 1, 31), period_start=date(2025, 1, 1),
+            )
@@ -7,6 +7,8 @@ and determinism guarantees.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
 
@@ -18,6 +20,7 @@ from finance_engines.ice import (
     ContractCostInput,
     CostElement,
     ICEInput,
+    ICELineCache,
     ICEScheduleType,
     ICESubmission,
     ICEValidationFinding,
@@ -1382,6 +1385,97 @@ class TestEdgeCases:
         assert result.total_unallowable.amount == Decimal("7000")
 
 
+# ============================================================================
+# Incremental / Concurrent Compilation Tests
+# ============================================================================
+
+
+def _many_contracts(n: int) -> tuple[ContractCostInput, ...]:
+    return tuple(
+        ContractCostInput(
+            contract_number=f"C-{i:05d}",
+            contract_type="CPFF",
+            direct_labor=_money(str(1000 + i)),
+            direct_material=_money(str(i % 7 * 100)),
+            travel=_money("12.34"),
+        )
+        for i in range(n)
+    )
+
+
+class TestIncrementalCompilation:
+    """ICELineCache and executor never change the submission."""
+
+    def test_cached_matches_cold(self):
+        ice = _basic_ice_input()
+        cache = ICELineCache()
+        first = compile_ice_submission(ice, line_cache=cache)
+        second = compile_ice_submission(ice, line_cache=cache)
+        assert first == compile_ice_submission(ice)
+        assert second == first
+        assert cache.hits == 2 and cache.misses == 0
+
+    def test_edit_recomputes_only_changed_contract(self):
+        ice = _basic_ice_input()
+        cache = ICELineCache()
+        compile_ice_submission(ice, line_cache=cache)
+
+        costs = list(ice.contract_costs)
+        costs[1] = replace(costs[1], direct_labor=_money("90000"))
+        edited = replace(ice, contract_costs=tuple(costs))
+        result = compile_ice_submission(edited, line_cache=cache)
+
+        assert cache.hits == 1 and cache.misses == 1
+        assert result == compile_ice_submission(edited)
+        assert len(cache) == 2
+
+    def test_pool_change_invalidates_all_lines(self):
+        ice = _basic_ice_input()
+        cache = ICELineCache()
+        compile_ice_submission(ice, line_cache=cache)
+
+        pools = list(ice.indirect_pools)
+        pools[0] = replace(pools[0], claimed_rate=Decimal("0.36"))
+        edited = replace(ice, indirect_pools=tuple(pools))
+        result = compile_ice_submission(edited, line_cache=cache)
+
+        assert cache.hits == 0 and cache.misses == 2
+        assert result == compile_ice_submission(edited)
+
+    def test_removed_contracts_are_evicted(self):
+        ice = replace(_basic_ice_input(), contract_costs=_many_contracts(50))
+        cache = ICELineCache()
+        compile_ice_submission(ice, line_cache=cache)
+        compile_ice_submission(
+            replace(ice, contract_costs=ice.contract_costs[:10]),
+            line_cache=cache,
+        )
+        assert len(cache) == 10
+
+    def test_executor_matches_serial(self):
+        ice = replace(_basic_ice_input(), contract_costs=_many_contracts(700))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            concurrent = compile_ice_submission(ice, executor=executor)
+        assert concurrent == compile_ice_submission(ice)
+        assert [l.contract_number for l in concurrent.schedule_i.lines] == [
+            cc.contract_number for cc in ice.contract_costs
+        ]
+
+    def test_schedule_h_and_i_share_lines(self):
+        ice = replace(_basic_ice_input(), contract_costs=_many_contracts(20))
+        result = compile_ice_submission(ice)
+        assert result.schedule_h == compile_schedule_h(
+            ice.contract_costs, ice.indirect_pools, USD,
+        )
+        assert result.schedule_i == compile_schedule_i(
+            ice.contract_costs, ice.indirect_pools, USD,
+        )
+        assert (
+            result.schedule_h.total_indirect_applied
+            == result.schedule_i.grand_total_indirect
+        )
+
+
 # ============================================================================
 # Enum Tests
 # ============================================================================
@@ -15,16 +15,19 @@ from uuid import uuid4
 import pytest
 
 from finance_engines.rate_compliance import (
+    RateScheduleIndex,
     compute_all_reconciliations,
     compute_rate_reconciliation,
     find_applicable_rate,
     find_contract_ceiling,
     verify_labor_rate,
+    verify_labor_rates,
 )
 from finance_modules.contracts.rate_types import (
     ContractRateCeiling,
     IndirectRateRecord,
     IndirectRateType,
+    LaborChargeLine,
     LaborRateSchedule,
     RateReconciliationRecord,
     RateSource,
@@ -286,6 +289,103 @@ class TestVerifyLaborRate:
         assert result.ceiling_rate == Decimal("120.00")
 
 
+# ===========================================================================
+# Indexed lookup and batch verification
+# ===========================================================================
+
+
+class TestRateScheduleIndex:
+    """RateScheduleIndex returns what the linear lookups return."""
+
+    def test_bisects_disjoint_intervals(self):
+        schedules = (
+            _schedule(loaded_rate="110.00", effective_from=date(2024, 1, 1),
+                      effective_to=date(2024, 12, 31)),
+            _schedule(loaded_rate="120.00", effective_from=date(2025, 1, 1),
+                      effective_to=date(2025, 12, 31)),
+            _schedule(loaded_rate="130.00", effective_from=date(2026, 1, 1)),
+        )
+        index = RateScheduleIndex(schedules)
+        assert index.find_rate("Senior Engineer", "ENG-03", date(2024, 6, 1)).loaded_rate == Decimal("110.00")
+        assert index.find_rate("Senior Engineer", "ENG-03", date(2025, 12, 31)).loaded_rate == Decimal("120.00")
+        assert index.find_rate("Senior Engineer", "ENG-03", date(2027, 3, 1)).loaded_rate == Decimal("130.00")
+        assert index.find_rate("Senior Engineer", "ENG-03", date(2023, 12, 31)) is None
+
+    def test_gap_between_intervals(self):
+        schedules = (
+            _schedule(effective_from=date(2024, 1, 1), effective_to=date(2024, 6, 30)),
+            _schedule(effective_from=date(2025, 1, 1)),
+        )
+        index = RateScheduleIndex(schedules)
+        assert index.find_rate("Senior Engineer", "ENG-03", date(2024, 9, 1)) is None
+
+    def test_overlap_picks_first_in_input_order(self):
+        schedules = (
+            _schedule(loaded_rate="140.00", effective_from=date(2025, 6, 1)),
+            _schedule(loaded_rate="120.00", effective_from=date(2025, 1, 1)),
+            _schedule(loaded_rate="130.00", effective_from=date(2025, 1, 1)),
+        )
+        index = RateScheduleIndex(schedules)
+        for d in (date(2025, 3, 1), date(2025, 7, 1)):
+            expected = find_applicable_rate("Senior Engineer", "ENG-03", schedules, d)
+            assert index.find_rate("Senior Engineer", "ENG-03", d) is expected
+
+    def test_ceiling_keyed_by_contract_and_category(self):
+        c1, c2 = uuid4(), uuid4()
+        ceilings = (
+            _ceiling(contract_id=c1, max_hourly="100.00"),
+            _ceiling(contract_id=c2, max_hourly="200.00"),
+            _ceiling(contract_id=c1, category="ENG-04", max_hourly="300.00"),
+        )
+        index = RateScheduleIndex((), ceilings)
+        assert index.find_ceiling(c1, "ENG-03", date(2026, 1, 1)).max_hourly_rate == Decimal("100.00")
+        assert index.find_ceiling(c2, "ENG-03", date(2026, 1, 1)).max_hourly_rate == Decimal("200.00")
+        assert index.find_ceiling(c1, "ENG-04", date(2026, 1, 1)).max_hourly_rate == Decimal("300.00")
+        assert index.find_ceiling(c2, "ENG-04", date(2026, 1, 1)) is None
+
+
+class TestVerifyLaborRates:
+    """Batch verification matches per-line verify_labor_rate."""
+
+    def test_batch_matches_single_line(self):
+        contract_id = uuid4()
+        schedules = (
+            _schedule(loaded_rate="125.00"),
+            _schedule(classification="Analyst", category="ADM-01",
+                      base_rate="40.00", loaded_rate="70.00"),
+        )
+        ceilings = (_ceiling(contract_id=contract_id, max_hourly="120.00"),)
+        lines = [
+            LaborChargeLine(uuid4(), "Senior Engineer", "ENG-03", Decimal("110.00"), date(2026, 1, 15), contract_id),
+            LaborChargeLine(uuid4(), "Senior Engineer", "ENG-03", Decimal("122.00"), date(2026, 1, 15), contract_id),
+            LaborChargeLine(uuid4(), "Senior Engineer", "ENG-03", Decimal("130.00"), date(2026, 1, 15)),
+            LaborChargeLine(uuid4(), "Analyst", "ADM-01", Decimal("60.00"), date(2026, 1, 15)),
+            LaborChargeLine(uuid4(), "Analyst", "ENG-03", Decimal("60.00"), date(2026, 1, 15)),
+        ]
+        batch = verify_labor_rates(lines, RateScheduleIndex(schedules, ceilings))
+        single = tuple(
+            verify_labor_rate(
+                employee_id=line.employee_id,
+                employee_classification=line.employee_classification,
+                labor_category=line.labor_category,
+                charged_rate=line.charged_rate,
+                rate_schedule=schedules,
+                contract_ceilings=ceilings,
+                contract_id=line.contract_id,
+                charge_date=line.charge_date,
+            )
+            for line in lines
+        )
+        assert batch == single
+        assert [r.is_valid for r in batch] == [True, False, False, True, False]
+        assert batch[1].violation_type == RateViolationType.EXCEEDS_CONTRACT_CEILING
+        assert batch[2].violation_type == RateViolationType.EXCEEDS_CLASSIFICATION
+        assert batch[4].violation_type == RateViolationType.RATE_EXPIRED
+
+    def test_empty_batch(self):
+        assert verify_labor_rates([], RateScheduleIndex(())) == ()
+
+
 # ===========================================================================
 # Indirect Rate Reconciliation
 # ===========================================================================
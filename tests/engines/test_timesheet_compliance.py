@@ -18,13 +18,18 @@ import pytest
 from finance_engines.timesheet_compliance import (
     compute_total_time_record,
     detect_concurrent_overlaps,
+    detect_pay_period_overlaps,
     validate_all_entries_daily_recording,
     validate_correction_reversal,
     validate_daily_recording,
     validate_no_excessive_daily_hours,
     validate_total_time_accounting,
 )
-from finance_modules.payroll.dcaa_types import ChargeType, TimesheetEntry
+from finance_modules.payroll.dcaa_types import (
+    ChargeType,
+    TimesheetEntry,
+    TimesheetSubmission,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -319,6 +324,121 @@ class TestConcurrentOverlap:
         assert len(result.overlapping_entries) == 3  # A-B, A-C, B-C
 
 
+    def test_touching_intervals_do_not_overlap(self):
+        a = _entry(charge_code="A", hours=Decimal("4"),
+                   start_time=time(8, 0), end_time=time(12, 0))
+        b = _entry(charge_code="B", hours=Decimal("4"),
+                   start_time=time(12, 0), end_time=time(16, 0))
+        assert detect_concurrent_overlaps((b, a)).is_valid
+
+    def test_zero_length_entry_at_shared_start_does_not_overlap(self):
+        a = _entry(charge_code="A", hours=Decimal("4"),
+                   start_time=time(8, 0), end_time=time(12, 0))
+        marker = _entry(charge_code="B", hours=Decimal("0"),
+                        start_time=time(8, 0), end_time=time(8, 0))
+        assert detect_concurrent_overlaps((a, marker)).is_valid
+        assert detect_concurrent_overlaps((marker, a)).is_valid
+
+    def test_pairs_follow_input_order(self):
+        late = _entry(charge_code="A", hours=Decimal("2"),
+                      start_time=time(10, 0), end_time=time(12, 0))
+        early = _entry(charge_code="B", hours=Decimal("4"),
+                       start_time=time(8, 0), end_time=time(12, 0))
+        result = detect_concurrent_overlaps((late, early))
+        assert result.overlapping_entries == ((late.entry_id, early.entry_id),)
+
+    def test_different_days_do_not_overlap(self):
+        entries = (
+            _entry(work_date=date(2026, 1, 5), charge_code="A", hours=Decimal("8"),
+                   start_time=time(8, 0), end_time=time(16, 0)),
+            _entry(work_date=date(2026, 1, 6), charge_code="B", hours=Decimal("8"),
+                   start_time=time(8, 0), end_time=time(16, 0)),
+        )
+        assert detect_concurrent_overlaps(entries).is_valid
+
+    def test_matches_pairwise_comparison(self):
+        # Staggered blocks across a day, three charge codes.
+        entries = tuple(
+            _entry(
+                charge_code=f"C{i % 3}", hours=Decimal("1"),
+                start_time=time(6 + i // 2, 30 * (i % 2)),
+                end_time=time(7 + i // 2 + (i % 3 == 0), 30 * (i % 2)),
+            )
+            for i in range(20)
+        )
+        expected = {
+            (a.entry_id, b.entry_id)
+            for i, a in enumerate(entries)
+            for b in entries[i + 1:]
+            if a.charge_code != b.charge_code
+            and a.start_time < b.end_time and b.start_time < a.end_time
+        }
+        result = detect_concurrent_overlaps(entries)
+        assert expected
+        assert set(result.overlapping_entries) == expected
+        assert len(result.overlapping_entries) == len(expected)
+
+    def test_employee_id_reported(self):
+        employee_id = uuid4()
+        result = detect_concurrent_overlaps((_entry(),), employee_id)
+        assert result.employee_id == employee_id
+
+
+class TestPayPeriodOverlap:
+    """D4 for a whole pay period in one pass."""
+
+    @staticmethod
+    def _submission(employee_id, *entries):
+        return TimesheetSubmission(
+            submission_id=uuid4(),
+            employee_id=employee_id,
+            pay_period_id=uuid4(),
+            work_week_start=date(2026, 1, 5),
+            work_week_end=date(2026, 1, 11),
+            entries=entries,
+        )
+
+    def test_results_per_employee(self):
+        clean, conflicted = uuid4(), uuid4()
+        submissions = [
+            self._submission(
+                clean,
+                _entry(charge_code="A", hours=Decimal("4"),
+                       start_time=time(8, 0), end_time=time(12, 0)),
+                _entry(charge_code="B", hours=Decimal("4"),
+                       start_time=time(13, 0), end_time=time(17, 0)),
+            ),
+            self._submission(
+                conflicted,
+                _entry(charge_code="A", hours=Decimal("4"),
+                       start_time=time(8, 0), end_time=time(12, 0)),
+                _entry(charge_code="B", hours=Decimal("4"),
+                       start_time=time(9, 0), end_time=time(13, 0)),
+            ),
+        ]
+        checks = detect_pay_period_overlaps(submissions)
+        assert list(checks) == [clean, conflicted]
+        assert checks[clean].is_valid
+        assert checks[clean].employee_id == clean
+        assert not checks[conflicted].is_valid
+        assert checks[conflicted].total_hours == Decimal("8")
+
+    def test_entries_merged_across_submissions(self):
+        employee_id = uuid4()
+        a = _entry(charge_code="A", hours=Decimal("4"),
+                   start_time=time(8, 0), end_time=time(12, 0))
+        b = _entry(charge_code="B", hours=Decimal("4"),
+                   start_time=time(10, 0), end_time=time(14, 0))
+        checks = detect_pay_period_overlaps([
+            self._submission(employee_id, a),
+            self._submission(employee_id, b),
+        ])
+        assert checks[employee_id].overlapping_entries == ((a.entry_id, b.entry_id),)
+
+    def test_empty_period(self):
+        assert detect_pay_period_overlaps([]) == {}
+
+
 # ===========================================================================
 # Daily Hours Validation
 # ===========================================================================
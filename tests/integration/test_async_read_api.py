@@ -0,0 +1,172 @@
+"""
+Async read API tests (asyncpg + sqlalchemy.ext.asyncio).
+
+Verifies:
+- AsyncSelectors and AsyncReportingService return the same DTOs as the
+  synchronous selectors and ReportingService over committed data.
+- Independent calls awaited with asyncio.gather run concurrently on
+  separate pooled connections.
+"""
+
+import asyncio
+import time
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+pytest.importorskip("asyncpg")
+
+from finance_kernel.db.async_engine import (  # noqa: E402
+    init_async_engine_from_url,
+    reset_async_engine,
+    to_async_url,
+)
+from finance_kernel.domain.clock import DeterministicClock  # noqa: E402
+from finance_kernel.selectors.async_selectors import AsyncSelectors  # noqa: E402
+from finance_kernel.selectors.ledger_selector import LedgerSelector  # noqa: E402
+from finance_kernel.selectors.trace_selector import TraceSelector  # noqa: E402
+from finance_modules.reporting.async_service import (  # noqa: E402
+    AsyncReportingService,
+)
+from finance_modules.reporting.service import ReportingService  # noqa: E402
+
+AS_OF = date(2025, 6, 30)
+PERIOD_START = date(2025, 6, 1)
+
+
+@pytest.fixture
+def posted_sale(pg_session):
+    """Commit Dr Cash 250 / Cr Revenue 250 on the primary; returns the event id."""
+    actor_id, event_id, entry_id = uuid4(), uuid4(), uuid4()
+    cash_id, revenue_id = uuid4(), uuid4()
+    for account_id, code, account_type, normal in (
+        (cash_id, f"C{str(uuid4())[:8]}", "asset", "debit"),
+        (revenue_id, f"R{str(uuid4())[:8]}", "revenue", "credit"),
+    ):
+        pg_session.execute(
+            text("""
+                INSERT INTO accounts (id, code, name, account_type, normal_balance,
+                                     is_active, created_at, created_by_id)
+                VALUES (:id, :code, :code, :type, :normal, true, NOW(), :actor_id)
+            """),
+            {"id": str(account_id), "code": code, "type": account_type,
+             "normal": normal, "actor_id": str(actor_id)},
+        )
+    pg_session.execute(
+        text("""
+            INSERT INTO events (id, event_id, event_type, occurred_at, effective_date,
+                               actor_id, producer, payload, payload_hash, schema_version,
+                               ingested_at)
+            VALUES (:id, :event_id, 'test.async', NOW(), :eff,
+                   :actor_id, 'test', '{}', 'hash123', 1, NOW())
+        """),
+        {"id": str(uuid4()), "event_id": str(event_id), "eff": AS_OF,
+         "actor_id": str(actor_id)},
+    )
+    pg_session.execute(
+        text("""
+            INSERT INTO journal_entries (id, source_event_id, source_event_type,
+                                        occurred_at, effective_date, actor_id,
+                                        status, idempotency_key, posting_rule_version,
+                                        created_at, created_by_id)
+            VALUES (:id, :event_id, 'test.async', NOW(), :eff, :actor_id,
+                   'draft', :key, 1, NOW(), :actor_id)
+        """),
+        {"id": str(entry_id), "event_id": str(event_id), "eff": AS_OF,
+         "actor_id": str(actor_id), "key": f"test:async:{entry_id}"},
+    )
+    lines = ((cash_id, "debit"), (revenue_id, "credit"))
+    for seq, (account_id, side) in enumerate(lines, 1):
+        pg_session.execute(
+            text("""
+                INSERT INTO journal_lines (id, journal_entry_id, account_id, side, amount,
+                                          currency, line_seq, is_rounding, created_at,
+                                          created_by_id)
+                VALUES (:id, :entry_id, :account_id, :side, 250.00, 'USD', :seq, false,
+                       NOW(), :actor_id)
+            """),
+            {"id": str(uuid4()), "entry_id": str(entry_id), "account_id": str(account_id),
+             "side": side, "seq": seq, "actor_id": str(actor_id)},
+        )
+    pg_session.execute(
+        text("UPDATE journal_entries SET status = 'posted', seq = 1 WHERE id = :id"),
+        {"id": str(entry_id)},
+    )
+    pg_session.commit()
+    return event_id
+
+
+def _run_async(db_engine, main):
+    """Run ``main()`` against a fresh async engine on the test database."""
+    async def runner():
+        init_async_engine_from_url(
+            db_engine.url.render_as_string(hide_password=False), pool_size=4,
+        )
+        try:
+            return await main()
+        finally:
+            await reset_async_engine()
+    return asyncio.run(runner())
+
+
+class TestAsyncUrl:
+
+    def test_driver_rewritten(self):
+        assert to_async_url("postgresql://u:p@h:5432/db") == (
+            "postgresql+asyncpg://u:p@h:5432/db"
+        )
+        assert to_async_url("postgresql+psycopg2://u@h/db") == (
+            "postgresql+asyncpg://u@h/db"
+        )
+
+    def test_non_postgres_rejected(self):
+        with pytest.raises(ValueError, match="requires PostgreSQL"):
+            to_async_url("sqlite:///x.db")
+
+
+class TestAsyncReadApi:
+
+    def test_matches_sync_results(self, db_engine, pg_session, posted_sale):
+        clock = DeterministicClock()
+
+        async def main():
+            reports = AsyncReportingService(clock=clock)
+            selectors = AsyncSelectors(clock=clock)
+            return await asyncio.gather(
+                selectors.trial_balance(AS_OF, "USD"),
+                reports.trial_balance(AS_OF, "USD"),
+                reports.balance_sheet(AS_OF, "USD"),
+                reports.income_statement(PERIOD_START, AS_OF, "USD"),
+                selectors.trace_by_event_id(posted_sale),
+            )
+
+        rows, tb, bs, pl, trace = _run_async(db_engine, main)
+
+        sync_reports = ReportingService(session=pg_session, clock=clock)
+        assert rows == LedgerSelector(pg_session).trial_balance(AS_OF, "USD")
+        assert tb.lines == sync_reports.trial_balance(AS_OF, "USD").lines
+        assert tb.total_debits == Decimal("250.00") and tb.is_balanced
+        assert bs.total_assets == sync_reports.balance_sheet(AS_OF, "USD").total_assets
+        assert pl.total_revenue == Decimal("250.00")
+        sync_trace = TraceSelector(pg_session, clock=clock).trace_by_event_id(posted_sale)
+        assert trace.integrity.bundle_hash == sync_trace.integrity.bundle_hash
+
+    def test_gathered_calls_use_separate_connections(self, db_engine, pg_session):
+        def slow_pid(session):
+            return session.execute(
+                text("SELECT pg_backend_pid() FROM pg_sleep(0.3)")
+            ).scalar()
+
+        async def main():
+            selectors = AsyncSelectors()
+            start = time.monotonic()
+            pids = await asyncio.gather(*(selectors.run(slow_pid) for _ in range(3)))
+            return pids, time.monotonic() - start
+
+        pids, elapsed = _run_async(db_engine, main)
+
+        assert len(set(pids)) == 3
+        assert elapsed < 0.85
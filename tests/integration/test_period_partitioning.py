@@ -0,0 +1,311 @@
+"""
+Fiscal-period partitioning tests (sql/20_period_partitioning.sql).
+
+A scratch PostgreSQL database (``<test db>_partitioned``) gets the full
+schema, the immutability triggers, three fiscal periods (2025-05..07) and
+then the partitioned layout.
+
+Verifies:
+- journal_entries, journal_lines and subledger_entries are partitioned per
+  fiscal period; new periods get partitions automatically.
+- R10/R12 triggers fire on the partitions.
+- Idempotency key and seq stay unique across partitions (key registry).
+- LedgerSelector as-of queries prune partitions of later periods.
+- Locked periods can be moved and detached; detached rows stay read-only
+  and their keys stay reserved.
+"""
+
+from datetime import date
+from itertools import count
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import Session
+
+from finance_kernel.db.base import Base
+from finance_kernel.db.partitioning import (
+    archive_period_partition,
+    install_period_partitioning,
+    list_period_partitions,
+    period_partitioning_installed,
+)
+from finance_kernel.db.triggers import install_immutability_triggers, triggers_installed
+from finance_kernel.selectors.ledger_selector import LedgerSelector
+
+PERIODS = (
+    ("2025-05", date(2025, 5, 1), date(2025, 5, 31)),
+    ("2025-06", date(2025, 6, 1), date(2025, 6, 30)),
+    ("2025-07", date(2025, 7, 1), date(2025, 7, 31)),
+)
+
+_seq = count(1)
+
+
+def _add_period(conn, code: str, start: date, end: date) -> None:
+    conn.execute(
+        text("""
+            INSERT INTO fiscal_periods (id, period_code, name, start_date, end_date,
+                                        status, allows_adjustments, created_at,
+                                        created_by_id)
+            VALUES (:id, :code, :code, :start, :end, 'open', false, NOW(), :actor_id)
+        """),
+        {"id": str(uuid4()), "code": code, "start": start, "end": end,
+         "actor_id": str(uuid4())},
+    )
+
+
+@pytest.fixture(scope="module")
+def engine(db_engine, db_tables):
+    """Scratch database with the partitioned layout installed."""
+    primary_url = db_engine.url
+    name = f"{primary_url.database}_partitioned"
+
+    admin = create_engine(
+        primary_url.set(database="postgres"), isolation_level="AUTOCOMMIT",
+    )
+    try:
+        with admin.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+            conn.execute(text(
+                f"CREATE DATABASE \"{name}\" ENCODING 'UTF8' TEMPLATE template0"
+            ))
+    except Exception as exc:
+        admin.dispose()
+        pytest.skip(f"Cannot create scratch database: {exc}")
+
+    eng = create_engine(primary_url.set(database=name))
+    Base.metadata.create_all(eng)
+    install_immutability_triggers(eng)
+    with eng.begin() as conn:
+        for period in PERIODS:
+            _add_period(conn, *period)
+    install_period_partitioning(eng)
+
+    yield eng
+
+    eng.dispose()
+    with admin.connect() as conn:
+        conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+    admin.dispose()
+
+
+@pytest.fixture
+def accounts(engine):
+    """Fresh (cash, revenue) account ids."""
+    actor_id = str(uuid4())
+    ids = []
+    with engine.begin() as conn:
+        for account_type, normal in (("asset", "debit"), ("revenue", "credit")):
+            account_id = str(uuid4())
+            conn.execute(
+                text("""
+                    INSERT INTO accounts (id, code, name, account_type, normal_balance,
+                                         is_active, created_at, created_by_id)
+                    VALUES (:id, :code, :code, :type, :normal, true, NOW(), :actor_id)
+                """),
+                {"id": account_id, "code": f"P{account_id[:8]}", "type": account_type,
+                 "normal": normal, "actor_id": actor_id},
+            )
+            ids.append(account_id)
+    return tuple(ids)
+
+
+def _entry(conn, accounts, effective_date, amount="100.00", key=None, post=True):
+    """Insert a draft entry with two lines and optionally post it."""
+    actor_id, event_id, entry_id = str(uuid4()), str(uuid4()), str(uuid4())
+    conn.execute(
+        text("""
+            INSERT INTO events (id, event_id, event_type, occurred_at, effective_date,
+                               actor_id, producer, payload, payload_hash, schema_version,
+                               ingested_at)
+            VALUES (:id, :event_id, 'test.partition', NOW(), :eff,
+                   :actor_id, 'test', '{}', 'hash123', 1, NOW())
+        """),
+        {"id": str(uuid4()), "event_id": event_id, "eff": effective_date,
+         "actor_id": actor_id},
+    )
+    conn.execute(
+        text("""
+            INSERT INTO journal_entries (id, source_event_id, source_event_type,
+                                        occurred_at, effective_date, actor_id,
+                                        status, idempotency_key, posting_rule_version,
+                                        created_at, created_by_id)
+            VALUES (:id, :event_id, 'test.partition', NOW(), :eff, :actor_id,
+                   'draft', :key, 1, NOW(), :actor_id)
+        """),
+        {"id": entry_id, "event_id": event_id, "eff": effective_date,
+         "actor_id": actor_id, "key": key or f"test:partition:{entry_id}"},
+    )
+    for line_seq, (account_id, side, line_amount) in enumerate(
+        ((accounts[0], "debit", amount), (accounts[1], "credit", "100.00")), 1,
+    ):
+        conn.execute(
+            text("""
+                INSERT INTO journal_lines (id, journal_entry_id, account_id, side,
+                                          amount, currency, line_seq, is_rounding,
+                                          effective_date, created_at, created_by_id)
+                VALUES (:id, :entry_id, :account_id, :side, :amount, 'USD', :seq,
+                       false, :eff, NOW(), :actor_id)
+            """),
+            {"id": str(uuid4()), "entry_id": entry_id, "account_id": account_id,
+             "side": side, "amount": line_amount, "seq": line_seq,
+             "eff": effective_date, "actor_id": actor_id},
+        )
+    if post:
+        conn.execute(
+            text("UPDATE journal_entries SET status = 'posted', seq = :seq WHERE id = :id"),
+            {"id": entry_id, "seq": next(_seq)},
+        )
+    return entry_id
+
+
+class TestPartitionedLayout:
+
+    def test_tables_partitioned_per_period(self, engine):
+        assert period_partitioning_installed(engine)
+        assert install_period_partitioning(engine) == 0
+        for table in ("journal_entries", "journal_lines", "subledger_entries"):
+            assert list_period_partitions(engine, table) == [
+                f"{table}_2025_05", f"{table}_2025_06", f"{table}_2025_07",
+                f"{table}_default",
+            ]
+        assert triggers_installed(engine)
+
+    def test_new_period_gets_partitions(self, engine):
+        with engine.begin() as conn:
+            _add_period(conn, "2025-08", date(2025, 8, 1), date(2025, 8, 31))
+        assert "journal_lines_2025_08" in list_period_partitions(engine, "journal_lines")
+
+    def test_unknown_table_rejected(self, engine):
+        with pytest.raises(ValueError, match="not a partitioned table"):
+            list_period_partitions(engine, "accounts")
+
+
+class TestTriggersOnPartitions:
+
+    def test_posted_entry_and_lines_immutable(self, engine, accounts):
+        with engine.begin() as conn:
+            entry_id = _entry(conn, accounts, date(2025, 6, 15))
+
+        with pytest.raises(DBAPIError, match="R10 Violation"):
+            with engine.begin() as conn:
+                conn.execute(
+                    text("UPDATE journal_entries SET description = 'x' WHERE id = :id"),
+                    {"id": entry_id},
+                )
+        with pytest.raises(DBAPIError, match="R10 Violation"):
+            with engine.begin() as conn:
+                conn.execute(
+                    text("UPDATE journal_lines SET amount = 1 WHERE journal_entry_id = :id"),
+                    {"id": entry_id},
+                )
+
+    def test_unbalanced_posting_rejected(self, engine, accounts):
+        with pytest.raises(DBAPIError, match="R12 Violation"):
+            with engine.begin() as conn:
+                _entry(conn, accounts, date(2025, 6, 15), amount="90.00")
+
+    def test_keys_unique_across_partitions(self, engine, accounts):
+        key = f"test:partition:dup:{uuid4()}"
+        with engine.begin() as conn:
+            _entry(conn, accounts, date(2025, 6, 15), key=key)
+
+        with pytest.raises(IntegrityError, match="uq_journal_entry_keys_idempotency"):
+            with engine.begin() as conn:
+                _entry(conn, accounts, date(2025, 7, 15), key=key)
+
+        seq = next(_seq)
+        with pytest.raises(IntegrityError, match="uq_journal_entry_keys_seq"):
+            with engine.begin() as conn:
+                for effective_date in (date(2025, 6, 16), date(2025, 7, 16)):
+                    entry_id = _entry(conn, accounts, effective_date, post=False)
+                    conn.execute(
+                        text("UPDATE journal_entries SET status = 'posted', seq = :seq"
+                             " WHERE id = :id"),
+                        {"id": entry_id, "seq": seq},
+                    )
+
+    def test_partition_key_immutable(self, engine, accounts):
+        with pytest.raises(DBAPIError, match="partition key"):
+            with engine.begin() as conn:
+                entry_id = _entry(conn, accounts, date(2025, 6, 15), post=False)
+                conn.execute(
+                    text("UPDATE journal_entries SET effective_date = '2025-07-01'"
+                         " WHERE id = :id"),
+                    {"id": entry_id},
+                )
+
+
+class TestPartitionPruning:
+
+    def test_as_of_queries_skip_later_periods(self, engine, accounts):
+        with engine.begin() as conn:
+            _entry(conn, accounts, date(2025, 6, 10))
+            _entry(conn, accounts, date(2025, 7, 10))
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            with Session(engine) as session:
+                rows = LedgerSelector(session).trial_balance(date(2025, 6, 30), "USD")
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        cash = next(r for r in rows if str(r.account_id) == accounts[0])
+        assert cash.debit_total == 100
+
+        statement, parameters = statements[-1]
+        with engine.connect() as conn:
+            plan = "\n".join(conn.exec_driver_sql(
+                "EXPLAIN " + statement, parameters,
+            ).scalars())
+        assert "journal_lines_2025_06" in plan
+        assert "journal_entries_2025_06" in plan
+        assert "_2025_07" not in plan
+
+
+class TestArchival:
+
+    def test_locked_period_detached(self, engine, accounts):
+        key = f"test:partition:archived:{uuid4()}"
+        with engine.begin() as conn:
+            entry_id = _entry(conn, accounts, date(2025, 5, 20), key=key)
+
+        with pytest.raises(DBAPIError, match="must be locked"):
+            archive_period_partition(engine, "2025-05", detach=True)
+        with pytest.raises(ValueError, match="Nothing to do"):
+            archive_period_partition(engine, "2025-05")
+
+        with engine.begin() as conn:
+            for status in ("closed", "locked"):
+                conn.execute(
+                    text("UPDATE fiscal_periods SET status = :status"
+                         " WHERE period_code = '2025-05'"),
+                    {"status": status},
+                )
+        assert archive_period_partition(
+            engine, "2025-05", tablespace="pg_default", detach=True,
+        ) == 3
+
+        assert "journal_entries_2025_05" not in list_period_partitions(
+            engine, "journal_entries",
+        )
+        with Session(engine) as session:
+            rows = LedgerSelector(session).trial_balance(date(2025, 5, 31), "USD")
+        assert not [r for r in rows if str(r.account_id) in accounts]
+
+        with pytest.raises(DBAPIError, match="archived partition"):
+            with engine.begin() as conn:
+                conn.execute(
+                    text("DELETE FROM journal_entries_2025_05 WHERE id = :id"),
+                    {"id": entry_id},
+                )
+        with pytest.raises(IntegrityError, match="uq_journal_entry_keys_idempotency"):
+            with engine.begin() as conn:
+                _entry(conn, accounts, date(2025, 6, 20), key=key)
@@ -0,0 +1,231 @@
+"""
+Read replica session routing tests.
+
+A second PostgreSQL database (``<test db>_replica``) stands in for the
+replica; the harness keeps it in sync by copying every table from the
+primary, so "replication lag" is whatever the last sync left behind.
+
+Verifies:
+- get_read_session returns a primary session when no replica is configured.
+- Reads route to the replica while its journal watermark (highest
+  journal_entries.seq) is within max_lag of the primary's.
+- A lagging replica, or one behind a caller's min_seq, falls back to the
+  primary.
+- The primary watermark is cached for watermark_ttl seconds and taken from
+  min_seq when given, so replica reads do not each query the primary.
+- ReportingService.read_scope reads through the routed session.
+- Replica sessions are read-only.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.exc import InternalError
+
+from finance_kernel.db.base import Base
+from finance_kernel.db.engine import (
+    get_engine,
+    get_read_session,
+    get_replica_lag,
+    init_replica_engine_from_url,
+    read_session_scope,
+    reset_replica_engine,
+)
+from finance_kernel.models.journal import JournalEntry
+
+
+@pytest.fixture(scope="module")
+def replica_url(db_engine, db_tables):
+    """Create the stand-in replica database with the full schema."""
+    primary_url = db_engine.url
+    replica_name = f"{primary_url.database}_replica"
+
+    admin = create_engine(
+        primary_url.set(database="postgres"), isolation_level="AUTOCOMMIT",
+    )
+    try:
+        with admin.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": replica_name},
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{replica_name}"'))
+    except Exception as exc:
+        pytest.skip(f"Cannot create replica database: {exc}")
+    finally:
+        admin.dispose()
+
+    url = primary_url.set(database=replica_name)
+    schema_engine = create_engine(url)
+    Base.metadata.create_all(schema_engine)
+    schema_engine.dispose()
+    return url.render_as_string(hide_password=False)
+
+
+@pytest.fixture
+def replica(replica_url, pg_session):
+    """Configure the replica engine; yields a function that syncs it."""
+    sync_engine = create_engine(replica_url)
+
+    def sync():
+        tables = Base.metadata.sorted_tables
+        with get_engine().connect() as primary, sync_engine.begin() as target:
+            target.execute(text(
+                "TRUNCATE " + ", ".join(t.name for t in tables) + " CASCADE"
+            ))
+            for table in tables:
+                rows = primary.execute(select(table)).mappings().all()
+                if rows:
+                    target.execute(table.insert(), [dict(r) for r in rows])
+
+    sync()
+    init_replica_engine_from_url(replica_url)
+    yield sync
+    reset_replica_engine()
+    sync_engine.dispose()
+
+
+def _post(pg_session, seq: int) -> None:
+    """Commit a posted journal entry carrying ``seq`` on the primary."""
+    actor_id, event_id, entry_id = uuid4(), uuid4(), uuid4()
+    pg_session.execute(
+        text("""
+            INSERT INTO events (id, event_id, event_type, occurred_at, effective_date,
+                               actor_id, producer, payload, payload_hash, schema_version,
+                               ingested_at)
+            VALUES (:id, :event_id, 'test.replica', NOW(), CURRENT_DATE,
+                   :actor_id, 'test', '{}', 'hash123', 1, NOW())
+        """),
+        {"id": str(uuid4()), "event_id": str(event_id), "actor_id": str(actor_id)},
+    )
+    pg_session.execute(
+        text("""
+            INSERT INTO journal_entries (id, source_event_id, source_event_type,
+                                        occurred_at, effective_date, actor_id,
+                                        status, idempotency_key, posting_rule_version,
+                                        seq, created_at, created_by_id)
+            VALUES (:id, :event_id, 'test.replica', NOW(), CURRENT_DATE, :actor_id,
+                   'posted', :idempotency_key, 1, :seq, NOW(), :actor_id)
+        """),
+        {
+            "id": str(entry_id),
+            "event_id": str(event_id),
+            "actor_id": str(actor_id),
+            "idempotency_key": f"test:replica:{entry_id}",
+            "seq": seq,
+        },
+    )
+    pg_session.commit()
+
+
+def _entry_count(session) -> int:
+    return len(session.execute(select(JournalEntry.id)).all())
+
+
+@pytest.fixture
+def primary_watermark_reads():
+    """Count journal watermark queries run on the primary engine."""
+    reads = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if "ORDER BY seq DESC" in statement:
+            reads.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", count)
+    yield reads
+    event.remove(engine, "before_cursor_execute", count)
+
+
+class TestReadSessionRouting:
+
+    def test_primary_when_no_replica(self, pg_session):
+        session = get_read_session()
+        try:
+            assert session.get_bind() is get_engine()
+        finally:
+            session.close()
+
+    def test_caught_up_replica_serves_reads(self, pg_session, replica):
+        _post(pg_session, 1)
+        replica()
+
+        assert get_replica_lag().entries_behind == 0
+        with read_session_scope() as session:
+            assert session.get_bind() is not get_engine()
+            assert _entry_count(session) == 1
+
+    def test_lagging_replica_falls_back(self, pg_session, replica):
+        _post(pg_session, 1)
+        replica()
+        _post(pg_session, 2)
+
+        lag = get_replica_lag()
+        assert (lag.primary_seq, lag.replica_seq, lag.entries_behind) == (2, 1, 1)
+        with read_session_scope() as session:
+            assert session.get_bind() is get_engine()
+            assert _entry_count(session) == 2
+        with read_session_scope(max_lag=1) as session:
+            assert session.get_bind() is not get_engine()
+            assert _entry_count(session) == 1
+
+    def test_min_seq_reads_own_write(self, pg_session, replica):
+        _post(pg_session, 1)
+        replica()
+
+        with read_session_scope(min_seq=2, max_lag=5) as session:
+            assert session.get_bind() is get_engine()
+
+    def test_primary_watermark_cached(
+        self, pg_session, replica, primary_watermark_reads,
+    ):
+        _post(pg_session, 1)
+        replica()
+
+        for _ in range(3):
+            with read_session_scope() as session:
+                assert session.get_bind() is not get_engine()
+        assert len(primary_watermark_reads) == 1
+
+    def test_zero_ttl_reads_primary_every_time(
+        self, pg_session, replica, replica_url, primary_watermark_reads,
+    ):
+        reset_replica_engine()
+        init_replica_engine_from_url(replica_url, watermark_ttl=0)
+        for _ in range(2):
+            with read_session_scope():
+                pass
+        assert len(primary_watermark_reads) == 2
+
+    def test_min_seq_skips_primary_read(
+        self, pg_session, replica, primary_watermark_reads,
+    ):
+        _post(pg_session, 1)
+        replica()
+
+        with read_session_scope(min_seq=1) as session:
+            assert session.get_bind() is not get_engine()
+        assert primary_watermark_reads == []
+
+    def test_reporting_service_read_scope(self, pg_session, replica):
+        from finance_modules.reporting.service import ReportingService
+
+        with ReportingService.read_scope() as service:
+            assert service._session.get_bind() is not get_engine()
+
+    def test_replica_session_is_read_only(self, pg_session, replica):
+        with read_session_scope() as session:
+            assert session.get_bind() is not get_engine()
+            with pytest.raises(InternalError, match="read-only"):
+                session.execute(text(
+                    "INSERT INTO sequence_counters (id, name, current_value) "
+                    "VALUES (:id, 'replica_write', 1)"
+                ), {"id": str(uuid4())})
+
+    def test_negative_max_lag_rejected(self, replica_url):
+        with pytest.raises(ValueError, match="non-negative"):
+            init_replica_engine_from_url(replica_url, max_lag=-1)
+        with pytest.raises(ValueError, match="non-negative"):
+            init_replica_engine_from_url(replica_url, watermark_ttl=-1)
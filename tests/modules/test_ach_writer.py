@@ -0,0 +1,156 @@
+"""
+Tests for the streaming NACHA/ACH writer (finance_modules._ach_writer).
+
+Validates record layout, incremental control totals, batch splitting by
+company / effective date, blocking, and that payments are consumed lazily.
+All tests are pure — no database, no session.
+"""
+
+from __future__ import annotations
+
+import io
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from finance_modules._ach_writer import (
+    BLOCKING_FACTOR,
+    RECORD_LENGTH,
+    AchFileWriter,
+    write_ach_file,
+)
+
+CREATED = datetime(2024, 1, 12, 9, 30)
+ODFI = "091000019"
+
+
+def _payment(i: int, **extra) -> dict:
+    return {
+        "name": f"Employee {i}",
+        "account": f"ACCT{i:05d}",
+        "routing": "021000021" if i % 2 else "111000025",
+        "amount": Decimal("1000.00") + i,
+        **extra,
+    }
+
+
+def _write(payments, **kwargs) -> tuple[list[str], object]:
+    sink = io.StringIO()
+    totals = write_ach_file(
+        payments,
+        sink,
+        company_name=kwargs.pop("company_name", "Acme Corp"),
+        company_id=kwargs.pop("company_id", "1234567890"),
+        effective_date=kwargs.pop("effective_date", "2024-01-15"),
+        immediate_destination=ODFI,
+        created_at=CREATED,
+        **kwargs,
+    )
+    return sink.getvalue().splitlines(), totals
+
+
+class TestAchRecords:
+    """Record layout and control totals."""
+
+    def test_all_records_fixed_width_and_blocked(self):
+        records, totals = _write(_payment(i) for i in range(13))
+        assert all(len(r) == RECORD_LENGTH for r in records)
+        assert len(records) % BLOCKING_FACTOR == 0
+        assert totals.block_count == len(records) // BLOCKING_FACTOR
+        assert [r[0] for r in records[:4]] == ["1", "5", "6", "6"]
+
+    def test_control_totals(self):
+        payments = [_payment(i) for i in range(5)]
+        records, totals = _write(payments)
+
+        expected_cents = sum(int(p["amount"] * 100) for p in payments)
+        expected_hash = sum(int(p["routing"][:8]) for p in payments)
+        assert totals.entry_count == 5
+        assert totals.batch_count == 1
+        assert totals.entry_hash == expected_hash
+        assert totals.total_credit == Decimal(expected_cents).scaleb(-2)
+
+        batch_control = next(r for r in records if r[0] == "8")
+        assert int(batch_control[4:10]) == 5
+        assert int(batch_control[10:20]) == expected_hash
+        assert int(batch_control[32:44]) == expected_cents
+
+        file_control = next(r for r in records if r[0] == "9" and r[1] != "9")
+        assert int(file_control[1:7]) == 1
+        assert int(file_control[13:21]) == 5
+        assert int(file_control[21:31]) == expected_hash
+        assert int(file_control[43:55]) == expected_cents
+
+    def test_entry_fields(self):
+        records, _ = _write([_payment(1)])
+        entry = next(r for r in records if r[0] == "6")
+        assert entry[1:3] == "22"
+        assert entry[3:12] == "021000021"
+        assert entry[12:29].rstrip() == "ACCT00001"
+        assert int(entry[29:39]) == 100100
+        assert entry[54:76].rstrip() == "EMPLOYEE 1"
+        assert entry[79:94] == ODFI[:8] + "0000001"
+
+    def test_empty_file(self):
+        records, totals = _write([])
+        assert len(records) == BLOCKING_FACTOR
+        assert totals.entry_count == 0
+        assert totals.batch_count == 0
+        assert totals.total_credit == Decimal("0.00")
+
+    def test_invalid_routing_rejected(self):
+        with pytest.raises(ValueError, match="routing"):
+            _write([_payment(1, routing="12345")])
+
+    def test_sub_cent_amount_rejected(self):
+        with pytest.raises(ValueError, match="sub-cent"):
+            _write([_payment(1, amount=Decimal("10.005"))])
+
+
+class TestAchBatchSplitting:
+    """Batches open on company / effective date changes."""
+
+    def test_split_by_effective_date_and_company(self):
+        payments = [
+            _payment(1),
+            _payment(2),
+            _payment(3, effective_date=date(2024, 1, 16)),
+            _payment(4, effective_date=date(2024, 1, 16), company_id="9876543210",
+                     company_name="Acme West"),
+        ]
+        records, totals = _write(payments)
+        headers = [r for r in records if r[0] == "5"]
+        controls = [r for r in records if r[0] == "8"]
+
+        assert totals.batch_count == 3
+        assert [h[69:75] for h in headers] == ["240115", "240116", "240116"]
+        assert [h[40:50] for h in headers] == ["1234567890", "1234567890", "9876543210"]
+        assert headers[2][4:20].rstrip() == "ACME WEST"
+        assert [int(c[4:10]) for c in controls] == [2, 1, 1]
+        assert [int(h[87:94]) for h in headers] == [1, 2, 3]
+        assert sum(int(c[10:20]) for c in controls) == totals.entry_hash
+
+
+class TestAchStreaming:
+    """Records reach the sink while payments are still being produced."""
+
+    def test_records_written_before_iterator_exhausted(self):
+        sink = io.StringIO()
+        seen: list[int] = []
+
+        def payments():
+            for i in range(3):
+                seen.append(sink.getvalue().count("\n"))
+                yield _payment(i)
+
+        writer = AchFileWriter(
+            sink, immediate_destination=ODFI, immediate_origin="1234567890",
+            created_at=CREATED,
+        )
+        writer.write_header()
+        writer.write_payments(payments(), "Acme Corp", "1234567890", "2024-01-15")
+        writer.close()
+
+        # header before the first payment; batch header + one entry per payment after
+        assert seen == [1, 3, 4]
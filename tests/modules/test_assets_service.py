@@ -10,16 +10,20 @@ Validates:
 from __future__ import annotations
 
 import inspect
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
 from finance_kernel.services.module_posting_service import ModulePostingStatus
 from finance_modules.assets.helpers import (
     calculate_impairment_loss,
+    depreciate_portfolio,
     double_declining_balance,
+    forecast_portfolio,
+    next_period_end,
     straight_line,
     sum_of_years_digits,
     units_of_production,
@@ -28,6 +32,7 @@ from finance_modules.assets.models import (
     AssetRevaluation,
     AssetTransfer,
     DepreciationComponent,
+    PortfolioAsset,
 )
 from finance_modules.assets.service import FixedAssetService
 from tests.modules.conftest import TEST_ASSET_CATEGORY_ID, TEST_ASSET_ID
@@ -421,6 +426,388 @@ class TestMassDepreciation:
         assert len(results) == 2
         assert all(r.status == ModulePostingStatus.POSTED for r in results)
 
+    def test_mass_depreciation_consolidated(
+        self, asset_service, session, current_period, test_actor_id,
+        deterministic_clock, test_asset_category,
+    ):
+        """Consolidated batch posts one entry with a line pair and link per asset."""
+        from sqlalchemy import select
+
+        from finance_kernel.domain.economic_link import ArtifactRef, ArtifactType
+        from finance_kernel.models.journal import JournalLine
+
+        asset_ids = [str(uuid4()) for _ in range(3)]
+        results = asset_service.run_mass_depreciation(
+            assets=[
+                {"asset_id": a, "amount": amt, "cost_center": "CC100"}
+                for a, amt in zip(asset_ids, ("1000.00", "2000.00", "500.00"))
+            ],
+            effective_date=deterministic_clock.now().date(),
+            actor_id=test_actor_id,
+            consolidated=True,
+        )
+
+        assert len(results) == 1
+        result = results[0]
+        assert result.status == ModulePostingStatus.POSTED
+        assert len(result.journal_entry_ids) == 1
+
+        entry_id = result.journal_entry_ids[0]
+        lines = session.execute(
+            select(JournalLine).where(JournalLine.journal_entry_id == entry_id)
+        ).scalars().all()
+        assert len(lines) == 6
+        assert {l.dimensions["asset_id"] for l in lines} == set(asset_ids)
+        assert all(l.dimensions["cost_center"] == "CC100" for l in lines)
+
+        for asset_id in asset_ids:
+            children = asset_service._link_graph.get_children(
+                ArtifactRef(ArtifactType.ASSET, asset_id),
+            )
+            assert [c.child_ref.artifact_id for c in children] == [entry_id]
+
+    def test_mass_depreciation_consolidated_empty(
+        self, asset_service, current_period, test_actor_id, deterministic_clock,
+    ):
+        """An empty consolidated batch posts nothing."""
+        results = asset_service.run_mass_depreciation(
+            assets=[],
+            effective_date=deterministic_clock.now().date(),
+            actor_id=test_actor_id,
+            consolidated=True,
+        )
+        assert results == []
+
+
+# =============================================================================
+# Portfolio Depreciation
+# =============================================================================
+
+
+def _portfolio_asset(method="straight_line", convention="full_month", **kw):
+    fields = dict(
+        asset_id=uuid4(),
+        method=method,
+        in_service_date=date(2024, 1, 10),
+        cost=Decimal("12000.00"),
+        salvage_value=Decimal("0"),
+        useful_life_months=60,
+        convention=convention,
+    )
+    fields.update(kw)
+    return PortfolioAsset(**fields)
+
+
+class TestPortfolioDepreciationHelpers:
+    """Tests for depreciate_portfolio / forecast_portfolio (pure)."""
+
+    def test_matches_single_asset_helpers(self):
+        sl = _portfolio_asset(salvage_value=Decimal("1000.00"))
+        ddb = _portfolio_asset(
+            method="double_declining", accumulated_depreciation=Decimal("400.00"),
+        )
+        lines, skipped = depreciate_portfolio([sl, ddb], date(2024, 3, 31))
+        assert skipped == ()
+        assert [l.asset_id for l in lines] == [sl.asset_id, ddb.asset_id]
+        assert lines[0].depreciation_amount == straight_line(
+            Decimal("12000.00"), Decimal("1000.00"), 60,
+        )
+        assert lines[1].depreciation_amount == double_declining_balance(
+            Decimal("12000.00"), Decimal("400.00"), 60,
+        )
+        assert lines[1].net_book_value == Decimal("12000.00") - Decimal("400.00") - lines[1].depreciation_amount
+
+    @pytest.mark.parametrize("life", [7, 37, 59])
+    @pytest.mark.parametrize("cost", [Decimal("1000.00"), Decimal("12345.67")])
+    def test_full_month_parity_over_life(self, life, cost):
+        """Full-month kernels agree with the per-asset helpers every period."""
+        salvage = Decimal("100.00")
+        sl = _portfolio_asset(
+            method="straight_line", convention="full_month",
+            cost=cost, salvage_value=salvage, useful_life_months=life,
+        )
+        ddb = _portfolio_asset(
+            method="double_declining", convention="full_month",
+            cost=cost, salvage_value=salvage, useful_life_months=life,
+        )
+        period = date(2024, 1, 31)
+        for _ in range(life):
+            lines, _ = depreciate_portfolio([sl, ddb], period)
+            by_id = {l.asset_id: l.depreciation_amount for l in lines}
+            sl_amount = by_id.get(sl.asset_id, Decimal("0"))
+            ddb_amount = by_id.get(ddb.asset_id, Decimal("0"))
+            assert sl_amount == min(
+                straight_line(cost, salvage, life),
+                cost - salvage - sl.accumulated_depreciation,
+            )
+            assert ddb_amount == double_declining_balance(
+                cost, ddb.accumulated_depreciation, life, salvage,
+            )
+            sl = replace(
+                sl, accumulated_depreciation=sl.accumulated_depreciation + sl_amount,
+            )
+            ddb = replace(
+                ddb, accumulated_depreciation=ddb.accumulated_depreciation + ddb_amount,
+            )
+            period = next_period_end(period)
+
+    def test_declining_rounding_tie_matches_helper(self):
+        """Rate-first operation order: 1.65 * (2/60) rounds to 0.05, not 0.06."""
+        asset = _portfolio_asset(
+            method="double_declining", cost=Decimal("1000.00"),
+            accumulated_depreciation=Decimal("998.35"),
+        )
+        lines, _ = depreciate_portfolio([asset], date(2028, 12, 31))
+        assert lines[0].depreciation_amount == double_declining_balance(
+            Decimal("1000.00"), Decimal("998.35"), 60,
+        ) == Decimal("0.05")
+
+    def test_conventions_in_first_period(self):
+        first = date(2024, 1, 31)
+        full, mid, half = (
+            _portfolio_asset(convention=c, in_service_date=date(2024, 7, 1))
+            for c in ("full_month", "mid_month", "half_year")
+        )
+        lines, _ = depreciate_portfolio([full, mid, half], date(2024, 7, 31))
+        assert [l.depreciation_amount for l in lines] == [
+            Decimal("200.00"), Decimal("100.00"), Decimal("200.00"),
+        ]
+        # Placed in service in October: half a year over three months.
+        q4 = _portfolio_asset(convention="half_year", in_service_date=date(2024, 10, 1))
+        lines, _ = depreciate_portfolio([q4], date(2024, 10, 31))
+        assert lines[0].depreciation_amount == Decimal("400.00")
+        # Not yet in service
+        assert depreciate_portfolio([q4], first)[0] == ()
+
+    def test_unsupported_method_skipped(self):
+        macrs = _portfolio_asset(method="macrs")
+        lines, skipped = depreciate_portfolio([macrs], date(2024, 3, 31))
+        assert lines == ()
+        assert skipped == (macrs,)
+
+    def test_never_below_salvage(self):
+        asset = _portfolio_asset(
+            salvage_value=Decimal("1000.00"), accumulated_depreciation=Decimal("10950.00"),
+        )
+        lines, _ = depreciate_portfolio([asset], date(2029, 1, 31))
+        assert lines[0].depreciation_amount == Decimal("50.00")
+        assert lines[0].net_book_value == Decimal("1000.00")
+
+    @pytest.mark.parametrize("method", [
+        "straight_line", "double_declining", "declining_balance", "sum_of_years",
+    ])
+    @pytest.mark.parametrize("convention", ["full_month", "mid_month", "half_year"])
+    def test_forecast_depreciates_to_salvage(self, method, convention):
+        asset = _portfolio_asset(
+            method=method, convention=convention, salvage_value=Decimal("1500.00"),
+        )
+        lines = list(forecast_portfolio([asset], date(2024, 1, 31), max_periods=240))
+        total = sum(l.depreciation_amount for l in lines)
+        if method in ("straight_line", "sum_of_years"):
+            assert total == Decimal("10500.00")
+            assert lines[-1].net_book_value == Decimal("1500.00")
+        assert total <= Decimal("10500.00")
+        assert all(l.depreciation_amount > 0 for l in lines)
+        assert [l.period_date for l in lines] == sorted(l.period_date for l in lines)
+
+    def test_forecast_waits_for_in_service(self):
+        asset = _portfolio_asset(in_service_date=date(2024, 6, 15), useful_life_months=3)
+        lines = list(forecast_portfolio([asset], date(2024, 1, 31)))
+        assert [l.period_date for l in lines] == [
+            date(2024, 6, 30), date(2024, 7, 31), date(2024, 8, 31),
+        ]
+
+
+class TestPortfolioDepreciationRun:
+    """Tests for run_portfolio_depreciation / forecast_portfolio_depreciation."""
+
+    @pytest.fixture
+    def register_assets(self, session, test_actor_id, test_asset_category):
+        from finance_modules.assets.orm import AssetModel
+
+        assets = []
+        for i, cost in enumerate(("6000.00", "12000.00", "24000.00")):
+            asset = AssetModel(
+                id=uuid4(),
+                asset_number=f"PORTFOLIO-{uuid4().hex[:8]}-{i}",
+                description=f"Portfolio asset {i}",
+                category_id=TEST_ASSET_CATEGORY_ID,
+                acquisition_date=date(2023, 12, 15),
+                in_service_date=date(2024, 1, 1),
+                acquisition_cost=Decimal(cost),
+                salvage_value=Decimal("0"),
+                useful_life_months=60,
+                net_book_value=Decimal(cost),
+                status="in_service",
+                created_by_id=test_actor_id,
+            )
+            session.add(asset)
+            assets.append(asset)
+        session.flush()
+        return assets
+
+    def test_run_posts_and_writes_schedules(
+        self, asset_service, session, current_period, test_actor_id,
+        deterministic_clock, register_assets,
+    ):
+        from sqlalchemy import select
+
+        from finance_modules.assets.orm import AssetModel, DepreciationScheduleModel
+
+        period = deterministic_clock.now().date()
+        ids = [a.id for a in register_assets]
+        run = asset_service.run_portfolio_depreciation(
+            period_date=period,
+            actor_id=test_actor_id,
+            convention="full_month",
+            chunk_size=2,
+            asset_ids=ids,
+        )
+
+        assert run.asset_count == 3
+        assert run.chunk_count == 2
+        assert run.schedule_rows_written == 3
+        assert run.total_depreciation == Decimal("700.00")
+        assert run.posting_status == ModulePostingStatus.POSTED.value
+        assert len(run.journal_entry_ids) == 2
+
+        rows = session.execute(
+            select(DepreciationScheduleModel).where(
+                DepreciationScheduleModel.asset_id.in_(ids),
+            )
+        ).scalars().all()
+        assert len(rows) == 3
+        assert all(r.is_posted and r.period_date == period for r in rows)
+
+        session.expire_all()
+        balances = {
+            a.id: a.accumulated_depreciation
+            for a in session.execute(
+                select(AssetModel).where(AssetModel.id.in_(ids))
+            ).scalars()
+        }
+        assert sorted(balances.values()) == [
+            Decimal("100.00"), Decimal("200.00"), Decimal("400.00"),
+        ]
+
+        rerun = asset_service.run_portfolio_depreciation(
+            period_date=period, actor_id=test_actor_id, asset_ids=ids,
+        )
+        assert rerun.asset_count == 0
+        assert rerun.journal_entry_ids == ()
+
+    def test_draft_run_leaves_register_for_posting_run(
+        self, asset_service, session, current_period, test_actor_id,
+        deterministic_clock, register_assets,
+    ):
+        from sqlalchemy import select
+
+        from finance_modules.assets.orm import AssetModel, DepreciationScheduleModel
+
+        period = deterministic_clock.now().date()
+        ids = [a.id for a in register_assets]
+
+        def accumulated():
+            session.expire_all()
+            return sorted(
+                a.accumulated_depreciation
+                for a in session.execute(
+                    select(AssetModel).where(AssetModel.id.in_(ids))
+                ).scalars()
+            )
+
+        draft = asset_service.run_portfolio_depreciation(
+            period_date=period, actor_id=test_actor_id, convention="full_month",
+            post=False, asset_ids=ids,
+        )
+        assert draft.schedule_rows_written == 3
+        assert draft.journal_entry_ids == ()
+        assert accumulated() == [Decimal("0")] * 3
+
+        posted = asset_service.run_portfolio_depreciation(
+            period_date=period, actor_id=test_actor_id, convention="full_month",
+            asset_ids=ids,
+        )
+        assert posted.asset_count == 3
+        assert posted.total_depreciation == Decimal("700.00")
+        assert len(posted.journal_entry_ids) == 1
+        assert accumulated() == [Decimal("100.00"), Decimal("200.00"), Decimal("400.00")]
+        rows = session.execute(
+            select(DepreciationScheduleModel).where(
+                DepreciationScheduleModel.asset_id.in_(ids),
+            )
+        ).scalars().all()
+        assert len(rows) == 3
+        assert all(r.is_posted for r in rows)
+
+    def test_mass_depreciation_task_posts(
+        self, session, module_role_resolver, party_service, test_actor_party,
+        workflow_executor, deterministic_clock, current_period, test_actor_id,
+        register_assets,
+    ):
+        from sqlalchemy import select
+
+        from finance_batch.domain.types import BatchItemStatus
+        from finance_batch.tasks.assets_tasks import MassDepreciationTask
+        from finance_kernel.models.journal import JournalEntry, JournalLine
+        from finance_modules.assets.orm import AssetModel, DepreciationScheduleModel
+
+        task = MassDepreciationTask(service_factory=lambda s: FixedAssetService(
+            session=s, role_resolver=module_role_resolver,
+            workflow_executor=workflow_executor, clock=deterministic_clock,
+            party_service=party_service,
+        ))
+        period = deterministic_clock.now().date()
+        parameters = {
+            "period_date": period.isoformat(), "convention": "full_month",
+            "actor_id": str(test_actor_id),
+        }
+        asset = register_assets[0]
+        asset.department_id = department_id = uuid4()
+        session.flush()
+        (item,) = [
+            i for i in task.prepare_items(parameters, session, deterministic_clock.now())
+            if i.item_key == str(asset.id)
+        ]
+        assert item.payload["cost_center"] == str(department_id)
+
+        result = task.execute_item(item, parameters, session, deterministic_clock.now())
+        assert result.status == BatchItemStatus.SUCCEEDED, result.error_message
+        assert len(result.result_data["journal_entry_ids"]) == 1
+        row = session.execute(
+            select(DepreciationScheduleModel).where(
+                DepreciationScheduleModel.asset_id == asset.id,
+            )
+        ).scalar_one()
+        assert row.is_posted and row.depreciation_amount == Decimal("100.00")
+        session.expire_all()
+        assert session.get(AssetModel, asset.id).accumulated_depreciation == Decimal("100.00")
+        entry = session.get(JournalEntry, UUID(result.result_data["journal_entry_ids"][0]))
+        assert entry.source_event_type == "ASSET_DEPRECIATION_BATCH"
+        lines = session.execute(
+            select(JournalLine).where(JournalLine.journal_entry_id == entry.id)
+        ).scalars().all()
+        assert {l.dimensions["cost_center"] for l in lines} == {str(department_id)}
+
+    def test_forecast_is_read_only(
+        self, asset_service, session, deterministic_clock, register_assets,
+    ):
+        from sqlalchemy import func, select
+
+        from finance_modules.assets.orm import DepreciationScheduleModel
+
+        ids = [a.id for a in register_assets]
+        lines = list(asset_service.forecast_portfolio_depreciation(
+            start_period=date(2024, 1, 31), convention="full_month", asset_ids=ids,
+        ))
+        assert len(lines) == 180
+        assert sum(l.depreciation_amount for l in lines) == Decimal("42000.00")
+        assert session.execute(
+            select(func.count()).select_from(DepreciationScheduleModel).where(
+                DepreciationScheduleModel.asset_id.in_(ids),
+            )
+        ).scalar_one() == 0
+
 
 # =============================================================================
 # Integration Tests — Asset Transfer
@@ -1,11 +1,12 @@
 """ORM round-trip tests for Budget module.
 
-Covers all five models:
+Covers all six models:
     - BudgetModel (budget header / version container)
     - BudgetLineModel (line items)
     - BudgetVersionModel (amendment snapshots)
     - BudgetTransferModel (inter-line transfers)
     - BudgetAllocationModel (top-down allocations)
+    - BudgetEncumbranceModel (encumbrance relief state)
 """
 
 from datetime import date
@@ -15,8 +16,10 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from finance_modules.budget.models import Encumbrance, EncumbranceStatus
 from finance_modules.budget.orm import (
     BudgetAllocationModel,
+    BudgetEncumbranceModel,
     BudgetLineModel,
     BudgetModel,
     BudgetTransferModel,
@@ -577,3 +580,45 @@ class TestBudgetAllocationModelORM:
         assert q2 is not None
         assert q1.target_entity_id == "DEPT-ENG"
         assert q2.target_entity_id == "DEPT-SALES"
+
+
+# ==========================================================================
+# BudgetEncumbranceModel
+# ==========================================================================
+
+
+class TestBudgetEncumbranceModelORM:
+    """Round-trip persistence tests for BudgetEncumbranceModel."""
+
+    def test_dto_round_trip(self, session, test_actor_id):
+        dto = Encumbrance(
+            id=uuid4(),
+            po_id=uuid4(),
+            account_code="6100",
+            amount=Decimal("1200.00"),
+            period="2024-01",
+            status=EncumbranceStatus.PARTIALLY_RELIEVED,
+            relieved_amount=Decimal("200.00"),
+        )
+        session.add(BudgetEncumbranceModel.from_dto(dto, created_by_id=test_actor_id))
+        session.flush()
+
+        queried = session.get(BudgetEncumbranceModel, dto.id)
+        assert queried.status == "partially_relieved"
+        assert queried.to_dto() == dto
+
+    def test_defaults(self, session, test_actor_id):
+        obj = BudgetEncumbranceModel(
+            po_id=uuid4(),
+            account_code="6100",
+            period="2024-01",
+            amount=Decimal("50.00"),
+            created_by_id=test_actor_id,
+        )
+        session.add(obj)
+        session.flush()
+
+        queried = session.get(BudgetEncumbranceModel, obj.id)
+        assert queried.status == "open"
+        assert queried.relieved_amount == Decimal("0")
+        assert queried.currency == "USD"
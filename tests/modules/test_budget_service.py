@@ -12,6 +12,7 @@ Validates:
 - get_encumbrance_balance: pure calculation
 - get_available_budget: pure calculation
 - update_forecast: memo posting
+- get_budget_cube: one ledger aggregation, dimensions, watermark cache
 """
 
 from __future__ import annotations
@@ -338,3 +339,154 @@ class TestForecast:
         assert result.status == ModulePostingStatus.POSTED
         assert isinstance(entry, ForecastEntry)
         assert entry.forecast_amount == Decimal("55000.00")
+
+
+# =============================================================================
+# Integration Tests — Budget Cube
+# =============================================================================
+
+
+@pytest.fixture
+def cube_service(session, role_resolver, deterministic_clock, workflow_executor):
+    """BudgetService over the standard accounts (actuals via post_via_coordinator)."""
+    return BudgetService(
+        session=session,
+        role_resolver=role_resolver,
+        workflow_executor=workflow_executor,
+        clock=deterministic_clock,
+    )
+
+
+def _add_budget_line(session, actor_id, account_code, period, amount, dimensions=None):
+    from finance_modules.budget.orm import BudgetLineModel
+
+    session.add(BudgetLineModel.from_dto(
+        BudgetEntry(
+            id=uuid4(), version_id=TEST_BUDGET_VERSION_ID,
+            account_code=account_code, period=period, amount=Decimal(amount),
+            dimensions=dimensions,
+        ),
+        created_by_id=actor_id,
+    ))
+    session.flush()
+
+
+class TestBudgetCube:
+    """get_budget_cube: whole-chart budget vs actual vs encumbrance."""
+
+    def test_cube_combines_budget_actual_encumbrance(
+        self, cube_service, session, post_via_coordinator, current_period,
+        test_actor_id, test_budget_version,
+    ):
+        from finance_modules.budget.orm import BudgetEncumbranceModel
+
+        period = current_period.period_code
+        post_via_coordinator(debit_role="COGS", credit_role="CashAsset", amount=Decimal("700.00"))
+        post_via_coordinator(debit_role="CashAsset", credit_role="SalesRevenue", amount=Decimal("1200.00"))
+        _add_budget_line(session, test_actor_id, "5000", period, "1000")
+        _add_budget_line(session, test_actor_id, "4000", period, "1500")
+        session.add(BudgetEncumbranceModel.from_dto(
+            Encumbrance(id=uuid4(), po_id=uuid4(), account_code="5000",
+                        amount=Decimal("250"), period=period,
+                        relieved_amount=Decimal("50"),
+                        status=EncumbranceStatus.PARTIALLY_RELIEVED),
+            created_by_id=test_actor_id,
+        ))
+        session.flush()
+
+        cube = cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [period])
+
+        expense = cube.get("5000", period)
+        assert expense.budget_amount == Decimal("1000")
+        assert expense.actual_amount == Decimal("700.00")
+        assert expense.encumbrance_amount == Decimal("200")
+        assert expense.available_amount == Decimal("100.00")
+        revenue = cube.get("4000", period)
+        assert revenue.actual_amount == Decimal("1200.00")
+        # Cash (asset) is outside the default revenue/expense scope.
+        assert cube.get("1000", period).actual_amount == Decimal("0")
+
+        variances = {v.account_code: v for v in cube.variances()}
+        assert variances["5000"].is_favorable is True
+        assert variances["4000"].variance_amount == Decimal("300.00")
+
+    def test_cube_dimensions_slice_and_rollup(
+        self, cube_service, session, post_via_coordinator, current_period,
+        test_actor_id, test_budget_version,
+    ):
+        from finance_kernel.domain.accounting_intent import IntentLine
+
+        period = current_period.period_code
+        post_via_coordinator(
+            debit_role="CashAsset", credit_role="CashAsset", amount=Decimal("0"),
+            extra_lines=(
+                IntentLine.debit("COGS", Decimal("300"), "USD", dimensions={"org_unit": "east"}),
+                IntentLine.debit("COGS", Decimal("100"), "USD", dimensions={"org_unit": "west"}),
+                IntentLine.credit("CashAsset", Decimal("400"), "USD"),
+            ),
+        )
+        _add_budget_line(session, test_actor_id, "5000", period, "350", (("org_unit", "east"),))
+
+        cube = cube_service.get_budget_cube(
+            TEST_BUDGET_VERSION_ID, [period], dimension_keys=("org_unit",),
+        )
+
+        east = cube.get("5000", period, org_unit="east")
+        assert (east.budget_amount, east.actual_amount) == (Decimal("350"), Decimal("300"))
+        assert cube.slice(org_unit="west").total_actual == Decimal("100")
+        rolled = cube.rollup()
+        assert rolled.dimension_keys == ()
+        assert rolled.get("5000", period).actual_amount == Decimal("400")
+        with pytest.raises(ValueError, match="no dimension"):
+            cube.slice(region="x")
+
+    def test_cube_cache_refreshes_on_new_posting(
+        self, cube_service, session, post_via_coordinator, current_period,
+        test_budget_version,
+    ):
+        period = current_period.period_code
+        post_via_coordinator(debit_role="COGS", credit_role="CashAsset", amount=Decimal("10"))
+        first = cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [period])
+        assert cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [period]).cells == first.cells
+
+        post_via_coordinator(debit_role="COGS", credit_role="CashAsset", amount=Decimal("5"))
+        refreshed = cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [period])
+        assert refreshed.get("5000", period).actual_amount == Decimal("15")
+
+    def test_cube_cache_refreshes_on_external_budget_write(
+        self, cube_service, session, post_via_coordinator, current_period,
+        test_actor_id, test_budget_version,
+    ):
+        """Budget rows written outside this service still invalidate the cube."""
+        from finance_modules.budget.orm import BudgetEncumbranceModel
+
+        period = current_period.period_code
+        post_via_coordinator(debit_role="COGS", credit_role="CashAsset", amount=Decimal("10"))
+        _add_budget_line(session, test_actor_id, "5000", period, "100")
+        assert cube_service.get_budget_cube(
+            TEST_BUDGET_VERSION_ID, [period],
+        ).get("5000", period).budget_amount == Decimal("100")
+
+        _add_budget_line(session, test_actor_id, "4000", period, "40")
+        cube = cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [period])
+        assert cube.get("4000", period).budget_amount == Decimal("40")
+
+        encumbrance = BudgetEncumbranceModel.from_dto(
+            Encumbrance(id=uuid4(), po_id=uuid4(), account_code="5000",
+                        amount=Decimal("30"), period=period),
+            created_by_id=test_actor_id,
+        )
+        session.add(encumbrance)
+        session.flush()
+        cube = cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [period])
+        assert cube.get("5000", period).encumbrance_amount == Decimal("30")
+
+        encumbrance.relieved_amount = Decimal("10")
+        encumbrance.status = EncumbranceStatus.PARTIALLY_RELIEVED.value
+        session.flush()
+        cube = cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [period])
+        assert cube.get("5000", period).encumbrance_amount == Decimal("20")
+
+    def test_cube_requires_periods(self, cube_service):
+        with pytest.raises(ValueError, match="period"):
+            cube_service.get_budget_cube(TEST_BUDGET_VERSION_ID, [])
@@ -10,6 +10,7 @@ Validates:
 from __future__ import annotations
 
 import inspect
+import io
 from datetime import date
 from decimal import Decimal
 from uuid import uuid4
@@ -465,6 +466,26 @@ class TestPaymentFileGeneration:
         assert pf.total_amount == Decimal("5000.00")
         assert "Vendor A" in pf.content
 
+    def test_write_payment_file_streams_to_sink(self, cash_service):
+        payments = [
+            {"name": "Vendor A", "account": "12345", "routing": "021000021", "amount": "5000.00"},
+            {"name": "Vendor B", "account": "67890", "routing": "021000021", "amount": "1250.00",
+             "effective_date": "2024-01-16"},
+        ]
+        sink = io.StringIO()
+        totals = cash_service.write_payment_file(
+            payments=iter(payments),
+            sink=sink,
+            company_name="Test Corp",
+            company_id="123",
+            effective_date="2024-01-15",
+            immediate_destination="091000019",
+        )
+        assert totals.batch_count == 2
+        assert totals.entry_count == 2
+        assert totals.total_credit == Decimal("6250.00")
+        assert "VENDOR A" in sink.getvalue()
+
     def test_generate_unsupported_format(self, cash_service):
         with pytest.raises(ValueError, match="Unsupported payment format"):
             cash_service.generate_payment_file([], "SWIFT", "Corp", "123")
@@ -294,6 +294,62 @@ class TestContractsServiceIntegration:
         assert submission is not None
         assert submission.fiscal_year == 2024
 
+    def test_compile_ice_recomputes_only_edited_contract(self, contracts_service):
+        """A recompile after a one-contract edit reuses every other contract's lines."""
+        from dataclasses import replace
+        from datetime import date
+
+        from finance_engines.ice import (
+            ContractCostInput,
+            ICEInput,
+            IndirectPoolInput,
+            compile_ice_submission,
+        )
+        from finance_kernel.domain.values import Money
+
+        contracts = tuple(
+            ContractCostInput(
+                contract_number=f"FA8750-21-C-{i:04d}",
+                contract_type="CPFF",
+                direct_labor=Money.of(Decimal("100000") * i, "USD"),
+                direct_material=Money.of(Decimal("20000"), "USD"),
+            )
+            for i in range(1, 6)
+        )
+        pools = (
+            IndirectPoolInput(
+                pool_name="OVERHEAD",
+                pool_costs=Money.of(Decimal("150000"), "USD"),
+                allocation_base=Money.of(Decimal("1500000"), "USD"),
+                claimed_rate=Decimal("0.10"),
+                base_description="Direct labor",
+            ),
+        )
+        ice_input = ICEInput(
+            fiscal_year=2024,
+            fiscal_year_start=date(2024, 1, 1),
+            fiscal_year_end=date(2024, 12, 31),
+            contractor_name="Test Corp",
+            currency="USD",
+            contract_costs=contracts,
+            indirect_pools=pools,
+        )
+        contracts_service.compile_ice(ice_input)
+        cache = contracts_service._ice_line_cache
+        assert (cache.hits, cache.misses) == (0, 5)
+
+        edited = replace(
+            contracts[2], direct_labor=Money.of(Decimal("310000"), "USD"),
+        )
+        edited_input = replace(
+            ice_input,
+            contract_costs=contracts[:2] + (edited,) + contracts[3:],
+        )
+        submission = contracts_service.compile_ice(edited_input)
+
+        assert (cache.hits, cache.misses) == (4, 1)
+        assert submission == compile_ice_submission(edited_input)
+
     def test_record_fee_accrual_posts(
         self, contracts_service, current_period, test_actor_id, deterministic_clock,
         test_customer_party,
@@ -314,6 +370,113 @@ class TestContractsServiceIntegration:
         assert len(result.journal_entry_ids) > 0
 
 
+class TestVerifyLaborRates:
+    """Tests for verify_and_record_labor_rates (pay-period verification)."""
+
+    @pytest.fixture
+    def rate_tables(self, session, test_actor_id):
+        """ENG-03 loaded rate 125.00; contract ceiling 120.00 for ENG-03."""
+        from finance_modules.contracts.rate_orm import (
+            ContractRateCeilingModel,
+            LaborRateScheduleModel,
+        )
+        from finance_modules.contracts.rate_types import (
+            ContractRateCeiling,
+            LaborRateSchedule,
+            RateSource,
+        )
+
+        contract_id = uuid4()
+        session.add(LaborRateScheduleModel.from_dto(
+            LaborRateSchedule(
+                schedule_id=uuid4(),
+                employee_classification="Senior Engineer",
+                labor_category="ENG-03",
+                base_rate=Decimal("75.00"),
+                loaded_rate=Decimal("125.00"),
+                effective_from=date(2024, 1, 1),
+                rate_source=RateSource.NEGOTIATED,
+            ),
+            created_by_id=test_actor_id,
+        ))
+        session.add(ContractRateCeilingModel.from_dto(
+            ContractRateCeiling(
+                contract_id=contract_id,
+                labor_category="ENG-03",
+                max_hourly_rate=Decimal("120.00"),
+                effective_from=date(2024, 1, 1),
+            ),
+            created_by_id=test_actor_id,
+        ))
+        session.flush()
+        return contract_id
+
+    def test_records_results_and_ceiling_violation(
+        self, contracts_service, session, rate_tables, current_period,
+        test_actor_id, deterministic_clock,
+    ):
+        import logging
+
+        from sqlalchemy import select
+
+        from finance_kernel.models.event import Event
+        from finance_modules.contracts.rate_types import (
+            LaborChargeLine,
+            RateViolationType,
+        )
+        from finance_modules.contracts.service import logger as service_logger
+
+        contract_id = rate_tables
+        charge_date = deterministic_clock.now().date()
+        within, over = uuid4(), uuid4()
+        lines = [
+            LaborChargeLine(
+                within, "Senior Engineer", "ENG-03", Decimal("110.00"),
+                charge_date, contract_id,
+            ),
+            LaborChargeLine(
+                over, "Senior Engineer", "ENG-03", Decimal("122.00"),
+                charge_date, contract_id,
+            ),
+        ]
+
+        records: list[logging.LogRecord] = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        service_logger.addHandler(handler)
+        try:
+            results = contracts_service.verify_and_record_labor_rates(
+                lines, actor_id=test_actor_id,
+            )
+        finally:
+            service_logger.removeHandler(handler)
+
+        assert [r.employee_id for r in results] == [within, over]
+        assert results[0].is_valid
+        assert not results[1].is_valid
+        assert results[1].violation_type == RateViolationType.EXCEEDS_CONTRACT_CEILING
+        assert results[1].ceiling_rate == Decimal("120.00")
+        assert results[1].excess_amount == Decimal("2.00")
+
+        recorded = {
+            e.payload["employee_id"]: e.event_type
+            for e in session.execute(
+                select(Event).where(Event.event_type.in_((
+                    "contract.rate_verified", "contract.rate_ceiling_exceeded",
+                )))
+            ).scalars()
+        }
+        assert recorded[str(within)] == "contract.rate_verified"
+        assert recorded[str(over)] == "contract.rate_ceiling_exceeded"
+
+        (summary,) = [r for r in records if r.getMessage() == "labor_rates_verified"]
+        assert summary.line_count == 2
+        assert summary.verified_count == 2
+        assert summary.violation_count == 1
+        assert summary.schedule_rows == 1
+        assert summary.ceiling_rows == 1
+
+
 class TestContractModels:
     """Verify new contract models are frozen dataclasses."""
 
@@ -15,6 +15,9 @@ Also validates calculations:
 - calculate_ecl_loss_rate, calculate_ecl_pd_lgd
 - calculate_vintage_loss_curve, apply_forward_looking_adjustment
 - calculate_provision_change
+- PortfolioECLAccumulator, apply_ecl_matrix, provision_rollforward
+- run_portfolio_ecl: streamed pass over open AR subledger items, shared
+  with the credit_loss.ecl_calculation batch task
 """
 
 from __future__ import annotations
@@ -26,16 +29,21 @@ from uuid import uuid4
 import pytest
 
 from finance_kernel.services.module_posting_service import ModulePostingStatus
+from finance_kernel.selectors.subledger_selector import OpenItemDTO
 from finance_modules.credit_loss.calculations import (
+    PortfolioECLAccumulator,
+    apply_ecl_matrix,
     apply_forward_looking_adjustment,
     calculate_ecl_loss_rate,
     calculate_ecl_pd_lgd,
     calculate_provision_change,
     calculate_vintage_loss_curve,
+    provision_rollforward,
 )
 from finance_modules.credit_loss.models import (
     CreditPortfolio,
     ECLEstimate,
+    ECLRateMatrix,
     ForwardLookingAdjustment,
     LossRate,
     VintageAnalysis,
@@ -321,3 +329,217 @@ class TestDisclosure:
         assert data["total_gross_receivable"] == "1500000"
         assert data["total_allowance"] == "55000"
         assert data["net_receivable"] == "1445000"
+
+
+# =============================================================================
+# Portfolio ECL
+# =============================================================================
+
+AS_OF = date(2024, 12, 31)
+
+
+def _item(entity: str, effective: date, amount: str, segment: str | None = None) -> OpenItemDTO:
+    return OpenItemDTO(
+        id=uuid4(), entity_id=entity, effective_date=effective,
+        open_amount=Decimal(amount), currency="USD",
+        dimensions={"segment": segment} if segment else None,
+    )
+
+
+class TestPortfolioECLEngine:
+    """Pure portfolio engine: cells, matrix, roll-forward."""
+
+    def test_cells_by_segment_vintage_bucket(self):
+        acc = PortfolioECLAccumulator(AS_OF, segment_map={"C2": "consumer"})
+        acc.add([
+            _item("C1", date(2024, 12, 31), "100", segment="commercial"),
+            _item("C1", date(2024, 12, 20), "50", segment="commercial"),
+            _item("C1", date(2024, 12, 25), "25", segment="commercial"),
+            _item("C2", date(2024, 8, 1), "400"),
+            _item("C2", date(2024, 12, 1), "-30"),
+        ])
+        cells = {(c.segment, c.vintage, c.bucket): c for c in acc.cells()}
+
+        assert acc.item_count == 5
+        assert acc.unapplied_credits == Decimal("30")
+        assert cells[("commercial", "2024-12", "Current")].exposure == Decimal("100")
+        assert cells[("commercial", "2024-12", "1-30")].item_count == 2
+        assert cells[("commercial", "2024-12", "1-30")].exposure == Decimal("75")
+        assert cells[("consumer", "2024-08", "Over 90")].exposure == Decimal("400")
+
+    def test_terms_days_and_quarter_vintage(self):
+        acc = PortfolioECLAccumulator(AS_OF, terms_days=30, vintage_grain="quarter")
+        acc.add([_item("C1", date(2024, 11, 15), "10")])
+        (cell,) = acc.cells()
+        assert (cell.segment, cell.vintage, cell.bucket) == ("default", "2024-Q4", "1-30")
+
+    def test_loss_rate_matrix_matches_single_balance(self):
+        acc = PortfolioECLAccumulator(AS_OF)
+        acc.add([_item("C1", date(2024, 12, 31), "1000.00"), _item("C2", date(2024, 1, 1), "333.33")])
+        matrix = ECLRateMatrix(rates={
+            ("*", "Current"): Decimal("0.01"),
+            ("default", "Over 90"): Decimal("0.35"),
+        })
+        priced = {c.bucket: c for c in apply_ecl_matrix(acc.cells(), matrix)}
+        assert priced["Current"].ecl_amount == calculate_ecl_loss_rate(Decimal("1000.00"), Decimal("0.01"))
+        assert priced["Over 90"].ecl_amount == calculate_ecl_loss_rate(Decimal("333.33"), Decimal("0.35"))
+
+    def test_pd_lgd_and_vintage_methods(self):
+        acc = PortfolioECLAccumulator(AS_OF)
+        acc.add([_item("C1", date(2024, 6, 1), "1000")])
+        (pd_cell,) = apply_ecl_matrix(acc.cells(), ECLRateMatrix(
+            method="pd_lgd", rates={("*", "Over 90"): Decimal("0.2")}, lgd={"*": Decimal("0.5")},
+        ))
+        assert pd_cell.ecl_amount == Decimal("100.00")
+        (vintage_cell,) = apply_ecl_matrix(acc.cells(), ECLRateMatrix(
+            method="vintage", rates={("default", "2024-06"): Decimal("0.04")},
+        ))
+        assert vintage_cell.ecl_amount == Decimal("40.00")
+
+    def test_missing_rate_raises(self):
+        acc = PortfolioECLAccumulator(AS_OF)
+        acc.add([_item("C1", date(2024, 6, 1), "1000")])
+        with pytest.raises(ValueError, match="Over 90"):
+            apply_ecl_matrix(acc.cells(), ECLRateMatrix(rates={("*", "Current"): Decimal("0.01")}))
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError, match="ECL method"):
+            ECLRateMatrix(method="magic")
+
+    def test_rollforward(self):
+        acc = PortfolioECLAccumulator(AS_OF)
+        acc.add([_item("C1", date(2024, 12, 31), "10000")])
+        cells = apply_ecl_matrix(acc.cells(), ECLRateMatrix(rates={("*", "Current"): Decimal("0.02")}))
+        rows = {r.segment: r for r in provision_rollforward(
+            cells,
+            opening_allowance={"default": Decimal("150"), "retired": Decimal("40")},
+            write_offs={"default": Decimal("30")},
+            recoveries={"default": Decimal("5")},
+        )}
+        default = rows["default"]
+        assert default.closing_allowance == Decimal("200.00")
+        assert default.provision == Decimal("75.00")
+        assert (default.opening_allowance + default.provision - default.write_offs
+                + default.recoveries) == default.closing_allowance
+        assert rows["retired"].closing_allowance == Decimal("0")
+        assert rows["retired"].provision == Decimal("-40")
+
+
+class TestRunPortfolioECL:
+    """run_portfolio_ecl streams open AR subledger items."""
+
+    @pytest.fixture
+    def portfolio_service(self, session, role_resolver, deterministic_clock, workflow_executor):
+        return CreditLossService(
+            session=session,
+            role_resolver=role_resolver,
+            workflow_executor=workflow_executor,
+            clock=deterministic_clock,
+        )
+
+    def test_portfolio_run_over_subledger(
+        self, portfolio_service, session, post_via_coordinator, current_period, test_actor_id,
+    ):
+        from finance_kernel.models.subledger import SubledgerEntryModel
+
+        posted = post_via_coordinator(debit_role="AccountsReceivable", credit_role="SalesRevenue")
+        journal_entry_id = posted.journal_result.entries[0].entry_id
+        as_of = current_period.end_date
+        rows = [
+            ("CUST-1", as_of, Decimal("1000.00"), None, None, "open", "retail"),
+            ("CUST-1", as_of, Decimal("600.00"), None, Decimal("200.00"), "partial", "retail"),
+            ("CUST-2", as_of, Decimal("500.00"), None, Decimal("500.00"), "reconciled", "retail"),
+            ("CUST-2", as_of, None, Decimal("80.00"), None, "open", "retail"),
+            ("CUST-3", as_of, Decimal("2000.00"), None, None, "open", "wholesale"),
+        ]
+        for i, (entity, eff, debit, credit, reconciled, status, segment) in enumerate(rows):
+            session.add(SubledgerEntryModel(
+                subledger_type="AR", entity_id=entity, journal_entry_id=journal_entry_id,
+                source_document_type="INVOICE", source_document_id=f"INV-{i}",
+                source_line_id=str(i), debit_amount=debit, credit_amount=credit,
+                currency="USD", effective_date=eff, reconciliation_status=status,
+                reconciled_amount=reconciled, dimensions={"segment": segment},
+                created_by_id=test_actor_id,
+            ))
+        session.flush()
+
+        result = portfolio_service.run_portfolio_ecl(
+            as_of,
+            ECLRateMatrix(rates={("*", "Current"): Decimal("0.01"), ("wholesale", "Current"): Decimal("0.005")}),
+            opening_allowance={"retail": Decimal("10.00")},
+            chunk_size=2,
+        )
+
+        assert result.item_count == 4
+        assert result.unapplied_credits == Decimal("80.00")
+        assert result.by_segment() == {
+            "retail": (Decimal("1400.00"), Decimal("14.00")),
+            "wholesale": (Decimal("2000.00"), Decimal("10.00")),
+        }
+        retail = next(r for r in result.rollforward if r.segment == "retail")
+        assert retail.provision == Decimal("4.00")
+        assert result.total_provision == Decimal("14.00")
+
+    def test_batch_task_uses_same_pipeline(
+        self, portfolio_service, session, post_via_coordinator, current_period, test_actor_id,
+    ):
+        """The ECL batch task honours segment_map and buckets like the service."""
+        from datetime import datetime, timedelta
+
+        from finance_batch.tasks.credit_loss_tasks import ECLCalculationTask
+        from finance_engines.aging import AgeBucket
+        from finance_kernel.models.subledger import SubledgerEntryModel
+
+        posted = post_via_coordinator(debit_role="AccountsReceivable", credit_role="SalesRevenue")
+        journal_entry_id = posted.journal_result.entries[0].entry_id
+        as_of = current_period.end_date
+        rows = [
+            ("CUST-1", as_of, "1000.00"),
+            ("CUST-1", as_of - timedelta(days=20), "300.00"),
+            ("CUST-2", as_of - timedelta(days=20), "500.00"),
+        ]
+        for i, (entity, eff, debit) in enumerate(rows):
+            session.add(SubledgerEntryModel(
+                subledger_type="AR", entity_id=entity, journal_entry_id=journal_entry_id,
+                source_document_type="INVOICE", source_document_id=f"INV-{i}",
+                source_line_id=str(i), debit_amount=Decimal(debit), credit_amount=None,
+                currency="USD", effective_date=eff, reconciliation_status="open",
+                created_by_id=test_actor_id,
+            ))
+        session.flush()
+
+        buckets = (AgeBucket("fresh", 0, 9), AgeBucket("aged", 10, None))
+        segment_map = {"CUST-1": "retail", "CUST-2": "wholesale"}
+        result = portfolio_service.run_portfolio_ecl(
+            as_of,
+            ECLRateMatrix(rates={("*", "fresh"): Decimal("0.01"), ("*", "aged"): Decimal("0.10")}),
+            buckets=buckets,
+            segment_map=segment_map,
+        )
+        items = ECLCalculationTask().prepare_items(
+            {
+                "rates": [
+                    {"bucket": "fresh", "rate": "0.01"},
+                    {"bucket": "aged", "rate": "0.10"},
+                ],
+                "as_of_date": as_of.isoformat(),
+                "buckets": [
+                    {"name": "fresh", "min_days": 0, "max_days": 9},
+                    {"name": "aged", "min_days": 10, "max_days": None},
+                ],
+                "segment_map": segment_map,
+            },
+            session,
+            datetime.combine(as_of, datetime.min.time()),
+        )
+
+        assert result.by_segment() == {
+            "retail": (Decimal("1300.00"), Decimal("40.00")),
+            "wholesale": (Decimal("500.00"), Decimal("50.00")),
+        }
+        assert {item.item_key: item.payload["provision"] for item in items} == {
+            row.segment: str(row.provision) for row in result.rollforward
+        }
+        assert {
+            item.item_key: Decimal(item.payload["gross_receivable"]) for item in items
+        } == {"retail": Decimal("1300.00"), "wholesale": Decimal("500.00")}
@@ -66,6 +66,30 @@ class TestTimesheetEntry:
                 pay_code="REGULAR",
             )
 
+    def test_zero_length_interval_only_for_zero_hours(self):
+        marker = TimesheetEntry(
+            entry_id=uuid4(),
+            work_date=date(2026, 1, 5),
+            charge_code="PROJ-001",
+            charge_type=ChargeType.DIRECT,
+            hours=Decimal("0"),
+            pay_code="REGULAR",
+            start_time=time(10, 0),
+            end_time=time(10, 0),
+        )
+        assert marker.start_time == marker.end_time
+        with pytest.raises(ValueError, match="must be after"):
+            TimesheetEntry(
+                entry_id=uuid4(),
+                work_date=date(2026, 1, 5),
+                charge_code="PROJ-001",
+                charge_type=ChargeType.DIRECT,
+                hours=Decimal("1"),
+                pay_code="REGULAR",
+                start_time=time(10, 0),
+                end_time=time(10, 0),
+            )
+
     def test_end_before_start_rejected(self):
         with pytest.raises(ValueError, match="must be after"):
             TimesheetEntry(
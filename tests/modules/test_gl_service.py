@@ -11,12 +11,13 @@ Validates:
 from __future__ import annotations
 
 import inspect
-from datetime import date
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 
+from finance_kernel.models.exchange_rate import ExchangeRate
 from finance_kernel.services.module_posting_service import ModulePostingStatus
 from finance_modules.gl.models import (
     AccountReconciliation,
@@ -703,6 +704,67 @@ class TestRecordCTA:
         assert result.is_success
 
 
+class TestTranslateTrialBalance:
+    """Tests for the whole-trial-balance translation and shared rate store."""
+
+    def _rate(self, session, test_actor_id, rate, effective_at):
+        session.add(ExchangeRate(
+            from_currency="EUR",
+            to_currency="USD",
+            rate=Decimal(rate),
+            effective_at=effective_at,
+            source="test",
+            created_by_id=test_actor_id,
+        ))
+        session.flush()
+
+    def test_translates_posted_balances_with_cta(
+        self, gl_service, session, current_period,
+        test_actor_id, deterministic_clock,
+    ):
+        today = deterministic_clock.now().date()
+        self._rate(session, test_actor_id, "1.10", datetime(2000, 1, 1, tzinfo=UTC))
+        posted = gl_service.record_fx_unrealized_gain(
+            amount=Decimal("1000.00"),
+            effective_date=today,
+            actor_id=test_actor_id,
+            currency="EUR",
+            original_currency="EUR",
+        )
+        assert posted.status == ModulePostingStatus.POSTED
+
+        translation = gl_service.translate_trial_balance(
+            as_of_date=today, period_start=current_period.start_date,
+        )
+        eur = [line for line in translation.lines if line.currency == "EUR"]
+        assert len(eur) == 2
+        assert all(line.rate == Decimal("1.10") for line in eur)
+        assert translation.cta_by_currency == (("EUR", Decimal("0.00")),)
+
+        cta = gl_service.record_cta(
+            entity_id="ENTITY-001",
+            period=current_period.period_code,
+            cta_amount=Decimal("25.00"),
+            effective_date=today,
+            actor_id=test_actor_id,
+            cta_by_currency=translation.cta_by_currency,
+        )
+        assert cta.status == ModulePostingStatus.POSTED
+
+    def test_rate_store_cached_until_rates_change(
+        self, gl_service, session, test_actor_id,
+    ):
+        self._rate(session, test_actor_id, "1.10", datetime(2000, 1, 1, tzinfo=UTC))
+        store = gl_service.fx_rate_store()
+        assert gl_service.fx_rate_store() is store
+
+        self._rate(session, test_actor_id, "1.25", datetime(2000, 6, 1, tzinfo=UTC))
+        reloaded = gl_service.fx_rate_store()
+        assert reloaded is not store
+        assert reloaded.rate("EUR", "USD", date(2000, 7, 1)) == Decimal("1.25")
+        assert reloaded.rate("USD", "EUR", date(2000, 2, 1)) == Decimal("1") / Decimal("1.10")
+
+
 class TestRunPeriodEndRevaluation:
     """Tests for run_period_end_revaluation batch method."""
 
@@ -765,6 +827,36 @@ class TestRunPeriodEndRevaluation:
         assert result.currencies_processed == 0
 
 
+    def test_revaluation_from_rate_store(
+        self, gl_service, session, current_period, test_actor_id, deterministic_clock,
+    ):
+        """Entries without an amount are revalued at the store's closing rate."""
+        for ccy, rate in (("EUR", "1.10"), ("GBP", "1.25")):
+            session.add(ExchangeRate(
+                from_currency=ccy, to_currency="USD", rate=Decimal(rate),
+                effective_at=datetime(2000, 1, 1, tzinfo=UTC),
+                source="test", created_by_id=test_actor_id,
+            ))
+        session.flush()
+        entries = [
+            {"original_currency": "EUR", "foreign_amount": "1000.00", "booked_amount": "1050.00"},
+            {"original_currency": "GBP", "foreign_amount": "400.00", "booked_amount": "520.00"},
+            {"original_currency": "EUR", "foreign_amount": "100.00", "booked_amount": "110.00"},
+        ]
+
+        result = gl_service.run_period_end_revaluation(
+            revaluation_entries=entries,
+            effective_date=deterministic_clock.now().date(),
+            actor_id=test_actor_id,
+            period="2024-12",
+        )
+
+        assert result.total_gain == Decimal("50.00")
+        assert result.total_loss == Decimal("20.00")
+        assert result.entries_posted == 2
+        assert result.currencies_processed == 3
+
+
 class TestMultiCurrencyTrialBalance:
     """Tests for multi_currency_trial_balance reporting method."""
 
@@ -812,3 +904,48 @@ class TestMultiCurrencyTrialBalance:
         assert result.all_balanced is True
         for report in result.currency_reports:
             assert report.is_balanced
+
+    def test_multi_currency_tb_translated_with_rate_store(
+        self, reporting_service, gl_service, session, module_accounts, current_period,
+        test_actor_id, deterministic_clock,
+    ):
+        """Totals are translated to the reporting currency through the GL rate store."""
+        session.add(ExchangeRate(
+            from_currency="EUR", to_currency="USD", rate=Decimal("1.10"),
+            effective_at=datetime(2000, 1, 1, tzinfo=UTC),
+            source="test", created_by_id=test_actor_id,
+        ))
+        session.flush()
+        as_of = deterministic_clock.now().date()
+        gl_service.record_fx_unrealized_gain(
+            amount=Decimal("1000.00"),
+            effective_date=as_of,
+            actor_id=test_actor_id,
+            currency="EUR",
+            original_currency="EUR",
+        )
+
+        result = reporting_service.multi_currency_trial_balance(
+            as_of_date=as_of,
+            currencies=["USD", "EUR"],
+            fx_rates=gl_service.fx_rate_store(),
+        )
+
+        assert result.reporting_currency == "USD"
+        translated = dict(result.translated_debits_by_currency)
+        eur_debits = dict(result.total_debits_by_currency)["EUR"]
+        assert eur_debits == Decimal("1000.00")
+        assert translated["EUR"] == Decimal("1100.00")
+        assert translated["USD"] == dict(result.total_debits_by_currency)["USD"]
+        assert dict(result.translated_credits_by_currency)["EUR"] == Decimal("1100.00")
+
+    def test_multi_currency_tb_untranslated_by_default(
+        self, reporting_service, module_accounts, current_period, deterministic_clock,
+    ):
+        result = reporting_service.multi_currency_trial_balance(
+            as_of_date=deterministic_clock.now().date(),
+            currencies=["USD"],
+        )
+
+        assert result.reporting_currency is None
+        assert result.translated_debits_by_currency == ()
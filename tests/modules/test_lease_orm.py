@@ -1,11 +1,12 @@
 """ORM round-trip tests for Lease module (ASC 842).
 
-Covers all five models:
+Covers all six models:
     - LeaseModel
     - LeasePaymentModel
     - ROUAssetModel
     - LeaseLiabilityModel
     - LeaseModificationModel
+    - LeaseScheduleLineModel
 """
 
 from datetime import date
@@ -20,6 +21,7 @@ from finance_modules.lease.orm import (
     LeaseModel,
     LeaseModificationModel,
     LeasePaymentModel,
+    LeaseScheduleLineModel,
     ROUAssetModel,
 )
 from tests.modules.conftest import TEST_LESSEE_ID
@@ -550,3 +552,42 @@ class TestLeaseModificationModelORM:
         queried = session.get(LeaseModificationModel, mod.id)
         assert queried.lease is not None
         assert queried.lease.id == lease.id
+
+
+# ==========================================================================
+# LeaseScheduleLineModel
+# ==========================================================================
+
+
+class TestLeaseScheduleLineModelORM:
+    """Round-trip persistence tests for LeaseScheduleLineModel."""
+
+    def test_dto_round_trip(self, session, test_actor_id, test_lessee_party):
+        from finance_modules.lease.models import AmortizationScheduleLine
+
+        lease = _make_lease(session, test_actor_id, test_lessee_party)
+        line = AmortizationScheduleLine(
+            period=1, payment_date=date(2024, 1, 31), payment=Decimal("5000.00"),
+            interest=Decimal("208.33"), principal=Decimal("4791.67"),
+            balance=Decimal("245208.33"),
+        )
+        orm = LeaseScheduleLineModel.from_dto(line, lease.id, 1, created_by_id=test_actor_id)
+        session.add(orm)
+        session.flush()
+
+        queried = session.get(LeaseScheduleLineModel, orm.id)
+        assert queried.schedule_version == 1
+        assert queried.to_dto() == line
+
+    def test_unique_version_period(self, session, test_actor_id, test_lessee_party):
+        lease = _make_lease(session, test_actor_id, test_lessee_party)
+        for _ in range(2):
+            session.add(LeaseScheduleLineModel(
+                lease_id=lease.id, schedule_version=1, period=1,
+                payment_date=date(2024, 1, 31), payment=Decimal("1"),
+                interest=Decimal("0"), principal=Decimal("1"), balance=Decimal("0"),
+                created_by_id=test_actor_id,
+            ))
+        with pytest.raises(IntegrityError):
+            session.flush()
+        session.rollback()
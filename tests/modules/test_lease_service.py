@@ -11,6 +11,7 @@ Validates:
 - modify_lease: remeasurement (posts)
 - terminate_early: derecognition (posts)
 - get_lease_portfolio, get_disclosure_data: queries
+- stored schedule versions and get_portfolio_disclosures
 - calculations: pure functions
 """
 
@@ -24,6 +25,8 @@ import pytest
 
 from finance_kernel.services.module_posting_service import ModulePostingStatus
 from finance_modules.lease.calculations import (
+    amortization_schedule_lines,
+    annuity_factor,
     build_amortization_schedule,
     calculate_rou_adjustment,
     classify_lease_type,
@@ -37,8 +40,10 @@ from finance_modules.lease.models import (
     LeaseLiability,
     LeaseModification,
     LeasePayment,
+    LeaseStatus,
     ROUAsset,
 )
+from finance_modules.lease.orm import LeaseModel
 from finance_modules.lease.service import LeaseAccountingService
 from tests.modules.conftest import TEST_LEASE_ID, TEST_LESSEE_ID
 
@@ -139,6 +144,37 @@ class TestLeaseCalculations:
         )
         assert pv == Decimal("12000")
 
+    def test_annuity_factor_closed_form(self):
+        """Closed form matches the iterated discount factor."""
+        rate = Decimal("0.005")
+        iterated = Decimal("1")
+        for _ in range(360):
+            iterated /= Decimal("1") + rate
+        expected = (Decimal("1") - iterated) / rate
+        assert abs(annuity_factor(rate, 360) - expected) < Decimal("1e-20")
+        assert annuity_factor(Decimal("0"), 12) == Decimal("12")
+        assert present_value(Decimal("1000"), rate, 360) == Decimal("166791.61")
+
+    def test_schedule_memoised_per_terms(self):
+        """Same terms return the same immutable schedule."""
+        args = (Decimal("10000"), Decimal("0.005"), Decimal("860"), 12, date(2024, 1, 1))
+        assert amortization_schedule_lines(*args) is amortization_schedule_lines(*args)
+        assert build_amortization_schedule(*args)[-1]["balance"] == Decimal("0")
+
+    def test_schedule_cache_keeps_caller_scale(self):
+        """Equal terms of a different Decimal scale get their own schedule."""
+        start = date(2024, 1, 1)
+        coarse = amortization_schedule_lines(
+            Decimal("10000"), Decimal("0.005"), Decimal("860"), 12, start,
+        )
+        fine = amortization_schedule_lines(
+            Decimal("10000.00"), Decimal("0.0050"), Decimal("860.00"), 12, start,
+        )
+        assert coarse is not fine
+        assert str(coarse[0].payment) == "860"
+        assert str(fine[0].payment) == "860.00"
+        assert [line.balance for line in coarse] == [line.balance for line in fine]
+
     def test_build_amortization_schedule(self):
         """Build schedule with correct number of periods."""
         schedule = build_amortization_schedule(
@@ -411,6 +447,108 @@ class TestAmortizationSchedule:
         assert schedule[-1].balance == Decimal("0")
 
 
+class TestStoredSchedules:
+    """Versioned schedule storage and portfolio disclosures."""
+
+    def test_initial_recognition_stores_schedule(
+        self, lease_service, current_period, test_actor_id, test_lessee_party,
+    ):
+        lease_id = uuid4()
+        _, liability, result = lease_service.record_initial_recognition(
+            lease_id=lease_id,
+            classification=LeaseClassification.FINANCE,
+            monthly_payment=Decimal("2000.00"),
+            discount_rate=Decimal("0.06"),
+            lease_term_months=24,
+            commencement_date=date(2024, 1, 1),
+            actor_id=test_actor_id,
+            lessee_id=TEST_LESSEE_ID,
+        )
+        assert result.is_success
+
+        stored = lease_service.get_amortization_schedule(lease_id)
+        assert len(stored) == 24
+        assert stored == lease_service.generate_amortization_schedule(
+            liability.initial_value, Decimal("2000.00"), Decimal("0.06"), 24, date(2024, 1, 1),
+        )
+
+    def test_modification_stores_next_version(
+        self, lease_service, current_period, test_actor_id, test_lessee_party,
+    ):
+        lease_id = uuid4()
+        lease_service.record_initial_recognition(
+            lease_id=lease_id, classification=LeaseClassification.OPERATING,
+            monthly_payment=Decimal("1000.00"), discount_rate=Decimal("0.05"),
+            lease_term_months=12, commencement_date=date(2024, 1, 1),
+            actor_id=test_actor_id, lessee_id=TEST_LESSEE_ID,
+        )
+        _, result = lease_service.modify_lease(
+            lease_id=lease_id, modification_date=date(2024, 1, 1),
+            remeasurement_amount=Decimal("5000.00"), actor_id=test_actor_id,
+            new_monthly_payment=Decimal("1200.00"), new_discount_rate=Decimal("0.05"),
+            remaining_periods=18,
+        )
+        assert result.is_success
+        assert len(lease_service.get_amortization_schedule(lease_id, 1)) == 12
+        current = lease_service.get_amortization_schedule(lease_id)
+        assert len(current) == 18
+        assert current[0].payment == Decimal("1200.00")
+
+    def test_modification_rate_drives_disclosures(
+        self, lease_service, session, current_period, test_actor_id, test_lessee_party,
+    ):
+        lease_id = uuid4()
+        lease_service.record_initial_recognition(
+            lease_id=lease_id, classification=LeaseClassification.FINANCE,
+            monthly_payment=Decimal("1000.00"), discount_rate=Decimal("0.05"),
+            lease_term_months=12, commencement_date=date(2024, 1, 1),
+            actor_id=test_actor_id, lessee_id=TEST_LESSEE_ID,
+        )
+        _, result = lease_service.modify_lease(
+            lease_id=lease_id, modification_date=date(2024, 1, 1),
+            remeasurement_amount=Decimal("5000.00"), actor_id=test_actor_id,
+            new_monthly_payment=Decimal("1200.00"), new_discount_rate=Decimal("0.08"),
+            remaining_periods=18,
+        )
+        assert result.is_success
+
+        lease = session.get(LeaseModel, lease_id)
+        assert lease.status == LeaseStatus.MODIFIED.value
+        assert lease.discount_rate == Decimal("0.08")
+        (finance,) = lease_service.get_portfolio_disclosures(date(2024, 1, 1))
+        assert finance.lease_count == 1
+        assert finance.weighted_average_discount_rate == Decimal("0.0800")
+        assert finance.total_undiscounted == Decimal("1200.00") * 18
+
+    def test_portfolio_disclosures(
+        self, lease_service, current_period, test_actor_id, test_lessee_party,
+    ):
+        for payment, rate, term in (
+            (Decimal("1000.00"), Decimal("0.06"), 24),
+            (Decimal("3000.00"), Decimal("0.04"), 84),
+        ):
+            lease_service.record_initial_recognition(
+                lease_id=uuid4(), classification=LeaseClassification.FINANCE,
+                monthly_payment=payment, discount_rate=rate, lease_term_months=term,
+                commencement_date=date(2024, 1, 1), actor_id=test_actor_id,
+                lessee_id=TEST_LESSEE_ID,
+            )
+
+        (finance,) = lease_service.get_portfolio_disclosures(date(2024, 1, 1))
+        maturity = dict(finance.maturity)
+
+        assert finance.classification == "finance"
+        assert finance.lease_count == 2
+        assert finance.total_undiscounted == Decimal("1000.00") * 24 + Decimal("3000.00") * 84
+        assert sum(maturity.values()) == finance.total_undiscounted
+        assert maturity["thereafter"] > Decimal("0")
+        assert finance.lease_liability + finance.imputed_interest == finance.total_undiscounted
+        assert Decimal("0.04") < finance.weighted_average_discount_rate < Decimal("0.045")
+        assert Decimal("24") < finance.weighted_average_remaining_term_months < Decimal("84")
+
+        assert lease_service.get_lease_portfolio()["finance_leases"] == 2
+
+
 # =============================================================================
 # Query Tests
 # =============================================================================
@@ -10,6 +10,8 @@ Validates:
 from __future__ import annotations
 
 import inspect
+import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from decimal import Decimal
 from uuid import uuid4
@@ -20,12 +22,14 @@ from finance_kernel.services.module_posting_service import ModulePostingStatus
 from finance_modules.payroll.helpers import (
     calculate_federal_withholding,
     calculate_fica,
+    calculate_pay_run,
     calculate_state_withholding,
     generate_nacha_batch,
 )
 from finance_modules.payroll.models import (
     BenefitsDeduction,
     EmployerContribution,
+    PayRunInput,
     WithholdingResult,
 )
 from finance_modules.payroll.service import PayrollService
@@ -147,6 +151,47 @@ class TestPayrollServiceIntegration:
         assert result.status == ModulePostingStatus.POSTED
         assert result.is_success
 
+    def test_allocate_labor_costs_consolidated(
+        self, payroll_service, session, current_period, test_actor_id,
+        deterministic_clock, test_employee_party, test_pay_period,
+    ):
+        """Consolidated allocation posts one entry with dimension-tagged lines."""
+        from sqlalchemy import select
+
+        from finance_kernel.models.journal import JournalLine
+
+        result = payroll_service.allocate_labor_costs(
+            run_id=uuid4(),
+            allocations=[
+                {"target_id": "CC-ENG", "amount": "3000.00", "labor_type": "DIRECT",
+                 "project": "P-100"},
+                {"target_id": "CC-OPS", "amount": "1500.00", "labor_type": "DIRECT"},
+                {"target_id": "CC-ADMIN", "amount": "2000.00", "labor_type": "INDIRECT"},
+                {"target_id": "CC-FAC", "amount": "500.00", "labor_type": "OVERHEAD"},
+            ],
+            effective_date=deterministic_clock.now().date(),
+            actor_id=test_actor_id,
+            consolidated=True,
+        )
+
+        assert result.status == ModulePostingStatus.POSTED
+        assert len(result.journal_entry_ids) == 1
+
+        lines = session.execute(
+            select(JournalLine).where(
+                JournalLine.journal_entry_id == result.journal_entry_ids[0]
+            )
+        ).scalars().all()
+        assert len(lines) == 8
+        assert sum(l.amount for l in lines if l.side == "debit") == Decimal("7000.00")
+        assert {l.dimensions["target_id"] for l in lines} == {
+            "CC-ENG", "CC-OPS", "CC-ADMIN", "CC-FAC",
+        }
+        assert {
+            l.dimensions.get("project") for l in lines
+            if l.dimensions["target_id"] == "CC-ENG"
+        } == {"P-100"}
+
     def test_run_dcaa_cascade(self, payroll_service, deterministic_clock, test_actor_id):
         """DCAA cascade computes indirect cost allocations (pure engine)."""
         step_results, final_balances = payroll_service.run_dcaa_cascade(
@@ -433,6 +478,87 @@ class TestGrossToNet:
         )
 
 
+def _pay_run(n: int) -> PayRunInput:
+    """Mixed pay run: both filing statuses, allowances, FICA cap crossings."""
+    return PayRunInput(
+        employee_ids=tuple(uuid4() for _ in range(n)),
+        earnings_codes=("REGULAR", "OVERTIME", "BONUS"),
+        earnings=tuple(
+            (
+                Decimal(1200 + 137 * i) + Decimal("0.33"),
+                Decimal(45 * (i % 4)) + Decimal("0.5"),
+                Decimal(9000) if i % 7 == 0 else Decimal("0"),
+            )
+            for i in range(n)
+        ),
+        filing_statuses=tuple("married" if i % 3 == 0 else "single" for i in range(n)),
+        allowances=tuple(i % 4 for i in range(n)),
+        state_rates=tuple(Decimal("0.0" + str(3 + i % 5)) for i in range(n)),
+        ytd_earnings=tuple(Decimal(25_000 * (i % 10)) for i in range(n)),
+    )
+
+
+class TestPayRun:
+    """Tests for calculate_pay_run (batch gross-to-net)."""
+
+    def test_matches_single_employee_helpers(self):
+        pay_run = _pay_run(60)
+        result = calculate_pay_run(pay_run)
+        for i, row in enumerate(pay_run.earnings):
+            gross = sum(row, Decimal("0"))
+            federal = calculate_federal_withholding(
+                gross, pay_run.filing_statuses[i], pay_run.allowances[i],
+            )
+            state = calculate_state_withholding(gross, pay_run.state_rates[i])
+            ss, medicare = calculate_fica(gross, pay_run.ytd_earnings[i])
+            assert result.gross_pay[i] == gross
+            assert result.federal_withholding[i] == federal
+            assert result.state_withholding[i] == state
+            assert result.social_security[i] == ss
+            assert result.medicare[i] == medicare
+            assert result.total_deductions[i] == federal + state + ss + medicare
+            assert result.net_pay[i] == gross - result.total_deductions[i]
+
+    def test_run_totals(self):
+        result = calculate_pay_run(_pay_run(25))
+        assert result.employee_count == 25
+        assert result.total_gross == sum(result.gross_pay)
+        assert result.total_withheld == sum(result.total_deductions)
+        assert result.total_net == sum(result.net_pay)
+        assert result.total_gross == result.total_withheld + result.total_net
+
+    def test_executor_matches_sequential(self, monkeypatch):
+        monkeypatch.setattr("finance_modules.payroll.helpers._PAY_RUN_CHUNK", 7)
+        pay_run = _pay_run(50)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = calculate_pay_run(pay_run, executor=pool)
+        assert parallel == calculate_pay_run(pay_run)
+
+    def test_misaligned_columns_rejected(self):
+        with pytest.raises(ValueError, match="allowances"):
+            PayRunInput(
+                employee_ids=(uuid4(), uuid4()),
+                earnings_codes=("REGULAR",),
+                earnings=((Decimal("1000"),), (Decimal("2000"),)),
+                filing_statuses=("single", "single"),
+                allowances=(0,),
+                state_rates=(Decimal("0.05"), Decimal("0.05")),
+                ytd_earnings=(Decimal("0"), Decimal("0")),
+            )
+
+    def test_service_pay_run(self, payroll_service):
+        result = payroll_service.calculate_pay_run(_pay_run(3))
+        single = payroll_service.calculate_gross_to_net(
+            employee_id=result.employee_ids[0],
+            gross_pay=result.gross_pay[0],
+            filing_status="married",
+            allowances=0,
+            state_rate=Decimal("0.03"),
+            ytd_earnings=Decimal("0"),
+        )
+        assert result.net_pay[0] == single.net_pay
+
+
 # =============================================================================
 # Integration Tests — Benefits Deduction
 # =============================================================================
@@ -479,6 +605,27 @@ class TestNACHAGeneration:
         assert "Jane Smith" in content
         assert "PAYROLL_BATCH_HEADER" in content
 
+    def test_write_nacha_file_streams_to_sink(self, payroll_service):
+        payments = (
+            {"name": f"Employee {i}", "account": f"{i:05d}", "routing": "021000021",
+             "amount": "2500.00"}
+            for i in range(3)
+        )
+        sink = io.StringIO()
+        totals = payroll_service.write_nacha_file(
+            payments=payments,
+            sink=sink,
+            company_name="Acme Corp",
+            company_id="123456",
+            effective_date="2024-01-15",
+            immediate_destination="091000019",
+        )
+        records = sink.getvalue().splitlines()
+        assert totals.entry_count == 3
+        assert totals.total_credit == Decimal("7500.00")
+        assert all(len(r) == 94 for r in records)
+        assert records[1][50:53] == "PPD"
+
 
 # =============================================================================
 # Integration Tests — Employer Contribution
@@ -503,3 +650,96 @@ class TestEmployerContribution:
         assert result.status == ModulePostingStatus.POSTED
         assert isinstance(contribution, EmployerContribution)
         assert contribution.amount == Decimal("250.00")
+
+
+# =============================================================================
+# Integration Tests — Pay Period Concurrent Work (D4)
+# =============================================================================
+
+
+class TestPayPeriodConcurrentWork:
+    """Tests for check_pay_period_concurrent_work."""
+
+    @pytest.fixture
+    def add_timesheet(self, session, test_actor_id):
+        """Persist one submission of (charge_code, start, end, hours) entries."""
+        from finance_modules.payroll.dcaa_orm import (
+            TimesheetEntryModel,
+            TimesheetSubmissionModel,
+        )
+        from finance_modules.payroll.orm import EmployeeModel
+
+        def add(pay_period_id, entries, status="submitted"):
+            employee = EmployeeModel(
+                id=uuid4(),
+                employee_number=f"EMP-D4-{uuid4().hex[:8]}",
+                first_name="Floor",
+                last_name="Check",
+                hire_date=date(2023, 1, 1),
+                pay_type="hourly",
+                base_pay=Decimal("50.00"),
+                pay_frequency="biweekly",
+                created_by_id=test_actor_id,
+            )
+            session.add(employee)
+            session.flush()
+            submission = TimesheetSubmissionModel(
+                id=uuid4(),
+                employee_id=employee.id,
+                pay_period_id=pay_period_id,
+                work_week_start=date(2024, 1, 1),
+                work_week_end=date(2024, 1, 7),
+                total_hours=sum((e[3] for e in entries), Decimal("0")),
+                status=status,
+                created_by_id=test_actor_id,
+            )
+            session.add(submission)
+            session.flush()
+            session.add_all(
+                TimesheetEntryModel(
+                    id=uuid4(),
+                    submission_id=submission.id,
+                    work_date=date(2024, 1, 2),
+                    charge_code=code,
+                    hours=hours,
+                    start_time=start,
+                    end_time=end,
+                    created_by_id=test_actor_id,
+                )
+                for code, start, end, hours in entries
+            )
+            session.flush()
+            session.expire(submission)
+            return employee.id
+
+        return add
+
+    def test_overlapping_touching_and_zero_length(self, payroll_service, add_timesheet):
+        from datetime import time
+
+        pay_period_id = uuid4()
+        overlapping = add_timesheet(pay_period_id, [
+            ("FA-001", time(8, 0), time(12, 0), Decimal("4")),
+            ("FA-002", time(11, 0), time(15, 0), Decimal("4")),
+        ])
+        touching = add_timesheet(pay_period_id, [
+            ("FA-001", time(8, 0), time(12, 0), Decimal("4")),
+            ("FA-002", time(12, 0), time(16, 0), Decimal("4")),
+        ])
+        zero_length = add_timesheet(pay_period_id, [
+            ("FA-001", time(8, 0), time(12, 0), Decimal("4")),
+            ("FA-002", time(8, 0), time(8, 0), Decimal("0")),
+        ])
+        add_timesheet(pay_period_id, [
+            ("FA-001", time(8, 0), time(12, 0), Decimal("4")),
+            ("FA-002", time(9, 0), time(10, 0), Decimal("1")),
+        ], status="rejected")
+
+        checks = payroll_service.check_pay_period_concurrent_work(pay_period_id)
+
+        assert set(checks) == {overlapping, touching, zero_length}
+        assert not checks[overlapping].is_valid
+        assert len(checks[overlapping].overlapping_entries) == 1
+        # [start, end) intervals: end == next start is not an overlap.
+        assert checks[touching].is_valid
+        assert checks[zero_length].is_valid
@@ -0,0 +1,223 @@
+"""
+Period-close balance snapshot tests (PC1).
+
+Verifies:
+- Locking a period writes one sealed closing-balance row per
+  (account, currency, dimension set), linked to the R24 canonical hash.
+- trial_balance / account_balance / total_debits_credits start from the
+  latest snapshot and aggregate only the tail, matching a direct SUM --
+  including lines backdated into an open earlier period after the lock.
+- Snapshot rows are immutable and tampering is detected by
+  verify_close_snapshot.
+- period_watermarks reports the seq of each period's latest posted entry.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select, text
+
+from finance_kernel.domain.accounting_intent import IntentLine
+from finance_kernel.exceptions import ImmutabilityViolationError
+from finance_kernel.models.period_close_balance import (
+    PeriodCloseBalanceModel,
+    PeriodCloseSnapshotModel,
+)
+from finance_kernel.services.period_service import PeriodService
+
+PERIODS = (
+    ("2025-01", date(2025, 1, 1), date(2025, 1, 31)),
+    ("2025-02", date(2025, 2, 1), date(2025, 2, 28)),
+    ("2025-03", date(2025, 3, 1), date(2025, 3, 31)),
+)
+
+
+@pytest.fixture
+def periods(create_period):
+    return {code: create_period(code, code, start, end) for code, start, end in PERIODS}
+
+
+@pytest.fixture
+def lock(session, deterministic_clock, test_actor_id, periods):
+    def _lock(period_code):
+        service = PeriodService(session, deterministic_clock)
+        service.close_period(period_code, test_actor_id)
+        service.lock_period(period_code, test_actor_id)
+        session.flush()
+    return _lock
+
+
+@pytest.fixture
+def post(post_via_coordinator, periods):
+    def _post(eff, amount="100.00", debit_role="CashAsset", dimensions=None):
+        extra_lines = ()
+        if dimensions is not None:
+            extra_lines = (
+                IntentLine.debit("CashAsset", Decimal("10.00"), "USD",
+                                 dimensions=dimensions),
+                IntentLine.credit("SalesRevenue", Decimal("10.00"), "USD",
+                                  dimensions=dimensions),
+            )
+        result = post_via_coordinator(
+            debit_role=debit_role, amount=Decimal(amount), effective_date=eff,
+            extra_lines=extra_lines,
+        )
+        assert result.success
+        return result
+    return _post
+
+
+def _tb(ledger_selector, as_of):
+    return {
+        (row.account_code, row.currency): (row.debit_total, row.credit_total)
+        for row in ledger_selector.trial_balance(as_of)
+    }
+
+
+class TestSnapshotWrite:
+
+    def test_lock_seals_closing_balances(self, session, ledger_selector, lock, post):
+        post(date(2025, 1, 10), dimensions={"project": "P1", "region": "EU"})
+        post(date(2025, 1, 20), dimensions={"region": "EU", "project": "P1"})
+        post(date(2025, 1, 25), debit_role="AccountsReceivable")
+        expected_hash = ledger_selector.canonical_hash(date(2025, 1, 31))
+
+        lock("2025-01")
+
+        snapshot = ledger_selector.close_snapshot("2025-01")
+        assert snapshot.end_date == date(2025, 1, 31)
+        assert snapshot.ledger_hash == expected_hash
+        assert ledger_selector.verify_close_snapshot("2025-01")
+
+        rows = session.execute(
+            select(PeriodCloseBalanceModel).where(
+                PeriodCloseBalanceModel.snapshot_id == snapshot.snapshot_id,
+            )
+        ).scalars().all()
+        assert len(rows) == snapshot.cell_count
+        dimensioned = [r for r in rows if r.dimensions_key]
+        # Both postings share one dimension set despite the key order.
+        assert {r.dimensions_key for r in dimensioned} == {
+            '{"project":"P1","region":"EU"}',
+        }
+        assert sum(r.line_count for r in dimensioned) == 4
+
+    def test_unlocked_close_writes_no_snapshot(self, ledger_selector, session,
+                                               deterministic_clock, test_actor_id,
+                                               periods):
+        PeriodService(session, deterministic_clock).close_period(
+            "2025-01", test_actor_id,
+        )
+        assert ledger_selector.close_snapshot("2025-01") is None
+
+
+class TestSnapshotReads:
+
+    def test_balances_match_direct_aggregation(self, ledger_selector, lock, post,
+                                               standard_accounts):
+        post(date(2025, 1, 10))
+        post(date(2025, 1, 15), amount="40.00", debit_role="AccountsReceivable")
+        post(date(2025, 2, 5), amount="25.00")
+        as_of_dates = (date(2025, 1, 31), date(2025, 2, 10), None)
+        before = {d: _tb(ledger_selector, d) for d in as_of_dates}
+        cash_before = ledger_selector.account_balance(standard_accounts["cash"].id)
+        totals_before = ledger_selector.total_debits_credits(date(2025, 2, 10))
+
+        lock("2025-01")
+
+        assert {d: _tb(ledger_selector, d) for d in as_of_dates} == before
+        cash = ledger_selector.account_balance(standard_accounts["cash"].id)
+        assert [(b.debit_total, b.line_count) for b in cash] == [
+            (b.debit_total, b.line_count) for b in cash_before
+        ]
+        assert ledger_selector.total_debits_credits(date(2025, 2, 10)) == totals_before
+
+    def test_tail_after_lock_is_added(self, ledger_selector, lock, post,
+                                      standard_accounts):
+        post(date(2025, 1, 10))
+        lock("2025-01")
+        post(date(2025, 2, 10), amount="7.00")
+
+        cash = ledger_selector.account_balance(
+            standard_accounts["cash"].id, as_of_date=date(2025, 2, 28),
+        )
+        assert cash[0].debit_total == Decimal("107.00")
+        assert cash[0].line_count == 2
+
+    def test_backdated_posting_after_lock_counted(self, ledger_selector, lock, post,
+                                                  standard_accounts):
+        post(date(2025, 2, 10))
+        lock("2025-02")
+        # 2025-01 is still open: a later posting there predates the snapshot
+        # end but has a seq above its watermark.
+        post(date(2025, 1, 10), amount="5.00")
+
+        cash = ledger_selector.account_balance(
+            standard_accounts["cash"].id, as_of_date=date(2025, 2, 28),
+        )
+        assert cash[0].debit_total == Decimal("105.00")
+        assert ledger_selector.verify_close_snapshot("2025-02")
+
+    def test_earlier_as_of_ignores_snapshot(self, ledger_selector, lock, post):
+        post(date(2025, 1, 10))
+        post(date(2025, 2, 10))
+        lock("2025-01")
+        lock("2025-02")
+
+        january = _tb(ledger_selector, date(2025, 1, 31))
+        assert january[("1000", "USD")] == (Decimal("100.00"), Decimal("0"))
+
+
+class TestSnapshotIntegrity:
+
+    def test_snapshot_rows_immutable(self, session, ledger_selector, lock, post):
+        post(date(2025, 1, 10))
+        lock("2025-01")
+        row = session.execute(select(PeriodCloseBalanceModel)).scalars().first()
+
+        row.debit_total = Decimal("1.00")
+        with pytest.raises(ImmutabilityViolationError):
+            session.flush()
+
+    def test_snapshot_header_cannot_be_deleted(self, session, lock, post):
+        post(date(2025, 1, 10))
+        lock("2025-01")
+        snapshot = session.execute(select(PeriodCloseSnapshotModel)).scalar_one()
+
+        session.delete(snapshot)
+        with pytest.raises(ImmutabilityViolationError):
+            session.flush()
+
+    def test_tampering_detected(self, session, ledger_selector, lock, post):
+        post(date(2025, 1, 10))
+        lock("2025-01")
+
+        session.execute(text(
+            "UPDATE period_close_balances SET debit_total = debit_total + 1"
+        ))
+        assert not ledger_selector.verify_close_snapshot("2025-01")
+
+    def test_verify_requires_snapshot(self, ledger_selector, periods):
+        with pytest.raises(ValueError, match="no close snapshot"):
+            ledger_selector.verify_close_snapshot("2025-01")
+
+
+class TestPeriodWatermarks:
+
+    def test_watermark_is_latest_posted_seq(self, ledger_selector, post):
+        post(date(2025, 1, 10))
+        jan_seq = ledger_selector.posted_seq_watermark()
+        post(date(2025, 2, 10))
+        feb_seq = ledger_selector.posted_seq_watermark()
+
+        codes = ["2025-01", "2025-02", "2025-03"]
+        assert ledger_selector.period_watermarks(codes) == {
+            "2025-01": jan_seq, "2025-02": feb_seq,
+        }
+
+        post(date(2025, 1, 20))
+        marks = ledger_selector.period_watermarks(codes)
+        assert marks["2025-01"] == ledger_selector.posted_seq_watermark() > feb_seq
+        assert marks["2025-02"] == feb_seq
+        assert ledger_selector.period_watermarks([]) == {}
@@ -0,0 +1,135 @@
+"""
+Database-side open-item aging tests.
+
+Verifies:
+- SubledgerSelector.aging_totals classifies open items into buckets in SQL,
+  excludes reconciled, future-dated and other-currency items, and signs
+  amounts by the subledger's normal balance side.
+- iter_aging_detail_chunks streams the same classification in pages.
+- ARService.calculate_subledger_aging assembles a report from the totals,
+  with per-item detail only when requested.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from finance_engines.aging import STANDARD_BUCKETS
+from finance_kernel.domain.subledger_control import SubledgerType
+from finance_kernel.domain.values import Money
+from finance_kernel.models.subledger import SubledgerEntryModel
+from finance_kernel.selectors.subledger_selector import SubledgerSelector
+from finance_modules.ar.service import ARService
+
+AS_OF = date(2025, 3, 31)
+BOUNDS = [(b.name, b.min_days, b.max_days) for b in STANDARD_BUCKETS]
+
+
+@pytest.fixture
+def open_items(session, post_via_coordinator, current_period, test_actor_id):
+    """Seed AR and AP subledger items against one posted journal entry."""
+    posted = post_via_coordinator(debit_role="AccountsReceivable", credit_role="SalesRevenue")
+    journal_entry_id = posted.journal_result.entries[0].entry_id
+    rows = [
+        ("AR", "C1", date(2025, 3, 31), Decimal("1000.00"), None, None, "open", "USD"),
+        ("AR", "C1", date(2025, 3, 10), Decimal("600.00"), None, Decimal("200.00"), "partial", "USD"),
+        ("AR", "C2", date(2024, 12, 1), Decimal("500.00"), None, None, "open", "USD"),
+        ("AR", "C2", date(2025, 2, 15), None, Decimal("80.00"), None, "open", "USD"),
+        ("AR", "C3", date(2025, 1, 15), Decimal("300.00"), None, Decimal("300.00"), "reconciled", "USD"),
+        ("AR", "C3", date(2025, 4, 5), Decimal("50.00"), None, None, "open", "USD"),
+        ("AR", "C1", date(2025, 3, 1), Decimal("999.00"), None, None, "open", "EUR"),
+        ("AP", "V1", date(2025, 3, 1), None, Decimal("700.00"), None, "open", "USD"),
+    ]
+    for i, (sl_type, entity, eff, debit, credit, reconciled, status, ccy) in enumerate(rows):
+        session.add(SubledgerEntryModel(
+            subledger_type=sl_type, entity_id=entity, journal_entry_id=journal_entry_id,
+            source_document_type="INVOICE", source_document_id=f"DOC-{i}",
+            source_line_id=str(i), debit_amount=debit, credit_amount=credit,
+            currency=ccy, effective_date=eff, reconciliation_status=status,
+            reconciled_amount=reconciled, created_by_id=test_actor_id,
+        ))
+    session.flush()
+
+
+class TestAgingTotals:
+
+    def test_buckets_computed_in_sql(self, session, open_items):
+        totals = SubledgerSelector(session).aging_totals(
+            SubledgerType.AR, AS_OF, BOUNDS, currency="USD",
+        )
+        got = {(t.entity_id, t.bucket): (t.amount, t.overdue_amount, t.item_count) for t in totals}
+        assert got == {
+            ("C1", "Current"): (Decimal("1000.00"), Decimal("0"), 1),
+            ("C1", "1-30"): (Decimal("400.00"), Decimal("400.00"), 1),
+            ("C2", "31-60"): (Decimal("-80.00"), Decimal("-80.00"), 1),
+            ("C2", "Over 90"): (Decimal("500.00"), Decimal("500.00"), 1),
+        }
+
+    def test_payment_terms_shift_due_date(self, session, open_items):
+        totals = SubledgerSelector(session).aging_totals(
+            SubledgerType.AR, AS_OF, BOUNDS, currency="USD", payment_terms_days=30,
+        )
+        buckets = {(t.entity_id, t.bucket) for t in totals}
+        assert buckets == {("C1", "Current"), ("C2", "1-30"), ("C2", "61-90")}
+
+    def test_credit_normal_subledger_positive(self, session, open_items):
+        totals = SubledgerSelector(session).aging_totals(
+            SubledgerType.AP, AS_OF, BOUNDS, currency="USD",
+        )
+        assert [(t.entity_id, t.bucket, t.amount) for t in totals] == [
+            ("V1", "1-30", Decimal("700.00")),
+        ]
+
+    def test_gap_in_buckets_rejected(self, session, open_items):
+        with pytest.raises(ValueError, match="do not fit any aging bucket"):
+            SubledgerSelector(session).aging_totals(
+                SubledgerType.AR, AS_OF, [("Current", 0, 30)], currency="USD",
+            )
+
+    def test_detail_chunks(self, session, open_items):
+        chunks = list(SubledgerSelector(session).iter_aging_detail_chunks(
+            SubledgerType.AR, AS_OF, BOUNDS, currency="USD", chunk_size=3,
+        ))
+        assert [len(c) for c in chunks] == [3, 1]
+        by_doc = {d.source_document_id: d for c in chunks for d in c}
+        assert by_doc["DOC-1"].age_days == 21
+        assert by_doc["DOC-1"].open_amount == Decimal("400.00")
+        assert by_doc["DOC-2"].bucket == "Over 90"
+
+
+class TestARSubledgerAging:
+
+    @pytest.fixture
+    def ar_service(self, session, role_resolver, deterministic_clock, workflow_executor):
+        return ARService(
+            session=session,
+            role_resolver=role_resolver,
+            workflow_executor=workflow_executor,
+            clock=deterministic_clock,
+        )
+
+    def test_report_from_totals(self, ar_service, open_items):
+        report = ar_service.calculate_subledger_aging(AS_OF, currency="USD")
+
+        assert report.report_type == "AR"
+        assert report.items == ()
+        assert report.item_count == 4
+        assert report.total_amount() == Money.of("1820.00", "USD")
+        assert report.overdue_amount() == Money.of("820.00", "USD")
+        assert report.total_by_bucket()["Over 90"] == Money.of("500.00", "USD")
+        assert report.total_by_counterparty()["C2"]["31-60"] == Money.of("-80.00", "USD")
+
+    def test_include_items(self, ar_service, open_items):
+        report = ar_service.calculate_subledger_aging(AS_OF, currency="USD", include_items=True)
+
+        assert len(report.items) == 4
+        assert {i.bucket.name for i in report.items_for_counterparty("C1")} == {"Current", "1-30"}
+        assert report.total_amount() == Money.of("1820.00", "USD")
+
+    def test_no_open_items(self, ar_service, open_items):
+        report = ar_service.calculate_subledger_aging(AS_OF, currency="GBP")
+
+        assert report.item_count == 0
+        assert report.total_amount() == Money.zero("GBP")
+        assert report.total_by_bucket() == {}
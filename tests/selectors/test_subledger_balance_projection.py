@@ -0,0 +1,224 @@
+"""
+Subledger entity balance projection tests (SL-P1).
+
+Verifies:
+- The before_flush listener maintains subledger_entity_balances for entry
+  inserts and reconciliation status changes.
+- get_balance / get_aggregate_balance read the projection and subtract
+  entries dated after as_of_date, matching a direct SUM.
+- SubledgerPeriodService.verify_balance_projection detects writes that
+  bypass the ORM and repairs the drifted rows.
+- backfill_subledger_entity_balances (run by create_tables) folds entries
+  that predate the projection into it.
+"""
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+
+from finance_kernel.db.subledger_projection import backfill_subledger_entity_balances
+from finance_kernel.domain.subledger_control import SubledgerControlRegistry, SubledgerType
+from finance_kernel.domain.values import Money
+from finance_kernel.models.subledger import (
+    SubledgerEntityBalanceModel,
+    SubledgerEntryModel,
+)
+from finance_kernel.selectors.subledger_selector import SubledgerSelector
+from finance_services.subledger_period_service import SubledgerPeriodService
+
+
+@pytest.fixture
+def journal_entry_id(post_via_coordinator):
+    posted = post_via_coordinator(debit_role="AccountsReceivable", credit_role="SalesRevenue")
+    return posted.journal_result.entries[0].entry_id
+
+
+@pytest.fixture
+def add_entry(session, journal_entry_id, test_actor_id):
+    def _add(entity, eff, debit=None, credit=None, status="open", sl_type="AR", ccy="USD"):
+        entry = SubledgerEntryModel(
+            subledger_type=sl_type, entity_id=entity, journal_entry_id=journal_entry_id,
+            source_document_type="INVOICE", source_document_id=str(uuid4()),
+            source_line_id=str(uuid4()), debit_amount=debit, credit_amount=credit,
+            currency=ccy, effective_date=eff, reconciliation_status=status,
+            created_by_id=test_actor_id,
+        )
+        session.add(entry)
+        session.flush()
+        return entry
+    return _add
+
+
+def _projection(session, entity, sl_type="AR", ccy="USD"):
+    return session.execute(
+        select(
+            SubledgerEntityBalanceModel.debit_total,
+            SubledgerEntityBalanceModel.credit_total,
+            SubledgerEntityBalanceModel.entry_count,
+            SubledgerEntityBalanceModel.open_item_count,
+            SubledgerEntityBalanceModel.last_effective_date,
+        ).where(
+            SubledgerEntityBalanceModel.subledger_type == sl_type,
+            SubledgerEntityBalanceModel.entity_id == entity,
+            SubledgerEntityBalanceModel.currency == ccy,
+        )
+    ).one_or_none()
+
+
+class TestProjectionMaintenance:
+
+    def test_inserts_accumulate(self, session, add_entry):
+        add_entry("C1", date(2025, 1, 10), debit=Decimal("100.00"))
+        add_entry("C1", date(2025, 2, 10), credit=Decimal("30.00"))
+
+        row = _projection(session, "C1")
+        assert (row.debit_total, row.credit_total) == (Decimal("100.00"), Decimal("30.00"))
+        assert (row.entry_count, row.open_item_count) == (2, 2)
+        assert row.last_effective_date == date(2025, 2, 10)
+
+    def test_reconciliation_moves_open_count(self, session, add_entry):
+        entry = add_entry("C1", date(2025, 1, 10), debit=Decimal("100.00"))
+        entry.reconciliation_status = "reconciled"
+        entry.reconciled_amount = Decimal("100.00")
+        session.flush()
+
+        row = _projection(session, "C1")
+        assert (row.entry_count, row.open_item_count) == (1, 0)
+        assert row.debit_total == Decimal("100.00")
+
+    def test_rolled_back_flush_leaves_no_projection(self, session, add_entry):
+        nested = session.begin_nested()
+        add_entry("C9", date(2025, 1, 10), debit=Decimal("5.00"))
+        nested.rollback()
+
+        assert _projection(session, "C9") is None
+
+
+class TestProjectedBalances:
+
+    def test_as_of_subtracts_future_tail(self, session, add_entry):
+        add_entry("C1", date(2025, 1, 10), debit=Decimal("100.00"))
+        add_entry("C1", date(2025, 2, 10), credit=Decimal("30.00"), status="reconciled")
+        add_entry("C1", date(2025, 3, 10), debit=Decimal("45.00"))
+        selector = SubledgerSelector(session)
+
+        feb = selector.get_balance("C1", SubledgerType.AR, date(2025, 2, 28), "USD")
+        assert (feb.debit_total, feb.credit_total, feb.balance) == (
+            Decimal("100.00"), Decimal("30.00"), Decimal("70.00"),
+        )
+        assert (feb.entry_count, feb.open_item_count) == (2, 1)
+
+        latest = selector.get_balance("C1", SubledgerType.AR, date(2025, 12, 31), "USD")
+        assert latest.balance == Decimal("115.00")
+        assert latest.entry_count == 3
+
+    def test_aggregate_matches_direct_sum(self, session, add_entry):
+        add_entry("C1", date(2025, 1, 10), debit=Decimal("100.00"))
+        add_entry("C2", date(2025, 3, 10), debit=Decimal("40.00"))
+        add_entry("V1", date(2025, 1, 5), credit=Decimal("70.00"), sl_type="AP")
+        selector = SubledgerSelector(session)
+
+        assert selector.get_aggregate_balance(
+            SubledgerType.AR, date(2025, 2, 1), "USD",
+        ) == Money.of("100.00", "USD")
+        assert selector.get_aggregate_balance(
+            SubledgerType.AR, date(2025, 3, 31), "USD",
+        ) == Money.of("140.00", "USD")
+        assert selector.get_aggregate_balance(
+            SubledgerType.AP, date(2025, 3, 31), "USD",
+        ) == Money.of("70.00", "USD")
+
+    def test_unknown_entity_is_zero(self, session):
+        dto = SubledgerSelector(session).get_balance(
+            "NOBODY", SubledgerType.AR, date(2025, 1, 1), "USD",
+        )
+        assert dto.is_zero
+        assert dto.entry_count == 0
+
+
+class TestVerifyBalanceProjection:
+
+    @pytest.fixture
+    def period_service(self, session, deterministic_clock, role_resolver):
+        return SubledgerPeriodService(
+            session=session,
+            clock=deterministic_clock,
+            registry=SubledgerControlRegistry(),
+            role_resolver=role_resolver,
+        )
+
+    def test_clean_projection_has_no_drift(self, add_entry, period_service):
+        add_entry("C1", date(2025, 1, 10), debit=Decimal("100.00"))
+        assert period_service.verify_balance_projection() == []
+
+    def test_bypassing_write_detected_and_repaired(
+        self, session, add_entry, journal_entry_id, test_actor_id, period_service,
+    ):
+        add_entry("C1", date(2025, 1, 10), debit=Decimal("100.00"))
+        session.execute(insert(SubledgerEntryModel).values(
+            id=uuid4(), subledger_type="AR", entity_id="C1",
+            journal_entry_id=journal_entry_id, source_document_type="INVOICE",
+            source_document_id="BULK-1", source_line_id="1",
+            debit_amount=Decimal("25.00"), currency="USD",
+            effective_date=date(2025, 1, 20), reconciliation_status="open",
+            created_by_id=test_actor_id,
+        ))
+
+        drifts = period_service.verify_balance_projection(SubledgerType.AR, repair=True)
+
+        assert [(d.entity_id, d.projected.entry_count, d.recomputed.entry_count)
+                for d in drifts] == [("C1", 1, 2)]
+        row = _projection(session, "C1")
+        assert row.debit_total == Decimal("125.00")
+        assert row.last_effective_date == date(2025, 1, 20)
+        assert period_service.verify_balance_projection() == []
+
+
+class TestProjectionBackfill:
+
+    def test_entries_predating_projection_are_backfilled(
+        self, session, add_entry, journal_entry_id, test_actor_id,
+    ):
+        # Core inserts skip the flush listener, like rows written before the
+        # projection table existed.
+        for i, (eff, amount) in enumerate(
+            ((date(2025, 1, 5), "60.00"), (date(2025, 2, 5), "40.00")),
+        ):
+            session.execute(insert(SubledgerEntryModel).values(
+                id=uuid4(), subledger_type="AR", entity_id="LEGACY",
+                journal_entry_id=journal_entry_id, source_document_type="INVOICE",
+                source_document_id=f"LEGACY-{i}", source_line_id=str(i),
+                debit_amount=Decimal(amount), currency="USD", effective_date=eff,
+                reconciliation_status="open", created_by_id=test_actor_id,
+            ))
+        add_entry("LEGACY", date(2025, 3, 5), debit=Decimal("5.00"))
+        assert _projection(session, "LEGACY").entry_count == 1
+
+        assert backfill_subledger_entity_balances(session.connection()) >= 1
+
+        row = _projection(session, "LEGACY")
+        assert (row.debit_total, row.entry_count, row.open_item_count) == (
+            Decimal("105.00"), 3, 3,
+        )
+        add_entry("LEGACY", date(2025, 3, 6), credit=Decimal("15.00"))
+        selector = SubledgerSelector(session)
+        assert selector.get_balance(
+            "LEGACY", SubledgerType.AR, date(2025, 2, 28), "USD",
+        ).balance == Decimal("100.00")
+        assert selector.get_balance(
+            "LEGACY", SubledgerType.AR, date(2025, 12, 31), "USD",
+        ).balance == Decimal("90.00")
+        assert selector.get_aggregate_balance(
+            SubledgerType.AR, date(2025, 12, 31), "USD",
+        ) == Money.of(
+            sum(
+                (r.debit_total - r.credit_total
+                 for r in selector.recompute_entity_balances(SubledgerType.AR)
+                 if r.currency == "USD"),
+                Decimal("0"),
+            ),
+            "USD",
+        )
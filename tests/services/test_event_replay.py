@@ -0,0 +1,214 @@
+"""
+Tests for parallel event replay (finance_services.replay_service).
+
+Events are posted through a pack-driven ModulePostingService inside a
+savepoint, read back with iter_replay_events, rolled back, and replayed
+into the same (now empty) ledger, so per-account hashes of source and
+target must match.  The prepare stage is also run in a fork-started
+process pool to prove its inputs and outputs pickle.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from finance_kernel.selectors.ledger_selector import LedgerSelector
+from finance_kernel.services.module_posting_service import (
+    ModulePostingService,
+    ModulePostingStatus,
+)
+from finance_services.invokers import register_standard_engines
+from finance_services.posting_orchestrator import PostingOrchestrator
+from finance_services.replay_service import (
+    EventReplayer,
+    ReplayEvent,
+    iter_replay_events,
+    prepare_replay_events,
+)
+
+pytestmark = pytest.mark.service
+
+
+_RECEIPTS = (
+    ("RAW-STEEL-001", 100, "25.00"),
+    ("BOLT-M8", 50, "10.00"),
+    ("NUT-M8", 200, "0.50"),
+)
+
+
+# Subledger control roles required by the pack's subledger contracts.
+_CONTROL_ROLES = {
+    "AP_CONTROL": "ap",
+    "AR_CONTROL": "ar",
+    "INVENTORY_CONTROL": "inventory",
+    "CASH_CONTROL": "cash",
+    "CONTRACT_WIP_CONTROL": "wip",
+}
+
+
+@pytest.fixture
+def orchestrator(
+    session, test_config, module_role_resolver, module_accounts, deterministic_clock,
+    register_modules, test_actor_party,
+):
+    for role, key in _CONTROL_ROLES.items():
+        account = module_accounts[key]
+        module_role_resolver.register_binding(role, account.id, account.code)
+    orch = PostingOrchestrator(
+        session=session,
+        compiled_pack=test_config,
+        role_resolver=module_role_resolver,
+        clock=deterministic_clock,
+    )
+    register_standard_engines(orch.engine_dispatcher)
+    return orch
+
+
+def _reference_account_hashes(session) -> dict[str, str]:
+    """Per-account hashes built the straightforward way: load, sort, hash."""
+    import hashlib
+    import json
+
+    from sqlalchemy import select
+
+    from finance_kernel.models.account import Account
+    from finance_kernel.models.journal import JournalEntry, JournalEntryStatus, JournalLine
+
+    rows = session.execute(
+        select(Account.code, JournalLine, JournalEntry.seq, JournalEntry.effective_date)
+        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
+        .join(Account, JournalLine.account_id == Account.id)
+        .where(JournalEntry.status == JournalEntryStatus.POSTED)
+    ).all()
+    by_account: dict[str, list] = {}
+    for code, line, seq, effective in rows:
+        dims = json.dumps(line.dimensions, sort_keys=True, separators=(",", ":")) \
+            if line.dimensions else ""
+        by_account.setdefault(code, []).append(((line.currency, dims, seq, line.line_seq), {
+            "currency": line.currency, "dimensions": dims,
+            "effective_date": effective.isoformat(), "line_seq": line.line_seq,
+            "side": getattr(line.side, "value", line.side), "amount": str(line.amount),
+            "is_rounding": line.is_rounding,
+        }))
+    hashes = {}
+    for code, lines in by_account.items():
+        hasher = hashlib.sha256()
+        for _, data in sorted(lines, key=lambda x: x[0]):
+            hasher.update(json.dumps(data, sort_keys=True, separators=(",", ":")).encode())
+            hasher.update(b"\n")
+        hashes[code] = hasher.hexdigest()
+    return hashes
+
+
+@pytest.fixture
+def recorded_events(session, orchestrator, current_period, test_actor_id, deterministic_clock):
+    """Post receipts in a savepoint, capture events + hashes, roll back."""
+    service = ModulePostingService.from_orchestrator(orchestrator, auto_commit=False)
+    savepoint = session.begin_nested()
+    for item, qty, cost in _RECEIPTS:
+        result = service.post_event(
+            event_type="inventory.receipt",
+            payload={"quantity": qty, "unit_cost": cost, "item_code": item},
+            effective_date=deterministic_clock.now().date(),
+            actor_id=test_actor_id,
+            amount=Decimal(cost) * qty,
+        )
+        assert result.status == ModulePostingStatus.POSTED, result.message
+    session.flush()
+    events = list(iter_replay_events(session, chunk_size=2))
+    source_hashes = LedgerSelector(session).account_canonical_hashes()
+    # The streamed per-account hashes must match a load-everything recompute.
+    assert source_hashes == _reference_account_hashes(session)
+    savepoint.rollback()
+    return events, source_hashes
+
+
+class TestReplaySource:
+
+    def test_events_read_in_order_with_posting_inputs(self, recorded_events):
+        events, source_hashes = recorded_events
+        assert [e.payload["item_code"] for e in events] == [r[0] for r in _RECEIPTS]
+        assert [e.amount for e in events] == [
+            Decimal("2500.00"), Decimal("500.00"), Decimal("100.00"),
+        ]
+        assert all(e.currency == "USD" for e in events)
+        assert len(source_hashes) >= 2
+
+    def test_chunk_size_validated(self, session):
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(iter_replay_events(session, chunk_size=0))
+
+
+class TestReplayPrepare:
+
+    def test_prepare_builds_intent(self, test_config, register_modules, recorded_events):
+        events, _ = recorded_events
+        prepared = prepare_replay_events(test_config, events)
+        assert [p.event_id for p in prepared] == [e.event_id for e in events]
+        assert all(p.failed_stage is None for p in prepared)
+        assert prepared[0].profile_name == "InventoryReceipt"
+        assert prepared[0].accounting_intent.source_event_id == events[0].event_id
+
+    def test_missing_amount_reported(self, test_config, register_modules, recorded_events):
+        events, _ = recorded_events
+        event = events[0]
+        stripped = ReplayEvent(**{**event.__dict__, "amount": None})
+        (prepared,) = prepare_replay_events(test_config, [stripped])
+        assert prepared.failed_stage == "inputs"
+
+    def test_unknown_event_type_reported(self, test_config, register_modules, recorded_events):
+        events, _ = recorded_events
+        unknown = ReplayEvent(**{**events[0].__dict__, "event_type": "nope.unknown"})
+        (prepared,) = prepare_replay_events(test_config, [unknown])
+        assert prepared.failed_stage == "profile"
+
+    def test_process_pool_matches_inline(self, test_config, register_modules, recorded_events):
+        events, _ = recorded_events
+        inline = prepare_replay_events(test_config, events)
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("fork"),
+        ) as pool:
+            pooled = pool.submit(prepare_replay_events, test_config, events).result()
+        assert [p.accounting_intent.ledger_intents for p in pooled] == [
+            p.accounting_intent.ledger_intents for p in inline
+        ]
+
+
+class TestEventReplayer:
+
+    def test_replay_reproduces_ledger(self, orchestrator, recorded_events):
+        events, source_hashes = recorded_events
+        assert LedgerSelector(orchestrator.session).account_canonical_hashes() == {}
+
+        report = EventReplayer(orchestrator, chunk_size=2).replay(
+            events, source_hashes=source_hashes,
+        )
+
+        assert report.events_read == 3
+        assert report.events_posted == 3
+        assert report.failures == ()
+        assert report.matches, report.mismatched_accounts
+
+    def test_replay_twice_reports_ingest_duplicates(self, orchestrator, recorded_events):
+        events, source_hashes = recorded_events
+        replayer = EventReplayer(orchestrator)
+        replayer.replay(events, source_hashes=source_hashes)
+
+        again = replayer.replay(events, source_hashes=source_hashes)
+        assert again.events_posted == 0
+        assert {f.stage for f in again.failures} == {"ingest"}
+        assert again.matches
+
+    def test_mismatch_detected(self, orchestrator, recorded_events):
+        events, source_hashes = recorded_events
+        report = EventReplayer(orchestrator).replay(events[:2], source_hashes=source_hashes)
+        assert not report.matches
+        assert report.mismatched_accounts
+
+    def test_invalid_chunk_size(self, orchestrator):
+        with pytest.raises(ValueError, match="chunk_size"):
+            EventReplayer(orchestrator, chunk_size=0)
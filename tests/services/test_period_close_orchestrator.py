@@ -497,6 +497,19 @@ class TestPhase6LockPeriod:
         ).scalar_one()
         assert fp.status == PeriodStatus.LOCKED
 
+    def test_phase_6_seals_closing_balances(
+        self, orchestrator, period, ledger_selector,
+    ):
+        """Locking writes the sealed closing-balance snapshot (PC1)."""
+        run = orchestrator.begin_close(PERIOD_CODE, TEST_ACTOR, is_year_end=True)
+        orchestrator.run_phase(run, 5, TEST_ACTOR)
+        result = orchestrator.run_phase(run, 6, TEST_ACTOR)
+
+        assert "sealed" in result.message
+        snapshot = ledger_selector.close_snapshot(PERIOD_CODE)
+        assert snapshot is not None
+        assert ledger_selector.verify_close_snapshot(PERIOD_CODE)
+
 
 # =========================================================================
 # Full Close Workflow
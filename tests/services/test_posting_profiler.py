@@ -0,0 +1,221 @@
+"""
+Tests for the posting-stage profiler (finance_kernel.services.posting_profiler).
+
+Histogram precision and export formatting are checked in isolation; the
+integration tests post through a pack-driven ModulePostingService with an
+injected profiler and assert that the pipeline stages, SQL counts, and the
+Prometheus text file are populated.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, select
+
+from finance_kernel.models.interpretation_outcome import InterpretationOutcome
+
+from finance_kernel.services.module_posting_service import (
+    ModulePostingService,
+    ModulePostingStatus,
+)
+from finance_kernel.services.posting_profiler import (
+    ALL_EVENT_TYPES,
+    TOTAL_STAGE,
+    LatencyHistogram,
+    PostingProfiler,
+    begin_stage,
+    end_stage,
+)
+from finance_services.invokers import register_standard_engines
+from finance_services.posting_orchestrator import PostingOrchestrator
+
+_CONTROL_ROLES = {
+    "AP_CONTROL": "ap",
+    "AR_CONTROL": "ar",
+    "INVENTORY_CONTROL": "inventory",
+    "CASH_CONTROL": "cash",
+    "CONTRACT_WIP_CONTROL": "wip",
+}
+
+
+class TestLatencyHistogram:
+
+    def test_small_values_exact(self):
+        h = LatencyHistogram()
+        for v in (0, 1, 5, 127):
+            h.record(v)
+        assert h.percentile(0) == 0
+        assert h.percentile(50) == 1
+        assert h.percentile(100) == 127
+        assert (h.count, h.min_us, h.max_us, h.total_us) == (4, 0, 127, 133)
+
+    def test_relative_error_bounded(self):
+        h = LatencyHistogram()
+        values = [1000 + 37 * i for i in range(10_000)]
+        for v in values:
+            h.record(v)
+        for q in (50, 90, 99, 99.9):
+            exact = values[int(len(values) * q / 100) - 1]
+            assert abs(h.percentile(q) - exact) / exact < 0.02
+
+    def test_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(10)
+        b.record(5000, count=3)
+        a.merge(b)
+        assert (a.count, a.min_us, a.max_us) == (4, 10, 5000)
+        assert a.percentile(25) == 10
+
+    def test_percentile_validated(self):
+        with pytest.raises(ValueError, match="Percentile"):
+            LatencyHistogram().percentile(101)
+
+
+class TestPostingProfilerUnit:
+
+    def test_stages_accumulate_once_per_posting(self):
+        profiler = PostingProfiler()
+        with profiler.posting("ar.invoice"):
+            begin_stage("ingest")
+            begin_stage("audit")
+            end_stage()
+            begin_stage("audit")
+        snapshot = profiler.snapshot()
+        assert snapshot.get("ar.invoice", "audit").count == 1
+        assert snapshot.get("ar.invoice", "ingest").count == 1
+        assert snapshot.get("ar.invoice", TOTAL_STAGE).count == 1
+        assert snapshot.get("ar.invoice", "meaning") is None
+
+    def test_stage_marks_noop_without_span(self):
+        begin_stage("ingest")
+        end_stage()
+
+    def test_unknown_stage_rejected(self):
+        with PostingProfiler().posting("x"):
+            with pytest.raises(ValueError, match="Unknown posting stage"):
+                begin_stage("bogus")
+
+    def test_disabled_records_nothing(self):
+        profiler = PostingProfiler(enabled=False)
+        with profiler.posting("x"):
+            begin_stage("ingest")
+        assert profiler.snapshot().stats == ()
+
+    def test_rollup_across_event_types(self):
+        profiler = PostingProfiler()
+        for event_type in ("a", "b", "b"):
+            with profiler.posting(event_type):
+                begin_stage("meaning")
+        snapshot = profiler.snapshot()
+        assert snapshot.event_types == ("a", "b")
+        assert snapshot.get(ALL_EVENT_TYPES, "meaning").count == 3
+
+    def test_prometheus_text(self):
+        profiler = PostingProfiler()
+        with profiler.posting('weird"type'):
+            begin_stage("ingest")
+        text = profiler.to_prometheus_text()
+        assert "# TYPE finance_posting_stage_duration_seconds histogram" in text
+        assert 'event_type="weird\\"type",stage="ingest",le="+Inf"} 1' in text
+        assert 'finance_posting_stage_sql_statements_total{event_type="weird\\"type",stage="ingest"} 0' in text
+
+
+@pytest.fixture
+def profiled_service(
+    session, test_config, module_role_resolver, module_accounts, deterministic_clock,
+    register_modules, test_actor_party,
+):
+    for role, key in _CONTROL_ROLES.items():
+        account = module_accounts[key]
+        module_role_resolver.register_binding(role, account.id, account.code)
+    orchestrator = PostingOrchestrator(
+        session=session,
+        compiled_pack=test_config,
+        role_resolver=module_role_resolver,
+        clock=deterministic_clock,
+    )
+    register_standard_engines(orchestrator.engine_dispatcher)
+    profiler = PostingProfiler()
+    service = ModulePostingService.from_orchestrator(
+        orchestrator, auto_commit=False, profiler=profiler,
+    )
+    return service, profiler
+
+
+@pytest.mark.service
+class TestPostingProfilerPipeline:
+
+    def _post(self, service, deterministic_clock, test_actor_id, item="BOLT-M8"):
+        return service.post_event(
+            event_type="inventory.receipt",
+            payload={"quantity": 10, "unit_cost": "2.50", "item_code": item},
+            effective_date=deterministic_clock.now().date(),
+            actor_id=test_actor_id,
+            amount=Decimal("25.00"),
+        )
+
+    def test_stages_and_sql_recorded(
+        self, profiled_service, current_period, deterministic_clock, test_actor_id,
+    ):
+        service, profiler = profiled_service
+        for item in ("BOLT-M8", "NUT-M8"):
+            result = self._post(service, deterministic_clock, test_actor_id, item)
+            assert result.status == ModulePostingStatus.POSTED, result.message
+
+        snapshot = profiler.snapshot()
+        stages = {s.stage for s in snapshot.for_event_type("inventory.receipt")}
+        assert {
+            "actor_check", "period_check", "ingest", "profile_selection",
+            "meaning", "intent", "journal_write", "audit", TOTAL_STAGE,
+        } <= stages
+
+        total = snapshot.get("inventory.receipt", TOTAL_STAGE)
+        journal = snapshot.get("inventory.receipt", "journal_write")
+        assert total.count == 2
+        assert journal.count == 2
+        assert journal.sql_statements > 0
+        assert total.sql_statements >= journal.sql_statements
+        assert total.p50_us >= journal.p50_us
+
+    def test_textfile_export(
+        self, profiled_service, current_period, deterministic_clock, test_actor_id, tmp_path,
+    ):
+        service, profiler = profiled_service
+        self._post(service, deterministic_clock, test_actor_id)
+
+        path = tmp_path / "posting.prom"
+        profiler.write_prometheus_textfile(str(path))
+        text = path.read_text()
+        assert 'stage="journal_write",le="+Inf"} 1' in text
+        assert "finance_db_pool_checkout_wait_seconds_count" in text
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_decision_log_excludes_pool_records(
+        self, profiled_service, current_period, deterministic_clock, test_actor_id,
+        session, db_engine,
+    ):
+        """Pool DEBUG records (checkout, reset, ...) never reach the journal."""
+        service, _ = profiled_service
+
+        def checkout_during_post(*args):
+            with db_engine.connect():
+                pass
+
+        event.listen(session, "after_flush", checkout_during_post)
+        try:
+            result = self._post(service, deterministic_clock, test_actor_id)
+        finally:
+            event.remove(session, "after_flush", checkout_during_post)
+        assert result.status == ModulePostingStatus.POSTED, result.message
+
+        records = [
+            record
+            for log in session.execute(
+                select(InterpretationOutcome.decision_log)
+            ).scalars()
+            for record in log or ()
+        ]
+        assert records
+        assert not [r for r in records if "pool" in str(r.get("logger", "")).lower()]
@@ -0,0 +1,109 @@
+"""
+Tests for ReferenceSnapshotService freshness checks backed by change stamps.
+
+ORM writes to accounts bump the ``coa`` stamp (db/immutability.py); the
+freshness check must skip re-hashing while stamps are unchanged and fall
+back to the content hash when they move.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from finance_kernel.domain.reference_snapshot import (
+    SnapshotComponentType,
+    SnapshotRequest,
+)
+from finance_kernel.models.account import AccountType, NormalBalance
+from finance_kernel.services.reference_snapshot_service import (
+    ReferenceSnapshotService,
+)
+
+pytestmark = pytest.mark.service
+
+
+@pytest.fixture
+def snapshot_service(session, deterministic_clock, standard_accounts):
+    return ReferenceSnapshotService(session, deterministic_clock)
+
+
+def _capture(service, actor_id):
+    return service.capture(SnapshotRequest(
+        include_components=(
+            SnapshotComponentType.COA,
+            SnapshotComponentType.FX_RATES,
+            SnapshotComponentType.ROUNDING_POLICY,
+        ),
+        requested_by=actor_id,
+    ))
+
+
+def _coa_stamp(snapshot):
+    return next(
+        cv.change_stamp for cv in snapshot.component_versions
+        if cv.component_type == SnapshotComponentType.COA
+    )
+
+
+class TestSnapshotChangeStamps:
+
+    def test_account_write_bumps_coa_stamp(
+        self, snapshot_service, create_account, test_actor_id,
+    ):
+        before = _coa_stamp(_capture(snapshot_service, test_actor_id))
+        create_account("9100", "Stamp Test", AccountType.EXPENSE, NormalBalance.DEBIT)
+        after = _coa_stamp(_capture(snapshot_service, test_actor_id))
+        assert after == before + 1
+
+    def test_fresh_snapshot_skips_rehash(
+        self, snapshot_service, test_actor_id, monkeypatch,
+    ):
+        snapshot = _capture(snapshot_service, test_actor_id)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("component re-hashed despite unchanged stamp")
+
+        monkeypatch.setattr(snapshot_service, "_capture_component", _fail)
+        assert snapshot_service.validate_freshness(snapshot).is_valid
+
+    def test_stamp_change_detects_drift(
+        self, snapshot_service, create_account, test_actor_id,
+    ):
+        snapshot = _capture(snapshot_service, test_actor_id)
+        create_account("9101", "New Account", AccountType.EXPENSE, NormalBalance.DEBIT)
+
+        result = snapshot_service.validate_freshness(snapshot)
+        assert not result.is_valid
+        assert [e.component_type for e in result.errors] == [SnapshotComponentType.COA]
+
+    def test_stamp_change_without_content_change_stays_valid(
+        self, session, snapshot_service, standard_accounts, test_actor_id,
+    ):
+        snapshot = _capture(snapshot_service, test_actor_id)
+        account = standard_accounts["cash"]
+        original = account.name
+        account.name = "Renamed"
+        session.flush()
+        account.name = original
+        session.flush()
+
+        assert _coa_stamp(_capture(snapshot_service, test_actor_id)) == _coa_stamp(snapshot) + 2
+        assert snapshot_service.validate_freshness(snapshot).is_valid
+
+    def test_unstamped_snapshot_falls_back_to_hash(self, snapshot_service, test_actor_id):
+        snapshot = _capture(snapshot_service, test_actor_id)
+        unstamped = replace(snapshot, component_versions=tuple(
+            replace(cv, change_stamp=None) for cv in snapshot.component_versions
+        ))
+        rehashed: list[SnapshotComponentType] = []
+        capture = snapshot_service._capture_component
+
+        def _tracking(component_type, as_of):
+            rehashed.append(component_type)
+            return capture(component_type, as_of)
+
+        snapshot_service._capture_component = _tracking
+        assert snapshot_service.validate_freshness(unstamped).is_valid
+        assert rehashed == [SnapshotComponentType.COA, SnapshotComponentType.FX_RATES]
@@ -8,9 +8,12 @@ from uuid import uuid4
 import pytest
 
 from finance_kernel.logging_config import (
+    BatchingLogWriter,
     LogContext,
+    QueueingHandler,
     StructuredFormatter,
     configure_logging,
+    flush_logging,
     get_logger,
     reset_logging,
 )
@@ -239,3 +242,194 @@ class TestConfigureLogging:
         record = _parse_log(stream)
         assert record["message"] == "hierarchy_test"
         assert record["logger"] == "finance_kernel.deep.nested.module"
+
+
+# ---------------------------------------------------------------------------
+# Queued pipeline tests
+# ---------------------------------------------------------------------------
+
+
+class TestQueuedLogging:
+    """Tests for configure_logging(queued=True)."""
+
+    def test_records_written_by_writer_thread(self):
+        stream = StringIO()
+        configure_logging(stream=stream, queued=True)
+        root = logging.getLogger("finance_kernel")
+        assert any(isinstance(h, QueueingHandler) for h in root.handlers)
+
+        get_logger("queued").info("queued_msg", extra={"n": 1})
+        assert flush_logging()
+        record = _parse_log(stream)
+        assert record["message"] == "queued_msg"
+        assert record["n"] == 1
+
+    def test_context_captured_on_emitting_thread(self):
+        stream = StringIO()
+        configure_logging(stream=stream, queued=True)
+        with LogContext.bind(correlation_id="corr-q", event_id="evt-q"):
+            get_logger("queued").info("with_context")
+        flush_logging()
+        record = _parse_log(stream)
+        assert record["correlation_id"] == "corr-q"
+        assert record["event_id"] == "evt-q"
+        assert "_log_context" not in record
+
+    def test_raw_values_serialised_like_sync_mode(self):
+        from decimal import Decimal
+
+        eid = uuid4()
+        stream = StringIO()
+        configure_logging(stream=stream, queued=True)
+        get_logger("queued").info(
+            "raw", extra={"amount": Decimal("10.50"), "entry_id": eid}
+        )
+        flush_logging()
+        record = _parse_log(stream)
+        assert record["amount"] == "10.50"
+        assert record["entry_id"] == str(eid)
+
+    def test_batches_preserve_order(self):
+        stream = StringIO()
+        configure_logging(stream=stream, queued=True, batch_size=7)
+        log = get_logger("queued")
+        for i in range(100):
+            log.info("seq", extra={"i": i})
+        flush_logging()
+        assert [r["i"] for r in _parse_all_logs(stream)] == list(range(100))
+
+    def test_level_filter_respected(self):
+        stream = StringIO()
+        configure_logging(stream=stream, queued=True, level=logging.WARNING)
+        get_logger("queued").info("dropped")
+        get_logger("queued").warning("kept")
+        flush_logging()
+        assert [r["message"] for r in _parse_all_logs(stream)] == ["kept"]
+
+    def test_reset_drains_and_stops_writer(self):
+        stream = StringIO()
+        configure_logging(stream=stream, queued=True)
+        get_logger("queued").info("last")
+        reset_logging()
+        assert [r["message"] for r in _parse_all_logs(stream)] == ["last"]
+        assert flush_logging()  # no writer left: no-op
+
+    def test_batching_writer_other_handler(self):
+        records: list[logging.LogRecord] = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        writer = BatchingLogWriter(ListHandler(), batch_size=4)
+        writer.start()
+        try:
+            handler = QueueingHandler(writer.queue)
+            for i in range(10):
+                handler.handle(logging.LogRecord("x", logging.INFO, "", 0, f"m{i}", (), None))
+            assert writer.flush()
+        finally:
+            writer.stop()
+        assert [r.getMessage() for r in records] == [f"m{i}" for i in range(10)]
+
+
+# ---------------------------------------------------------------------------
+# DecisionJournal tests
+# ---------------------------------------------------------------------------
+
+
+class TestDecisionJournal:
+    """Tests for the context-local decision journal."""
+
+    def test_collects_records_while_active(self):
+        from finance_kernel.services.decision_journal import DecisionJournal
+
+        logger = get_logger("journal.test")
+        logger.info("before")
+        with DecisionJournal() as journal:
+            logger.info("inside", extra={"step": 1})
+        logger.info("after")
+        records = journal.to_dicts()
+        assert [r["message"] for r in records] == ["inside"]
+        assert records[0]["step"] == 1
+        assert records[0]["logger"] == "finance_kernel.journal.test"
+
+    def test_shape_matches_formatter(self):
+        from finance_kernel.services.decision_journal import DecisionJournal
+
+        eid = uuid4()
+        handler, stream = _make_handler()
+        root = logging.getLogger("finance_kernel")
+        root.addHandler(handler)
+        try:
+            with DecisionJournal() as journal:
+                with LogContext.bind(correlation_id="c-1"):
+                    get_logger("journal.shape").info(
+                        "shape", extra={"entry_id": eid, "n": 2}
+                    )
+        finally:
+            root.removeHandler(handler)
+        formatted = _parse_log(stream)
+        journaled = journal.to_dicts()[0]
+        assert journaled == formatted
+        json.dumps(journaled)
+
+    def test_exception_detail_kept(self):
+        from finance_kernel.services.decision_journal import DecisionJournal
+
+        logger = get_logger("journal.exc")
+        with DecisionJournal() as journal:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("failed", exc_info=True)
+        record = journal.to_dicts()[0]
+        assert record["exc_type"] == "ValueError"
+        assert "traceback" in record
+
+    def test_nested_journal_shadows_outer(self):
+        from finance_kernel.services.decision_journal import DecisionJournal
+
+        logger = get_logger("journal.nested")
+        with DecisionJournal() as outer:
+            logger.info("outer_1")
+            with DecisionJournal() as inner:
+                logger.info("inner")
+            logger.info("outer_2")
+        assert [r.message for r in outer.records] == ["outer_1", "outer_2"]
+        assert [r.message for r in inner.records] == ["inner"]
+
+    def test_concurrent_journals_do_not_cross_capture(self):
+        import threading
+
+        from finance_kernel.services.decision_journal import DecisionJournal
+
+        logger = get_logger("journal.threads")
+        barrier = threading.Barrier(4)
+        results: dict[int, list[str]] = {}
+
+        def worker(n: int) -> None:
+            with DecisionJournal() as journal:
+                barrier.wait()
+                for i in range(50):
+                    logger.info(f"t{n}-{i}")
+            results[n] = [r.message for r in journal.records]
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for n in range(4):
+            assert results[n] == [f"t{n}-{i}" for i in range(50)]
+
+    def test_reinstalls_after_reset_logging(self):
+        from finance_kernel.services.decision_journal import DecisionJournal
+
+        with DecisionJournal():
+            pass
+        reset_logging()
+        with DecisionJournal() as journal:
+            get_logger("journal.reset").debug("after_reset")
+        assert len(journal) == 1
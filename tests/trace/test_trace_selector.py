@@ -828,3 +828,131 @@ class TestPipelineIntegration:
         assert bundle.integrity.balance_verified is True
         assert bundle.integrity.bundle_hash != ""
         assert len(bundle.integrity.bundle_hash) == 64
+
+
+# ============================================================================
+# Tests: batch trace (trace_events)
+# ============================================================================
+
+
+class TestTraceEvents:
+    def _seed(self, session, clock, actor_id, accounts, n, seq_base):
+        """n events, each with a posted entry, audit events and a link."""
+        events = []
+        for i in range(n):
+            event = _create_event(session, clock, actor_id)
+            entry = _create_posted_entry(
+                session, clock, actor_id, event, accounts, seq=seq_base + i,
+            )
+            _create_audit_event(
+                session, clock, actor_id, "Event", event.event_id,
+                AuditAction.EVENT_INGESTED, seq=seq_base * 10 + 2 * i,
+            )
+            _create_audit_event(
+                session, clock, actor_id, "JournalEntry", entry.id,
+                AuditAction.JOURNAL_POSTED, seq=seq_base * 10 + 2 * i + 1,
+            )
+            _create_economic_link(
+                session, clock, event.event_id,
+                parent_type="receipt", parent_id=uuid4(),
+                child_type="journal_entry", child_id=entry.id,
+            )
+            _create_interpretation_outcome(
+                session, clock, event.event_id, journal_entry_ids=[str(entry.id)],
+            )
+            events.append(event)
+        return events
+
+    def test_batch_matches_single_trace(
+        self, session, trace_selector, standard_accounts,
+        test_actor_id, deterministic_clock,
+    ):
+        """Each batch bundle hashes identically to trace_by_event_id."""
+        events = self._seed(
+            session, deterministic_clock, test_actor_id, standard_accounts, 3, 500,
+        )
+        _create_audit_event(
+            session, deterministic_clock, test_actor_id, "Event", events[1].event_id,
+            AuditAction.PROTOCOL_VIOLATION, seq=9999,
+        )
+        unknown = uuid4()
+        ids = [e.event_id for e in events] + [unknown]
+
+        batch = list(trace_selector.trace_events(ids, chunk_size=2))
+
+        assert [b.artifact.artifact_id for b in batch] == ids
+        for bundle, event_id in zip(batch, ids):
+            single = trace_selector.trace_by_event_id(event_id)
+            assert bundle.integrity.bundle_hash == single.integrity.bundle_hash
+        assert len(batch[1].conflicts) == 1
+        assert len(batch[0].lifecycle_links) == 1
+        assert len([t for t in batch[0].timeline if t.source == "audit_event"]) == 2
+        assert {f.fact for f in batch[3].missing_facts} == {
+            "ORIGIN_EVENT", "JOURNAL_ENTRIES", "STRUCTURED_LOGS",
+        }
+
+    def test_query_count_independent_of_event_count(
+        self, session, trace_selector, standard_accounts,
+        test_actor_id, deterministic_clock,
+    ):
+        """One keyed query per component type per chunk, not per event."""
+        from sqlalchemy import event as sa_event
+
+        events = self._seed(
+            session, deterministic_clock, test_actor_id, standard_accounts, 6, 700,
+        )
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, params, context, executemany):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        sa_event.listen(engine, "before_cursor_execute", _count)
+        try:
+            list(trace_selector.trace_events([e.event_id for e in events[:2]]))
+            small = len(statements)
+            statements.clear()
+            list(trace_selector.trace_events([e.event_id for e in events]))
+            large = len(statements)
+        finally:
+            sa_event.remove(engine, "before_cursor_execute", _count)
+
+        assert large == small
+
+    def test_chunk_size_validated(self, trace_selector):
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(trace_selector.trace_events([uuid4()], chunk_size=0))
+
+    def test_event_ids_for_period(
+        self, session, trace_selector, test_actor_id, deterministic_clock,
+    ):
+        event = _create_event(session, deterministic_clock, test_actor_id)
+        today = deterministic_clock.now().date()
+
+        assert event.event_id in trace_selector.event_ids_for_period(today, today)
+        assert trace_selector.event_ids_for_period(date(1990, 1, 1), date(1990, 1, 2)) == []
+
+    def test_jsonl_export(
+        self, session, trace_selector, standard_accounts,
+        test_actor_id, deterministic_clock,
+    ):
+        """scripts/trace.py streams one JSON bundle per line with progress."""
+        import io
+        import json
+
+        from scripts.trace import export_jsonl
+
+        events = self._seed(
+            session, deterministic_clock, test_actor_id, standard_accounts, 3, 900,
+        )
+        out, progress = io.StringIO(), io.StringIO()
+
+        count = export_jsonl(
+            trace_selector, [e.event_id for e in events], out,
+            chunk_size=2, progress=progress, progress_every=2,
+        )
+
+        lines = out.getvalue().splitlines()
+        assert count == len(lines) == 3
+        assert json.loads(lines[2])["artifact"]["artifact_id"] == str(events[2].event_id)
+        assert "traced 3/3 (100.0%)" in progress.getvalue()